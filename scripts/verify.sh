@@ -19,8 +19,8 @@ DAEMON_PID=""
 PASS=0
 FAIL=0
 STEP=0
-# Total gates: build(1) + daemon-start(1) + suites(21 = smoke+auth+handoff+cdp+actions-v2+pages-frames+network-cdp+c05-fixes+policy+element-map+r07c02+r07c03+r07c04+r08c01+r08c02+r08c03+r08c04+r08c05+r08c06+r08c06-modes+r08c07) + daemon-stop(1) = 24
-TOTAL=24
+# Total gates: build(1) + daemon-start(1) + suites(39 = smoke+auth+handoff+cdp+actions-v2+pages-frames+network-cdp+c05-fixes+policy+element-map+r07c02+r07c03+r07c04+r08c01+r08c02+r08c03+r08c04+r08c05+r08c06+r08c06-modes+r08c07+transport+binary-transfer+sdk-decode+sdk-import+fanout+session-pool+retry+conditional-get+instrument+persist+warm-pool+shared-contexts+admission+hibernation+metrics+timings+ws-channel+events) + daemon-stop(1) = 42
+TOTAL=42
 
 # ── Color helpers ──────────────────────────────────────────────────────────
 green() { printf '\033[32m%s\033[0m\n' "$*"; }
@@ -60,7 +60,7 @@ fi
 # ── Gate: daemon start ─────────────────────────────────────────────────────
 STEP=$((STEP + 1))
 printf "[%d/%d] Daemon start on :%s... " "$STEP" "$TOTAL" "$PORT"
-AGENTMB_PORT="$PORT" AGENTMB_DATA_DIR="$DATA_DIR" AGENTMB_POLICY_PROFILE="disabled" node dist/daemon/index.js \
+AGENTMB_PORT="$PORT" AGENTMB_DATA_DIR="$DATA_DIR" AGENTMB_POLICY_PROFILE="disabled" AGENTMB_SOCKET=1 node dist/daemon/index.js \
   > /tmp/agentmb-daemon.log 2>&1 &
 DAEMON_PID=$!
 
@@ -121,6 +121,24 @@ run_suite "r08c05"        tests/e2e/test_r08c05.py
 run_suite "r08c06"        tests/e2e/test_r08c06.py
 run_suite "r08c06-modes" tests/e2e/test_r08c06_modes.py
 run_suite "r08c07"        tests/e2e/test_r08c07.py
+run_suite "transport"     tests/e2e/test_transport.py
+run_suite "binary-transfer" tests/e2e/test_binary_transfer.py
+run_suite "sdk-decode"    tests/e2e/test_sdk_decode.py
+run_suite "sdk-import"    tests/e2e/test_sdk_import.py
+run_suite "fanout"        tests/e2e/test_fanout.py
+run_suite "session-pool"  tests/e2e/test_session_pool.py
+run_suite "retry"         tests/e2e/test_retry.py
+run_suite "conditional-get" tests/e2e/test_conditional_get.py
+run_suite "instrument"    tests/e2e/test_instrument.py
+run_suite "persist"       tests/e2e/test_persist.py
+run_suite "warm-pool"     tests/e2e/test_warm_pool.py
+run_suite "shared-contexts" tests/e2e/test_shared_contexts.py
+run_suite "admission"     tests/e2e/test_admission.py
+run_suite "hibernation"   tests/e2e/test_hibernation.py
+run_suite "metrics"       tests/e2e/test_metrics.py
+run_suite "timings"       tests/e2e/test_timings.py
+run_suite "ws-channel"    tests/e2e/test_ws_channel.py
+run_suite "events"        tests/e2e/test_events.py
 
 # ── Gate: daemon stop ──────────────────────────────────────────────────────
 STEP=$((STEP + 1))
@@ -1,79 +1,208 @@
-"""agentmb Python SDK"""
+"""agentmb Python SDK
+
+Public names are loaded on first attribute access (PEP 562), so
+``import agentmb`` stays cheap for short-lived CLI / MCP wrappers: httpx and
+the client load with ``BrowserClient`` / ``AsyncBrowserClient``, pydantic and
+the result models with the first model name.  ``python -m
+agentmb._bench.import_time`` checks the cold-import budget.
+"""
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .client import BrowserClient, AsyncBrowserClient
+    from .transport import TransportConfig, SharedTransport
+    from .lazy import LazyModelList
+    from .fanout import FanOutResult
+    from .pool import SessionPool, AsyncSessionPool
+    from .retry import RetryPolicy, RetryRule, ClientMetrics
+    from .instrument import ClientHook, LatencyHistogram, RequestEvent
+    from .models import (
+        SessionInfo,
+        NavigateResult,
+        ScreenshotResult,
+        ScreenshotFileResult,
+        EvalResult,
+        ActionResult,
+        ExtractResult,
+        HandoffResult,
+        AuditEntry,
+        TypeResult,
+        PressResult,
+        SelectResult,
+        HoverResult,
+        WaitForSelectorResult,
+        WaitForUrlResult,
+        WaitForResponseResult,
+        UploadResult,
+        DownloadResult,
+        DownloadToResult,
+        PageInfo,
+        PageListResult,
+        NewPageResult,
+        RouteMock,
+        RouteEntry,
+        RouteListResult,
+        TraceResult,
+        PolicyInfo,
+        ElementInfo,
+        ElementRect,
+        ElementMapResult,
+        GetPropertyResult,
+        AssertResult,
+        StableResult,
+        SnapshotElement,
+        SnapshotMapResult,
+        StaleRefError,
+        DragResult,
+        MouseResult,
+        KeyResult,
+        NavResult,
+        WaitTextResult,
+        WaitLoadStateResult,
+        WaitFunctionResult,
+        ScrollUntilResult,
+        LoadMoreResult,
+        CookieInfo,
+        CookieListResult,
+        StorageStateResult,
+        StorageStateRestoreResult,
+        AnnotatedScreenshotResult,
+        ConsoleEntry,
+        ConsoleLogResult,
+        PageErrorEntry,
+        PageErrorListResult,
+        ClickAtResult,
+        WheelAtResult,
+        InsertTextResult,
+        BboxResult,
+        DialogEntry,
+        DialogListResult,
+        SessionEvent,
+        ClipboardWriteResult,
+        ClipboardReadResult,
+        ViewportResult,
+        NetworkConditionsResult,
+    )
+
+# public name -> submodule that defines it
+_LAZY = {
+    "BrowserClient": "client",
+    "AsyncBrowserClient": "client",
+    "TransportConfig": "transport",
+    "SharedTransport": "transport",
+    "LazyModelList": "lazy",
+    "FanOutResult": "fanout",
+    "SessionPool": "pool",
+    "AsyncSessionPool": "pool",
+    "RetryPolicy": "retry",
+    "RetryRule": "retry",
+    "ClientMetrics": "retry",
+    "ClientHook": "instrument",
+    "LatencyHistogram": "instrument",
+    "RequestEvent": "instrument",
+    "SessionInfo": "models",
+    "NavigateResult": "models",
+    "ScreenshotResult": "models",
+    "ScreenshotFileResult": "models",
+    "EvalResult": "models",
+    "ActionResult": "models",
+    "ExtractResult": "models",
+    "HandoffResult": "models",
+    "AuditEntry": "models",
+    "TypeResult": "models",
+    "PressResult": "models",
+    "SelectResult": "models",
+    "HoverResult": "models",
+    "WaitForSelectorResult": "models",
+    "WaitForUrlResult": "models",
+    "WaitForResponseResult": "models",
+    "UploadResult": "models",
+    "DownloadResult": "models",
+    "DownloadToResult": "models",
+    "PageInfo": "models",
+    "PageListResult": "models",
+    "NewPageResult": "models",
+    "RouteMock": "models",
+    "RouteEntry": "models",
+    "RouteListResult": "models",
+    "TraceResult": "models",
+    "PolicyInfo": "models",
+    "ElementInfo": "models",
+    "ElementRect": "models",
+    "ElementMapResult": "models",
+    "GetPropertyResult": "models",
+    "AssertResult": "models",
+    "StableResult": "models",
+    "SnapshotElement": "models",
+    "SnapshotMapResult": "models",
+    "StaleRefError": "models",
+    "DragResult": "models",
+    "MouseResult": "models",
+    "KeyResult": "models",
+    "NavResult": "models",
+    "WaitTextResult": "models",
+    "WaitLoadStateResult": "models",
+    "WaitFunctionResult": "models",
+    "ScrollUntilResult": "models",
+    "LoadMoreResult": "models",
+    "CookieInfo": "models",
+    "CookieListResult": "models",
+    "StorageStateResult": "models",
+    "StorageStateRestoreResult": "models",
+    "AnnotatedScreenshotResult": "models",
+    "ConsoleEntry": "models",
+    "ConsoleLogResult": "models",
+    "PageErrorEntry": "models",
+    "PageErrorListResult": "models",
+    "ClickAtResult": "models",
+    "WheelAtResult": "models",
+    "InsertTextResult": "models",
+    "BboxResult": "models",
+    "DialogEntry": "models",
+    "DialogListResult": "models",
+    "SessionEvent": "models",
+    "ClipboardWriteResult": "models",
+    "ClipboardReadResult": "models",
+    "ViewportResult": "models",
+    "NetworkConditionsResult": "models",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
 
-from .client import BrowserClient, AsyncBrowserClient
-from .models import (
-    SessionInfo,
-    NavigateResult,
-    ScreenshotResult,
-    EvalResult,
-    ActionResult,
-    ExtractResult,
-    HandoffResult,
-    AuditEntry,
-    TypeResult,
-    PressResult,
-    SelectResult,
-    HoverResult,
-    WaitForSelectorResult,
-    WaitForUrlResult,
-    WaitForResponseResult,
-    UploadResult,
-    DownloadResult,
-    PageInfo,
-    PageListResult,
-    NewPageResult,
-    RouteMock,
-    RouteEntry,
-    RouteListResult,
-    TraceResult,
-    PolicyInfo,
-    ElementInfo,
-    ElementRect,
-    ElementMapResult,
-    GetPropertyResult,
-    AssertResult,
-    StableResult,
-    SnapshotElement,
-    SnapshotMapResult,
-    StaleRefError,
-    DragResult,
-    MouseResult,
-    KeyResult,
-    NavResult,
-    WaitTextResult,
-    WaitLoadStateResult,
-    WaitFunctionResult,
-    ScrollUntilResult,
-    LoadMoreResult,
-    CookieInfo,
-    CookieListResult,
-    StorageStateResult,
-    StorageStateRestoreResult,
-    AnnotatedScreenshotResult,
-    ConsoleEntry,
-    ConsoleLogResult,
-    PageErrorEntry,
-    PageErrorListResult,
-    # R07-T19/T20/T22/T23/T24/T25
-    ClickAtResult,
-    WheelAtResult,
-    InsertTextResult,
-    BboxResult,
-    DialogEntry,
-    DialogListResult,
-    ClipboardWriteResult,
-    ClipboardReadResult,
-    ViewportResult,
-    NetworkConditionsResult,
-)
 
 __version__ = "0.3.1"
 __all__ = [
     "BrowserClient",
     "AsyncBrowserClient",
+    "TransportConfig",
+    "SharedTransport",
+    "LazyModelList",
+    "FanOutResult",
+    "SessionPool",
+    "AsyncSessionPool",
+    "RetryPolicy",
+    "RetryRule",
+    "ClientMetrics",
+    "ClientHook",
+    "LatencyHistogram",
+    "RequestEvent",
     "SessionInfo",
     "NavigateResult",
     "ScreenshotResult",
+    "ScreenshotFileResult",
     "EvalResult",
     "ActionResult",
     "ExtractResult",
@@ -88,6 +217,7 @@ __all__ = [
     "WaitForResponseResult",
     "UploadResult",
     "DownloadResult",
+    "DownloadToResult",
     "PageInfo",
     "PageListResult",
     "NewPageResult",
@@ -129,6 +259,7 @@ __all__ = [
     "BboxResult",
     "DialogEntry",
     "DialogListResult",
+    "SessionEvent",
     "ClipboardWriteResult",
     "ClipboardReadResult",
     "ViewportResult",
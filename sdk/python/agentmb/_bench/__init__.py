@@ -0,0 +1,23 @@
+"""agentmb SDK micro-benchmarks.
+
+Each module is runnable with ``python -m agentmb._bench.<name> --help``.
+Benchmarks that talk to a daemon use ``AGENTMB_PORT`` (or ``--base-url``).
+"""
+
+from __future__ import annotations
+
+import os
+from typing import List, Sequence
+
+
+def default_base_url() -> str:
+    return f"http://127.0.0.1:{os.environ.get('AGENTMB_PORT', '19315')}"
+
+
+def percentile(samples: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile of *samples* (0 when empty)."""
+    if not samples:
+        return 0.0
+    ordered: List[float] = sorted(samples)
+    k = max(0, min(len(ordered) - 1, int(round(pct / 100.0 * len(ordered) + 0.5)) - 1))
+    return ordered[k]
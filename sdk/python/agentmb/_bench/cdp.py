@@ -0,0 +1,76 @@
+"""CDP command latency through ``POST /sessions/:id/cdp``.
+
+Sends a few cheap CDP commands back to back on one session and prints
+p50 / p95 / p99 per command, then for the same commands sent as one
+``cdp_send_many`` batch (in order and in parallel), and finally the
+daemon's CDP session cache counters (``cdp_sessions`` in ``/api/v1/status``)::
+
+    python -m agentmb._bench.cdp --iterations 300
+
+The daemon keeps one attached CDP session per page, so after the first
+call every command is a single CDP round trip. Run the same command
+against an older daemon (one attach + detach per call) to compare.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import time
+from typing import List, Optional
+
+import httpx
+
+from ..client import BrowserClient
+from . import default_base_url, percentile
+
+_COMMANDS = [
+    ("Runtime.evaluate", {"expression": "1 + 1", "returnByValue": True}),
+    ("DOM.getDocument", {"depth": 1}),
+    ("Page.getLayoutMetrics", {}),
+]
+
+
+def main(argv: Optional[list] = None) -> None:
+    ap = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    ap.add_argument("--base-url", default=default_base_url())
+    ap.add_argument("--iterations", type=int, default=300)
+    args = ap.parse_args(argv)
+
+    token = os.environ.get("AGENTMB_API_TOKEN")
+    headers = {"x-api-token": token} if token else {}
+    with BrowserClient(base_url=args.base_url) as client:
+        sess = client.sessions.create(profile="bench-cdp", ephemeral=True)
+        try:
+            sess.navigate("data:text/html,<h1>cdp</h1>")
+            print(f"{args.iterations} iterations per command")
+            for method, params in _COMMANDS:
+                sess.cdp_send(method, params)  # warm-up (attaches the session on a new daemon)
+                samples: List[float] = []
+                for _ in range(args.iterations):
+                    t0 = time.perf_counter()
+                    sess.cdp_send(method, params)
+                    samples.append((time.perf_counter() - t0) * 1000)
+                print(
+                    f"  {method:<24} p50={percentile(samples, 50):6.2f}ms "
+                    f"p95={percentile(samples, 95):6.2f}ms p99={percentile(samples, 99):6.2f}ms"
+                )
+            batch = list(_COMMANDS)
+            for label, parallel in (("batch", False), ("batch ||", True)):
+                samples = []
+                for _ in range(args.iterations):
+                    t0 = time.perf_counter()
+                    sess.cdp_send_many(batch, parallel=parallel)
+                    samples.append((time.perf_counter() - t0) * 1000)
+                print(
+                    f"  {label + f' ({len(batch)} cmds)':<24} p50={percentile(samples, 50):6.2f}ms "
+                    f"p95={percentile(samples, 95):6.2f}ms p99={percentile(samples, 99):6.2f}ms"
+                )
+        finally:
+            sess.close()
+    status = httpx.get(f"{args.base_url}/api/v1/status", headers=headers).json()
+    print(f"cdp session cache: {status.get('cdp_sessions') or 'not reported (older daemon)'}")
+
+
+if __name__ == "__main__":
+    main()
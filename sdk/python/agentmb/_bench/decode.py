@@ -0,0 +1,137 @@
+"""Response decode cost: json.loads + model_validate vs the client's decode paths.
+
+Times decode + model build for element_map / snapshot_map bodies, the two
+responses that dominate client CPU in an agent loop. Payloads are either
+synthetic (``--elements N``, shaped like daemon output) or recorded from a
+live daemon into a directory and replayed::
+
+    python -m agentmb._bench.decode --elements 500
+    python -m agentmb._bench.decode --record ./payloads --url https://news.ycombinator.com
+    python -m agentmb._bench.decode --replay ./payloads
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+
+from .._decode import decode, get_loads
+from ..models import ElementMapResult, SnapshotMapResult
+from . import default_base_url
+
+_MODELS = {"element_map": ElementMapResult, "snapshot_map": SnapshotMapResult}
+
+
+def _element(i: int, ref: Optional[str] = None) -> dict:
+    el = {
+        "element_id": f"e{i}",
+        "tag": "a" if i % 3 else "button",
+        "role": "link" if i % 3 else "button",
+        "text": f"Item number {i} with some visible text",
+        "name": f"item-{i}",
+        "placeholder": "",
+        "href": f"https://example.com/items/{i}" if i % 3 else "",
+        "type": "",
+        "overlay_blocked": False,
+        "rect": {"x": 10, "y": 20 * i, "width": 200, "height": 18},
+        "label": f"Item number {i}",
+        "label_source": "text",
+    }
+    if ref:
+        el = {"ref_id": f"{ref}:e{i}", **el}
+    return el
+
+
+def synthetic(n: int) -> Dict[str, bytes]:
+    em = {"status": "ok", "url": "https://example.com/", "elements": [_element(i) for i in range(1, n + 1)],
+          "count": n, "duration_ms": 42}
+    sm = {"status": "ok", "snapshot_id": "snap_000001", "page_rev": 3, "url": "https://example.com/",
+          "elements": [_element(i, "snap_000001") for i in range(1, n + 1)], "count": n, "duration_ms": 42}
+    return {"element_map": json.dumps(em).encode(), "snapshot_map": json.dumps(sm).encode()}
+
+
+def record(dest: str, base_url: str, url: str) -> None:
+    """Capture raw element_map / snapshot_map bodies for *url* into *dest*."""
+    import httpx
+    os.makedirs(dest, exist_ok=True)
+    headers = {"X-API-Token": os.environ["AGENTMB_API_TOKEN"]} if os.environ.get("AGENTMB_API_TOKEN") else {}
+    with httpx.Client(base_url=base_url, headers=headers, timeout=60) as c:
+        sid = c.post("/api/v1/sessions", json={"profile": "bench-decode", "ephemeral": True}).json()["session_id"]
+        try:
+            c.post(f"/api/v1/sessions/{sid}/navigate", json={"url": url}).raise_for_status()
+            for name in _MODELS:
+                body = c.post(f"/api/v1/sessions/{sid}/{name}", json={"limit": 5000}).content
+                with open(os.path.join(dest, f"{name}.json"), "wb") as f:
+                    f.write(body)
+                print(f"recorded {name}: {len(body)} bytes")
+        finally:
+            c.delete(f"/api/v1/sessions/{sid}")
+
+
+def replay(src: str) -> Dict[str, bytes]:
+    out = {}
+    for name in _MODELS:
+        p = os.path.join(src, f"{name}.json")
+        if os.path.exists(p):
+            with open(p, "rb") as f:
+                out[name] = f.read()
+    return out
+
+
+def _legacy(body: bytes, model) -> object:
+    """What the client did before: resp.json() then model_validate(dict)."""
+    return model.model_validate(json.loads(body))
+
+
+def _bench(fn, rounds: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - t0) / rounds * 1e6
+
+
+def main(argv: Optional[list] = None) -> None:
+    ap = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    ap.add_argument("--elements", type=int, default=500)
+    ap.add_argument("--rounds", type=int, default=200)
+    ap.add_argument("--record", metavar="DIR")
+    ap.add_argument("--replay", metavar="DIR")
+    ap.add_argument("--url", default="https://example.com")
+    ap.add_argument("--base-url", default=default_base_url())
+    args = ap.parse_args(argv)
+
+    if args.record:
+        record(args.record, args.base_url, args.url)
+        return
+    payloads = replay(args.replay) if args.replay else synthetic(args.elements)
+
+    decoders: List[str] = ["json"]
+    try:
+        get_loads("orjson")
+        decoders.append("orjson")
+    except ImportError:
+        print("(orjson not installed — pip install 'agentmb[fast]' to include it)")
+
+    for name, body in payloads.items():
+        n = len(json.loads(body).get("elements", []))
+        print(f"{name}: {n} elements, {len(body) / 1024:.0f} KiB")
+        model = _MODELS[name]
+        cases: List[Tuple[str, object]] = [
+            ("json + model_validate", lambda: _legacy(body, model)),
+            ("validated (default)", lambda: decode(model, body, json.loads, False)),
+        ]
+        for d in decoders:
+            loads = get_loads(d)
+            cases.append((f"{d} + trusted", lambda loads=loads: decode(model, body, loads, True)))
+        baseline = None
+        for label, fn in cases:
+            us = _bench(fn, args.rounds)
+            baseline = baseline or us
+            print(f"  {label:<24} {us:9.0f} µs/response   {baseline / us:4.1f}x")
+
+
+if __name__ == "__main__":
+    main()
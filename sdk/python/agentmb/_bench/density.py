@@ -0,0 +1,119 @@
+"""Session density: memory per ephemeral session (sessions per GB).
+
+Opens ephemeral sessions one by one against a daemon on this host, loads a
+small page in each, and samples the memory of the daemon's process tree
+(Linux ``/proc``: PSS when the kernel reports it, else RSS). Compare a
+daemon started normally with one in shared-browser mode::
+
+    agentmb start
+    python -m agentmb._bench.density --sessions 20
+    agentmb stop && AGENTMB_SHARED_CONTEXTS=8 agentmb start
+    python -m agentmb._bench.density --sessions 20
+
+PSS splits shared pages between the processes mapping them, so it does not
+double-count the Chromium binary the way summed RSS does.
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import os
+import time
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+from ..client import BrowserClient
+from . import default_base_url
+
+_PAGE = "data:text/html;base64," + base64.b64encode(
+    b"<h1>density</h1><script>document.body.append(new Array(2000).fill('x').join(''))</script>"
+).decode()
+
+
+def _children() -> Dict[int, List[int]]:
+    tree: Dict[int, List[int]] = {}
+    for name in os.listdir("/proc"):
+        if not name.isdigit():
+            continue
+        try:
+            with open(f"/proc/{name}/stat") as f:
+                stat = f.read()
+        except OSError:
+            continue
+        ppid = int(stat.rsplit(")", 1)[1].split()[1])
+        tree.setdefault(ppid, []).append(int(name))
+    return tree
+
+
+def _kb(path: str, field: str) -> Optional[int]:
+    try:
+        with open(path) as f:
+            for line in f:
+                if line.startswith(field):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def tree_memory(pid: int) -> Tuple[int, int, str]:
+    """``(bytes, processes, "pss"|"rss")`` for *pid* and all its descendants."""
+    tree = _children()
+    pids, stack = [], [pid]
+    while stack:
+        p = stack.pop()
+        pids.append(p)
+        stack.extend(tree.get(p, ()))
+    use_pss = _kb(f"/proc/{pid}/smaps_rollup", "Pss:") is not None
+    total = 0
+    for p in pids:
+        kb = _kb(f"/proc/{p}/smaps_rollup", "Pss:") if use_pss else _kb(f"/proc/{p}/status", "VmRSS:")
+        total += kb or 0
+    return total * 1024, len(pids), "pss" if use_pss else "rss"
+
+
+def main(argv: Optional[list] = None) -> None:
+    ap = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    ap.add_argument("--base-url", default=default_base_url())
+    ap.add_argument("--sessions", type=int, default=20)
+    ap.add_argument("--settle", type=float, default=1.0, help="seconds to wait before each sample")
+    args = ap.parse_args(argv)
+
+    if not os.path.isdir("/proc"):
+        ap.error("needs Linux /proc (the daemon must run on this host)")
+    token = os.environ.get("AGENTMB_API_TOKEN")
+    headers = {"x-api-token": token} if token else {}
+    status = httpx.get(f"{args.base_url}/api/v1/status", headers=headers).json()
+    pid = status["pid"]
+    shared = (status.get("shared_browsers") or {}).get("contexts_per_browser", 0)
+
+    with BrowserClient(base_url=args.base_url) as client:
+        time.sleep(args.settle)
+        base, procs, kind = tree_memory(pid)
+        print(f"daemon pid {pid}, shared contexts/browser: {shared or 'off'}, measuring {kind.upper()}")
+        print(f"  {'sessions':>8} {'procs':>6} {'MB':>9} {'MB/session':>11}")
+        print(f"  {0:>8} {procs:>6} {base / 2**20:9.1f} {'-':>11}")
+        sessions = []
+        try:
+            for i in range(args.sessions):
+                sess = client.sessions.create(profile=f"bench-density-{i}", ephemeral=True)
+                sessions.append(sess)
+                sess.navigate(_PAGE)
+                if (i + 1) % max(1, args.sessions // 10) and i + 1 != args.sessions:
+                    continue
+                time.sleep(args.settle)
+                used, procs, _ = tree_memory(pid)
+                per = (used - base) / (i + 1)
+                print(f"  {i + 1:>8} {procs:>6} {used / 2**20:9.1f} {per / 2**20:11.1f}")
+        finally:
+            for sess in sessions:
+                sess.close()
+
+    if sessions and per > 0:
+        print(f"~{2**30 / per:.1f} sessions per GB ({per / 2**20:.1f} MB each, above the idle daemon)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""Cold-import time of ``agentmb`` with a regression budget.
+
+Runs ``python -X importtime`` in fresh subprocesses and reports the
+cumulative import time of the ``agentmb`` package (and, separately, of
+``from agentmb import BrowserClient``, which pulls in httpx and the
+models).  Exits 1 when the median bare import exceeds ``--budget-ms`` so it
+can gate CI::
+
+    python -m agentmb._bench.import_time
+    python -m agentmb._bench.import_time --budget-ms 20 --record import_times.jsonl
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+_PKG_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+CASES = {
+    "import agentmb": "import agentmb",
+    "from agentmb import BrowserClient": "from agentmb import BrowserClient",
+}
+
+
+def _run(stmt: str) -> Dict[str, int]:
+    """One cold run of *stmt*; cumulative µs per top-level module imported."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [_PKG_ROOT, os.environ.get("PYTHONPATH")])))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", stmt],
+        capture_output=True, text=True, env=env, check=True,
+    )
+    modules: Dict[str, int] = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if not cumulative.strip().isdigit():
+            continue  # header row
+        if not name.startswith("  "):  # top-level imports only (nesting is indented)
+            modules[name.strip()] = int(cumulative)
+    return modules
+
+
+def measure(stmt: str, runs: int) -> Tuple[List[float], Dict[str, int]]:
+    """Import times in ms over *runs* cold processes, plus the module breakdown of the last run.
+
+    Modules the interpreter imports at startup anyway (``site``,
+    ``encodings``, ...) are measured with ``pass`` and left out.
+    """
+    startup = set(_run("pass"))
+    samples: List[float] = []
+    modules: Dict[str, int] = {}
+    for _ in range(runs):
+        modules = {k: v for k, v in _run(stmt).items() if k not in startup}
+        samples.append(sum(modules.values()) / 1000)
+    return samples, modules
+
+
+def main(argv: Optional[list] = None) -> int:
+    ap = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    ap.add_argument("--runs", type=int, default=7)
+    ap.add_argument("--budget-ms", type=float, default=25.0, help="max median ms for a bare `import agentmb`")
+    ap.add_argument("--top", type=int, default=5, help="slowest top-level imports to list")
+    ap.add_argument("--record", metavar="FILE", help="append results as a JSON line")
+    args = ap.parse_args(argv)
+
+    results = {}
+    for label, stmt in CASES.items():
+        samples, modules = measure(stmt, args.runs)
+        median = statistics.median(samples)
+        results[label] = {"median_ms": round(median, 2), "min_ms": round(min(samples), 2)}
+        print(f"{label:<36} median {median:7.1f} ms   min {min(samples):7.1f} ms")
+        for name, us in sorted(modules.items(), key=lambda kv: -kv[1])[: args.top]:
+            print(f"    {name:<32} {us / 1000:7.1f} ms")
+
+    if args.record:
+        with open(args.record, "a") as f:
+            f.write(json.dumps({"ts": time.time(), "python": sys.version.split()[0], **results}) + "\n")
+
+    bare = results["import agentmb"]["median_ms"]
+    if bare > args.budget_ms:
+        print(f"FAIL: import agentmb took {bare:.1f} ms (budget {args.budget_ms:.1f} ms)")
+        return 1
+    print(f"OK: import agentmb within {args.budget_ms:.1f} ms budget")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+"""Eager vs lazy list results: decode latency and memory on large pages.
+
+Builds ``ElementMapResult`` / ``SnapshotMapResult`` from a synthetic
+5 000-element body (or bodies recorded with ``agentmb._bench.decode
+--record``) and reports, per mode, the time to decode plus touch the first
+``--touch`` items, and the memory held by the result (tracemalloc)::
+
+    python -m agentmb._bench.lazy
+    python -m agentmb._bench.lazy --elements 5000 --touch 10
+    python -m agentmb._bench.lazy --replay ./payloads
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+from typing import Callable, List, Optional, Tuple
+
+from .._decode import decode, get_loads
+from .decode import _MODELS, replay, synthetic
+
+
+def _touch(result, n: int) -> None:
+    for el in result.elements[:n]:
+        el.rect.width
+
+
+def _latency(fn: Callable[[], object], touch: int, rounds: int) -> float:
+    t0 = time.perf_counter()
+    for _ in range(rounds):
+        _touch(fn(), touch)
+    return (time.perf_counter() - t0) / rounds * 1e3
+
+
+def _memory(fn: Callable[[], object], touch: int) -> Tuple[float, float]:
+    """(retained, peak) KiB allocated while building and holding one result."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        result = fn()
+        _touch(result, touch)
+        retained, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return retained / 1024, peak / 1024
+
+
+def main(argv: Optional[list] = None) -> None:
+    ap = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    ap.add_argument("--elements", type=int, default=5000)
+    ap.add_argument("--touch", type=int, default=10, help="items accessed after decode")
+    ap.add_argument("--rounds", type=int, default=20)
+    ap.add_argument("--replay", metavar="DIR")
+    args = ap.parse_args(argv)
+
+    payloads = replay(args.replay) if args.replay else synthetic(args.elements)
+    loads = get_loads("auto")
+
+    for name, body in payloads.items():
+        model = _MODELS[name]
+        n = len(json.loads(body).get("elements", []))
+        print(f"{name}: {n} elements, {len(body) / 1024:.0f} KiB, touching {min(args.touch, n)}")
+        cases: List[Tuple[str, Callable[[], object]]] = [
+            ("eager validated", lambda: decode(model, body, loads, False)),
+            ("eager trusted", lambda: decode(model, body, loads, True)),
+            ("lazy validated", lambda: decode(model, body, loads, False, lazy=True)),
+            ("lazy trusted", lambda: decode(model, body, loads, True, lazy=True)),
+        ]
+        baseline = None
+        for label, fn in cases:
+            ms = _latency(fn, args.touch, args.rounds)
+            retained, peak = _memory(fn, args.touch)
+            baseline = baseline or ms
+            print(f"  {label:<16} {ms:8.1f} ms  {baseline / ms:5.1f}x   "
+                  f"retained {retained:8.0f} KiB   peak {peak:8.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
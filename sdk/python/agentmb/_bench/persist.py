@@ -0,0 +1,134 @@
+"""Daemon event-loop lag while sessions churn (registry persistence).
+
+Every tab open / switch / close re-attaches the session in the daemon's
+registry, which may persist it (``sessions.json`` + ``sessions.journal``).
+This bench drives that churn
+from several threads while a probe thread polls ``/health`` and reports the
+probe latency plus the daemon's own event-loop delay (``/api/v1/status``).
+
+The cost of a full registry write grows with the number of sessions in it.
+To measure with a large registry, seed zombie entries first, then start the
+daemon on that data dir (``--age-days`` backdates them, for zombie GC)::
+
+    python -m agentmb._bench.persist --seed 2000 --data-dir /tmp/amb-bench
+    AGENTMB_DATA_DIR=/tmp/amb-bench agentmb start
+    python -m agentmb._bench.persist --sessions 4 --duration 10
+
+Run it against a daemon built before and after a persistence change to
+compare.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from typing import List, Optional
+
+import httpx
+
+from ..client import BrowserClient
+from . import default_base_url, percentile
+
+
+def seed(data_dir: str, count: int, age_days: float = 0.0, prefix: str = "seed") -> str:
+    """Add *count* zombie sessions created *age_days* ago to ``<data_dir>/sessions.json`` (plain JSON)."""
+    os.makedirs(data_dir, exist_ok=True)
+    path = os.path.join(data_dir, "sessions.json")
+    infos = []
+    if os.path.exists(path):
+        with open(path) as f:
+            infos = json.load(f)
+    created = datetime.fromtimestamp(time.time() - age_days * 86400, timezone.utc).isoformat()
+    infos += [
+        {"id": f"sess_{prefix}{i:07x}", "profile": f"bench-{prefix}-{i}", "headless": True,
+         "createdAt": created, "state": "zombie"}
+        for i in range(count)
+    ]
+    with open(path, "w") as f:
+        json.dump(infos, f, indent=2)
+    return path
+
+
+def _churn(sess, stop: threading.Event, ops: List[int]) -> None:
+    n = 0
+    while not stop.is_set():
+        page = sess.new_page()
+        sess.switch_page(page.page_id)
+        sess.close_page(page.page_id)
+        n += 3
+    ops.append(n)
+
+
+def _probe(base_url: str, stop: threading.Event, samples: List[float], interval: float) -> None:
+    with httpx.Client(base_url=base_url) as http:
+        while not stop.is_set():
+            t0 = time.perf_counter()
+            http.get("/health")
+            samples.append((time.perf_counter() - t0) * 1000)
+            time.sleep(interval)
+
+
+def main(argv: Optional[list] = None) -> None:
+    ap = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    ap.add_argument("--base-url", default=default_base_url())
+    ap.add_argument("--sessions", type=int, default=4, help="sessions churning tabs concurrently")
+    ap.add_argument("--duration", type=float, default=10.0, help="seconds of churn")
+    ap.add_argument("--probe-interval-ms", type=float, default=10.0)
+    ap.add_argument("--seed", type=int, default=0, help="only write N zombie sessions to --data-dir and exit")
+    ap.add_argument("--data-dir", default=None)
+    ap.add_argument("--age-days", type=float, default=0.0, help="creation age of seeded sessions")
+    args = ap.parse_args(argv)
+
+    if args.seed:
+        if not args.data_dir:
+            ap.error("--seed needs --data-dir")
+        path = seed(args.data_dir, args.seed, args.age_days)
+        print(f"wrote {args.seed} zombie sessions to {path}; start the daemon with AGENTMB_DATA_DIR={args.data_dir}")
+        return
+
+    with BrowserClient(base_url=args.base_url) as client:
+        token = os.environ.get("AGENTMB_API_TOKEN")
+        headers = {"x-api-token": token} if token else {}
+        status_url = f"{args.base_url}/api/v1/status"
+        registry_size = len(httpx.get(status_url, headers=headers).json()["sessions"])
+
+        sessions = [client.sessions.create(profile=f"bench-persist-{i}", ephemeral=True)
+                    for i in range(args.sessions)]
+        try:
+            httpx.get(status_url, params={"reset_event_loop": "1"}, headers=headers)
+            stop = threading.Event()
+            ops: List[int] = []
+            probe: List[float] = []
+            threads = [threading.Thread(target=_churn, args=(s, stop, ops)) for s in sessions]
+            threads.append(threading.Thread(
+                target=_probe, args=(args.base_url, stop, probe, args.probe_interval_ms / 1000)))
+            for t in threads:
+                t.start()
+            time.sleep(args.duration)
+            stop.set()
+            for t in threads:
+                t.join()
+            loop = httpx.get(status_url, headers=headers).json().get("event_loop", {})
+        finally:
+            for s in sessions:
+                s.close()
+
+    total = sum(ops)
+    print(f"registry: {registry_size + args.sessions} sessions, {args.sessions} churning for {args.duration:.0f}s")
+    print(f"  churn       {total} tab ops ({total / args.duration:.0f}/s, each re-attaches the session)")
+    print(
+        f"  /health     p50={percentile(probe, 50):6.2f}ms p99={percentile(probe, 99):6.2f}ms "
+        f"max={max(probe, default=0):6.2f}ms ({len(probe)} probes)"
+    )
+    if loop:
+        print(
+            f"  event loop  p50={loop['p50_ms']:6.2f}ms p99={loop['p99_ms']:6.2f}ms max={loop['max_ms']:6.2f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Requests/sec with the default httpx pool vs a tuned ``TransportConfig``.
+
+Fires ``--requests`` GETs at ``/health`` (no browser work, so the number is
+pure client + HTTP overhead) from ``--concurrency`` asyncio tasks, once per
+transport variant::
+
+    python -m agentmb._bench.transport --requests 2000 --concurrency 64
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from typing import Optional
+
+from ..client import AsyncBrowserClient
+from ..transport import SharedTransport, TransportConfig
+from . import default_base_url, percentile
+
+
+async def _run(base_url: str, transport, requests: int, concurrency: int) -> dict:
+    latencies = []
+    async with AsyncBrowserClient(base_url=base_url, transport=transport) as client:
+        await client.health()  # warm-up: open the first connection
+        remaining = requests
+
+        async def worker() -> None:
+            nonlocal remaining
+            while remaining > 0:
+                remaining -= 1
+                t0 = time.perf_counter()
+                await client.health()
+                latencies.append((time.perf_counter() - t0) * 1000)
+
+        t0 = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - t0
+    return {
+        "rps": requests / elapsed,
+        "p50_ms": percentile(latencies, 50),
+        "p99_ms": percentile(latencies, 99),
+    }
+
+
+async def main(argv: Optional[list] = None) -> None:
+    ap = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    ap.add_argument("--base-url", default=default_base_url())
+    ap.add_argument("--requests", type=int, default=2000)
+    ap.add_argument("--concurrency", type=int, default=64)
+    args = ap.parse_args(argv)
+
+    cfg = TransportConfig(
+        max_connections=args.concurrency,
+        max_keepalive_connections=args.concurrency,
+        keepalive_expiry=60.0,
+    )
+    variants = [
+        ("default (httpx limits)", None),
+        ("TransportConfig", cfg),
+        ("SharedTransport", SharedTransport(cfg)),
+    ]
+    print(f"{args.requests} requests, concurrency={args.concurrency}, {args.base_url}")
+    for label, transport in variants:
+        r = await _run(args.base_url, transport, args.requests, args.concurrency)
+        if isinstance(transport, SharedTransport):
+            await transport.aclose()
+        print(f"  {label:<24} {r['rps']:8.0f} req/s   p50={r['p50_ms']:.2f}ms  p99={r['p99_ms']:.2f}ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
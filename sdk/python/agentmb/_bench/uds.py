@@ -0,0 +1,70 @@
+"""Small-action latency over loopback TCP vs the daemon's Unix socket.
+
+Start the daemon with ``AGENTMB_SOCKET=1`` (socket at
+``<AGENTMB_DATA_DIR>/agentmb.sock``), then::
+
+    python -m agentmb._bench.uds --iterations 300
+
+One session is shared by both clients; its policy is set to ``disabled`` so
+the click numbers measure transport + Playwright only, not throttling.
+"""
+
+from __future__ import annotations
+
+import argparse
+import base64
+import time
+from typing import Callable, List, Optional
+
+from ..client import BrowserClient
+from ..transport import default_socket_path
+from . import default_base_url, percentile
+
+_PAGE = "data:text/html;base64," + base64.b64encode(
+    b"<button id=b onclick='this.dataset.n=(+this.dataset.n||0)+1'>b</button>"
+).decode()
+
+
+def _time(fn: Callable[[], object], iterations: int) -> List[float]:
+    fn()  # warm-up
+    out: List[float] = []
+    for _ in range(iterations):
+        t0 = time.perf_counter()
+        fn()
+        out.append((time.perf_counter() - t0) * 1000)
+    return out
+
+
+def main(argv: Optional[list] = None) -> None:
+    ap = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    ap.add_argument("--base-url", default=default_base_url())
+    ap.add_argument("--socket-path", default=None, help=f"default: {default_socket_path()}")
+    ap.add_argument("--iterations", type=int, default=300)
+    args = ap.parse_args(argv)
+
+    tcp = BrowserClient(base_url=args.base_url)
+    uds = BrowserClient(base_url=args.base_url, transport="uds", socket_path=args.socket_path)
+    sess = tcp.sessions.create(profile="bench-uds", ephemeral=True)
+    try:
+        sess.set_policy("disabled")
+        sess.navigate(_PAGE)
+        handles = {"tcp": sess, "uds": uds.sessions.get_handle(sess.id)}
+        print(f"{args.iterations} iterations per action")
+        for action in ("page_rev", "click"):
+            for label, h in handles.items():
+                if action == "page_rev":
+                    samples = _time(h.page_rev, args.iterations)
+                else:
+                    samples = _time(lambda: h.click("#b"), args.iterations)
+                print(
+                    f"  {action:<9}{label:<4} p50={percentile(samples, 50):6.2f}ms "
+                    f"p95={percentile(samples, 95):6.2f}ms p99={percentile(samples, 99):6.2f}ms"
+                )
+    finally:
+        sess.close()
+        tcp.close()
+        uds.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Round-trip latency over plain HTTP vs the WebSocket command channel.
+
+Runs the same small actions through ``AsyncBrowserClient()`` and
+``AsyncBrowserClient(websocket=True)`` against one session, first one at a
+time (p50 / p95 / p99 round trip), then from ``--concurrency`` tasks at
+once (requests/sec)::
+
+    python -m agentmb._bench.ws --iterations 500 --concurrency 32
+
+The session's policy is set to ``disabled`` so the numbers measure
+transport + dispatch, not throttling.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from typing import Awaitable, Callable, List, Optional
+
+from ..client import AsyncBrowserClient, AsyncSession
+from . import default_base_url, percentile
+
+
+async def _sequential(fn: Callable[[], Awaitable[object]], iterations: int) -> List[float]:
+    await fn()  # warm-up (opens the connection / channel)
+    out: List[float] = []
+    for _ in range(iterations):
+        t0 = time.perf_counter()
+        await fn()
+        out.append((time.perf_counter() - t0) * 1000)
+    return out
+
+
+async def _throughput(fn: Callable[[], Awaitable[object]], requests: int, concurrency: int) -> float:
+    remaining = requests
+
+    async def worker() -> None:
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            await fn()
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return requests / (time.perf_counter() - t0)
+
+
+async def main(argv: Optional[list] = None) -> None:
+    ap = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    ap.add_argument("--base-url", default=default_base_url())
+    ap.add_argument("--iterations", type=int, default=500)
+    ap.add_argument("--concurrency", type=int, default=32)
+    args = ap.parse_args(argv)
+
+    http = AsyncBrowserClient(base_url=args.base_url, cache=False)
+    ws = AsyncBrowserClient(base_url=args.base_url, cache=False, websocket=True)
+    sess = await http.sessions.create(profile="bench-ws", ephemeral=True)
+    try:
+        await sess.set_policy("disabled")
+        await sess.navigate("data:text/html,<h1>ws</h1>")
+        handles = {"http": sess, "ws": AsyncSession(sess.id, ws)}
+        actions = {
+            "page_rev": lambda h: h.page_rev(),
+            "mouse_move": lambda h: h.mouse_move(x=10, y=10),
+        }
+        print(f"{args.iterations} sequential round trips per action")
+        for action, call in actions.items():
+            for label, h in handles.items():
+                samples = await _sequential(lambda: call(h), args.iterations)
+                print(
+                    f"  {action:<11}{label:<5} p50={percentile(samples, 50):6.2f}ms "
+                    f"p95={percentile(samples, 95):6.2f}ms p99={percentile(samples, 99):6.2f}ms"
+                )
+        print(f"page_rev x {args.iterations}, concurrency={args.concurrency}")
+        for label, h in handles.items():
+            rps = await _throughput(h.page_rev, args.iterations, args.concurrency)
+            print(f"  {label:<5} {rps:8.0f} req/s")
+    finally:
+        await sess.close()
+        await http.close()
+        await ws.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,219 @@
+"""Response decoding for the agentmb clients.
+
+Two independent knobs, both set on the client:
+
+* ``decoder`` — how the JSON body is parsed. ``"auto"`` (default) uses
+  orjson when it is installed (``pip install 'agentmb[fast]'``) and the
+  stdlib ``json`` module otherwise; ``"json"`` / ``"orjson"`` force one.
+* ``trusted`` — how result models are built. ``False`` (default) runs full
+  pydantic validation straight from the response bytes
+  (``model_validate_json``). ``True`` parses with ``decoder`` and builds
+  models without type checks or coercion, recursing into nested models and
+  lists of models so attribute access works the same. Only use it against a
+  daemon you trust to return well-formed responses.
+
+``lazy=True`` on the client additionally leaves the list fields of
+``LazyListsModel`` results as ``LazyModelList`` (see ``agentmb.lazy``).
+"""
+
+from __future__ import annotations
+
+import json
+import typing
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+from pydantic import BaseModel
+
+from .lazy import LazyModelList
+
+Loads = Callable[[bytes], Any]
+
+
+def get_loads(decoder: str = "auto") -> Loads:
+    """Return a ``bytes -> object`` JSON decoder for the given mode."""
+    if decoder not in ("auto", "json", "orjson"):
+        raise ValueError(f"unknown decoder {decoder!r} (expected 'auto', 'json' or 'orjson')")
+    if decoder != "json":
+        try:
+            import orjson
+            return orjson.loads
+        except ImportError:
+            if decoder == "orjson":
+                raise ImportError("decoder='orjson' requires orjson: pip install 'agentmb[fast]'") from None
+    return json.loads
+
+
+# ---------------------------------------------------------------------------
+# Trusted construction (no validation)
+# ---------------------------------------------------------------------------
+
+Builder = Callable[[Any], Any]
+
+
+class _Plan:
+    """Per-model construction recipe, computed once and cached in ``_plans``."""
+
+    __slots__ = ("order", "fields", "all_set", "defaults", "factories", "nested")
+
+    def __init__(self, model: Type[BaseModel]) -> None:
+        self.order = tuple(model.model_fields)
+        self.fields = frozenset(self.order)
+        # Shared by every instance built from a complete payload.  Pydantic
+        # only ever adds field names to fields_set, which is a no-op here.
+        self.all_set = set(self.fields)
+        self.defaults: Dict[str, Any] = {}
+        factories = []
+        nested = []
+        for name, field in model.model_fields.items():
+            if field.default_factory is not None:
+                factories.append((name, field.default_factory))
+            elif not field.is_required():
+                self.defaults[name] = field.default
+            b = _builder_for(field.annotation)
+            if b is not None:
+                nested.append((name, b))
+        self.factories: Tuple[Tuple[str, Callable[[], Any]], ...] = tuple(factories)
+        self.nested: Tuple[Tuple[str, Builder], ...] = tuple(nested)
+
+
+_plans: Dict[type, _Plan] = {}
+_new = object.__new__
+_set = object.__setattr__
+
+
+def construct(model: Type[BaseModel], data: Any) -> Any:
+    """Build *model* from decoded JSON without validation.
+
+    Equivalent to a recursive ``model_construct`` (defaults filled in,
+    unknown keys dropped, ``model_fields_set`` = keys present) but writes
+    ``__dict__`` directly.  Takes ownership of *data*: when it carries
+    exactly the model's fields the dict itself becomes the instance
+    ``__dict__``.
+    """
+    if not isinstance(data, dict):
+        return data
+    plan = _plans.get(model)
+    if plan is None:
+        plan = _plans[model] = _Plan(model)
+    if data.keys() == plan.fields:
+        fields_set = plan.all_set
+    else:
+        fields_set = set(data) & plan.fields
+        values = {}
+        for name in plan.order:
+            if name in fields_set:
+                values[name] = data[name]
+            elif name in plan.defaults:
+                values[name] = plan.defaults[name]
+        for name, factory in plan.factories:
+            if name not in values:
+                values[name] = factory()
+        data = values
+    for name, b in plan.nested:
+        value = data[name]
+        if value is not None:
+            data[name] = b(value)
+    obj = _new(model)
+    _set(obj, "__dict__", data)
+    _set(obj, "__pydantic_fields_set__", fields_set)
+    _set(obj, "__pydantic_extra__", None)
+    _set(obj, "__pydantic_private__", None)
+    return obj
+
+
+def _builder_for(tp: Any) -> Optional[Builder]:
+    if isinstance(tp, type) and issubclass(tp, BaseModel):
+        return lambda v, m=tp: construct(m, v)
+    origin = typing.get_origin(tp)
+    args = typing.get_args(tp)
+    if origin is typing.Union:
+        inner = [a for a in args if a is not type(None)]
+        return _builder_for(inner[0]) if len(inner) == 1 else None
+    if origin in (list, typing.List) and args:
+        item = _builder_for(args[0])
+        if item is None:
+            return None
+        return lambda v, b=item: [b(x) for x in v] if isinstance(v, list) else v
+    if origin in (dict, typing.Dict) and len(args) == 2:
+        val = _builder_for(args[1])
+        if val is None:
+            return None
+        return lambda v, b=val: {k: b(x) for k, x in v.items()} if isinstance(v, dict) else v
+    return None
+
+
+def build(model: Any, data: Any, trusted: bool) -> Any:
+    """Build a result model (validated or trusted); ``dict`` / None pass data through."""
+    if not model or model is dict:
+        return data
+    if trusted:
+        return construct(model, data)
+    return model.model_validate(data)
+
+
+def decode(model: Any, content: bytes, loads: Loads, trusted: bool, lazy: bool = False) -> Any:
+    """Decode a raw response body into *model*.
+
+    The validated path hands the bytes straight to pydantic-core
+    (``model_validate_json``), which parses and validates in one pass and
+    skips building an intermediate Python dict.
+    """
+    if lazy and model and _lazy_fields(model):
+        return build_lazy(model, loads(content), trusted)
+    if model and model is not dict and not trusted:
+        return model.model_validate_json(content)
+    return build(model, loads(content), trusted)
+
+
+# ---------------------------------------------------------------------------
+# Lazy list fields
+# ---------------------------------------------------------------------------
+
+_lazy_plans: Dict[type, Tuple[Tuple[str, Any], ...]] = {}
+
+
+def _lazy_fields(model: Any) -> Tuple[Tuple[str, Any], ...]:
+    """``(name, item type)`` for each list field of a ``LazyListsModel``."""
+    plan = _lazy_plans.get(model)
+    if plan is None:
+        from .models import LazyListsModel
+        fields = []
+        if isinstance(model, type) and issubclass(model, LazyListsModel):
+            for name, field in model.model_fields.items():
+                if typing.get_origin(field.annotation) in (list, typing.List):
+                    args = typing.get_args(field.annotation)
+                    fields.append((name, args[0] if args else Any))
+        plan = _lazy_plans[model] = tuple(fields)
+    return plan
+
+
+def item_builder(item: Any, trusted: bool) -> Callable[[Any], Any]:
+    """Per-item build function for a ``LazyModelList`` of *item*."""
+    if not (isinstance(item, type) and issubclass(item, BaseModel)):
+        return lambda v: v
+    if trusted:
+        return lambda v: construct(item, v)
+    return item.model_validate
+
+
+def lazy_list(item: Any, raw: List[Any], trusted: bool) -> LazyModelList:
+    return LazyModelList(raw, item_builder(item, trusted))
+
+
+def build_lazy(model: Type[BaseModel], data: Any, trusted: bool) -> Any:
+    """Build *model* with its list fields left as ``LazyModelList``.
+
+    The rest of the result is built as usual (validated unless trusted).
+    """
+    if not isinstance(data, dict):
+        return build(model, data, trusted)
+    raws = {}
+    for name, item in _lazy_fields(model):
+        value = data.get(name)
+        if isinstance(value, list):
+            raws[name] = (item, value)
+            data[name] = []
+    obj = build(model, data, trusted)
+    for name, (item, value) in raws.items():
+        obj.__dict__[name] = lazy_list(item, value, trusted)
+    return obj
@@ -0,0 +1,70 @@
+"""Conditional-GET cache for cheap, frequently polled read endpoints.
+
+``page_rev``, ``pages``, ``settings``, ``get_policy``, ``routes`` and
+``cookies`` are answered by the daemon with a weak ``ETag``.  The client
+keeps the last body per URL and revalidates with ``If-None-Match``; an
+unchanged resource comes back as an empty ``304`` and the cached body is
+decoded instead.  Results are always fresh model objects, so callers may
+mutate them freely.
+
+The cache is on by default (``BrowserClient(cache=False)`` turns it off),
+holds at most *max_entries* bodies across all sessions and drops a
+session's entries when the session is closed.  ``client.metrics.not_modified``
+counts revalidations that avoided a body.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+_SESSIONS = "/api/v1/sessions/"
+
+
+class ResponseCache:
+    """LRU of ``path -> (etag, body bytes)``."""
+
+    def __init__(self, max_entries: int = 256) -> None:
+        self._max = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[str, bytes]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def etag(self, path: str) -> Optional[str]:
+        """Validator to send as ``If-None-Match`` for *path*, if cached."""
+        with self._lock:
+            entry = self._entries.get(path)
+        return entry[0] if entry else None
+
+    def body(self, path: str) -> Optional[bytes]:
+        """Cached body for *path* (after a 304), marking it recently used."""
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is None:
+                return None
+            self._entries.move_to_end(path)
+            return entry[1]
+
+    def store(self, path: str, etag: Optional[str], body: bytes) -> None:
+        with self._lock:
+            if not etag:
+                self._entries.pop(path, None)
+                return
+            self._entries[path] = (etag, body)
+            self._entries.move_to_end(path)
+            while len(self._entries) > self._max:
+                self._entries.popitem(last=False)
+
+    def drop_session(self, session_id: str) -> None:
+        """Forget every cached response of *session_id*."""
+        prefix = f"{_SESSIONS}{session_id}/"
+        with self._lock:
+            for path in [p for p in self._entries if p.startswith(prefix)]:
+                del self._entries[path]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
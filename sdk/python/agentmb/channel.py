@@ -0,0 +1,299 @@
+"""WebSocket command channel: many API requests over one connection.
+
+``AsyncBrowserClient(websocket=True)`` sends its requests through the
+daemon's ``GET /api/v1/ws`` channel instead of one HTTP request each. The
+channel is an httpx transport, so everything above it — retries, hooks,
+ETag cache, decoding — is unchanged. Each message is a JSON header line
+followed by the raw body (see ``src/daemon/ws.ts``); responses are matched
+to requests by id, so concurrent requests share the connection freely.
+
+Streaming uploads / downloads and event streams still use plain HTTP, and
+so does every request if the daemon does not offer the channel (older
+daemons answer the upgrade with 404). A dropped connection fails the requests in flight with
+``httpx.ReadError`` (retryable under the client's retry policy) and is
+re-established by the next request.
+
+Only the standard library is used: the framing is the small subset of
+RFC 6455 the daemon speaks (binary messages, ping / pong / close).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import hashlib
+import itertools
+import json
+import os
+import re
+import struct
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+
+from .transport import SharedTransport, TransportConfig, TransportLike, _from_name
+
+CHANNEL_PATH = "/api/v1/ws"
+
+_WS_GUID = b"258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+_MAX_MESSAGE_BYTES = 64 * 2**20
+# Sent once on the upgrade request and applied by the daemon to every command
+_CONNECTION_HEADERS = ("x-api-token", "authorization", "x-operator", "x-agentmb-timings")
+# Forwarded per command (the rest describe the HTTP connection, not the request)
+_REQUEST_HEADERS = ("content-type", "if-none-match", "x-agentmb-timings")
+_STREAMING = re.compile(r"/(upload|download)/stream$|^/api/v1/sessions/[^/]+/events$")
+
+_OP_CONT, _OP_BINARY, _OP_CLOSE, _OP_PING, _OP_PONG = 0x0, 0x2, 0x8, 0x9, 0xA
+
+
+class ChannelUnavailable(Exception):
+    """The daemon answered the upgrade with something other than 101."""
+
+
+def _mask(data: bytes, key: bytes) -> bytes:
+    if not data:
+        return data
+    n = len(data)
+    pad = (key * (n // 4 + 1))[:n]
+    return (int.from_bytes(data, "big") ^ int.from_bytes(pad, "big")).to_bytes(n, "big")
+
+
+def _frame(opcode: int, payload: bytes) -> bytes:
+    n = len(payload)
+    if n < 126:
+        head = struct.pack("!BB", 0x80 | opcode, 0x80 | n)
+    elif n < 65536:
+        head = struct.pack("!BBH", 0x80 | opcode, 0x80 | 126, n)
+    else:
+        head = struct.pack("!BBQ", 0x80 | opcode, 0x80 | 127, n)
+    key = os.urandom(4)
+    return head + key + _mask(payload, key)
+
+
+class CommandChannel:
+    """One WebSocket connection to the daemon with id-matched request / response."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self._reader = reader
+        self._writer = writer
+        self._ids = itertools.count(1)
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._drain_lock = asyncio.Lock()
+        self._error: Optional[BaseException] = None
+        self._reader_task = asyncio.get_running_loop().create_task(self._read_loop())
+
+    @classmethod
+    async def connect(
+        cls, url: httpx.URL, headers: Dict[str, str], uds: Optional[str] = None,
+    ) -> "CommandChannel":
+        """Open the channel at ``url`` (http/https base of the daemon); raises ``ChannelUnavailable`` on refusal."""
+        host = url.host
+        port = url.port or (443 if url.scheme == "https" else 80)
+        if uds:
+            reader, writer = await asyncio.open_unix_connection(uds)
+        else:
+            reader, writer = await asyncio.open_connection(host, port, ssl=url.scheme == "https" or None)
+        key = base64.b64encode(os.urandom(16)).decode()
+        lines = [
+            f"GET {CHANNEL_PATH} HTTP/1.1",
+            f"Host: {host}:{port}",
+            "Upgrade: websocket",
+            "Connection: Upgrade",
+            f"Sec-WebSocket-Key: {key}",
+            "Sec-WebSocket-Version: 13",
+        ] + [f"{k}: {v}" for k, v in headers.items()]
+        writer.write(("\r\n".join(lines) + "\r\n\r\n").encode())
+        try:
+            head = await reader.readuntil(b"\r\n\r\n")
+        except (asyncio.IncompleteReadError, asyncio.LimitOverrunError) as exc:
+            writer.close()
+            raise ChannelUnavailable(f"no upgrade response: {exc}") from None
+        status_line, *header_lines = head.decode("latin-1").split("\r\n")
+        parts = status_line.split(" ", 2)
+        if len(parts) < 2 or parts[1] != "101":
+            writer.close()
+            raise ChannelUnavailable(status_line)
+        expected = base64.b64encode(hashlib.sha1(key.encode() + _WS_GUID).digest()).decode()
+        got = {
+            name.strip().lower(): value.strip()
+            for name, _, value in (h.partition(":") for h in header_lines if h)
+        }
+        if got.get("sec-websocket-accept") != expected:
+            writer.close()
+            raise ChannelUnavailable("bad Sec-WebSocket-Accept")
+        return cls(reader, writer)
+
+    @property
+    def closed(self) -> bool:
+        return self._reader_task.done()
+
+    async def request(
+        self, method: str, path: str, headers: Dict[str, str], body: bytes,
+    ) -> Tuple[int, Dict[str, str], bytes]:
+        """Send one command; returns ``(status, headers, body)``. Raises ``ConnectionError`` if the channel drops."""
+        if self.closed:
+            raise ConnectionError(f"command channel closed: {self._error}")
+        rid = next(self._ids)
+        fut = asyncio.get_running_loop().create_future()
+        self._pending[rid] = fut
+        head = json.dumps({"id": rid, "method": method, "path": path, "headers": headers}, separators=(",", ":"))
+        try:
+            await self._send(_OP_BINARY, head.encode() + b"\n" + body)
+            return await fut
+        finally:
+            self._pending.pop(rid, None)
+
+    async def aclose(self) -> None:
+        if not self.closed:
+            try:
+                await self._send(_OP_CLOSE, struct.pack("!H", 1000))
+            except (ConnectionError, OSError):
+                pass
+            self._reader_task.cancel()
+            try:
+                await self._reader_task
+            except (asyncio.CancelledError, Exception):
+                pass
+        self._writer.close()
+
+    async def _send(self, opcode: int, payload: bytes) -> None:
+        self._writer.write(_frame(opcode, payload))
+        if self._writer.transport.get_write_buffer_size() > 2**16:
+            async with self._drain_lock:
+                await self._writer.drain()
+
+    async def _read_message(self) -> Optional[bytes]:
+        """Next data message; None once the daemon closes the channel."""
+        fragments: List[bytes] = []
+        size = 0
+        while True:
+            b0, b1 = await self._reader.readexactly(2)
+            n = b1 & 0x7F
+            if n == 126:
+                (n,) = struct.unpack("!H", await self._reader.readexactly(2))
+            elif n == 127:
+                (n,) = struct.unpack("!Q", await self._reader.readexactly(8))
+            if n > _MAX_MESSAGE_BYTES or size + n > _MAX_MESSAGE_BYTES:
+                raise ConnectionError(f"command channel message over {_MAX_MESSAGE_BYTES} bytes")
+            key = await self._reader.readexactly(4) if b1 & 0x80 else None
+            payload = await self._reader.readexactly(n)
+            if key:
+                payload = _mask(payload, key)
+            opcode = b0 & 0x0F
+            if opcode == _OP_PING:
+                self._writer.write(_frame(_OP_PONG, payload))
+            elif opcode == _OP_CLOSE:
+                return None
+            elif opcode != _OP_PONG:
+                fragments.append(payload)
+                size += n
+                if b0 & 0x80:
+                    return b"".join(fragments)
+
+    async def _read_loop(self) -> None:
+        try:
+            while True:
+                message = await self._read_message()
+                if message is None:
+                    self._error = ConnectionError("closed by daemon")
+                    break
+                head, _, body = message.partition(b"\n")
+                meta = json.loads(head)
+                fut = self._pending.get(meta.get("id"))
+                if fut is not None and not fut.done():
+                    fut.set_result((meta["status"], meta.get("headers") or {}, body))
+        except asyncio.CancelledError:
+            self._error = ConnectionError("closed by client")
+            raise
+        except (asyncio.IncompleteReadError, ConnectionError, OSError, ValueError) as exc:
+            self._error = exc
+        finally:
+            for fut in self._pending.values():
+                if not fut.done():
+                    fut.set_exception(ConnectionError(f"command channel lost: {self._error}"))
+
+
+class CommandChannelTransport(httpx.AsyncBaseTransport):
+    """httpx transport that routes API requests over a ``CommandChannel``.
+
+    ``inner`` handles everything the channel does not carry (streaming
+    uploads / downloads, and all requests when the daemon has no channel).
+    """
+
+    def __init__(self, inner: httpx.AsyncBaseTransport, uds: Optional[str] = None) -> None:
+        self._inner = inner
+        self._uds = uds
+        self._channel: Optional[CommandChannel] = None
+        self._connect_lock = asyncio.Lock()
+        self._unavailable = False
+
+    @property
+    def active(self) -> bool:
+        """True while requests are going over the channel (False before the first request or after fallback)."""
+        return self._channel is not None and not self._channel.closed
+
+    def _eligible(self, request: httpx.Request) -> bool:
+        path = request.url.path
+        return (
+            not self._unavailable
+            and path.startswith("/api/v1/")
+            and path != CHANNEL_PATH
+            and not _STREAMING.search(path)
+            and isinstance(request.stream, httpx.ByteStream)
+        )
+
+    async def _channel_for(self, request: httpx.Request) -> Optional[CommandChannel]:
+        if self.active:
+            return self._channel
+        async with self._connect_lock:
+            if self.active or self._unavailable:
+                return self._channel if self.active else None
+            headers = {k: request.headers[k] for k in _CONNECTION_HEADERS if k in request.headers}
+            try:
+                self._channel = await CommandChannel.connect(request.url, headers, self._uds)
+            except ChannelUnavailable:
+                self._unavailable = True
+                return None
+            except OSError as exc:
+                raise httpx.ConnectError(str(exc), request=request) from exc
+            return self._channel
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        channel = await self._channel_for(request) if self._eligible(request) else None
+        if channel is None:
+            return await self._inner.handle_async_request(request)
+
+        target = request.url.raw_path.decode("ascii")
+        headers = {k: request.headers[k] for k in _REQUEST_HEADERS if k in request.headers}
+        timeout = (request.extensions.get("timeout") or {}).get("read")
+        try:
+            status, resp_headers, body = await asyncio.wait_for(
+                channel.request(request.method, target, headers, request.content), timeout,
+            )
+        except asyncio.TimeoutError:
+            raise httpx.ReadTimeout("command channel request timed out", request=request) from None
+        except (ConnectionError, OSError) as exc:
+            raise httpx.ReadError(str(exc), request=request) from exc
+        return httpx.Response(
+            status,
+            headers=[(k, v) for k, vs in resp_headers.items() for v in (vs if isinstance(vs, list) else [vs])],
+            content=body,
+            request=request,
+        )
+
+    async def aclose(self) -> None:
+        if self._channel is not None:
+            await self._channel.aclose()
+            self._channel = None
+        await self._inner.aclose()
+
+
+def socket_path_of(transport: TransportLike, socket_path: Optional[str] = None) -> Optional[str]:
+    """Unix socket the client's transport talks to, if any (the channel uses the same one)."""
+    if isinstance(transport, str):
+        transport = _from_name(transport, socket_path)
+    if isinstance(transport, SharedTransport):
+        transport = transport.config
+    if isinstance(transport, TransportConfig):
+        return transport.uds
+    return None
@@ -2,12 +2,24 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
+import time
 from contextlib import asynccontextmanager, contextmanager
-from typing import AsyncGenerator, Generator, List, Optional
+from typing import Any, AsyncGenerator, AsyncIterator, Awaitable, BinaryIO, Callable, Generator, Iterable, Iterator, List, Optional, Tuple, Union
 
 import httpx
 
+from ._decode import build as _build_model, decode as _decode_body, get_loads, lazy_list as _lazy_list
+from .cache import ResponseCache
+from .fanout import FanOutResult, fan_out_async, fan_out_sync
+from .instrument import Hooks
+from .retry import (
+    Attempts, ClientMetrics, RefIndex, RetryPolicy, error_code, remap_request, remapped_body,
+    resolve_policy, snapshot_elements,
+)
+from .transport import TransportLike, build_async_transport, build_sync_transport
+
 from .models import (
     ActionResult,
     AttachResult,
@@ -36,19 +48,24 @@ from .models import (
 
 _DEFAULT_BASE_URL = "http://127.0.0.1:19315"
 
+# Chunk size for streamed binary bodies (screenshots, downloads)
+_STREAM_CHUNK_SIZE = 256 * 1024
+
 
 def _base_url() -> str:
     port = os.environ.get("AGENTMB_PORT", "19315")
     return f"http://127.0.0.1:{port}"
 
 
-def _base_headers(api_token: Optional[str], operator: Optional[str] = None) -> dict:
+def _base_headers(api_token: Optional[str], operator: Optional[str] = None, timings: bool = False) -> dict:
     """Headers that go on every request (no content-type — set per-method)."""
     h: dict = {}
     if api_token:
         h["X-API-Token"] = api_token
     if operator:
         h["X-Operator"] = operator
+    if timings:
+        h["X-Agentmb-Timings"] = "1"
     return h
 
 
@@ -57,6 +74,66 @@ def _headers(api_token: Optional[str]) -> dict:
     return _base_headers(api_token)
 
 
+def _open_upload(selector: str, file, filename: Optional[str], mime_type: Optional[str],
+                 purpose: Optional[str], operator: Optional[str]) -> Tuple[BinaryIO, bool, dict]:
+    """Open *file* (path or binary file object) and build the /upload/stream query."""
+    import mimetypes
+    if isinstance(file, (str, os.PathLike)):
+        f, should_close = open(file, "rb"), True
+        name = filename or os.path.basename(os.fspath(file))
+    else:
+        f, should_close = file, False
+        name = filename or os.path.basename(getattr(file, "name", "") or "") or "upload.bin"
+    if mime_type is None:
+        guessed, _ = mimetypes.guess_type(name)
+        mime_type = guessed or "application/octet-stream"
+    params: dict = {"selector": selector, "filename": name, "mime_type": mime_type}
+    if purpose: params["purpose"] = purpose
+    if operator: params["operator"] = operator
+    return f, should_close, params
+
+
+def _remaining_size(f: BinaryIO) -> Optional[int]:
+    """Bytes left to read in *f*, or None for pipes / unseekable streams."""
+    try:
+        return os.fstat(f.fileno()).st_size - f.tell()
+    except (AttributeError, OSError, ValueError):
+        return None
+
+
+def _iter_file(f: BinaryIO) -> Iterator[bytes]:
+    while True:
+        chunk = f.read(_STREAM_CHUNK_SIZE)
+        if not chunk:
+            return
+        yield chunk
+
+
+async def _aiter_file(f: BinaryIO) -> AsyncIterator[bytes]:
+    import asyncio
+    while True:
+        chunk = await asyncio.to_thread(f.read, _STREAM_CHUNK_SIZE)
+        if not chunk:
+            return
+        yield chunk
+
+
+def _download_to_result(path: str, headers: httpx.Headers, size: int, t0: float) -> "DownloadToResult":
+    from urllib.parse import unquote
+    from .models import DownloadToResult
+    server_ms = int(headers.get("x-duration-ms", 0))
+    transfer_s = max(time.perf_counter() - t0 - server_ms / 1000.0, 1e-6)
+    return DownloadToResult(
+        status="ok",
+        path=path,
+        filename=unquote(headers.get("x-filename", os.path.basename(path))),
+        size_bytes=size,
+        duration_ms=server_ms,
+        transfer_ms=int(transfer_s * 1000),
+        bytes_per_sec=size / transfer_s,
+    )
+
+
 # ---------------------------------------------------------------------------
 # Sync session handle
 # ---------------------------------------------------------------------------
@@ -138,17 +215,30 @@ class Session:
             body["operator"] = operator
         return self._client._post(f"/api/v1/sessions/{self.id}/extract", body, ExtractResult)
 
-    def screenshot(self, format: str = "png", full_page: bool = False, purpose: Optional[str] = None, operator: Optional[str] = None) -> ScreenshotResult:
+    def screenshot(self, format: str = "png", full_page: bool = False, purpose: Optional[str] = None, operator: Optional[str] = None, raw: bool = False, path: Optional[str] = None) -> Union[ScreenshotResult, bytes, "ScreenshotFileResult"]:
+        """Capture a screenshot.
+
+        Default returns ``ScreenshotResult`` (base64 in JSON). ``raw=True``
+        returns the image bytes from ``/screenshot/raw``; ``path=`` streams
+        those bytes straight to a file and returns ``ScreenshotFileResult``.
+        """
         body: dict = {"format": format, "full_page": full_page}
         if purpose:
             body["purpose"] = purpose
         if operator:
             body["operator"] = operator
+        if path:
+            from .models import ScreenshotFileResult
+            headers, size = self._client._stream_to_file("POST", f"/api/v1/sessions/{self.id}/screenshot/raw", path, json=body)
+            return ScreenshotFileResult(status="ok", path=path, format=format, size_bytes=size,
+                                        duration_ms=int(headers.get("x-duration-ms", 0)))
+        if raw:
+            return self._client._post_bytes(f"/api/v1/sessions/{self.id}/screenshot/raw", body)
         return self._client._post(f"/api/v1/sessions/{self.id}/screenshot", body, ScreenshotResult)
 
     def logs(self, tail: int = 20) -> List[AuditEntry]:
         raw = self._client._get(f"/api/v1/sessions/{self.id}/logs?tail={tail}")
-        return [AuditEntry.model_validate(e) for e in raw]
+        return self._client._build_list(AuditEntry, raw)
 
     def cdp_info(self) -> dict:
         """Return CDP target info for this session's page."""
@@ -162,6 +252,25 @@ class Session:
             dict,
         )
 
+    def cdp_send_many(self, commands: list, parallel: bool = False, stop_on_error: bool = False, purpose: Optional[str] = None, operator: Optional[str] = None) -> "CdpBatchResult":
+        """Run several CDP commands on the page's CDP session in one request.
+
+        Args:
+            commands: List of {'method': str, 'params': dict} dicts (at most 100),
+                or (method, params) tuples.
+            parallel: Send all commands at once instead of in order.
+            stop_on_error: In order only — skip the rest after the first failure.
+
+        Failures are reported per command (``results[i].error``); the call itself
+        only raises for a bad request or a missing session.
+        """
+        from .models import CdpBatchResult
+        cmds = [c if isinstance(c, dict) else {"method": c[0], "params": c[1] if len(c) > 1 else {}} for c in commands]
+        body: dict = {"commands": cmds, "parallel": parallel, "stop_on_error": stop_on_error}
+        if purpose: body["purpose"] = purpose
+        if operator: body["operator"] = operator
+        return self._client._post(f"/api/v1/sessions/{self.id}/cdp/batch", body, CdpBatchResult)
+
     def cdp_ws_url(self) -> dict:
         """Return the browser-level CDP WebSocket URL for native DevTools connection."""
         return self._client._get(f"/api/v1/sessions/{self.id}/cdp/ws")
@@ -190,7 +299,7 @@ class Session:
     def routes(self) -> "RouteListResult":
         """List all active network route mocks for this session."""
         from .models import RouteListResult as _R
-        return self._client._get(f"/api/v1/sessions/{self.id}/routes", _R)
+        return self._client._get_cached(f"/api/v1/sessions/{self.id}/routes", _R)
 
     def route(self, pattern: str, mock: Optional[dict] = None) -> dict:
         """Register a network route mock (intercept requests matching pattern)."""
@@ -256,19 +365,22 @@ class Session:
         if operator: body["operator"] = operator
         return self._client._post(f"/api/v1/sessions/{self.id}/wait_for_response", body, WaitForResponseResult)
 
-    def upload(self, selector: str, file_path: str, mime_type: Optional[str] = None, purpose: Optional[str] = None, operator: Optional[str] = None) -> UploadResult:
-        import base64 as _b64
-        import mimetypes as _mt
-        import os as _os
-        with open(file_path, "rb") as f:
-            content = _b64.b64encode(f.read()).decode()
-        if mime_type is None:
-            guessed, _ = _mt.guess_type(file_path)
-            mime_type = guessed or "application/octet-stream"
-        body: dict = {"selector": selector, "content": content, "filename": _os.path.basename(file_path), "mime_type": mime_type}
-        if purpose: body["purpose"] = purpose
-        if operator: body["operator"] = operator
-        return self._client._post(f"/api/v1/sessions/{self.id}/upload", body, UploadResult)
+    def upload(self, selector: str, file_path: Union[str, "os.PathLike[str]", BinaryIO], mime_type: Optional[str] = None, purpose: Optional[str] = None, operator: Optional[str] = None, filename: Optional[str] = None) -> UploadResult:
+        """Upload a file to an ``<input type="file">``.
+
+        *file_path* may be a path or a binary file object. The bytes are
+        streamed to POST /upload/stream in chunks — the file is never read
+        into memory whole. ``filename`` defaults to the path's basename.
+        """
+        f, should_close, params = _open_upload(selector, file_path, filename, mime_type, purpose, operator)
+        try:
+            return self._client._post_content(
+                f"/api/v1/sessions/{self.id}/upload/stream", params,
+                _iter_file(f), _remaining_size(f), UploadResult,
+            )
+        finally:
+            if should_close:
+                f.close()
 
     def download(self, selector: Optional[str] = None, element_id: Optional[str] = None, ref_id: Optional[str] = None, timeout_ms: int = 30000, purpose: Optional[str] = None, operator: Optional[str] = None) -> DownloadResult:
         body: dict = {"timeout_ms": timeout_ms}
@@ -279,13 +391,31 @@ class Session:
         if operator: body["operator"] = operator
         return self._client._post(f"/api/v1/sessions/{self.id}/download", body, DownloadResult)
 
+    def download_to(self, path: str, selector: Optional[str] = None, element_id: Optional[str] = None, ref_id: Optional[str] = None, timeout_ms: int = 30000, max_bytes: Optional[int] = None, purpose: Optional[str] = None, operator: Optional[str] = None) -> "DownloadToResult":
+        """Trigger a download and stream it to *path* in fixed-size chunks.
+
+        Uses POST /download/stream, so neither process holds the whole file in
+        memory. Requires a session created with accept_downloads=True.
+        """
+        from .models import DownloadToResult
+        body: dict = {"timeout_ms": timeout_ms}
+        if ref_id: body["ref_id"] = ref_id
+        elif element_id: body["element_id"] = element_id
+        elif selector: body["selector"] = selector
+        if max_bytes is not None: body["max_bytes"] = max_bytes
+        if purpose: body["purpose"] = purpose
+        if operator: body["operator"] = operator
+        t0 = time.perf_counter()
+        headers, size = self._client._stream_to_file("POST", f"/api/v1/sessions/{self.id}/download/stream", path, json=body)
+        return _download_to_result(path, headers, size, t0)
+
     # ------------------------------------------------------------------
     # Multi-page management (T03)
     # ------------------------------------------------------------------
 
     def pages(self) -> PageListResult:
         """List all open pages in this session."""
-        return self._client._get(f"/api/v1/sessions/{self.id}/pages", PageListResult)
+        return self._client._get_cached(f"/api/v1/sessions/{self.id}/pages", PageListResult)
 
     def new_page(self) -> NewPageResult:
         """Open a new tab/page in this session."""
@@ -339,7 +469,7 @@ class Session:
     def get_policy(self) -> "PolicyInfo":
         """Get the current safety execution policy for this session."""
         from .models import PolicyInfo
-        return self._client._get(f"/api/v1/sessions/{self.id}/policy", PolicyInfo)
+        return self._client._get_cached(f"/api/v1/sessions/{self.id}/policy", PolicyInfo)
 
     # -----------------------------------------------------------------------
     # R07-T01/T02/T07: element map, read primitives, stability gate
@@ -494,12 +624,14 @@ class Session:
             body["purpose"] = purpose
         if operator:
             body["operator"] = operator
-        return self._client._post(f"/api/v1/sessions/{self.id}/snapshot_map", body, SnapshotMapResult)
+        result = self._client._post(f"/api/v1/sessions/{self.id}/snapshot_map", body, SnapshotMapResult)
+        self._client._remember_snapshot(self.id, body, result)
+        return result
 
     def page_rev(self) -> "PageRevResult":
         """Return current page revision counter (R08-R12). Use to detect page changes since last snapshot."""
         from .models import PageRevResult
-        return self._client._get(f"/api/v1/sessions/{self.id}/page_rev", PageRevResult)
+        return self._client._get_cached(f"/api/v1/sessions/{self.id}/page_rev", PageRevResult)
 
     # ── R07-T03: Interaction primitives ─────────────────────────────────────
 
@@ -699,7 +831,7 @@ class Session:
         """List all cookies for this session. Optionally filter by URL list."""
         from .models import CookieListResult
         qs = ("?urls=" + ",".join(urls)) if urls else ""
-        return self._client._get(f"/api/v1/sessions/{self.id}/cookies{qs}", CookieListResult)
+        return self._client._get_cached(f"/api/v1/sessions/{self.id}/cookies{qs}", CookieListResult)
 
     def add_cookies(self, cookies: list) -> dict:
         """Add cookies to this session. Each cookie must have at least name, value, domain."""
@@ -834,6 +966,20 @@ class Session:
         """Clear the dialog history buffer for this session."""
         self._client._delete(f"/api/v1/sessions/{self.id}/dialogs")
 
+    # ── Event stream ─────────────────────────────────────────────────────────
+
+    def events(self, types: Optional[List[str]] = None, since: Optional[int] = None,
+               reconnect: bool = True) -> Iterator["SessionEvent"]:
+        """Yield console / page_error / dialog / framenavigated / page_rev events as they happen.
+
+        ``types`` limits the stream to those event types; ``since`` first replays
+        retained events after that ``seq``. Ends after ``session_closed`` or when the
+        daemon shuts down; a dropped connection is resumed from the last event seen
+        (``reconnect=False`` raises instead), with a ``gap`` event if some were lost.
+        See ``agentmb.events``.
+        """
+        return self._client._stream_events(f"/api/v1/sessions/{self.id}/events", types, since, reconnect)
+
     # ── R07-T23: Clipboard ───────────────────────────────────────────────────
 
     def clipboard_write(self, text: str, purpose: Optional[str] = None, operator: Optional[str] = None) -> "ClipboardWriteResult":
@@ -895,7 +1041,7 @@ class Session:
     def get_settings(self) -> "SessionSettings":
         """Return current browser settings (viewport, user agent, url, headless, profile)."""
         from .models import SessionSettings
-        return self._client._get(f"/api/v1/sessions/{self.id}/settings", SessionSettings)
+        return self._client._get_cached(f"/api/v1/sessions/{self.id}/settings", SessionSettings)
 
     # ── R08-R15: Cookie delete by name ───────────────────────────────────────
 
@@ -963,6 +1109,7 @@ class Session:
 
     def close(self) -> None:
         self._client._delete(f"/api/v1/sessions/{self.id}")
+        self._client._forget_session(self.id)
 
     def __enter__(self) -> "Session":
         return self
@@ -1052,17 +1199,25 @@ class AsyncSession:
             body["operator"] = operator
         return await self._client._post(f"/api/v1/sessions/{self.id}/extract", body, ExtractResult)
 
-    async def screenshot(self, format: str = "png", full_page: bool = False, purpose: Optional[str] = None, operator: Optional[str] = None) -> ScreenshotResult:
+    async def screenshot(self, format: str = "png", full_page: bool = False, purpose: Optional[str] = None, operator: Optional[str] = None, raw: bool = False, path: Optional[str] = None) -> Union[ScreenshotResult, bytes, "ScreenshotFileResult"]:
+        """Capture a screenshot (see ``Session.screenshot`` for ``raw`` / ``path``)."""
         body: dict = {"format": format, "full_page": full_page}
         if purpose:
             body["purpose"] = purpose
         if operator:
             body["operator"] = operator
+        if path:
+            from .models import ScreenshotFileResult
+            headers, size = await self._client._stream_to_file("POST", f"/api/v1/sessions/{self.id}/screenshot/raw", path, json=body)
+            return ScreenshotFileResult(status="ok", path=path, format=format, size_bytes=size,
+                                        duration_ms=int(headers.get("x-duration-ms", 0)))
+        if raw:
+            return await self._client._post_bytes(f"/api/v1/sessions/{self.id}/screenshot/raw", body)
         return await self._client._post(f"/api/v1/sessions/{self.id}/screenshot", body, ScreenshotResult)
 
     async def logs(self, tail: int = 20) -> List[AuditEntry]:
         raw = await self._client._get(f"/api/v1/sessions/{self.id}/logs?tail={tail}")
-        return [AuditEntry.model_validate(e) for e in raw]
+        return self._client._build_list(AuditEntry, raw)
 
     async def cdp_info(self) -> dict:
         """Return CDP target info for this session's page."""
@@ -1076,6 +1231,25 @@ class AsyncSession:
             dict,
         )
 
+    async def cdp_send_many(self, commands: list, parallel: bool = False, stop_on_error: bool = False, purpose: Optional[str] = None, operator: Optional[str] = None) -> "CdpBatchResult":
+        """Run several CDP commands on the page's CDP session in one request.
+
+        Args:
+            commands: List of {'method': str, 'params': dict} dicts (at most 100),
+                or (method, params) tuples.
+            parallel: Send all commands at once instead of in order.
+            stop_on_error: In order only — skip the rest after the first failure.
+
+        Failures are reported per command (``results[i].error``); the call itself
+        only raises for a bad request or a missing session.
+        """
+        from .models import CdpBatchResult
+        cmds = [c if isinstance(c, dict) else {"method": c[0], "params": c[1] if len(c) > 1 else {}} for c in commands]
+        body: dict = {"commands": cmds, "parallel": parallel, "stop_on_error": stop_on_error}
+        if purpose: body["purpose"] = purpose
+        if operator: body["operator"] = operator
+        return await self._client._post(f"/api/v1/sessions/{self.id}/cdp/batch", body, CdpBatchResult)
+
     async def cdp_ws_url(self) -> dict:
         """Return the browser-level CDP WebSocket URL for native DevTools connection."""
         return await self._client._get(f"/api/v1/sessions/{self.id}/cdp/ws")
@@ -1104,7 +1278,7 @@ class AsyncSession:
     async def routes(self) -> "RouteListResult":
         """List all active network route mocks for this session."""
         from .models import RouteListResult as _R
-        return await self._client._get(f"/api/v1/sessions/{self.id}/routes", _R)
+        return await self._client._get_cached(f"/api/v1/sessions/{self.id}/routes", _R)
 
     async def route(self, pattern: str, mock: Optional[dict] = None) -> dict:
         """Register a network route mock."""
@@ -1170,22 +1344,20 @@ class AsyncSession:
         if operator: body["operator"] = operator
         return await self._client._post(f"/api/v1/sessions/{self.id}/wait_for_response", body, WaitForResponseResult)
 
-    async def upload(self, selector: str, file_path: str, mime_type: Optional[str] = None, purpose: Optional[str] = None, operator: Optional[str] = None) -> UploadResult:
-        import base64 as _b64
-        import mimetypes as _mt
-        import os as _os
-        import asyncio as _asyncio
-        def _read() -> str:
-            with open(file_path, "rb") as f:
-                return _b64.b64encode(f.read()).decode()
-        content = await _asyncio.to_thread(_read)
-        if mime_type is None:
-            guessed, _ = _mt.guess_type(file_path)
-            mime_type = guessed or "application/octet-stream"
-        body: dict = {"selector": selector, "content": content, "filename": _os.path.basename(file_path), "mime_type": mime_type}
-        if purpose: body["purpose"] = purpose
-        if operator: body["operator"] = operator
-        return await self._client._post(f"/api/v1/sessions/{self.id}/upload", body, UploadResult)
+    async def upload(self, selector: str, file_path: Union[str, "os.PathLike[str]", BinaryIO], mime_type: Optional[str] = None, purpose: Optional[str] = None, operator: Optional[str] = None, filename: Optional[str] = None) -> UploadResult:
+        """Upload a file, streamed in chunks (see ``Session.upload``).
+
+        File reads run in a worker thread so the event loop is never blocked.
+        """
+        f, should_close, params = _open_upload(selector, file_path, filename, mime_type, purpose, operator)
+        try:
+            return await self._client._post_content(
+                f"/api/v1/sessions/{self.id}/upload/stream", params,
+                _aiter_file(f), _remaining_size(f), UploadResult,
+            )
+        finally:
+            if should_close:
+                f.close()
 
     async def download(self, selector: Optional[str] = None, element_id: Optional[str] = None, ref_id: Optional[str] = None, timeout_ms: int = 30000, purpose: Optional[str] = None, operator: Optional[str] = None) -> DownloadResult:
         body: dict = {"timeout_ms": timeout_ms}
@@ -1196,12 +1368,25 @@ class AsyncSession:
         if operator: body["operator"] = operator
         return await self._client._post(f"/api/v1/sessions/{self.id}/download", body, DownloadResult)
 
+    async def download_to(self, path: str, selector: Optional[str] = None, element_id: Optional[str] = None, ref_id: Optional[str] = None, timeout_ms: int = 30000, max_bytes: Optional[int] = None, purpose: Optional[str] = None, operator: Optional[str] = None) -> "DownloadToResult":
+        """Trigger a download and stream it to *path* (see ``Session.download_to``)."""
+        body: dict = {"timeout_ms": timeout_ms}
+        if ref_id: body["ref_id"] = ref_id
+        elif element_id: body["element_id"] = element_id
+        elif selector: body["selector"] = selector
+        if max_bytes is not None: body["max_bytes"] = max_bytes
+        if purpose: body["purpose"] = purpose
+        if operator: body["operator"] = operator
+        t0 = time.perf_counter()
+        headers, size = await self._client._stream_to_file("POST", f"/api/v1/sessions/{self.id}/download/stream", path, json=body)
+        return _download_to_result(path, headers, size, t0)
+
     # ------------------------------------------------------------------
     # Multi-page management (T03)
     # ------------------------------------------------------------------
 
     async def pages(self) -> PageListResult:
-        return await self._client._get(f"/api/v1/sessions/{self.id}/pages", PageListResult)
+        return await self._client._get_cached(f"/api/v1/sessions/{self.id}/pages", PageListResult)
 
     async def new_page(self) -> NewPageResult:
         return await self._client._post(f"/api/v1/sessions/{self.id}/pages", {}, NewPageResult)
@@ -1239,7 +1424,7 @@ class AsyncSession:
     async def get_policy(self) -> "PolicyInfo":
         """Get the current safety execution policy for this session."""
         from .models import PolicyInfo
-        return await self._client._get(f"/api/v1/sessions/{self.id}/policy", PolicyInfo)
+        return await self._client._get_cached(f"/api/v1/sessions/{self.id}/policy", PolicyInfo)
 
     async def element_map(
         self,
@@ -1335,12 +1520,14 @@ class AsyncSession:
         if include_unlabeled: body["include_unlabeled"] = True
         if purpose: body["purpose"] = purpose
         if operator: body["operator"] = operator
-        return await self._client._post(f"/api/v1/sessions/{self.id}/snapshot_map", body, SnapshotMapResult)
+        result = await self._client._post(f"/api/v1/sessions/{self.id}/snapshot_map", body, SnapshotMapResult)
+        self._client._remember_snapshot(self.id, body, result)
+        return result
 
     async def page_rev(self) -> "PageRevResult":
         """Return current page revision counter (R08-R12)."""
         from .models import PageRevResult
-        return await self._client._get(f"/api/v1/sessions/{self.id}/page_rev", PageRevResult)
+        return await self._client._get_cached(f"/api/v1/sessions/{self.id}/page_rev", PageRevResult)
 
     async def dblclick(self, selector: Optional[str] = None, element_id: Optional[str] = None, ref_id: Optional[str] = None, timeout_ms: int = 5000, purpose: Optional[str] = None, operator: Optional[str] = None) -> ActionResult:
         if not selector and not element_id and not ref_id: raise ValueError("selector, element_id, or ref_id required")
@@ -1520,6 +1707,27 @@ class AsyncSession:
     async def clear_dialogs(self) -> None:
         await self._client._delete(f"/api/v1/sessions/{self.id}/dialogs")
 
+    # ── Cookies / console / page errors (pool reset) ────────────────────────
+
+    async def clear_cookies(self) -> None:
+        """Clear all cookies for this session."""
+        await self._client._delete(f"/api/v1/sessions/{self.id}/cookies")
+
+    async def clear_console_log(self) -> None:
+        """Clear the console log buffer for this session."""
+        await self._client._delete(f"/api/v1/sessions/{self.id}/console")
+
+    async def clear_page_errors(self) -> None:
+        """Clear the page error buffer for this session."""
+        await self._client._delete(f"/api/v1/sessions/{self.id}/page_errors")
+
+    # ── Event stream ─────────────────────────────────────────────────────────
+
+    def events(self, types: Optional[List[str]] = None, since: Optional[int] = None,
+               reconnect: bool = True) -> AsyncIterator["SessionEvent"]:
+        """Async iterator over the session's events (see ``Session.events``)."""
+        return self._client._stream_events(f"/api/v1/sessions/{self.id}/events", types, since, reconnect)
+
     # ── R07-T23: Clipboard ───────────────────────────────────────────────────
 
     async def clipboard_write(self, text: str, purpose: Optional[str] = None, operator: Optional[str] = None) -> "ClipboardWriteResult":
@@ -1568,7 +1776,7 @@ class AsyncSession:
     async def get_settings(self) -> "SessionSettings":
         """Return current browser settings (viewport, user agent, url, headless, profile)."""
         from .models import SessionSettings
-        return await self._client._get(f"/api/v1/sessions/{self.id}/settings", SessionSettings)
+        return await self._client._get_cached(f"/api/v1/sessions/{self.id}/settings", SessionSettings)
 
     # ── R08-R15: Cookie delete by name ───────────────────────────────────────
 
@@ -1627,6 +1835,7 @@ class AsyncSession:
 
     async def close(self) -> None:
         await self._client._delete(f"/api/v1/sessions/{self.id}")
+        self._client._forget_session(self.id)
 
     async def __aenter__(self) -> "AsyncSession":
         return self
@@ -1649,6 +1858,35 @@ class BrowserClient:
             sess.navigate("https://example.com")
             shot = sess.screenshot()
             shot.save("/tmp/out.png")
+
+    ``transport`` accepts a ``TransportConfig`` (private pool with explicit
+    keep-alive limits), a ``SharedTransport`` (pool shared across clients,
+    not closed by ``close()``) or ``"uds"`` to talk to a daemon started with
+    ``AGENTMB_SOCKET`` over its Unix socket (``socket_path`` overrides the
+    default ``<AGENTMB_DATA_DIR>/agentmb.sock``).
+
+    Result models are validated straight from the response bytes.
+    ``trusted=True`` skips validation and builds them as-is (only safe
+    against a daemon you trust); ``decoder`` picks the JSON parser for that
+    path — ``"auto"`` uses orjson when installed.  ``lazy=True`` returns the
+    element/snapshot/extract/console/error lists and ``logs()`` as
+    ``LazyModelList``, building each item on first access.
+
+    ``retry=RetryPolicy(...)`` (or ``retry=True``) retries stale refs,
+    throttling and transient errors with backoff (see ``agentmb.retry``);
+    counts land in ``client.metrics``.
+
+    Polled read endpoints (``page_rev``, ``pages``, ``settings``,
+    ``get_policy``, ``routes``, ``cookies``) are revalidated with their ETag
+    and served from a small cache on 304; ``cache=False`` disables this.
+
+    ``hooks=[...]`` (or ``add_hook``) receives a ``RequestEvent`` at the
+    start and end of every call — wall time, bytes, decode time and the
+    server's ``duration_ms``; ``LatencyHistogram`` aggregates them per
+    endpoint (see ``agentmb.instrument``). With ``timings=True`` the daemon
+    also breaks each call down by phase (policy wait, target resolution,
+    stability waits, execution, audit write) into ``RequestEvent.timings``
+    and a ``timings`` field in the JSON body.
     """
 
     def __init__(
@@ -1657,14 +1895,33 @@ class BrowserClient:
         api_token: Optional[str] = None,
         timeout: float = 30.0,
         operator: Optional[str] = None,
+        transport: TransportLike = None,
+        socket_path: Optional[str] = None,
+        decoder: str = "auto",
+        trusted: bool = False,
+        lazy: bool = False,
+        retry: Union[RetryPolicy, bool, None] = None,
+        cache: bool = True,
+        hooks: Optional[Iterable[Any]] = None,
+        timings: bool = False,
     ) -> None:
         self._base_url = base_url or _base_url()
         self._api_token = api_token or os.environ.get("AGENTMB_API_TOKEN")
         self._operator = operator or os.environ.get("AGENTMB_OPERATOR")
+        self._loads = get_loads(decoder)
+        self._trusted = trusted
+        self._lazy = lazy
+        self._retry = resolve_policy(retry)
+        self._refs = RefIndex()
+        self._cache = ResponseCache() if cache else None
+        self._hooks = Hooks(hooks)
+        self._timings = timings
+        self.metrics = ClientMetrics()
         self._http = httpx.Client(
             base_url=self._base_url,
-            headers=_base_headers(self._api_token, self._operator),
+            headers=_base_headers(self._api_token, self._operator, self._timings),
             timeout=timeout,
+            transport=build_sync_transport(transport, socket_path),
         )
         self.sessions = _SyncSessionManager(self)
 
@@ -1681,39 +1938,235 @@ class BrowserClient:
         from .models import ProfileResetResult
         return self._post(f"/api/v1/profiles/{name}/reset", {}, ProfileResetResult)
 
+    def fan_out(
+        self,
+        sessions: Iterable["Session"],
+        fn: Callable[["Session"], Any],
+        concurrency: int = 8,
+        timeout: Optional[float] = None,
+    ) -> Iterator["FanOutResult"]:
+        """Run ``fn(session)`` for each session on a thread pool of *concurrency* workers.
+
+        Yields a ``FanOutResult`` (timing, result or captured error) per
+        session as it completes.  See ``agentmb.fanout``.
+        """
+        return fan_out_sync(sessions, fn, concurrency, timeout)
+
+    def add_hook(self, hook: Any) -> None:
+        """Register an instrumentation hook (``on_request_start`` / ``on_request_end``)."""
+        self._hooks.add(hook)
+
+    def remove_hook(self, hook: Any) -> None:
+        self._hooks.remove(hook)
+
+    def _build(self, model, data):
+        """Build a result model from decoded JSON (validated, or constructed as-is when trusted)."""
+        return _build_model(model, data, self._trusted)
+
+    def _build_list(self, model, raw: list):
+        """Build a list of *model* (a ``LazyModelList`` when the client is lazy)."""
+        if self._lazy:
+            return _lazy_list(model, raw, self._trusted)
+        return [self._build(model, x) for x in raw]
+
+    def _decode(self, resp: httpx.Response, model=None):
+        return _decode_body(model, resp.content, self._loads, self._trusted, self._lazy)
+
+    def _send(self, method: str, path: str, json: Optional[dict] = None, ok: Tuple[int, ...] = (),
+              **kwargs) -> httpx.Response:
+        """Send a request under the retry policy; raise ``HTTPStatusError`` unless 2xx or in *ok*."""
+        if json is not None:
+            kwargs["headers"] = {"content-type": "application/json"}
+        if self._retry is None:
+            resp = self._http.request(method, path, json=json, **kwargs)
+            if resp.is_error and resp.status_code not in ok:
+                resp.raise_for_status()
+            return resp
+        attempts = Attempts(self._retry, method, self.metrics)
+        while True:
+            try:
+                resp = self._http.request(method, path, json=json, **kwargs)
+            except httpx.TransportError as e:
+                delay = attempts.after_error(e)
+                if delay is None:
+                    raise
+            else:
+                if not resp.is_error or resp.status_code in ok:
+                    return resp
+                error = error_code(resp)
+                if resp.status_code == 409 and error == "stale_ref":
+                    body = self._remap_ref(json) if attempts.stale_ref_rule(error) else None
+                    delay = attempts.after_remap() if body is not None else None
+                    json = body or json
+                else:
+                    delay = attempts.after_response(resp, error)
+                if delay is None:
+                    resp.raise_for_status()
+            time.sleep(delay)
+
+    def _remap_ref(self, body: Optional[dict]) -> Optional[dict]:
+        """Re-run snapshot_map for a stale ``ref_id`` and return *body* with the remapped ref."""
+        info = remap_request(self._refs, body)
+        if info is None:
+            return None
+        session_id, request, old = info
+        resp = self._http.post(f"/api/v1/sessions/{session_id}/snapshot_map", json=request)
+        if resp.is_error:
+            return None
+        return remapped_body(self._refs, body, session_id, request, old, self._loads(resp.content))
+
+    def _remember_snapshot(self, session_id: str, request: dict, result) -> None:
+        """Keep a snapshot's elements so a stale ref_id from it can be remapped."""
+        if self._retry is not None and self._retry.remap_stale_refs:
+            self._refs.remember(session_id, request, result.snapshot_id, snapshot_elements(result))
+
+    def _call(self, method: str, path: str, json: Optional[dict] = None, model=None,
+              ok: Tuple[int, ...] = (), raw: bool = False, cached: bool = False):
+        """Send a request and decode the result, reporting both to the hooks.
+
+        ``raw=True`` returns the response undecoded; ``cached=True`` revalidates
+        a GET against the conditional-GET cache.
+        """
+        event = self._hooks.start(method, path) if self._hooks else None
+        try:
+            if cached and self._cache is not None:
+                resp, content, hit = self._send_cached(path)
+            else:
+                resp = self._send(method, path, json, ok=ok)
+                content, hit = resp.content, False
+            if event is not None:
+                event.response(resp)
+                event.cached = hit
+            if raw:
+                return resp
+            t0 = time.perf_counter()
+            result = _decode_body(model, content, self._loads, self._trusted, self._lazy)
+            if event is not None:
+                event.decoded(t0, result)
+            return result
+        except BaseException as e:
+            if event is not None:
+                event.error = e
+            raise
+        finally:
+            if event is not None:
+                self._hooks.end(event)
+
+    def _send_cached(self, path: str) -> Tuple[httpx.Response, bytes, bool]:
+        """GET *path* with If-None-Match; ``(response, body, served_from_cache)``."""
+        tag = self._cache.etag(path)
+        resp = self._send("GET", path, headers={"if-none-match": tag} if tag else None)
+        if resp.status_code == 304:
+            content = self._cache.body(path)
+            if content is not None:
+                self.metrics.not_modified += 1
+                return resp, content, True
+            resp = self._send("GET", path)  # evicted meanwhile: fetch unconditionally
+        self._cache.store(path, resp.headers.get("etag"), resp.content)
+        return resp, resp.content, False
+
+    def _forget_session(self, session_id: str) -> None:
+        if self._cache is not None:
+            self._cache.drop_session(session_id)
+
     def _post(self, path: str, body: dict, model=None):
-        resp = self._http.post(path, json=body, headers={"content-type": "application/json"})
-        resp.raise_for_status()
-        data = resp.json()
-        if model and model is not dict:
-            return model.model_validate(data)
-        return data
+        return self._call("POST", path, body, model)
 
     def _get(self, path: str, model=None):
-        resp = self._http.get(path)
-        resp.raise_for_status()
-        data = resp.json()
-        if model:
-            return model.model_validate(data)
-        return data
+        return self._call("GET", path, model=model)
+
+    def _get_cached(self, path: str, model=None):
+        """GET an ETag-backed endpoint, revalidating the cached body with If-None-Match."""
+        return self._call("GET", path, model=model, cached=True)
 
     def _delete(self, path: str) -> None:
-        resp = self._http.delete(path)
-        if resp.status_code not in (200, 204, 404):
-            resp.raise_for_status()
+        self._call("DELETE", path, ok=(404,), raw=True)
 
     def _put(self, path: str, body: dict, model=None):
-        resp = self._http.put(path, json=body, headers={"content-type": "application/json"})
-        resp.raise_for_status()
-        data = resp.json()
-        if model and model is not dict:
-            return model.model_validate(data)
-        return data
+        return self._call("PUT", path, body, model)
 
     def _delete_with_body(self, path: str, body: dict) -> None:
-        resp = self._http.request("DELETE", path, json=body, headers={"content-type": "application/json"})
-        if resp.status_code not in (200, 204, 404):
-            resp.raise_for_status()
+        self._call("DELETE", path, body, ok=(404,), raw=True)
+
+    def _post_content(self, path: str, params: dict, content, size: Optional[int], model=None):
+        """POST a raw (streamed) octet-stream body; query params carry the metadata."""
+        headers = {"content-type": "application/octet-stream"}
+        if size is not None:
+            headers["content-length"] = str(size)
+        resp = self._http.post(path, params=params, content=content, headers=headers)
+        resp.raise_for_status()
+        return self._decode(resp, model)
+
+    def _post_bytes(self, path: str, body: dict) -> bytes:
+        """POST JSON, return the raw response body (binary endpoints)."""
+        return self._call("POST", path, body, raw=True).content
+
+    def _stream_to_file(self, method: str, path: str, dest: str, json: Optional[dict] = None,
+                        params: Optional[dict] = None) -> Tuple[httpx.Headers, int]:
+        """Stream a binary response body into *dest* chunk by chunk.
+
+        Bytes go to ``<dest>.part`` first and are renamed into place once the
+        body is complete, so a failed transfer never leaves a truncated file.
+        Returns the response headers and the number of bytes written.
+        """
+        tmp = dest + ".part"
+        size = 0
+        with self._http.stream(method, path, json=json, params=params) as resp:
+            if resp.is_error:
+                resp.read()
+                resp.raise_for_status()
+            try:
+                with open(tmp, "wb") as f:
+                    for chunk in resp.iter_bytes(_STREAM_CHUNK_SIZE):
+                        f.write(chunk)
+                        size += len(chunk)
+                os.replace(tmp, dest)
+            except BaseException:
+                if os.path.exists(tmp):
+                    os.unlink(tmp)
+                raise
+            return resp.headers, size
+
+    def _stream_events(self, path: str, types: Optional[Iterable[str]], since: Optional[int],
+                       reconnect: bool) -> Iterator["SessionEvent"]:
+        """Follow an event stream, re-opening it after the last seq seen if the connection drops."""
+        from .events import RECONNECT_ATTEMPTS, RECONNECT_DELAY_S, SseDecoder, event_params, gap_event, stream_timeout
+        from .models import SessionEvent
+        attempts = 0
+        while True:
+            try:
+                with self._http.stream(
+                    "GET", path, params=event_params(types, since),
+                    headers={"accept": "text/event-stream"}, timeout=stream_timeout(self._http.timeout),
+                ) as resp:
+                    if resp.is_error:
+                        resp.read()
+                        resp.raise_for_status()
+                    attempts = 0
+                    decoder = SseDecoder()
+                    for line in resp.iter_lines():
+                        message = decoder.feed(line)
+                        if message is None:
+                            continue
+                        data = self._loads(message[1])
+                        if message[0] == "ready":
+                            if data.get("missed"):
+                                yield self._build(SessionEvent, gap_event(data, since))
+                            if since is None:
+                                since = data["last_seq"]
+                            continue
+                        event = self._build(SessionEvent, data)
+                        since = event.seq
+                        yield event
+                        if event.type == "session_closed":
+                            return
+                # Ended without session_closed: the daemon is shutting down (sessions outlive it)
+                return
+            except httpx.TransportError:
+                if not reconnect or attempts >= RECONNECT_ATTEMPTS:
+                    raise
+            attempts += 1
+            time.sleep(RECONNECT_DELAY_S * attempts)
 
     def close(self) -> None:
         self._http.close()
@@ -1740,6 +2193,7 @@ class _SyncSessionManager:
         executable_path: Optional[str] = None,
         launch_mode: str = "managed",
         cdp_url: Optional[str] = None,
+        queue_timeout_ms: Optional[int] = None,
     ) -> Session:
         body: dict = {
             "profile": profile,
@@ -1757,12 +2211,14 @@ class _SyncSessionManager:
             body["launch_mode"] = launch_mode
         if cdp_url:
             body["cdp_url"] = cdp_url
+        if queue_timeout_ms is not None:
+            body["queue_timeout_ms"] = queue_timeout_ms
         info = self._client._post("/api/v1/sessions", body, SessionInfo)
         return Session(info.session_id, self._client)
 
     def list(self) -> List[SessionInfo]:
         raw = self._client._get("/api/v1/sessions")
-        return [SessionInfo.model_validate(s) for s in raw]
+        return [self._client._build(SessionInfo, s) for s in raw]
 
     def get(self, session_id: str) -> SessionInfo:
         return self._client._get(f"/api/v1/sessions/{session_id}", SessionInfo)
@@ -1785,6 +2241,14 @@ class AsyncBrowserClient:
             async with client.sessions.create() as sess:
                 await sess.navigate("https://example.com")
                 result = await sess.eval("document.title")
+
+    For many concurrent sessions pass ``transport=TransportConfig(...)`` with
+    ``max_keepalive_connections`` at least the expected concurrency.
+
+    ``websocket=True`` multiplexes requests over one WebSocket connection
+    (the daemon's ``/api/v1/ws`` command channel) instead of one HTTP
+    request each; see ``agentmb.channel``. Daemons without the channel are
+    served over HTTP as before.
     """
 
     def __init__(
@@ -1793,20 +2257,50 @@ class AsyncBrowserClient:
         api_token: Optional[str] = None,
         timeout: float = 30.0,
         operator: Optional[str] = None,
+        transport: TransportLike = None,
+        socket_path: Optional[str] = None,
+        decoder: str = "auto",
+        trusted: bool = False,
+        lazy: bool = False,
+        retry: Union[RetryPolicy, bool, None] = None,
+        cache: bool = True,
+        hooks: Optional[Iterable[Any]] = None,
+        timings: bool = False,
+        websocket: bool = False,
     ) -> None:
         self._base_url = base_url or _base_url()
         self._api_token = api_token or os.environ.get("AGENTMB_API_TOKEN")
         self._operator = operator or os.environ.get("AGENTMB_OPERATOR")
+        self._loads = get_loads(decoder)
+        self._trusted = trusted
+        self._lazy = lazy
+        self._retry = resolve_policy(retry)
+        self._refs = RefIndex()
+        self._cache = ResponseCache() if cache else None
+        self._hooks = Hooks(hooks)
+        self._timings = timings
+        self.metrics = ClientMetrics()
         self._timeout = timeout
+        self._transport = transport
+        self._socket_path = socket_path
+        self._websocket = websocket
         self._http: Optional[httpx.AsyncClient] = None
         self.sessions = _AsyncSessionManager(self)
 
     async def _ensure_client(self) -> httpx.AsyncClient:
         if self._http is None:
+            transport = build_async_transport(self._transport, self._socket_path)
+            if self._websocket:
+                from .channel import CommandChannelTransport, socket_path_of
+                transport = CommandChannelTransport(
+                    transport or httpx.AsyncHTTPTransport(),
+                    uds=socket_path_of(self._transport, self._socket_path),
+                )
             self._http = httpx.AsyncClient(
                 base_url=self._base_url,
-                headers=_base_headers(self._api_token, self._operator),
+                headers=_base_headers(self._api_token, self._operator, self._timings),
                 timeout=self._timeout,
+                transport=transport,
             )
         return self._http
 
@@ -1823,44 +2317,232 @@ class AsyncBrowserClient:
         from .models import ProfileResetResult
         return await self._post(f"/api/v1/profiles/{name}/reset", {}, ProfileResetResult)
 
-    async def _post(self, path: str, body: dict, model=None):
+    def fan_out(
+        self,
+        sessions: Iterable["AsyncSession"],
+        fn: Callable[["AsyncSession"], Awaitable[Any]],
+        concurrency: int = 8,
+        timeout: Optional[float] = None,
+    ) -> AsyncIterator["FanOutResult"]:
+        """Run ``await fn(session)`` for each session, at most *concurrency* at once.
+
+        Use with ``async for``; results (timing, result or captured error)
+        arrive in completion order.  See ``agentmb.fanout``.
+        """
+        return fan_out_async(sessions, fn, concurrency, timeout)
+
+    def add_hook(self, hook: Any) -> None:
+        """Register an instrumentation hook (``on_request_start`` / ``on_request_end``)."""
+        self._hooks.add(hook)
+
+    def remove_hook(self, hook: Any) -> None:
+        self._hooks.remove(hook)
+
+    def _build(self, model, data):
+        """Build a result model from decoded JSON (validated, or constructed as-is when trusted)."""
+        return _build_model(model, data, self._trusted)
+
+    def _build_list(self, model, raw: list):
+        """Build a list of *model* (a ``LazyModelList`` when the client is lazy)."""
+        if self._lazy:
+            return _lazy_list(model, raw, self._trusted)
+        return [self._build(model, x) for x in raw]
+
+    def _decode(self, resp: httpx.Response, model=None):
+        return _decode_body(model, resp.content, self._loads, self._trusted, self._lazy)
+
+    async def _send(self, method: str, path: str, json: Optional[dict] = None, ok: Tuple[int, ...] = (),
+                    **kwargs) -> httpx.Response:
+        """Async counterpart of ``BrowserClient._send``."""
         client = await self._ensure_client()
-        resp = await client.post(path, json=body, headers={"content-type": "application/json"})
-        resp.raise_for_status()
-        data = resp.json()
-        if model and model is not dict:
-            return model.model_validate(data)
-        return data
+        if json is not None:
+            kwargs["headers"] = {"content-type": "application/json"}
+        if self._retry is None:
+            resp = await client.request(method, path, json=json, **kwargs)
+            if resp.is_error and resp.status_code not in ok:
+                resp.raise_for_status()
+            return resp
+        attempts = Attempts(self._retry, method, self.metrics)
+        while True:
+            try:
+                resp = await client.request(method, path, json=json, **kwargs)
+            except httpx.TransportError as e:
+                delay = attempts.after_error(e)
+                if delay is None:
+                    raise
+            else:
+                if not resp.is_error or resp.status_code in ok:
+                    return resp
+                error = error_code(resp)
+                if resp.status_code == 409 and error == "stale_ref":
+                    body = await self._remap_ref(json) if attempts.stale_ref_rule(error) else None
+                    delay = attempts.after_remap() if body is not None else None
+                    json = body or json
+                else:
+                    delay = attempts.after_response(resp, error)
+                if delay is None:
+                    resp.raise_for_status()
+            await asyncio.sleep(delay)
+
+    async def _remap_ref(self, body: Optional[dict]) -> Optional[dict]:
+        """Re-run snapshot_map for a stale ``ref_id`` and return *body* with the remapped ref."""
+        info = remap_request(self._refs, body)
+        if info is None:
+            return None
+        session_id, request, old = info
+        client = await self._ensure_client()
+        resp = await client.post(f"/api/v1/sessions/{session_id}/snapshot_map", json=request)
+        if resp.is_error:
+            return None
+        return remapped_body(self._refs, body, session_id, request, old, self._loads(resp.content))
+
+    def _remember_snapshot(self, session_id: str, request: dict, result) -> None:
+        """Keep a snapshot's elements so a stale ref_id from it can be remapped."""
+        if self._retry is not None and self._retry.remap_stale_refs:
+            self._refs.remember(session_id, request, result.snapshot_id, snapshot_elements(result))
+
+    async def _call(self, method: str, path: str, json: Optional[dict] = None, model=None,
+                    ok: Tuple[int, ...] = (), raw: bool = False, cached: bool = False):
+        """Send a request and decode the result, reporting both to the hooks.
+
+        ``raw=True`` returns the response undecoded; ``cached=True`` revalidates
+        a GET against the conditional-GET cache.
+        """
+        event = self._hooks.start(method, path) if self._hooks else None
+        try:
+            if cached and self._cache is not None:
+                resp, content, hit = await self._send_cached(path)
+            else:
+                resp = await self._send(method, path, json, ok=ok)
+                content, hit = resp.content, False
+            if event is not None:
+                event.response(resp)
+                event.cached = hit
+            if raw:
+                return resp
+            t0 = time.perf_counter()
+            result = _decode_body(model, content, self._loads, self._trusted, self._lazy)
+            if event is not None:
+                event.decoded(t0, result)
+            return result
+        except BaseException as e:
+            if event is not None:
+                event.error = e
+            raise
+        finally:
+            if event is not None:
+                self._hooks.end(event)
+
+    async def _send_cached(self, path: str) -> Tuple[httpx.Response, bytes, bool]:
+        """GET *path* with If-None-Match; ``(response, body, served_from_cache)``."""
+        tag = self._cache.etag(path)
+        resp = await self._send("GET", path, headers={"if-none-match": tag} if tag else None)
+        if resp.status_code == 304:
+            content = self._cache.body(path)
+            if content is not None:
+                self.metrics.not_modified += 1
+                return resp, content, True
+            resp = await self._send("GET", path)  # evicted meanwhile: fetch unconditionally
+        self._cache.store(path, resp.headers.get("etag"), resp.content)
+        return resp, resp.content, False
+
+    def _forget_session(self, session_id: str) -> None:
+        if self._cache is not None:
+            self._cache.drop_session(session_id)
+
+    async def _post(self, path: str, body: dict, model=None):
+        return await self._call("POST", path, body, model)
 
     async def _get(self, path: str, model=None):
-        client = await self._ensure_client()
-        resp = await client.get(path)
-        resp.raise_for_status()
-        data = resp.json()
-        if model:
-            return model.model_validate(data)
-        return data
+        return await self._call("GET", path, model=model)
+
+    async def _get_cached(self, path: str, model=None):
+        """GET an ETag-backed endpoint, revalidating the cached body with If-None-Match."""
+        return await self._call("GET", path, model=model, cached=True)
 
     async def _delete(self, path: str) -> None:
-        client = await self._ensure_client()
-        resp = await client.delete(path)
-        if resp.status_code not in (200, 204, 404):
-            resp.raise_for_status()
+        await self._call("DELETE", path, ok=(404,), raw=True)
 
     async def _put(self, path: str, body: dict, model=None):
+        return await self._call("PUT", path, body, model)
+
+    async def _delete_with_body(self, path: str, body: dict) -> None:
+        await self._call("DELETE", path, body, ok=(404,), raw=True)
+
+    async def _post_content(self, path: str, params: dict, content, size: Optional[int], model=None):
         client = await self._ensure_client()
-        resp = await client.put(path, json=body, headers={"content-type": "application/json"})
+        headers = {"content-type": "application/octet-stream"}
+        if size is not None:
+            headers["content-length"] = str(size)
+        resp = await client.post(path, params=params, content=content, headers=headers)
         resp.raise_for_status()
-        data = resp.json()
-        if model and model is not dict:
-            return model.model_validate(data)
-        return data
+        return self._decode(resp, model)
 
-    async def _delete_with_body(self, path: str, body: dict) -> None:
+    async def _post_bytes(self, path: str, body: dict) -> bytes:
+        return (await self._call("POST", path, body, raw=True)).content
+
+    async def _stream_to_file(self, method: str, path: str, dest: str, json: Optional[dict] = None,
+                              params: Optional[dict] = None) -> Tuple[httpx.Headers, int]:
+        """Async counterpart of ``BrowserClient._stream_to_file``."""
+        client = await self._ensure_client()
+        tmp = dest + ".part"
+        size = 0
+        async with client.stream(method, path, json=json, params=params) as resp:
+            if resp.is_error:
+                await resp.aread()
+                resp.raise_for_status()
+            try:
+                with open(tmp, "wb") as f:
+                    async for chunk in resp.aiter_bytes(_STREAM_CHUNK_SIZE):
+                        f.write(chunk)
+                        size += len(chunk)
+                os.replace(tmp, dest)
+            except BaseException:
+                if os.path.exists(tmp):
+                    os.unlink(tmp)
+                raise
+            return resp.headers, size
+
+    async def _stream_events(self, path: str, types: Optional[Iterable[str]], since: Optional[int],
+                             reconnect: bool) -> AsyncIterator["SessionEvent"]:
+        """Async counterpart of ``BrowserClient._stream_events``."""
+        from .events import RECONNECT_ATTEMPTS, RECONNECT_DELAY_S, SseDecoder, event_params, gap_event, stream_timeout
+        from .models import SessionEvent
         client = await self._ensure_client()
-        resp = await client.request("DELETE", path, json=body, headers={"content-type": "application/json"})
-        if resp.status_code not in (200, 204, 404):
-            resp.raise_for_status()
+        attempts = 0
+        while True:
+            try:
+                async with client.stream(
+                    "GET", path, params=event_params(types, since),
+                    headers={"accept": "text/event-stream"}, timeout=stream_timeout(client.timeout),
+                ) as resp:
+                    if resp.is_error:
+                        await resp.aread()
+                        resp.raise_for_status()
+                    attempts = 0
+                    decoder = SseDecoder()
+                    async for line in resp.aiter_lines():
+                        message = decoder.feed(line)
+                        if message is None:
+                            continue
+                        data = self._loads(message[1])
+                        if message[0] == "ready":
+                            if data.get("missed"):
+                                yield self._build(SessionEvent, gap_event(data, since))
+                            if since is None:
+                                since = data["last_seq"]
+                            continue
+                        event = self._build(SessionEvent, data)
+                        since = event.seq
+                        yield event
+                        if event.type == "session_closed":
+                            return
+                return
+            except httpx.TransportError:
+                if not reconnect or attempts >= RECONNECT_ATTEMPTS:
+                    raise
+            attempts += 1
+            await asyncio.sleep(RECONNECT_DELAY_S * attempts)
 
     async def close(self) -> None:
         if self._http:
@@ -1889,6 +2571,7 @@ class _AsyncSessionManager:
         executable_path: Optional[str] = None,
         launch_mode: str = "managed",
         cdp_url: Optional[str] = None,
+        queue_timeout_ms: Optional[int] = None,
     ) -> AsyncSession:
         body: dict = {
             "profile": profile,
@@ -1906,12 +2589,14 @@ class _AsyncSessionManager:
             body["launch_mode"] = launch_mode
         if cdp_url:
             body["cdp_url"] = cdp_url
+        if queue_timeout_ms is not None:
+            body["queue_timeout_ms"] = queue_timeout_ms
         info = await self._client._post("/api/v1/sessions", body, SessionInfo)
         return AsyncSession(info.session_id, self._client)
 
     async def list(self) -> List[SessionInfo]:
         raw = await self._client._get("/api/v1/sessions")
-        return [SessionInfo.model_validate(s) for s in raw]
+        return [self._client._build(SessionInfo, s) for s in raw]
 
     async def get(self, session_id: str) -> SessionInfo:
         return await self._client._get(f"/api/v1/sessions/{session_id}", SessionInfo)
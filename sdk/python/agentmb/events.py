@@ -0,0 +1,92 @@
+"""Session event stream: console, page errors, dialogs and navigations as they happen.
+
+``Session.events()`` / ``AsyncSession.events()`` follow the daemon's
+``GET /api/v1/sessions/:id/events`` server-sent event stream instead of
+polling ``console_log()`` / ``page_errors()`` / ``dialogs()``::
+
+    async for event in sess.events(types=["console", "page_error"]):
+        if event.type == "page_error":
+            print(event.data["message"])
+
+Each item is a ``SessionEvent`` (``seq``, ``type``, ``ts``, ``page_id``,
+``data``). Iteration ends after ``session_closed``, or when the daemon
+ends the stream without one (it is shutting down; sessions outlive it);
+break out of the loop to stop earlier. A dropped connection is re-opened
+with the ``seq`` of the last event yielded, and the daemon replays what it
+still retains (the last 256 events per session), so short interruptions
+lose nothing. If events were lost anyway (a longer outage, or a daemon
+restart), a ``gap`` event is yielded before the replay, with the ``seq``
+resumed from in ``data["since"]``. A connection that cannot be re-opened
+raises ``httpx.TransportError`` once the reconnect attempts run out.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from typing import Iterable, List, Optional, Tuple
+
+import httpx
+
+EVENT_TYPES = ("console", "page_error", "dialog", "framenavigated", "page_rev", "session_closed")
+
+# Reconnect attempts after a dropped stream before giving up (reset once a stream is open)
+RECONNECT_ATTEMPTS = 5
+RECONNECT_DELAY_S = 0.5
+
+
+class SseDecoder:
+    """Incremental ``text/event-stream`` decoder.
+
+    ``feed()`` takes one line (without its line ending) and returns
+    ``(event, data, id)`` when the line completes a message.
+    """
+
+    def __init__(self) -> None:
+        self._event = "message"
+        self._data: List[str] = []
+        self._id: Optional[str] = None
+
+    def feed(self, line: str) -> Optional[Tuple[str, str, Optional[str]]]:
+        if not line:
+            if not self._data:
+                self._event = "message"
+                return None
+            message = (self._event, "\n".join(self._data), self._id)
+            self._event, self._data, self._id = "message", [], None
+            return message
+        if line.startswith(":"):  # comment / heartbeat
+            return None
+        name, _, value = line.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+        if name == "event":
+            self._event = value
+        elif name == "data":
+            self._data.append(value)
+        elif name == "id":
+            self._id = value
+        return None
+
+
+def gap_event(ready: dict, since: Optional[int]) -> dict:
+    """Client-side ``gap`` event for a ``ready`` message reporting ``missed`` events."""
+    return {
+        "seq": since or 0, "type": "gap",
+        "ts": datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z"),
+        "data": {"since": since, "last_seq": ready.get("last_seq")},
+    }
+
+
+def stream_timeout(timeout: httpx.Timeout) -> httpx.Timeout:
+    """The client's timeouts without the read timeout (a quiet page sends nothing for a while)."""
+    return httpx.Timeout(connect=timeout.connect, read=None, write=timeout.write, pool=timeout.pool)
+
+
+def event_params(types: Optional[Iterable[str]], since: Optional[int]) -> dict:
+    """Query parameters for the events endpoint."""
+    params: dict = {}
+    if types:
+        params["types"] = ",".join(types)
+    if since is not None:
+        params["since"] = str(since)
+    return params
@@ -0,0 +1,172 @@
+"""Bounded-concurrency fan-out of one function over many sessions.
+
+Async (``AsyncBrowserClient``)::
+
+    async with AsyncBrowserClient() as client:
+        sessions = [await client.sessions.create(profile=f"w{i}") for i in range(100)]
+
+        async def title(s):
+            await s.navigate("https://example.com")
+            return (await s.eval("document.title")).result
+
+        async for r in client.fan_out(sessions, title, concurrency=16, timeout=30):
+            print(r.index, r.status, r.duration_ms, r.result or r.error)
+
+Sync (``BrowserClient``, thread pool)::
+
+    for r in client.fan_out(sessions, lambda s: s.navigate(url), concurrency=8):
+        ...
+
+Results are yielded as they complete, so one slow session never holds back
+the others.  ``fn`` raising (or exceeding ``timeout`` seconds) is captured in
+the ``FanOutResult`` instead of aborting the batch; ``r.unwrap()`` re-raises.
+Leaving the loop early cancels work that has not started yet.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures as cf
+import inspect
+import time
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, Iterator, Optional
+
+
+# ---------------------------------------------------------------------------
+# Result
+# ---------------------------------------------------------------------------
+
+@dataclass
+class FanOutResult:
+    index: int           # position of the session in the input
+    session: Any
+    status: str          # 'ok' | 'error'
+    duration_ms: int     # time spent in fn (from start, not from submission)
+    result: Any = None
+    error: Optional[str] = None
+    exception: Optional[BaseException] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status == "ok"
+
+    def unwrap(self) -> Any:
+        """Return ``result`` or re-raise the captured exception."""
+        if self.exception is not None:
+            raise self.exception
+        return self.result
+
+
+def _ok(index: int, session: Any, t0: float, result: Any) -> FanOutResult:
+    return FanOutResult(index, session, "ok", int((time.perf_counter() - t0) * 1000), result=result)
+
+
+def _error(index: int, session: Any, t0: float, exc: BaseException) -> FanOutResult:
+    return FanOutResult(
+        index, session, "error", int((time.perf_counter() - t0) * 1000),
+        error=f"{type(exc).__name__}: {exc}", exception=exc,
+    )
+
+
+def _check_concurrency(concurrency: int) -> None:
+    if concurrency < 1:
+        raise ValueError(f"concurrency must be >= 1, got {concurrency}")
+
+
+# ---------------------------------------------------------------------------
+# Async
+# ---------------------------------------------------------------------------
+
+async def fan_out_async(
+    sessions: Iterable[Any],
+    fn: Callable[[Any], Awaitable[Any]],
+    concurrency: int = 8,
+    timeout: Optional[float] = None,
+) -> AsyncIterator[FanOutResult]:
+    """Run ``await fn(session)`` for every session, at most *concurrency* at once.
+
+    Yields a :class:`FanOutResult` per session in completion order.
+    *timeout* (seconds) bounds each call; an overrun is reported as a
+    ``TimeoutError`` result and the call is cancelled.
+    """
+    _check_concurrency(concurrency)
+    items = list(sessions)
+    sem = asyncio.Semaphore(concurrency)
+
+    async def run(index: int, session: Any) -> FanOutResult:
+        async with sem:
+            t0 = time.perf_counter()
+            try:
+                if timeout is not None:
+                    result = await asyncio.wait_for(fn(session), timeout)
+                else:
+                    result = await fn(session)
+            except asyncio.TimeoutError:
+                exc = TimeoutError(f"fan_out: session #{index} exceeded {timeout}s")
+                return _error(index, session, t0, exc)
+            except Exception as e:
+                return _error(index, session, t0, e)
+            return _ok(index, session, t0, result)
+
+    tasks = [asyncio.ensure_future(run(i, s)) for i, s in enumerate(items)]
+    try:
+        for fut in asyncio.as_completed(tasks):
+            yield await fut
+    finally:
+        for t in tasks:
+            t.cancel()
+
+
+# ---------------------------------------------------------------------------
+# Sync (thread pool)
+# ---------------------------------------------------------------------------
+
+def fan_out_sync(
+    sessions: Iterable[Any],
+    fn: Callable[[Any], Any],
+    concurrency: int = 8,
+    timeout: Optional[float] = None,
+) -> Iterator[FanOutResult]:
+    """Thread-pool counterpart of :func:`fan_out_async` for sync sessions.
+
+    A call that overruns *timeout* is reported as a ``TimeoutError`` result
+    right away; its thread cannot be interrupted and keeps its pool slot
+    until ``fn`` returns (bound each request with the client ``timeout``).
+    """
+    _check_concurrency(concurrency)
+    if inspect.iscoroutinefunction(fn):
+        raise TypeError("fan_out on a sync client needs a sync function; use AsyncBrowserClient.fan_out")
+    items = list(sessions)
+    started: Dict[int, float] = {}
+
+    def run(index: int, session: Any) -> FanOutResult:
+        t0 = time.perf_counter()
+        started[index] = time.monotonic()
+        try:
+            return _ok(index, session, t0, fn(session))
+        except Exception as e:
+            return _error(index, session, t0, e)
+
+    pool = cf.ThreadPoolExecutor(max_workers=min(concurrency, len(items)) or 1, thread_name_prefix="agentmb-fanout")
+    pending = {pool.submit(run, i, s): i for i, s in enumerate(items)}
+    try:
+        while pending:
+            wait_s = None
+            if timeout is not None:
+                running = [started[i] for i in pending.values() if i in started]
+                wait_s = max(0.0, min(running) + timeout - time.monotonic()) if running else timeout
+            done, _ = cf.wait(pending, timeout=wait_s, return_when=cf.FIRST_COMPLETED)
+            for fut in done:
+                del pending[fut]
+                yield fut.result()
+            if timeout is not None:
+                now = time.monotonic()
+                for fut, i in list(pending.items()):
+                    if i in started and now - started[i] >= timeout:
+                        del pending[fut]
+                        exc = TimeoutError(f"fan_out: session #{i} exceeded {timeout}s")
+                        yield FanOutResult(i, items[i], "error", int((now - started[i]) * 1000),
+                                           error=f"TimeoutError: {exc}", exception=exc)
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,292 @@
+"""Client-side instrumentation: per-request events and a latency histogram.
+
+Result models report the daemon's own ``duration_ms``; these hooks add what
+the client sees around it — wall time, bytes on the wire, decode cost —
+so the rest of an agent loop's latency (queueing, transport, JSON) can be
+told apart from time spent in the browser::
+
+    from agentmb import BrowserClient, LatencyHistogram
+
+    hist = LatencyHistogram()
+    with BrowserClient(hooks=[hist]) as client:
+        ...
+    print(hist.dump())            # p50 / p95 / p99 per endpoint
+
+A hook is any object with ``on_request_start(event)`` and/or
+``on_request_end(event)`` (subclass ``ClientHook`` for no-op defaults).
+Both run inline on the calling thread / event loop, so keep them cheap;
+an exception raised by a hook propagates to the caller.  Streamed
+uploads/downloads are not instrumented.
+"""
+
+from __future__ import annotations
+
+import math
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+
+import httpx
+
+_ID_SEGMENTS = [
+    (re.compile(r"(/api/v1/sessions/)[^/?]+"), r"\1{id}"),
+    (re.compile(r"(/pages/)(?!switch\b)[^/?]+"), r"\1{page_id}"),
+    (re.compile(r"(/api/v1/profiles/)[^/?]+"), r"\1{name}"),
+]
+
+
+def parse_server_timing(value: Optional[str]) -> Optional[Dict[str, float]]:
+    """``{"policy": 0.0, "execute": 41.2, ...}`` from a ``Server-Timing`` header."""
+    if not value:
+        return None
+    out: Dict[str, float] = {}
+    for metric in value.split(","):
+        name, _, params = metric.strip().partition(";")
+        for param in params.split(";"):
+            key, _, dur = param.strip().partition("=")
+            if key == "dur":
+                try:
+                    out[name.strip()] = float(dur)
+                except ValueError:
+                    pass
+    return out or None
+
+
+def endpoint_of(method: str, path: str) -> str:
+    """``"GET /api/v1/sessions/{id}/pages"`` — ids templated, query dropped."""
+    path = path.split("?", 1)[0]
+    for pattern, repl in _ID_SEGMENTS:
+        path = pattern.sub(repl, path)
+    return f"{method.upper()} {path}"
+
+
+@dataclass
+class RequestEvent:
+    """One SDK call, filled in as it progresses.
+
+    Attributes:
+        method, path: As sent (``path`` includes ids and query).
+        endpoint: Templated ``"METHOD /path/{id}/..."`` used for grouping.
+        status: HTTP status of the final response (None on transport error).
+        wall_ms: Start of the call to the decoded result (retries included).
+        decode_ms: Time spent turning the body into the result model.
+        server_ms: The result's ``duration_ms``, when it reports one.
+        timings: The daemon's per-phase breakdown in ms (``policy``,
+            ``resolve_target``, ``stability_pre``, ``execute``,
+            ``stability_post``, ``audit``, ``overhead``, ``total``), from its
+            ``Server-Timing`` header when the client was built with
+            ``timings=True``.
+        bytes_out / bytes_in: Request / response body sizes.
+        cached: Served from the conditional-GET cache after a 304.
+        error: The exception that ended the call, if any.
+    """
+
+    method: str
+    path: str
+    endpoint: str
+    started: float = field(default_factory=time.perf_counter)
+    status: Optional[int] = None
+    wall_ms: float = 0.0
+    decode_ms: float = 0.0
+    server_ms: Optional[float] = None
+    timings: Optional[Dict[str, float]] = None
+    bytes_out: int = 0
+    bytes_in: int = 0
+    cached: bool = False
+    error: Optional[BaseException] = None
+
+    @property
+    def overhead_ms(self) -> Optional[float]:
+        """Wall time not accounted for by the daemon (transport, queueing, JSON)."""
+        return None if self.server_ms is None else self.wall_ms - self.server_ms
+
+    def response(self, resp: httpx.Response) -> None:
+        self.status = resp.status_code
+        self.bytes_out = len(resp.request.content) if resp.request.content else 0
+        self.bytes_in = len(resp.content)
+        self.timings = parse_server_timing(resp.headers.get("server-timing"))
+
+    def decoded(self, t0: float, result: Any) -> None:
+        self.decode_ms = (time.perf_counter() - t0) * 1000
+        server = result.get("duration_ms") if isinstance(result, dict) else getattr(result, "duration_ms", None)
+        if isinstance(server, (int, float)):
+            self.server_ms = float(server)
+
+
+class ClientHook:
+    """Base class for instrumentation hooks; override either method."""
+
+    def on_request_start(self, event: RequestEvent) -> None:
+        pass
+
+    def on_request_end(self, event: RequestEvent) -> None:
+        pass
+
+
+class Hooks:
+    """The hooks registered on one client."""
+
+    def __init__(self, hooks: Optional[Iterable[Any]] = None) -> None:
+        self._hooks: List[Any] = list(hooks or ())
+
+    def __bool__(self) -> bool:
+        return bool(self._hooks)
+
+    def add(self, hook: Any) -> None:
+        self._hooks.append(hook)
+
+    def remove(self, hook: Any) -> None:
+        self._hooks.remove(hook)
+
+    def start(self, method: str, path: str) -> RequestEvent:
+        event = RequestEvent(method=method, path=path, endpoint=endpoint_of(method, path))
+        for h in self._hooks:
+            fn = getattr(h, "on_request_start", None)
+            if fn is not None:
+                fn(event)
+        return event
+
+    def end(self, event: RequestEvent) -> None:
+        event.wall_ms = (time.perf_counter() - event.started) * 1000
+        for h in self._hooks:
+            fn = getattr(h, "on_request_end", None)
+            if fn is not None:
+                fn(event)
+
+
+# ---------------------------------------------------------------------------
+# Histogram collector
+# ---------------------------------------------------------------------------
+
+_GROWTH = 1.05              # bucket width: values are reported within ~2.5%
+_LOG_GROWTH = math.log(_GROWTH)
+_MIN_MS = 0.001
+
+
+class Histogram:
+    """Log-bucketed histogram of millisecond values (bounded memory)."""
+
+    __slots__ = ("_buckets", "count", "total", "min", "max")
+
+    def __init__(self) -> None:
+        self._buckets: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def record(self, ms: float) -> None:
+        ms = max(ms, _MIN_MS)
+        idx = int(math.log(ms / _MIN_MS) / _LOG_GROWTH)
+        self._buckets[idx] = self._buckets.get(idx, 0) + 1
+        self.count += 1
+        self.total += ms
+        self.min = min(self.min, ms)
+        self.max = max(self.max, ms)
+
+    def percentile(self, p: float) -> float:
+        """Value at percentile *p* (0-100); 0.0 when empty."""
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(self.count * p / 100))
+        seen = 0
+        for idx in sorted(self._buckets):
+            seen += self._buckets[idx]
+            if seen >= rank:
+                mid = _MIN_MS * _GROWTH ** (idx + 0.5)
+                return min(max(mid, self.min), self.max)
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "p50": round(self.percentile(50), 3),
+            "p95": round(self.percentile(95), 3),
+            "p99": round(self.percentile(99), 3),
+            "mean": round(self.mean, 3),
+            "max": round(self.max, 3),
+        }
+
+
+class _Endpoint:
+    __slots__ = ("wall", "server", "decode", "overhead", "errors", "cached", "bytes_in", "bytes_out")
+
+    def __init__(self) -> None:
+        self.wall, self.server, self.decode, self.overhead = Histogram(), Histogram(), Histogram(), Histogram()
+        self.errors = self.cached = self.bytes_in = self.bytes_out = 0
+
+
+class LatencyHistogram(ClientHook):
+    """Hook that keeps wall / server / decode / overhead histograms per endpoint.
+
+    Thread-safe; one instance may be shared by several clients.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._endpoints: Dict[str, _Endpoint] = {}
+
+    def on_request_end(self, event: RequestEvent) -> None:
+        with self._lock:
+            ep = self._endpoints.get(event.endpoint)
+            if ep is None:
+                ep = self._endpoints[event.endpoint] = _Endpoint()
+            ep.wall.record(event.wall_ms)
+            ep.decode.record(event.decode_ms)
+            if event.server_ms is not None:
+                ep.server.record(event.server_ms)
+                ep.overhead.record(max(event.overhead_ms, 0.0))
+            ep.errors += event.error is not None
+            ep.cached += event.cached
+            ep.bytes_in += event.bytes_in
+            ep.bytes_out += event.bytes_out
+
+    def endpoints(self) -> List[str]:
+        with self._lock:
+            return sorted(self._endpoints)
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """``{endpoint: {count, errors, cached, bytes_in, bytes_out, wall, server, decode, overhead}}``.
+
+        ``wall``/``server``/``decode``/``overhead`` are ``{p50, p95, p99, mean, max}``
+        in milliseconds; ``server``/``overhead`` only cover results that report
+        ``duration_ms``.
+        """
+        with self._lock:
+            return {
+                name: {
+                    "count": ep.wall.count,
+                    "errors": ep.errors,
+                    "cached": ep.cached,
+                    "bytes_in": ep.bytes_in,
+                    "bytes_out": ep.bytes_out,
+                    "wall": ep.wall.summary(),
+                    "server": ep.server.summary(),
+                    "decode": ep.decode.summary(),
+                    "overhead": ep.overhead.summary(),
+                }
+                for name, ep in self._endpoints.items()
+            }
+
+    def dump(self) -> str:
+        """Plain-text table, endpoints ordered by total wall time."""
+        rows = sorted(self.summary().items(), key=lambda kv: -kv[1]["count"] * kv[1]["wall"]["mean"])
+        head = f"{'endpoint':<52} {'n':>6} {'p50':>8} {'p95':>8} {'p99':>8} {'server50':>9} {'decode50':>9}"
+        lines = [head, "-" * len(head)]
+        for name, s in rows:
+            w = s["wall"]
+            server = f"{s['server']['p50']:9.2f}" if s["server"]["max"] else f"{'-':>9}"
+            lines.append(
+                f"{name[:52]:<52} {s['count']:>6} {w['p50']:8.2f} {w['p95']:8.2f} {w['p99']:8.2f}"
+                f" {server} {s['decode']['p50']:9.3f}"
+            )
+        return "\n".join(lines)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._endpoints.clear()
@@ -0,0 +1,84 @@
+"""agentmb Python SDK — lazily built list results.
+
+With ``BrowserClient(lazy=True)`` the large list fields of
+``ElementMapResult``, ``SnapshotMapResult``, ``ExtractResult``,
+``ConsoleLogResult`` and ``PageErrorListResult`` (and ``Session.logs()``)
+come back as ``LazyModelList``: the decoded JSON list is kept as-is and an
+item model is only built — and cached — the first time it is indexed or
+iterated.  An agent that looks at a handful of 5 000 elements pays for a
+handful.
+
+A ``LazyModelList`` is a read-only ``Sequence``: indexing, negative
+indices, slicing (returns another lazy list), iteration, ``len`` and ``in``
+work as on a list, and it compares equal to a list of the same items.
+``model_dump()`` / ``model_dump_json()`` on the owning result build the
+remaining items first, so serialised output is unchanged.  Use
+``list(x)`` or ``x.materialize()`` when a real list is needed.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import Any, Callable, Iterator, List, Optional, overload
+
+_MISSING = object()
+
+
+class LazyModelList(Sequence):
+    """Sequence over decoded JSON items that builds each item on first access."""
+
+    __slots__ = ("_raw", "_items", "_build")
+
+    def __init__(self, raw: List[Any], build: Callable[[Any], Any], _items: Optional[List[Any]] = None) -> None:
+        self._raw = raw
+        self._build = build
+        self._items = _items if _items is not None else [_MISSING] * len(raw)
+
+    @property
+    def raw(self) -> List[Any]:
+        """The decoded JSON items (dicts), untouched."""
+        return self._raw
+
+    @property
+    def built_count(self) -> int:
+        """How many items have been built so far."""
+        return sum(1 for x in self._items if x is not _MISSING)
+
+    def _get(self, i: int) -> Any:
+        item = self._items[i]
+        if item is _MISSING:
+            item = self._items[i] = self._build(self._raw[i])
+        return item
+
+    @overload
+    def __getitem__(self, index: int) -> Any: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "LazyModelList": ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return LazyModelList(self._raw[index], self._build, self._items[index])
+        return self._get(index)
+
+    def __len__(self) -> int:
+        return len(self._raw)
+
+    def __iter__(self) -> Iterator[Any]:
+        get = self._get
+        for i in range(len(self._raw)):
+            yield get(i)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (list, LazyModelList)):
+            return len(self) == len(other) and list(self) == list(other)
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return repr(self.materialize())
+
+    def materialize(self) -> List[Any]:
+        """Build every remaining item and return them as a plain list."""
+        return list(self)
@@ -5,7 +5,21 @@ from __future__ import annotations
 import base64
 from typing import Any, Dict, List, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, model_serializer
+
+from .lazy import LazyModelList
+
+
+class LazyListsModel(BaseModel):
+    """Result whose list fields the client may leave as ``LazyModelList`` (``lazy=True``)."""
+
+    @model_serializer(mode="wrap")
+    def _materialize_lazy_lists(self, handler):
+        d = self.__dict__
+        for k, v in d.items():
+            if isinstance(v, LazyModelList):
+                d[k] = v.materialize()
+        return handler(self)
 
 
 class SessionInfo(BaseModel):
@@ -13,7 +27,7 @@ class SessionInfo(BaseModel):
     profile: str
     headless: bool
     created_at: str
-    state: str = "live"  # 'live' | 'zombie'
+    state: str = "live"  # 'live' | 'zombie' | 'hibernated'
     agent_id: Optional[str] = None
     accept_downloads: bool = False
     # R08-modes: three browser running modes
@@ -92,7 +106,16 @@ class ScreenshotResult(BaseModel):
             f.write(self.to_bytes())
 
 
-class ExtractResult(BaseModel):
+class ScreenshotFileResult(BaseModel):
+    """Result of Session.screenshot(path=...) — bytes streamed straight to disk."""
+    status: str
+    path: str
+    format: str
+    size_bytes: int
+    duration_ms: int
+
+
+class ExtractResult(LazyListsModel):
     status: str
     selector: str
     items: List[Dict[str, Any]]
@@ -155,6 +178,17 @@ class UploadResult(BaseModel):
     duration_ms: int
 
 
+class DownloadToResult(BaseModel):
+    """Result of Session.download_to() — file streamed to disk."""
+    status: str
+    path: str
+    filename: str
+    size_bytes: int
+    duration_ms: int  # server: click → download complete
+    transfer_ms: int  # client wall time minus duration_ms (≈ time on the wire + disk)
+    bytes_per_sec: float
+
+
 class PageInfo(BaseModel):
     page_id: str
     url: str
@@ -234,6 +268,7 @@ class AuditEntry(BaseModel):
     error: Optional[str] = None
     purpose: Optional[str] = None    # why this action is being taken
     operator: Optional[str] = None   # who/what is invoking
+    timings: Optional[Dict[str, float]] = None  # phase breakdown, for requests sent with timings on
 
 
 class HandoffResult(BaseModel):
@@ -247,6 +282,7 @@ class DaemonStatus(BaseModel):
     version: str
     uptime_s: int
     sessions_active: int
+    admission: Optional[Dict[str, Any]] = None  # queue_depth, in_flight, wait_p50_ms, ...
 
 
 
@@ -290,7 +326,7 @@ class ElementInfo(BaseModel):
     label_source: str = "none"  # 'aria-label'|'title'|'aria-labelledby'|'svg-title'|'text'|'placeholder'|'fallback'|'none'
 
 
-class ElementMapResult(BaseModel):
+class ElementMapResult(LazyListsModel):
     """Result of POST /sessions/:id/element_map."""
     status: str
     url: str
@@ -357,7 +393,7 @@ class SnapshotElement(BaseModel):
     label_source: str = "none"  # 'aria-label'|'title'|'aria-labelledby'|'svg-title'|'text'|'placeholder'|'fallback'|'none'
 
 
-class SnapshotMapResult(BaseModel):
+class SnapshotMapResult(LazyListsModel):
     """Result of POST /sessions/:id/snapshot_map."""
     status: str
     snapshot_id: str   # e.g. 'snap_abc123'
@@ -527,7 +563,7 @@ class ConsoleEntry(BaseModel):
     url: str
 
 
-class ConsoleLogResult(BaseModel):
+class ConsoleLogResult(LazyListsModel):
     session_id: str
     entries: List[ConsoleEntry]
     count: int
@@ -539,7 +575,7 @@ class PageErrorEntry(BaseModel):
     url: str
 
 
-class PageErrorListResult(BaseModel):
+class PageErrorListResult(LazyListsModel):
     session_id: str
     entries: List[PageErrorEntry]
     count: int
@@ -611,6 +647,21 @@ class DialogListResult(BaseModel):
     count: int
 
 
+class SessionEvent(BaseModel):
+    """One event from GET /sessions/:id/events (``Session.events()``).
+
+    ``data`` is a ConsoleEntry / PageErrorEntry / DialogEntry for those types,
+    ``{url, page_rev}`` for framenavigated and ``{page_rev, reason}`` for page_rev.
+    ``gap`` is added by the SDK when events were lost across a reconnect
+    (``{since, last_seq}``; ``seq`` is the last one received).
+    """
+    seq: int
+    type: str        # 'console' | 'page_error' | 'dialog' | 'framenavigated' | 'page_rev' | 'session_closed' | 'gap'
+    ts: str
+    page_id: Optional[str] = None
+    data: Dict[str, Any] = Field(default_factory=dict)
+
+
 # ---------------------------------------------------------------------------
 # R07-T23: Clipboard
 # ---------------------------------------------------------------------------
@@ -758,6 +809,28 @@ class RunStepsResult(BaseModel):
     results: List[StepResult]
 
 
+# ---------------------------------------------------------------------------
+# CDP batch (POST /sessions/:id/cdp/batch)
+# ---------------------------------------------------------------------------
+
+class CdpCommandResult(BaseModel):
+    index: int
+    method: str
+    result: Optional[Any] = None
+    error: Optional[str] = None   # sanitized CDP error message
+    duration_ms: int
+
+
+class CdpBatchResult(BaseModel):
+    """Result of POST /sessions/:id/cdp/batch; results are in command order."""
+    status: str           # 'ok' | 'partial' | 'failed'
+    total_commands: int
+    completed_commands: int
+    failed_commands: int
+    duration_ms: int
+    results: List[CdpCommandResult]
+
+
 # ---------------------------------------------------------------------------
 # R08-modes: CDP Attach + Session Seal results
 # ---------------------------------------------------------------------------
@@ -0,0 +1,543 @@
+"""Warm session pools: reuse browser sessions instead of launching one per task.
+
+Creating a session launches a Chromium persistent context, which takes
+seconds.  A pool keeps sessions alive between tasks and resets them on
+return (cookies, console / page-error / dialog buffers, extra tabs,
+``about:blank``)::
+
+    from agentmb import BrowserClient, SessionPool
+
+    with BrowserClient() as client, SessionPool(client, size=4, max_size=8) as pool:
+        with pool.checkout() as sess:
+            sess.navigate("https://example.com")
+
+    async with AsyncBrowserClient() as client:
+        async with AsyncSessionPool(client, size=4) as pool:
+            async with pool.checkout() as sess:
+                await sess.navigate("https://example.com")
+
+* ``size`` sessions are created up front (``warm()`` / entering the pool)
+  and never evicted for idleness; up to ``max_size`` exist at once, and
+  ``checkout()`` waits (``acquire_timeout``) when all are in use.
+* Sessions idle longer than ``idle_timeout`` seconds beyond ``size`` are
+  closed on the next pool operation (or an explicit ``evict_idle()``).
+* With ``health_check=True`` a session is checked (``sessions.get`` →
+  ``state`` ``'live'`` or ``'hibernated'``) before it is handed out; dead
+  ones are replaced.  A session the daemon hibernated while it sat idle is
+  kept: the check does not wake it, and its first request resumes it.
+* A session whose reset fails, or that is returned with
+  ``release(sess, discard=True)``, is closed rather than reused.  Reset
+  failures are counted (``reset_failed``) and reported with a
+  ``RuntimeWarning``, so a broken *reset* does not silently empty the pool.
+
+Pool sessions are ephemeral by default (``ephemeral=True``) so nothing
+persists on disk between tasks; each gets its own profile name
+``<profile_prefix>-<pool number>-<n>``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import threading
+import time
+import warnings
+from collections import deque
+from contextlib import asynccontextmanager, contextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, Iterator, Optional, Set
+
+import httpx
+
+_pool_ids = itertools.count(1)
+
+
+def reset_session(sess: Any) -> None:
+    """Default reset between uses (sync ``Session``)."""
+    pages = sess.pages().pages
+    for p in pages[1:]:
+        sess.close_page(p.page_id)
+    if len(pages) > 1:
+        sess.switch_page(pages[0].page_id)
+    sess.clear_cookies()
+    sess.clear_console_log()
+    sess.clear_page_errors()
+    sess.clear_dialogs()
+    sess.navigate("about:blank")
+
+
+async def async_reset_session(sess: Any) -> None:
+    """Default reset between uses (``AsyncSession``)."""
+    pages = (await sess.pages()).pages
+    for p in pages[1:]:
+        await sess.close_page(p.page_id)
+    if len(pages) > 1:
+        await sess.switch_page(pages[0].page_id)
+    await sess.clear_cookies()
+    await sess.clear_console_log()
+    await sess.clear_page_errors()
+    await sess.clear_dialogs()
+    await sess.navigate("about:blank")
+
+
+@dataclass
+class _Entry:
+    session: Any
+    idle_since: float
+
+
+class _PoolState:
+    """Bookkeeping shared by the sync and async pools (no I/O)."""
+
+    def __init__(self, size: int, max_size: Optional[int], idle_timeout: Optional[float], profile_prefix: str) -> None:
+        if size < 0:
+            raise ValueError(f"size must be >= 0, got {size}")
+        self.size = size
+        self.max_size = max(size, max_size if max_size is not None else size) or 1
+        self.idle_timeout = idle_timeout
+        self.profile_prefix = f"{profile_prefix}-{next(_pool_ids)}"
+        self._seq = itertools.count(1)
+        self.idle: Deque[_Entry] = deque()
+        self.in_use: Set[str] = set()
+        self.pending = 0        # creations in flight
+        self.closed = False
+        self.counters: Dict[str, int] = {"created": 0, "reused": 0, "evicted": 0, "unhealthy": 0, "discarded": 0,
+                                         "reset_failed": 0}
+
+    @property
+    def total(self) -> int:
+        return len(self.idle) + len(self.in_use) + self.pending
+
+    def next_profile(self) -> str:
+        return f"{self.profile_prefix}-{next(self._seq)}"
+
+    def take_expired(self) -> list:
+        """Pop idle entries past ``idle_timeout`` (oldest first), keeping ``size`` sessions."""
+        if self.idle_timeout is None:
+            return []
+        now = time.monotonic()
+        out = []
+        while (self.idle and len(self.idle) + len(self.in_use) > self.size
+               and now - self.idle[0].idle_since >= self.idle_timeout):
+            out.append(self.idle.popleft().session)
+        self.counters["evicted"] += len(out)
+        return out
+
+    def reset_failed(self, sess: Any, exc: BaseException) -> None:
+        """Record a failed reset; the session is discarded by the caller."""
+        self.counters["reset_failed"] += 1
+        warnings.warn(f"pool session {getattr(sess, 'id', sess)} discarded: reset failed: {exc!r}",
+                      RuntimeWarning, stacklevel=3)
+
+    def stats(self) -> Dict[str, int]:
+        return {"idle": len(self.idle), "in_use": len(self.in_use), "size": self.size,
+                "max_size": self.max_size, **self.counters}
+
+
+# Session states a pool may hand out; hibernated sessions resume on their next request
+_USABLE_STATES = ("live", "hibernated")
+
+
+def _is_gone(exc: Exception) -> bool:
+    return isinstance(exc, httpx.HTTPStatusError) and exc.response.status_code == 404
+
+
+# ---------------------------------------------------------------------------
+# Sync
+# ---------------------------------------------------------------------------
+
+class SessionPool:
+    """Pool of warm sync ``Session`` objects for a ``BrowserClient``.
+
+    Args:
+        client: The ``BrowserClient`` sessions are created on.
+        size: Sessions kept warm (created by ``warm()``, never idle-evicted).
+        max_size: Upper bound on sessions (defaults to *size*).
+        idle_timeout: Seconds before a surplus idle session is closed (None = never).
+        health_check: Verify a session is live (or hibernated) before handing it out.
+        reset: Called with each returned session; defaults to :func:`reset_session`.
+        acquire_timeout: Seconds ``acquire()`` waits for a free session (None = forever).
+        profile_prefix: Profile name prefix for pool sessions.
+        **create_kwargs: Passed to ``client.sessions.create`` (``headless``,
+            ``ephemeral`` — default True —, ``browser_channel``, ...).
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        size: int = 2,
+        max_size: Optional[int] = None,
+        idle_timeout: Optional[float] = 300.0,
+        health_check: bool = True,
+        reset: Optional[Callable[[Any], None]] = None,
+        acquire_timeout: Optional[float] = None,
+        profile_prefix: str = "pool",
+        **create_kwargs: Any,
+    ) -> None:
+        self._client = client
+        self._state = _PoolState(size, max_size, idle_timeout, profile_prefix)
+        self._cond = threading.Condition()
+        self.health_check = health_check
+        self._reset = reset or reset_session
+        self.acquire_timeout = acquire_timeout
+        create_kwargs.setdefault("ephemeral", True)
+        self._create_kwargs = create_kwargs
+
+    # -- lifecycle ---------------------------------------------------------
+
+    def warm(self) -> "SessionPool":
+        """Create sessions until ``size`` exist."""
+        while True:
+            with self._cond:
+                if self._state.closed or self._state.total >= self._state.size:
+                    return self
+                self._state.pending += 1
+            self._create(checkout=False)
+
+    def close(self) -> None:
+        """Close idle sessions now; checked-out ones are closed when released."""
+        with self._cond:
+            self._state.closed = True
+            idle = [e.session for e in self._state.idle]
+            self._state.idle.clear()
+            self._cond.notify_all()
+        for sess in idle:
+            self._close(sess)
+
+    def __enter__(self) -> "SessionPool":
+        return self.warm()
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    # -- checkout ----------------------------------------------------------
+
+    def acquire(self) -> Any:
+        """Take a session from the pool (create one if below ``max_size``, else wait)."""
+        deadline = None if self.acquire_timeout is None else time.monotonic() + self.acquire_timeout
+        while True:
+            self.evict_idle()
+            with self._cond:
+                while True:
+                    st = self._state
+                    if st.closed:
+                        raise RuntimeError("SessionPool is closed")
+                    if st.idle:
+                        entry = st.idle.pop()          # most recently used: warmest
+                        st.in_use.add(entry.session.id)
+                        create = False
+                        break
+                    if st.total < st.max_size:
+                        st.pending += 1
+                        create = True
+                        break
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise TimeoutError(f"no pool session free within {self.acquire_timeout}s "
+                                           f"(max_size={st.max_size})")
+                    self._cond.wait(remaining)
+            if create:
+                return self._create(checkout=True)
+            sess = entry.session
+            if self.health_check and not self._check(sess):
+                with self._cond:
+                    self._state.in_use.discard(sess.id)
+                    self._state.counters["unhealthy"] += 1
+                    self._cond.notify()
+                self._close(sess)
+                continue
+            with self._cond:
+                self._state.counters["reused"] += 1
+            return sess
+
+    def release(self, sess: Any, discard: bool = False) -> None:
+        """Return a session; it is reset and kept warm unless *discard* or the reset fails."""
+        keep = not discard and not self._state.closed
+        if keep:
+            try:
+                self._reset(sess)
+            except Exception as e:
+                self._state.reset_failed(sess, e)
+                keep = False
+        with self._cond:
+            self._state.in_use.discard(sess.id)
+            if keep:
+                self._state.idle.append(_Entry(sess, time.monotonic()))
+            elif not self._state.closed:
+                self._state.counters["discarded"] += 1
+            self._cond.notify()
+        if not keep:
+            self._close(sess)
+        self.evict_idle()
+
+    @contextmanager
+    def checkout(self) -> Iterator[Any]:
+        """``with pool.checkout() as sess:`` — discarded instead of reused if the block raises."""
+        sess = self.acquire()
+        try:
+            yield sess
+        except BaseException:
+            self.release(sess, discard=True)
+            raise
+        self.release(sess)
+
+    # -- maintenance -------------------------------------------------------
+
+    def evict_idle(self) -> int:
+        """Close idle sessions past ``idle_timeout`` (beyond ``size``); returns how many."""
+        with self._cond:
+            expired = self._state.take_expired()
+        for sess in expired:
+            self._close(sess)
+        return len(expired)
+
+    def stats(self) -> Dict[str, int]:
+        """Counts: idle, in_use, size, max_size, created, reused, evicted, unhealthy, discarded, reset_failed."""
+        with self._cond:
+            return self._state.stats()
+
+    # -- internals ---------------------------------------------------------
+
+    def _create(self, checkout: bool) -> Any:
+        """Create a session for a reserved ``pending`` slot; it moves to in_use
+        (*checkout*) or idle in the same critical section, so ``total`` never dips."""
+        try:
+            sess = self._client.sessions.create(profile=self._state.next_profile(), **self._create_kwargs)
+        except BaseException:
+            with self._cond:
+                self._state.pending -= 1
+                self._cond.notify()
+            raise
+        with self._cond:
+            self._state.pending -= 1
+            self._state.counters["created"] += 1
+            if checkout:
+                self._state.in_use.add(sess.id)
+            else:
+                self._state.idle.append(_Entry(sess, time.monotonic()))
+                self._cond.notify()
+        return sess
+
+    def _check(self, sess: Any) -> bool:
+        """Health-check a checked-out idle session; if the check itself fails, put it back first."""
+        try:
+            return self._healthy(sess)
+        except BaseException:
+            with self._cond:
+                self._state.in_use.discard(sess.id)
+                self._state.idle.append(_Entry(sess, time.monotonic()))
+                self._cond.notify()
+            raise
+
+    def _healthy(self, sess: Any) -> bool:
+        try:
+            return self._client.sessions.get(sess.id).state in _USABLE_STATES
+        except Exception as e:
+            if _is_gone(e):
+                return False
+            raise
+
+    def _close(self, sess: Any) -> None:
+        try:
+            sess.close()
+        except Exception:
+            pass
+
+
+# ---------------------------------------------------------------------------
+# Async
+# ---------------------------------------------------------------------------
+
+class AsyncSessionPool:
+    """Pool of warm ``AsyncSession`` objects for an ``AsyncBrowserClient``.
+
+    Same options as :class:`SessionPool`; *reset* is an ``async`` callable
+    (defaults to :func:`async_reset_session`).
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        size: int = 2,
+        max_size: Optional[int] = None,
+        idle_timeout: Optional[float] = 300.0,
+        health_check: bool = True,
+        reset: Optional[Callable[[Any], Awaitable[None]]] = None,
+        acquire_timeout: Optional[float] = None,
+        profile_prefix: str = "pool",
+        **create_kwargs: Any,
+    ) -> None:
+        self._client = client
+        self._state = _PoolState(size, max_size, idle_timeout, profile_prefix)
+        self._cond: Optional[asyncio.Condition] = None
+        self.health_check = health_check
+        self._reset = reset or async_reset_session
+        self.acquire_timeout = acquire_timeout
+        create_kwargs.setdefault("ephemeral", True)
+        self._create_kwargs = create_kwargs
+
+    @property
+    def _c(self) -> asyncio.Condition:
+        # Created lazily so the pool can be constructed outside a running loop.
+        if self._cond is None:
+            self._cond = asyncio.Condition()
+        return self._cond
+
+    # -- lifecycle ---------------------------------------------------------
+
+    async def warm(self) -> "AsyncSessionPool":
+        """Create sessions (concurrently) until ``size`` exist."""
+        async with self._c:
+            n = 0 if self._state.closed else max(0, self._state.size - self._state.total)
+            self._state.pending += n
+        results = await asyncio.gather(*(self._create(checkout=False) for _ in range(n)), return_exceptions=True)
+        errors = [e for e in results if isinstance(e, BaseException)]
+        if errors:
+            raise errors[0]
+        return self
+
+    async def close(self) -> None:
+        """Close idle sessions now; checked-out ones are closed when released."""
+        async with self._c:
+            self._state.closed = True
+            idle = [e.session for e in self._state.idle]
+            self._state.idle.clear()
+            self._c.notify_all()
+        await asyncio.gather(*(self._close(s) for s in idle))
+
+    async def __aenter__(self) -> "AsyncSessionPool":
+        return await self.warm()
+
+    async def __aexit__(self, *_) -> None:
+        await self.close()
+
+    # -- checkout ----------------------------------------------------------
+
+    async def acquire(self) -> Any:
+        """Take a session from the pool (create one if below ``max_size``, else wait)."""
+        deadline = None if self.acquire_timeout is None else time.monotonic() + self.acquire_timeout
+        while True:
+            await self.evict_idle()
+            async with self._c:
+                while True:
+                    st = self._state
+                    if st.closed:
+                        raise RuntimeError("AsyncSessionPool is closed")
+                    if st.idle:
+                        entry = st.idle.pop()
+                        st.in_use.add(entry.session.id)
+                        create = False
+                        break
+                    if st.total < st.max_size:
+                        st.pending += 1
+                        create = True
+                        break
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise TimeoutError(f"no pool session free within {self.acquire_timeout}s "
+                                           f"(max_size={st.max_size})")
+                    try:
+                        await asyncio.wait_for(self._c.wait(), remaining)
+                    except asyncio.TimeoutError:
+                        pass
+            if create:
+                return await self._create(checkout=True)
+            sess = entry.session
+            if self.health_check and not await self._check(sess):
+                async with self._c:
+                    self._state.in_use.discard(sess.id)
+                    self._state.counters["unhealthy"] += 1
+                    self._c.notify()
+                await self._close(sess)
+                continue
+            self._state.counters["reused"] += 1
+            return sess
+
+    async def release(self, sess: Any, discard: bool = False) -> None:
+        """Return a session; it is reset and kept warm unless *discard* or the reset fails."""
+        keep = not discard and not self._state.closed
+        if keep:
+            try:
+                await self._reset(sess)
+            except Exception as e:
+                self._state.reset_failed(sess, e)
+                keep = False
+        async with self._c:
+            self._state.in_use.discard(sess.id)
+            if keep:
+                self._state.idle.append(_Entry(sess, time.monotonic()))
+            elif not self._state.closed:
+                self._state.counters["discarded"] += 1
+            self._c.notify()
+        if not keep:
+            await self._close(sess)
+        await self.evict_idle()
+
+    @asynccontextmanager
+    async def checkout(self) -> AsyncIterator[Any]:
+        """``async with pool.checkout() as sess:`` — discarded if the block raises."""
+        sess = await self.acquire()
+        try:
+            yield sess
+        except BaseException:
+            await self.release(sess, discard=True)
+            raise
+        await self.release(sess)
+
+    # -- maintenance -------------------------------------------------------
+
+    async def evict_idle(self) -> int:
+        """Close idle sessions past ``idle_timeout`` (beyond ``size``); returns how many."""
+        expired = self._state.take_expired()
+        await asyncio.gather(*(self._close(s) for s in expired))
+        return len(expired)
+
+    def stats(self) -> Dict[str, int]:
+        """Counts: idle, in_use, size, max_size, created, reused, evicted, unhealthy, discarded, reset_failed."""
+        return self._state.stats()
+
+    # -- internals ---------------------------------------------------------
+
+    async def _create(self, checkout: bool) -> Any:
+        """Create a session for a reserved ``pending`` slot (see ``SessionPool._create``)."""
+        try:
+            sess = await self._client.sessions.create(profile=self._state.next_profile(), **self._create_kwargs)
+        except BaseException:
+            async with self._c:
+                self._state.pending -= 1
+                self._c.notify()
+            raise
+        async with self._c:
+            self._state.pending -= 1
+            self._state.counters["created"] += 1
+            if checkout:
+                self._state.in_use.add(sess.id)
+            else:
+                self._state.idle.append(_Entry(sess, time.monotonic()))
+                self._c.notify()
+        return sess
+
+    async def _check(self, sess: Any) -> bool:
+        """Health-check a checked-out idle session; if the check itself fails, put it back first."""
+        try:
+            return await self._healthy(sess)
+        except BaseException:
+            async with self._c:
+                self._state.in_use.discard(sess.id)
+                self._state.idle.append(_Entry(sess, time.monotonic()))
+                self._c.notify()
+            raise
+
+    async def _healthy(self, sess: Any) -> bool:
+        try:
+            return (await self._client.sessions.get(sess.id)).state in _USABLE_STATES
+        except Exception as e:
+            if _is_gone(e):
+                return False
+            raise
+
+    async def _close(self, sess: Any) -> None:
+        try:
+            await sess.close()
+        except Exception:
+            pass
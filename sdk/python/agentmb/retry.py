@@ -0,0 +1,297 @@
+"""Automatic retry / backoff for agentmb clients.
+
+Off by default; pass ``retry=RetryPolicy(...)`` (or ``retry=True`` for the
+defaults) to ``BrowserClient`` / ``AsyncBrowserClient``::
+
+    from agentmb import BrowserClient, RetryPolicy, RetryRule
+
+    client = BrowserClient(retry=RetryPolicy(
+        deadline=20.0,                       # give up 20 s after the first attempt
+        rules={**RetryPolicy.default_rules(), 410: RetryRule(max_attempts=3)},
+    ))
+    print(client.metrics.retries, client.metrics.stale_ref_remaps)
+
+Per-status rules (``RetryRule``) decide what is retried:
+
+* ``409`` with ``error == "stale_ref"`` — the page changed under a
+  ``ref_id``.  The client re-runs ``snapshot_map`` (same arguments as the
+  snapshot the ref came from), finds the element with the same fingerprint
+  (tag, role, name, text, label, href, placeholder, type; nearest rect on a
+  tie) and resends the request with the new ``ref_id``.
+* ``429`` / ``503`` — throttling / overload; ``Retry-After`` is honoured.
+* ``502`` / ``504`` — gateway errors, for idempotent methods only.
+* Connection failures (``httpx.ConnectError`` / ``ConnectTimeout``) — the
+  request never reached the daemon, so every method is retried.
+
+Not retried by default: policy ``403`` (``applyPolicy`` denials are final —
+throttling already waits server-side) and ``410`` zombie sessions (add a
+rule when something else relaunches them).  Backoff is exponential with
+full jitter, capped by ``max_backoff`` and the overall ``deadline``.  When
+retries run out the original ``httpx.HTTPStatusError`` is raised, exactly
+as without a policy.  Streamed uploads and downloads are never retried.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+import httpx
+
+IDEMPOTENT = frozenset({"GET", "HEAD", "PUT", "DELETE", "OPTIONS"})
+
+_CONNECT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout)
+
+_FINGERPRINT = ("tag", "role", "name", "text", "label", "href", "placeholder", "type")
+
+
+@dataclass(frozen=True)
+class RetryRule:
+    """How often one response status is retried.
+
+    Attributes:
+        max_attempts: Total attempts, including the first.
+        methods: Only retry these HTTP methods (None = any).
+        error: Only retry when the JSON body's ``error`` equals this.
+    """
+
+    max_attempts: int = 3
+    methods: Optional[FrozenSet[str]] = None
+    error: Optional[str] = None
+
+    def matches(self, method: str, error: Optional[str]) -> bool:
+        if self.methods is not None and method.upper() not in self.methods:
+            return False
+        return self.error is None or self.error == error
+
+
+@dataclass
+class RetryPolicy:
+    """Retry rules plus backoff settings.
+
+    Attributes:
+        rules: Status code -> ``RetryRule`` (see ``default_rules()``).
+        backoff: First retry delay in seconds.
+        multiplier: Delay growth per attempt.
+        max_backoff: Upper bound on one delay.
+        jitter: Fraction of the delay that is randomised (1.0 = full jitter).
+        deadline: Seconds after the first attempt past which no retry starts.
+        retry_connect_errors: Retry when the connection could not be made.
+        connect_attempts: Total attempts for connection failures.
+        remap_stale_refs: Re-snapshot and remap ``ref_id`` on 409 stale_ref.
+        respect_retry_after: Use the ``Retry-After`` header when present.
+    """
+
+    rules: Dict[int, RetryRule] = field(default_factory=lambda: RetryPolicy.default_rules())
+    backoff: float = 0.2
+    multiplier: float = 2.0
+    max_backoff: float = 5.0
+    jitter: float = 1.0
+    deadline: Optional[float] = 30.0
+    retry_connect_errors: bool = True
+    connect_attempts: int = 3
+    remap_stale_refs: bool = True
+    respect_retry_after: bool = True
+
+    @staticmethod
+    def default_rules() -> Dict[int, RetryRule]:
+        return {
+            409: RetryRule(max_attempts=2, error="stale_ref"),
+            429: RetryRule(max_attempts=4),
+            502: RetryRule(max_attempts=3, methods=IDEMPOTENT),
+            503: RetryRule(max_attempts=3),
+            504: RetryRule(max_attempts=3, methods=IDEMPOTENT),
+        }
+
+    def delay(self, attempt: int) -> float:
+        """Backoff before retry number *attempt* (1-based)."""
+        d = min(self.max_backoff, self.backoff * self.multiplier ** (attempt - 1))
+        return d - random.uniform(0, d * self.jitter)
+
+
+def resolve_policy(retry: Any) -> Optional[RetryPolicy]:
+    """Client ``retry=`` argument -> policy (None / False = off, True = defaults)."""
+    if retry is None or retry is False:
+        return None
+    if retry is True:
+        return RetryPolicy()
+    if isinstance(retry, RetryPolicy):
+        return retry
+    raise TypeError(f"retry must be a RetryPolicy, bool or None, not {type(retry).__name__}")
+
+
+@dataclass
+class ClientMetrics:
+    """Counters kept on ``client.metrics``."""
+
+    requests: int = 0
+    retries: int = 0
+    retries_by_status: Dict[int, int] = field(default_factory=dict)  # 0 = connection error
+    stale_ref_remaps: int = 0
+    gave_up: int = 0
+    not_modified: int = 0  # conditional GETs answered 304 from the client cache
+
+    def count_retry(self, status: int) -> None:
+        self.retries += 1
+        self.retries_by_status[status] = self.retries_by_status.get(status, 0) + 1
+
+
+def error_code(resp: httpx.Response) -> Optional[str]:
+    """The ``error`` field of a JSON error body, if any."""
+    if "json" not in resp.headers.get("content-type", ""):
+        return None
+    try:
+        body = resp.json()
+    except ValueError:
+        return None
+    err = body.get("error") if isinstance(body, dict) else None
+    return err if isinstance(err, str) else None
+
+
+def _retry_after(resp: httpx.Response) -> Optional[float]:
+    value = resp.headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        return None
+
+
+class Attempts:
+    """Retry bookkeeping for one logical request."""
+
+    def __init__(self, policy: RetryPolicy, method: str, metrics: ClientMetrics) -> None:
+        self.policy = policy
+        self.method = method.upper()
+        self.metrics = metrics
+        self.start = time.monotonic()
+        self.count = 1
+        metrics.requests += 1
+
+    def _schedule(self, delay: float, limit: int, status: int) -> Optional[float]:
+        if self.count >= limit:
+            self.metrics.gave_up += 1
+            return None
+        if self.policy.deadline is not None and time.monotonic() + delay - self.start > self.policy.deadline:
+            self.metrics.gave_up += 1
+            return None
+        self.metrics.count_retry(status)
+        self.count += 1
+        return delay
+
+    def after_response(self, resp: httpx.Response, error: Optional[str]) -> Optional[float]:
+        """Seconds to wait before retrying *resp*, or None to give up."""
+        rule = self.policy.rules.get(resp.status_code)
+        if rule is None or not rule.matches(self.method, error):
+            return None
+        delay = self.policy.delay(self.count)
+        if self.policy.respect_retry_after:
+            ra = _retry_after(resp)
+            if ra is not None:
+                delay = ra
+        return self._schedule(delay, rule.max_attempts, resp.status_code)
+
+    def after_error(self, exc: Exception) -> Optional[float]:
+        """Seconds to wait before retrying a transport error, or None to give up."""
+        if not (self.policy.retry_connect_errors and isinstance(exc, _CONNECT_ERRORS)):
+            return None
+        return self._schedule(self.policy.delay(self.count), self.policy.connect_attempts, 0)
+
+    def stale_ref_rule(self, error: Optional[str]) -> bool:
+        """True when a 409 with *error* should be remapped and retried."""
+        rule = self.policy.rules.get(409)
+        return self.policy.remap_stale_refs and rule is not None and rule.matches(self.method, error)
+
+    def after_remap(self) -> Optional[float]:
+        """Retry immediately after a successful ref remap (counts against the 409 rule)."""
+        delay = self._schedule(0.0, self.policy.rules[409].max_attempts, 409)
+        if delay is not None:
+            self.metrics.stale_ref_remaps += 1
+        return delay
+
+
+# ---------------------------------------------------------------------------
+# ref_id remapping
+# ---------------------------------------------------------------------------
+
+def _fingerprint(el: Dict[str, Any]) -> Tuple:
+    return tuple(el.get(k) for k in _FINGERPRINT)
+
+
+def _center(el: Dict[str, Any]) -> Tuple[float, float]:
+    r = el.get("rect") or {}
+    get = r.get if isinstance(r, dict) else (lambda k, d=0: getattr(r, k, d))
+    return (get("x", 0) + get("width", 0) / 2, get("y", 0) + get("height", 0) / 2)
+
+
+class RefIndex:
+    """Remembers recent snapshots so a stale ``ref_id`` can be remapped.
+
+    Keeps the elements of the last *max_snapshots* snapshots across all
+    sessions (decoded dicts), keyed by ``snapshot_id``.
+    """
+
+    def __init__(self, max_snapshots: int = 32) -> None:
+        self._max = max_snapshots
+        self._lock = threading.Lock()
+        # snapshot_id -> (session_id, snapshot_map request body, {ref_id: element})
+        self._snapshots: "OrderedDict[str, Tuple[str, dict, Dict[str, Dict[str, Any]]]]" = OrderedDict()
+
+    def remember(self, session_id: str, request: dict, snapshot_id: str, elements: Iterable[Dict[str, Any]]) -> None:
+        refs = {el["ref_id"]: el for el in elements if isinstance(el, dict) and "ref_id" in el}
+        with self._lock:
+            self._snapshots[snapshot_id] = (session_id, dict(request), refs)
+            self._snapshots.move_to_end(snapshot_id)
+            while len(self._snapshots) > self._max:
+                self._snapshots.popitem(last=False)
+
+    def lookup(self, ref_id: str) -> Optional[Tuple[str, dict, Dict[str, Any]]]:
+        """``(session_id, snapshot request, element)`` for a remembered ref_id."""
+        snapshot_id = ref_id.rpartition(":")[0]
+        with self._lock:
+            entry = self._snapshots.get(snapshot_id)
+        if entry is None or ref_id not in entry[2]:
+            return None
+        return entry[0], entry[1], entry[2][ref_id]
+
+    @staticmethod
+    def match(old: Dict[str, Any], elements: List[Dict[str, Any]]) -> Optional[str]:
+        """ref_id of the element in *elements* that best matches *old*, if any."""
+        fp = _fingerprint(old)
+        candidates = [el for el in elements if _fingerprint(el) == fp]
+        if not candidates:
+            return None
+        ox, oy = _center(old)
+        best = min(candidates, key=lambda el: (_center(el)[0] - ox) ** 2 + (_center(el)[1] - oy) ** 2)
+        return best.get("ref_id")
+
+
+def remap_request(index: RefIndex, body: Optional[dict]) -> Optional[Tuple[str, dict, Dict[str, Any]]]:
+    """Snapshot info needed to remap *body*'s ref_id, or None when it cannot be remapped."""
+    if not isinstance(body, dict) or not isinstance(body.get("ref_id"), str):
+        return None
+    return index.lookup(body["ref_id"])
+
+
+def remapped_body(index: RefIndex, body: dict, session_id: str, request: dict,
+                  old: Dict[str, Any], snapshot: Any) -> Optional[dict]:
+    """Record a fresh *snapshot* (decoded snapshot_map body) and rewrite *body*'s ref_id."""
+    if not isinstance(snapshot, dict) or not isinstance(snapshot.get("elements"), list):
+        return None
+    index.remember(session_id, request, snapshot.get("snapshot_id", ""), snapshot["elements"])
+    ref = RefIndex.match(old, snapshot["elements"])
+    return {**body, "ref_id": ref} if ref else None
+
+
+def snapshot_elements(result: Any) -> List[Dict[str, Any]]:
+    """Element dicts of a ``SnapshotMapResult`` (lazy or built) for ``RefIndex``."""
+    from .lazy import LazyModelList
+    els = result.elements
+    if isinstance(els, LazyModelList):
+        return els.raw
+    return [e.__dict__ for e in els]
@@ -0,0 +1,341 @@
+"""agentmb Python SDK — connection pooling / transport configuration.
+
+By default each ``BrowserClient`` / ``AsyncBrowserClient`` builds its own
+httpx connection pool with httpx's default limits (100 connections, only 20
+kept alive for 5 s).  When many sessions hammer one daemon concurrently the
+surplus connections are torn down after every burst and re-opened on the
+next one.  ``TransportConfig`` makes those limits explicit; ``SharedTransport``
+lets several clients reuse one pool.
+
+Usage::
+
+    from agentmb import AsyncBrowserClient, TransportConfig, SharedTransport
+
+    cfg = TransportConfig(max_connections=128, max_keepalive_connections=128,
+                          keepalive_expiry=60.0)
+    client = AsyncBrowserClient(transport=cfg)
+
+    shared = SharedTransport(cfg)
+    a = BrowserClient(transport=shared)
+    b = BrowserClient(transport=shared)
+    a.close(); b.close()      # the shared pool stays open
+    shared.close()            # owner closes it explicitly
+
+Unix domain socket: start the daemon with ``AGENTMB_SOCKET=1`` (socket file
+``<AGENTMB_DATA_DIR>/agentmb.sock``) and pass ``transport="uds"`` — or
+``TransportConfig(uds="/path/to/agentmb.sock")`` to combine it with pool
+limits — to skip loopback TCP entirely.
+
+HTTP/2 (``http2=True``) needs the optional ``h2`` package
+(``pip install 'agentmb[http2]'``).  httpx only negotiates HTTP/2 over TLS
+(ALPN), so it takes effect when the daemon sits behind a TLS-terminating
+proxy; plain ``http://127.0.0.1`` connections stay on HTTP/1.1.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+from dataclasses import dataclass
+from typing import Dict, Optional, Union
+
+import httpx
+
+
+@dataclass
+class TransportConfig:
+    """Connection-pool settings for an agentmb client.
+
+    Attributes:
+        max_connections: Upper bound on open connections (None = unbounded).
+        max_keepalive_connections: Idle connections kept for reuse.  Set this
+            to the expected concurrency to avoid reconnect churn.
+        keepalive_expiry: Seconds an idle connection is kept before closing.
+        http2: Negotiate HTTP/2 where possible (requires ``h2``).
+        max_connections_per_host: Optional cap on in-flight requests per
+            host, enforced on top of the pool (useful with a SharedTransport
+            that talks to several daemons).
+        retries: Connection-level retries on connect errors (httpx).
+        uds: Path of the daemon's Unix domain socket; None = TCP.
+    """
+
+    max_connections: Optional[int] = 100
+    max_keepalive_connections: Optional[int] = 100
+    keepalive_expiry: Optional[float] = 30.0
+    http2: bool = False
+    max_connections_per_host: Optional[int] = None
+    retries: int = 0
+    uds: Optional[str] = None
+
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    def _check_http2(self) -> None:
+        if not self.http2:
+            return
+        try:
+            import h2  # noqa: F401
+        except ImportError as e:
+            raise ImportError(
+                "TransportConfig(http2=True) requires the 'h2' package: "
+                "pip install 'agentmb[http2]'"
+            ) from e
+
+    def build_sync(self) -> httpx.BaseTransport:
+        """Build a new sync httpx transport from this config."""
+        self._check_http2()
+        t: httpx.BaseTransport = httpx.HTTPTransport(
+            limits=self.limits(), http2=self.http2, retries=self.retries, uds=self.uds,
+        )
+        if self.max_connections_per_host:
+            t = _HostLimitedTransport(t, self.max_connections_per_host)
+        return t
+
+    def build_async(self) -> httpx.AsyncBaseTransport:
+        """Build a new async httpx transport from this config."""
+        self._check_http2()
+        t: httpx.AsyncBaseTransport = httpx.AsyncHTTPTransport(
+            limits=self.limits(), http2=self.http2, retries=self.retries, uds=self.uds,
+        )
+        if self.max_connections_per_host:
+            t = _AsyncHostLimitedTransport(t, self.max_connections_per_host)
+        return t
+
+
+class SharedTransport:
+    """A connection pool that several clients can share.
+
+    Clients built with ``transport=shared`` never close the pool themselves;
+    call ``close()`` / ``aclose()`` (or use it as a context manager) once all
+    clients are done.  The sync and async pools are created lazily and are
+    independent of each other.
+    """
+
+    def __init__(self, config: Optional[TransportConfig] = None) -> None:
+        self.config = config or TransportConfig()
+        self._lock = threading.Lock()
+        self._sync: Optional[httpx.BaseTransport] = None
+        self._async: Optional[httpx.AsyncBaseTransport] = None
+
+    def sync_transport(self) -> httpx.BaseTransport:
+        with self._lock:
+            if self._sync is None:
+                self._sync = self.config.build_sync()
+            return _NonClosingTransport(self._sync)
+
+    def async_transport(self) -> httpx.AsyncBaseTransport:
+        with self._lock:
+            if self._async is None:
+                self._async = self.config.build_async()
+            return _AsyncNonClosingTransport(self._async)
+
+    def close(self) -> None:
+        """Close the sync pool (the async pool needs ``aclose()``)."""
+        with self._lock:
+            t, self._sync = self._sync, None
+        if t is not None:
+            t.close()
+
+    async def aclose(self) -> None:
+        """Close both pools."""
+        self.close()
+        with self._lock:
+            t, self._async = self._async, None
+        if t is not None:
+            await t.aclose()
+
+    def __enter__(self) -> "SharedTransport":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    async def __aenter__(self) -> "SharedTransport":
+        return self
+
+    async def __aexit__(self, *_) -> None:
+        await self.aclose()
+
+
+TransportLike = Union[TransportConfig, SharedTransport, str, None]
+
+
+def default_socket_path() -> str:
+    """Socket path the daemon uses for ``AGENTMB_SOCKET`` (mirrors src/daemon/config.ts)."""
+    env = os.environ.get("AGENTMB_SOCKET")
+    if env and env not in ("0", "1", "true", "false"):
+        return env
+    data_dir = os.environ.get("AGENTMB_DATA_DIR") or os.path.join(os.path.expanduser("~"), ".agentmb")
+    return os.path.join(data_dir, "agentmb.sock")
+
+
+def _from_name(transport: str, socket_path: Optional[str]) -> Optional[TransportConfig]:
+    if transport == "tcp":
+        return None
+    if transport == "uds":
+        return TransportConfig(uds=socket_path or default_socket_path())
+    raise ValueError(f"unknown transport {transport!r} (expected 'tcp' or 'uds')")
+
+
+def build_sync_transport(
+    transport: TransportLike, socket_path: Optional[str] = None,
+) -> Optional[httpx.BaseTransport]:
+    """Resolve a client's ``transport=`` argument to an httpx transport (None = httpx default)."""
+    if isinstance(transport, str):
+        transport = _from_name(transport, socket_path)
+    if transport is None:
+        return None
+    if isinstance(transport, SharedTransport):
+        return transport.sync_transport()
+    if isinstance(transport, TransportConfig):
+        return transport.build_sync()
+    raise TypeError(f"unsupported transport: {transport!r}")
+
+
+def build_async_transport(
+    transport: TransportLike, socket_path: Optional[str] = None,
+) -> Optional[httpx.AsyncBaseTransport]:
+    """Async counterpart of ``build_sync_transport``."""
+    if isinstance(transport, str):
+        transport = _from_name(transport, socket_path)
+    if transport is None:
+        return None
+    if isinstance(transport, SharedTransport):
+        return transport.async_transport()
+    if isinstance(transport, TransportConfig):
+        return transport.build_async()
+    raise TypeError(f"unsupported transport: {transport!r}")
+
+
+# ---------------------------------------------------------------------------
+# Transport wrappers
+# ---------------------------------------------------------------------------
+
+class _NonClosingTransport(httpx.BaseTransport):
+    """View of a shared transport; ``close()`` is a no-op."""
+
+    def __init__(self, inner: httpx.BaseTransport) -> None:
+        self._inner = inner
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return self._inner.handle_request(request)
+
+    def close(self) -> None:
+        pass
+
+
+class _AsyncNonClosingTransport(httpx.AsyncBaseTransport):
+    def __init__(self, inner: httpx.AsyncBaseTransport) -> None:
+        self._inner = inner
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        return await self._inner.handle_async_request(request)
+
+    async def aclose(self) -> None:
+        pass
+
+
+class _ReleasingStream(httpx.SyncByteStream):
+    def __init__(self, stream: httpx.SyncByteStream, release) -> None:
+        self._stream = stream
+        self._release = release
+
+    def __iter__(self):
+        yield from self._stream
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            release, self._release = self._release, None
+            if release is not None:
+                release()
+
+
+class _AsyncReleasingStream(httpx.AsyncByteStream):
+    def __init__(self, stream: httpx.AsyncByteStream, release) -> None:
+        self._stream = stream
+        self._release = release
+
+    async def __aiter__(self):
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            release, self._release = self._release, None
+            if release is not None:
+                release()
+
+
+class _HostLimitedTransport(httpx.BaseTransport):
+    """Caps in-flight requests per host; a slot is held until the response is closed."""
+
+    def __init__(self, inner: httpx.BaseTransport, per_host: int) -> None:
+        self._inner = inner
+        self._per_host = per_host
+        self._lock = threading.Lock()
+        self._sems: Dict[str, threading.BoundedSemaphore] = {}
+
+    def _sem(self, host: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            sem = self._sems.get(host)
+            if sem is None:
+                sem = self._sems[host] = threading.BoundedSemaphore(self._per_host)
+            return sem
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        sem = self._sem(request.url.netloc.decode("ascii"))
+        sem.acquire()
+        try:
+            resp = self._inner.handle_request(request)
+        except BaseException:
+            sem.release()
+            raise
+        return httpx.Response(
+            status_code=resp.status_code,
+            headers=resp.headers,
+            stream=_ReleasingStream(resp.stream, sem.release),
+            extensions=resp.extensions,
+        )
+
+    def close(self) -> None:
+        self._inner.close()
+
+
+class _AsyncHostLimitedTransport(httpx.AsyncBaseTransport):
+    def __init__(self, inner: httpx.AsyncBaseTransport, per_host: int) -> None:
+        self._inner = inner
+        self._per_host = per_host
+        self._sems: Dict[str, asyncio.Semaphore] = {}
+
+    def _sem(self, host: str) -> asyncio.Semaphore:
+        sem = self._sems.get(host)
+        if sem is None:
+            sem = self._sems[host] = asyncio.Semaphore(self._per_host)
+        return sem
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        sem = self._sem(request.url.netloc.decode("ascii"))
+        await sem.acquire()
+        try:
+            resp = await self._inner.handle_async_request(request)
+        except BaseException:
+            sem.release()
+            raise
+        return httpx.Response(
+            status_code=resp.status_code,
+            headers=resp.headers,
+            stream=_AsyncReleasingStream(resp.stream, sem.release),
+            extensions=resp.extensions,
+        )
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
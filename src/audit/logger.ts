@@ -1,5 +1,7 @@
 import fs from 'fs'
 import path from 'path'
+import { performance } from 'perf_hooks'
+import { currentTimings } from '../daemon/timings'
 
 export interface AuditEntry {
   ts?: string
@@ -16,6 +18,7 @@ export interface AuditEntry {
   error?: string | null
   purpose?: string    // why this action is being taken (caller-supplied, optional)
   operator?: string   // who/what is invoking (e.g. agent_id, "sdk", "cli")
+  timings?: Record<string, number>  // phase breakdown so far, when the request asked for timings
 }
 
 export class AuditLogger {
@@ -27,6 +30,8 @@ export class AuditLogger {
   }
 
   write(entry: AuditEntry): void {
+    const timings = currentTimings()
+    const t0 = timings ? performance.now() : 0
     const now = new Date()
     const date = now.toISOString().slice(0, 10) // YYYY-MM-DD
     if (date !== this.currentDate || !this.stream) {
@@ -40,7 +45,14 @@ export class AuditLogger {
       v: 1,
       ...entry,
     }
+    if (timings && entry.type === 'action') record.timings = timings.snapshot(t0)
     this.stream.write(JSON.stringify(record) + '\n')
+    timings?.add('audit', performance.now() - t0)
+  }
+
+  /** Bytes written but not yet flushed to the log file. */
+  backlogBytes(): number {
+    return this.stream?.writableLength ?? 0
   }
 
   tail(sessionId: string, lines: number): AuditEntry[] {
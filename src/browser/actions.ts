@@ -1,5 +1,6 @@
 import crypto from 'crypto'
 import fs from 'fs'
+import path from 'path'
 import { Page, Frame } from 'playwright-core'
 import { AuditLogger } from '../audit/logger'
 
@@ -181,15 +182,30 @@ export async function screenshot(
   purpose?: string,
   operator?: string,
 ): Promise<{ status: string; data: string; format: string; duration_ms: number }> {
+  const { buffer, duration_ms } = await screenshotBuffer(page, format, fullPage, logger, sessionId, purpose, operator)
+  return { status: 'ok', data: buffer.toString('base64'), format, duration_ms }
+}
+
+/**
+ * Capture a screenshot as a raw Buffer (no base64 step).
+ * Used by POST /screenshot/raw, which sends the bytes as the response body.
+ */
+export async function screenshotBuffer(
+  page: Page,
+  format: 'png' | 'jpeg' = 'png',
+  fullPage = false,
+  logger?: AuditLogger,
+  sessionId?: string,
+  purpose?: string,
+  operator?: string,
+): Promise<{ buffer: Buffer; format: string; duration_ms: number }> {
   const id = actionId()
   const t0 = Date.now()
   try {
     const buffer = await page.screenshot({ type: format, fullPage })
     const duration_ms = Date.now() - t0
-    const data = buffer.toString('base64')
-    const result = { status: 'ok', data, format, duration_ms }
     logger?.write({ session_id: sessionId, action_id: id, type: 'action', action: 'screenshot', url: page.url(), params: { format, full_page: fullPage }, result: { status: 'ok', size_bytes: buffer.length, duration_ms }, purpose, operator })
-    return result
+    return { buffer, format, duration_ms }
   } catch (err) {
     throw new ActionDiagnosticsError(await collectDiagnostics(page, t0, err))
   }
@@ -468,6 +484,37 @@ export async function uploadFile(
   }
 }
 
+/**
+ * Set a file input from a file already on disk (streamed uploads).
+ * Playwright hands the path to Chromium directly, so the bytes are never
+ * loaded into the daemon's heap. The MIME type is inferred by the browser
+ * from the extension; `mimeType` is recorded for the response/audit only.
+ */
+export async function uploadFilePath(
+  page: Page,
+  selector: string,
+  filePath: string,
+  mimeType = 'application/octet-stream',
+  logger?: AuditLogger,
+  sessionId?: string,
+  purpose?: string,
+  operator?: string,
+): Promise<{ status: string; selector: string; filename: string; size_bytes: number; mime_type: string; duration_ms: number }> {
+  const id = actionId()
+  const t0 = Date.now()
+  try {
+    const size_bytes = fs.statSync(filePath).size
+    const filename = path.basename(filePath)
+    await page.setInputFiles(selector, filePath)
+    const duration_ms = Date.now() - t0
+    const result = { status: 'ok', selector, filename, size_bytes, mime_type: mimeType, duration_ms }
+    logger?.write({ session_id: sessionId, action_id: id, type: 'action', action: 'upload', url: page.url(), selector, params: { filename, mime_type: mimeType, size_bytes, stream: true }, result, purpose, operator })
+    return result
+  } catch (err) {
+    throw new ActionDiagnosticsError(await collectDiagnostics(page, t0, err))
+  }
+}
+
 // ---------------------------------------------------------------------------
 // R07-T01: element_map — scan page elements, assign stable IDs
 // ---------------------------------------------------------------------------
@@ -1271,6 +1318,39 @@ export async function downloadFile(
   }
 }
 
+/**
+ * Click `selector`, wait for the resulting download to finish and return its
+ * on-disk path without reading it. POST /download/stream pipes the file to the
+ * client from there, so memory stays bounded whatever the file size.
+ */
+export async function downloadToPath(
+  page: Page,
+  selector: string,
+  timeoutMs = 30000,
+  logger?: AuditLogger,
+  sessionId?: string,
+  purpose?: string,
+  operator?: string,
+): Promise<{ status: string; filename: string; path: string; size_bytes: number; duration_ms: number }> {
+  const id = actionId()
+  const t0 = Date.now()
+  try {
+    const [download] = await Promise.all([
+      page.waitForEvent('download', { timeout: timeoutMs }),
+      page.click(selector),
+    ])
+    const downloadPath = await download.path()
+    if (!downloadPath) throw new Error('Download failed: no path returned')
+    const size_bytes = fs.statSync(downloadPath).size
+    const filename = download.suggestedFilename()
+    const duration_ms = Date.now() - t0
+    logger?.write({ session_id: sessionId, action_id: id, type: 'action', action: 'download', url: page.url(), selector, params: { timeout_ms: timeoutMs, stream: true }, result: { status: 'ok', filename, size_bytes, duration_ms }, purpose, operator })
+    return { status: 'ok', filename, path: downloadPath, size_bytes, duration_ms }
+  } catch (err) {
+    throw new ActionDiagnosticsError(await collectDiagnostics(page, t0, err))
+  }
+}
+
 // ---------------------------------------------------------------------------
 // R07-C04: T19 — coordinate-based primitives (click_at / wheel / insert_text)
 // ---------------------------------------------------------------------------
@@ -0,0 +1,117 @@
+// ---------------------------------------------------------------------------
+// Per-session event hub (GET /api/v1/sessions/:id/events)
+// ---------------------------------------------------------------------------
+
+export type SessionEventType = 'console' | 'page_error' | 'dialog' | 'framenavigated' | 'page_rev' | 'session_closed'
+
+export const SESSION_EVENT_TYPES: SessionEventType[] = [
+  'console', 'page_error', 'dialog', 'framenavigated', 'page_rev', 'session_closed',
+]
+
+export interface SessionEvent {
+  /** Per-session sequence number (1, 2, …); SSE clients resume with Last-Event-ID. */
+  seq: number
+  type: SessionEventType
+  ts: string
+  page_id?: string
+  data: Record<string, unknown>
+}
+
+export type SessionEventListener = (event: SessionEvent) => void
+
+interface Subscriber {
+  listener: SessionEventListener
+  /** Called when no more events will come (session closed, daemon shutting down). */
+  onEnd: () => void
+}
+
+interface SessionChannel {
+  seq: number
+  recent: SessionEvent[]
+  subscribers: Set<Subscriber>
+}
+
+/**
+ * Fans page events out to stream subscribers. The last `keep` events of each
+ * session are retained so that a reconnecting subscriber can pick up where it
+ * left off; subscribers that fall further behind are told they missed some.
+ */
+export class SessionEventHub {
+  private channels = new Map<string, SessionChannel>()
+  private published = 0
+
+  constructor(private readonly keep = 256) {}
+
+  publish(sessionId: string, type: SessionEventType, data: Record<string, unknown>, pageId?: string): void {
+    const ch = this.channel(sessionId)
+    const event: SessionEvent = { seq: ++ch.seq, type, ts: new Date().toISOString(), data }
+    if (pageId) event.page_id = pageId
+    ch.recent.push(event)
+    if (ch.recent.length > this.keep) ch.recent.shift()
+    this.published++
+    for (const sub of ch.subscribers) {
+      try {
+        sub.listener(event)
+      } catch {
+        // a broken subscriber must not break the Playwright event handler
+      }
+    }
+  }
+
+  /**
+   * Retained events after `seq`; `missed` when older ones were already evicted,
+   * or when `seq` is ahead of this session's counter (the daemon restarted).
+   */
+  since(sessionId: string, seq: number): { events: SessionEvent[]; missed: boolean } {
+    const ch = this.channels.get(sessionId)
+    const recent = ch?.recent ?? []
+    if (seq > (ch?.seq ?? 0)) return { events: recent.slice(), missed: true }
+    const events = recent.filter((e) => e.seq > seq)
+    const missed = recent.length > 0 && recent[0].seq > seq + 1
+    return { events, missed }
+  }
+
+  lastSeq(sessionId: string): number {
+    return this.channels.get(sessionId)?.seq ?? 0
+  }
+
+  /** Register a listener; returns the unsubscribe function. */
+  subscribe(sessionId: string, listener: SessionEventListener, onEnd: () => void): () => void {
+    const ch = this.channel(sessionId)
+    const sub: Subscriber = { listener, onEnd }
+    ch.subscribers.add(sub)
+    return () => { ch.subscribers.delete(sub) }
+  }
+
+  /** Publish `session_closed` to current subscribers, end them, then forget the session. */
+  close(sessionId: string): void {
+    const ch = this.channels.get(sessionId)
+    if (!ch) return
+    this.publish(sessionId, 'session_closed', {})
+    this.channels.delete(sessionId)
+    for (const sub of ch.subscribers) sub.onEnd()
+  }
+
+  /** End every subscription without closing sessions (daemon shutdown; sessions persist). */
+  endAll(): void {
+    for (const ch of this.channels.values()) {
+      for (const sub of ch.subscribers) sub.onEnd()
+      ch.subscribers.clear()
+    }
+  }
+
+  stats(): { sessions: number; subscribers: number; published: number } {
+    let subscribers = 0
+    for (const ch of this.channels.values()) subscribers += ch.subscribers.size
+    return { sessions: this.channels.size, subscribers, published: this.published }
+  }
+
+  private channel(sessionId: string): SessionChannel {
+    let ch = this.channels.get(sessionId)
+    if (!ch) {
+      ch = { seq: 0, recent: [], subscribers: new Set() }
+      this.channels.set(sessionId, ch)
+    }
+    return ch
+  }
+}
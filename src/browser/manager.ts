@@ -5,6 +5,10 @@ import path from 'path'
 import { chromium, Browser, BrowserContext, Page, Route, CDPSession } from 'playwright-core'
 import { SessionRegistry } from '../daemon/session'
 import { DaemonConfig, profilesDir } from '../daemon/config'
+import { WarmPool, launchOptions, warmPoolKey } from './pool'
+import { SharedBrowsers } from './shared'
+import { SessionEventHub } from './events'
+import { childRssBytes } from '../daemon/procmem'
 
 // ---------------------------------------------------------------------------
 // R07-T16/T17: Console log + page error ring buffer types
@@ -90,6 +94,33 @@ interface RouteEntry {
   handler: (route: Route) => Promise<void>
 }
 
+/** What a hibernated session needs to come back as it was (the profile / temp dir keeps the rest) */
+interface HibernatedState {
+  pages: Array<{ page_id: string; url: string }>
+  activePageId: string
+  pageRev: number
+  routes: Array<{ pattern: string; mock: RouteMockConfig }>
+  viewport: { width: number; height: number } | null
+  /**
+   * Cookies + localStorage. Shared-browser contexts have no user-data dir and
+   * start from all of it; persistent contexts keep storage on disk and only
+   * need the session cookies back (Chromium does not write those to disk).
+   */
+  storageState: { cookies: any[] }
+}
+
+const HIBERNATION_SAMPLES = 256
+
+function pushSample(buf: number[], v: number): void {
+  buf.push(v)
+  if (buf.length > HIBERNATION_SAMPLES) buf.shift()
+}
+
+function summarize(buf: number[]): { p50: number; max: number } {
+  const sorted = [...buf].sort((a, b) => a - b)
+  return { p50: sorted[Math.floor(sorted.length / 2)] ?? 0, max: sorted[sorted.length - 1] ?? 0 }
+}
+
 export class BrowserManager {
   private contexts = new Map<string, { context: BrowserContext; page: Page }>()
   /** Per-session multi-page tracking */
@@ -100,6 +131,8 @@ export class BrowserManager {
   private sessionAcceptDownloads = new Map<string, boolean>()
   /** R07-T13: page revision counter — incremented on main-frame navigation */
   private sessionPageRevs = new Map<string, number>()
+  /** Conditional GETs: bumped when pages, routes, viewport or the browser itself change (never reset while the session lives) */
+  private sessionStateRevs = new Map<string, number>()
   /** R07-T13: snapshot store — keyed by sessionId → snapshotId → SnapshotEntry */
   private sessionSnapshots = new Map<string, Map<string, SnapshotEntry>>()
   private readonly MAX_SNAPSHOTS = 5
@@ -112,17 +145,49 @@ export class BrowserManager {
   /** R07-C04-T22: JS dialog ring buffer (max 50/session, auto-dismissed) */
   private sessionDialogs = new Map<string, DialogEntry[]>()
   private readonly MAX_DIALOGS = 50
-  /** R07-C04-T25: CDP sessions for network-condition emulation */
-  private sessionCdpSessions = new Map<string, CDPSession>()
+  /** Cached CDP session per page, shared by REST CDP commands and network emulation (see cdpSession) */
+  private pageCdpSessions = new WeakMap<Page, Promise<CDPSession>>()
+  private cdpCache = { opened: 0, reused: 0, dropped: 0, retried: 0 }
+  /** R07-C04-T25: page whose network conditions are emulated, per session */
+  private sessionNetworkPages = new Map<string, Page>()
   /** R08-modes: Browser references for CDP-attach sessions (disconnect instead of close) */
   private sessionCdpBrowsers = new Map<string, Browser>()
   /** R08-modes: Ephemeral temp dir paths (cleaned up on session close) */
   private sessionEphemeralDirs = new Map<string, string>()
+  /** Streamed uploads: per-session temp dir for files handed to setInputFiles by path (cleaned up on session close) */
+  private sessionUploadDirs = new Map<string, string>()
+  /** Sessions hosted as contexts in a shared browser (see SharedBrowsers) */
+  private sessionShared = new Set<string>()
+  /** sessionId → --user-data-dir of the browser process the session owns (not shared / CDP) */
+  private sessionDataDirs = new Map<string, string>()
+  /** Init scripts added via addInitScript (re-applied on resume) */
+  private sessionInitScripts = new Map<string, string[]>()
+  /** Idle hibernation: last request time, requests in flight (+ pins), saved state of hibernated sessions */
+  private sessionLastActive = new Map<string, number>()
+  private sessionBusy = new Map<string, number>()
+  private sessionHibernated = new Map<string, HibernatedState>()
+  /** In-progress hibernate / resume per session (one transition at a time) */
+  private sessionTransitions = new Map<string, Promise<void>>()
+  private hibernateIdleMs = 0
+  private hibernateTimer: NodeJS.Timeout | null = null
+  private hibernation = {
+    hibernated: 0, resumed: 0, failed: 0, reclaimedBytes: 0, lastReclaimedBytes: 0,
+    hibernateMs: [] as number[], resumeMs: [] as number[],
+  }
+  /** Pre-launched ephemeral contexts claimed by launchSession (AGENTMB_WARM_POOL) */
+  readonly warmPool: WarmPool
+  /** Shared browser processes hosting ephemeral sessions as plain contexts (AGENTMB_SHARED_CONTEXTS) */
+  readonly sharedBrowsers: SharedBrowsers
+  /** Console / page error / dialog / navigation events pushed to event-stream subscribers */
+  readonly events = new SessionEventHub()
 
   constructor(
     private registry: SessionRegistry,
     private config: DaemonConfig,
-  ) {}
+  ) {
+    this.warmPool = new WarmPool(config.warmPool ?? {})
+    this.sharedBrowsers = new SharedBrowsers(config.sharedContextsPerBrowser ?? 0)
+  }
 
   // ---------------------------------------------------------------------------
   // R07-T13: page_rev + snapshot management
@@ -132,11 +197,21 @@ export class BrowserManager {
     return this.sessionPageRevs.get(sessionId) ?? 0
   }
 
+  /** Revision of session state that page_rev does not cover (pages, routes, viewport, relaunch). */
+  getStateRev(sessionId: string): number {
+    return this.sessionStateRevs.get(sessionId) ?? 0
+  }
+
+  bumpStateRev(sessionId: string): void {
+    this.sessionStateRevs.set(sessionId, this.getStateRev(sessionId) + 1)
+  }
+
   /** Called internally on main-frame navigation; clears all snapshots. */
-  private incrementPageRev(sessionId: string): void {
+  private incrementPageRev(sessionId: string, page: Page): void {
     const current = this.sessionPageRevs.get(sessionId) ?? 0
     this.sessionPageRevs.set(sessionId, current + 1)
     this.sessionSnapshots.get(sessionId)?.clear()
+    this.events.publish(sessionId, 'framenavigated', { url: page.url(), page_rev: current + 1 }, this.pageIdOf(sessionId, page))
   }
 
   storeSnapshot(sessionId: string, entry: SnapshotEntry): void {
@@ -223,62 +298,124 @@ export class BrowserManager {
   ): Promise<void> {
     const entry = this.contexts.get(sessionId)
     if (!entry) throw new Error(`Session ${sessionId} not found`)
-    // Detach any existing CDP session first
-    const existing = this.sessionCdpSessions.get(sessionId)
-    if (existing) { await existing.detach().catch(() => {}) }
-    const cdp: CDPSession = await entry.context.newCDPSession(entry.page)
-    this.sessionCdpSessions.set(sessionId, cdp)
-    await cdp.send('Network.enable')
-    await cdp.send('Network.emulateNetworkConditions', {
+    // Conditions set on another (earlier active) page are cleared first
+    const previous = this.sessionNetworkPages.get(sessionId)
+    if (previous && previous !== entry.page) await this.resetNetworkConditions(sessionId)
+    await this.sendCdp(entry.context, entry.page, 'Network.enable')
+    await this.sendCdp(entry.context, entry.page, 'Network.emulateNetworkConditions', {
       offline: opts.offline ?? false,
       latency: opts.latency_ms ?? 0,
       downloadThroughput: opts.download_kbps !== undefined ? (opts.download_kbps * 1024) / 8 : -1,
       uploadThroughput: opts.upload_kbps !== undefined ? (opts.upload_kbps * 1024) / 8 : -1,
     })
+    this.sessionNetworkPages.set(sessionId, entry.page)
   }
 
   async resetNetworkConditions(sessionId: string): Promise<void> {
-    const cdp = this.sessionCdpSessions.get(sessionId)
-    if (cdp) {
-      await cdp.send('Network.emulateNetworkConditions', {
-        offline: false, latency: 0, downloadThroughput: -1, uploadThroughput: -1,
-      }).catch(() => {})
-      await cdp.detach().catch(() => {})
-      this.sessionCdpSessions.delete(sessionId)
+    const page = this.sessionNetworkPages.get(sessionId)
+    const entry = this.contexts.get(sessionId)
+    this.sessionNetworkPages.delete(sessionId)
+    if (!page || !entry || page.isClosed()) return
+    await this.sendCdp(entry.context, page, 'Network.emulateNetworkConditions', {
+      offline: false, latency: 0, downloadThroughput: -1, uploadThroughput: -1,
+    }).catch(() => {})
+  }
+
+  // ---------------------------------------------------------------------------
+  // CDP session cache: one attached CDPSession per page, reused across calls
+  // ---------------------------------------------------------------------------
+
+  /**
+   * CDP session attached to `page`, created on first use and reused after
+   * that. Dropped when the page closes or the target detaches (renderer
+   * swap, crash); sendCdp() also retries once on a fresh session when a
+   * command fails because its session went away.
+   */
+  cdpSession(context: BrowserContext, page: Page): Promise<CDPSession> {
+    const cached = this.pageCdpSessions.get(page)
+    if (cached) {
+      this.cdpCache.reused++
+      return cached
     }
+    const opening = context.newCDPSession(page)
+    this.pageCdpSessions.set(page, opening)
+    this.cdpCache.opened++
+    opening.then(
+      (cdp) => cdp.on('Inspector.detached', () => this.dropCdpSession(page, opening)),
+      () => this.dropCdpSession(page, opening),
+    )
+    page.once('close', () => this.dropCdpSession(page, opening))
+    return opening
+  }
+
+  async sendCdp(context: BrowserContext, page: Page, method: string, params?: Record<string, unknown>): Promise<unknown> {
+    const opening = this.cdpSession(context, page)
+    try {
+      return await (await opening).send(method as any, params)
+    } catch (err: any) {
+      if (page.isClosed() || !/session closed|detached|target closed|has been closed/i.test(err?.message ?? '')) throw err
+      this.dropCdpSession(page, opening)
+      this.cdpCache.retried++
+      return (await this.cdpSession(context, page)).send(method as any, params)
+    }
+  }
+
+  cdpCacheStats(): Record<string, number> {
+    return { ...this.cdpCache }
+  }
+
+  private dropCdpSession(page: Page, opening: Promise<CDPSession>): void {
+    if (this.pageCdpSessions.get(page) !== opening) return
+    this.pageCdpSessions.delete(page)
+    this.cdpCache.dropped++
+    opening.then((cdp) => cdp.detach()).catch(() => {})
   }
 
   /** Register console + pageerror + dialog listeners on a page for observability. */
   private attachPageObservers(sessionId: string, page: Page): void {
     page.on('console', (msg) => {
-      this.pushConsole(sessionId, {
+      const entry: ConsoleEntry = {
         ts: new Date().toISOString(),
         type: msg.type(),
         text: msg.text(),
         url: page.url(),
-      })
+      }
+      this.pushConsole(sessionId, entry)
+      this.events.publish(sessionId, 'console', { ...entry }, this.pageIdOf(sessionId, page))
     })
     page.on('pageerror', (err) => {
-      this.pushPageError(sessionId, {
+      const entry: PageErrorEntry = {
         ts: new Date().toISOString(),
         message: err.message,
         url: page.url(),
-      })
+      }
+      this.pushPageError(sessionId, entry)
+      this.events.publish(sessionId, 'page_error', { ...entry }, this.pageIdOf(sessionId, page))
     })
     // T22: auto-dismiss dialogs and record them so callers can inspect
     page.on('dialog', async (dialog) => {
-      this.pushDialog(sessionId, {
+      const entry: DialogEntry = {
         ts: new Date().toISOString(),
         type: dialog.type(),
         message: dialog.message(),
         default_value: dialog.defaultValue(),
         url: page.url(),
         action: 'dismissed',
-      })
+      }
+      this.pushDialog(sessionId, entry)
+      this.events.publish(sessionId, 'dialog', { ...entry }, this.pageIdOf(sessionId, page))
       await dialog.dismiss().catch(() => { /* page may have been closed */ })
     })
   }
 
+  /** page_id of one of the session's pages (undefined while it is still being registered). */
+  private pageIdOf(sessionId: string, page: Page): string | undefined {
+    for (const [pageId, p] of this.sessionPages.get(sessionId)?.pages ?? []) {
+      if (p === page) return pageId
+    }
+    return undefined
+  }
+
   private newPageId(): string {
     return 'page_' + crypto.randomBytes(4).toString('hex')
   }
@@ -293,6 +430,7 @@ export class BrowserManager {
       executablePath?: string
       ephemeral?: boolean
     },
+    restore?: { pageId: string; storageState?: object },
   ): Promise<void> {
     const profile = opts.profile ?? 'default'
     const headless = opts.headless ?? true
@@ -300,36 +438,42 @@ export class BrowserManager {
     // Persist so switchMode can restore the same setting on relaunch
     this.sessionAcceptDownloads.set(sessionId, acceptDownloads)
 
-    let userDataDir: string
-    if (opts.ephemeral) {
-      // Pure Sandbox: ephemeral temp dir — cleaned up on close
-      userDataDir = path.join(os.tmpdir(), `agentmb-eph-${sessionId}`)
-      this.sessionEphemeralDirs.set(sessionId, userDataDir)
+    // Shared mode: an ephemeral session is a new context in a shared browser (no profile dir).
+    // A resumed session keeps the kind of context it had.
+    const shared = !!opts.ephemeral && (restore ? this.sessionShared.has(sessionId) : this.sharedBrowsers.enabled)
+    // Otherwise ephemeral sessions with default launch options can take a pre-launched context
+    const warm = !restore && !shared && opts.ephemeral && !opts.executablePath && !acceptDownloads
+      ? this.warmPool.claim(warmPoolKey(opts.channel, headless))
+      : null
+
+    let context: BrowserContext
+    if (shared) {
+      context = await this.sharedBrowsers.newContext({
+        headless, acceptDownloads, channel: opts.channel, executablePath: opts.executablePath,
+        storageState: restore?.storageState,
+      })
+      this.sessionShared.add(sessionId)
+    } else if (warm) {
+      context = warm.context
+      this.sessionEphemeralDirs.set(sessionId, warm.userDataDir)
+      this.sessionDataDirs.set(sessionId, warm.userDataDir)
     } else {
-      userDataDir = path.join(profilesDir(this.config), profile)
-    }
-
-    const launchOpts: Parameters<typeof chromium.launchPersistentContext>[1] = {
-      headless,
-      acceptDownloads,
-      args: [
-        '--no-sandbox',
-        '--disable-setuid-sandbox',
-        '--disable-dev-shm-usage',
-        '--disable-accelerated-2d-canvas',
-        '--no-first-run',
-        '--no-zygote',
-      ],
-      viewport: { width: 1280, height: 720 },
+      let userDataDir: string
+      if (opts.ephemeral) {
+        // Pure Sandbox: ephemeral temp dir — cleaned up on close (kept across hibernation)
+        userDataDir = this.sessionEphemeralDirs.get(sessionId) ?? path.join(os.tmpdir(), `agentmb-eph-${sessionId}`)
+        this.sessionEphemeralDirs.set(sessionId, userDataDir)
+      } else {
+        userDataDir = path.join(profilesDir(this.config), profile)
+      }
+      this.sessionDataDirs.set(sessionId, userDataDir)
+      context = await chromium.launchPersistentContext(userDataDir, launchOptions({
+        headless, acceptDownloads, channel: opts.channel, executablePath: opts.executablePath,
+      }))
     }
-    // Multi-channel: system Chrome / Edge (mutually exclusive with executablePath)
-    if (opts.channel) (launchOpts as any).channel = opts.channel
-    if (opts.executablePath) (launchOpts as any).executablePath = opts.executablePath
-
-    const context: BrowserContext = await chromium.launchPersistentContext(userDataDir, launchOpts)
 
     const page = context.pages()[0] ?? (await context.newPage())
-    const pageId = this.newPageId()
+    const pageId = restore?.pageId ?? this.newPageId()
     this.contexts.set(sessionId, { context, page })
     this.sessionPages.set(sessionId, {
       pages: new Map([[pageId, page]]),
@@ -338,15 +482,19 @@ export class BrowserManager {
     this.sessionRoutes.set(sessionId, new Map())
     this.sessionPageRevs.set(sessionId, 0)
     this.sessionSnapshots.set(sessionId, new Map())
-    this.sessionConsoleLog.set(sessionId, [])
-    this.sessionPageErrors.set(sessionId, [])
-    this.sessionDialogs.set(sessionId, [])
+    if (!restore) {
+      this.sessionConsoleLog.set(sessionId, [])
+      this.sessionPageErrors.set(sessionId, [])
+      this.sessionDialogs.set(sessionId, [])
+    }
+    this.sessionLastActive.set(sessionId, Date.now())
+    this.bumpStateRev(sessionId)
     this.registry.attach(sessionId, context, page)
 
     // R07-T13: increment page_rev on main-frame navigation (clears snapshots)
     page.on('framenavigated', (frame) => {
       if (frame === page.mainFrame()) {
-        this.incrementPageRev(sessionId)
+        this.incrementPageRev(sessionId, page)
       }
     })
     // R07-T16/T17: collect console log + page errors
@@ -398,10 +546,11 @@ export class BrowserManager {
     this.sessionConsoleLog.set(sessionId, [])
     this.sessionPageErrors.set(sessionId, [])
     this.sessionDialogs.set(sessionId, [])
+    this.bumpStateRev(sessionId)
     this.registry.attach(sessionId, ctx, page)
 
     page.on('framenavigated', (frame) => {
-      if (frame === page!.mainFrame()) this.incrementPageRev(sessionId)
+      if (frame === page!.mainFrame()) this.incrementPageRev(sessionId, page!)
     })
     this.attachPageObservers(sessionId, page)
   }
@@ -410,21 +559,21 @@ export class BrowserManager {
   // Multi-page management (T03)
   // ---------------------------------------------------------------------------
 
-  async createPage(sessionId: string): Promise<{ page_id: string; url: string }> {
+  async createPage(sessionId: string, pageId = this.newPageId()): Promise<{ page_id: string; url: string }> {
     const entry = this.contexts.get(sessionId)
     if (!entry) throw new Error(`Session ${sessionId} not found`)
     const page = await entry.context.newPage()
-    const pageId = this.newPageId()
     const state = this.sessionPages.get(sessionId)!
     state.pages.set(pageId, page)
     // R07-T13 fix: track navigations on new pages so page_rev increments correctly
     page.on('framenavigated', (frame) => {
       if (frame === page.mainFrame()) {
-        this.incrementPageRev(sessionId)
+        this.incrementPageRev(sessionId, page)
       }
     })
     // R07-T16/T17: collect console log + page errors on new pages too
     this.attachPageObservers(sessionId, page)
+    this.bumpStateRev(sessionId)
     return { page_id: pageId, url: page.url() }
   }
 
@@ -447,6 +596,7 @@ export class BrowserManager {
     const entry = this.contexts.get(sessionId)!
     this.contexts.set(sessionId, { ...entry, page })
     this.registry.attach(sessionId, entry.context, page)
+    this.bumpStateRev(sessionId)
   }
 
   async closePage(sessionId: string, pageId: string): Promise<void> {
@@ -462,6 +612,7 @@ export class BrowserManager {
     }
     await page.close()
     state.pages.delete(pageId)
+    this.bumpStateRev(sessionId)
     // If closed the active page, switch to first remaining
     if (state.activePageId === pageId) {
       const remaining = Array.from(state.pages.keys())
@@ -508,6 +659,7 @@ export class BrowserManager {
     }
     await entry.context.route(pattern, handler)
     routeState.set(pattern, { pattern, mock, handler })
+    this.bumpStateRev(sessionId)
   }
 
   async removeRoute(sessionId: string, pattern: string): Promise<void> {
@@ -518,6 +670,7 @@ export class BrowserManager {
     if (existing) {
       try { await entry.context.unroute(pattern, existing.handler) } catch { /* ignore */ }
       routeState.delete(pattern)
+      this.bumpStateRev(sessionId)
     }
   }
 
@@ -585,6 +738,167 @@ export class BrowserManager {
     }
   }
 
+  // ---------------------------------------------------------------------------
+  // Idle hibernation
+  // ---------------------------------------------------------------------------
+
+  /** Hibernate managed sessions that have seen no request for `idleMs` (checked periodically). */
+  startHibernation(idleMs: number): void {
+    if (idleMs <= 0 || this.hibernateTimer) return
+    this.hibernateIdleMs = idleMs
+    this.hibernateTimer = setInterval(() => {
+      const now = Date.now()
+      for (const id of this.contexts.keys()) {
+        if (now - (this.sessionLastActive.get(id) ?? now) >= idleMs && this.canHibernate(id)) {
+          void this.hibernate(id).catch(() => { this.hibernation.failed++ })
+        }
+      }
+    }, Math.max(1000, Math.min(idleMs / 4, 30_000)))
+    this.hibernateTimer.unref()
+  }
+
+  /** Mark a request on the session as started (+1) or finished (-1); pins (e.g. tracing) use the same count. */
+  markBusy(sessionId: string, delta: 1 | -1): void {
+    if (!this.contexts.has(sessionId) && !this.sessionHibernated.has(sessionId)) return
+    const n = Math.max(0, (this.sessionBusy.get(sessionId) ?? 0) + delta)
+    if (n === 0) this.sessionBusy.delete(sessionId)
+    else this.sessionBusy.set(sessionId, n)
+    this.sessionLastActive.set(sessionId, Date.now())
+  }
+
+  /** Hibernated, or a hibernate / resume is in progress: call ensureAwake() before touching the session. */
+  needsResume(sessionId: string): boolean {
+    return this.sessionHibernated.has(sessionId) || this.sessionTransitions.has(sessionId)
+  }
+
+  /**
+   * Only idle, headless, managed sessions whose state can be rebuilt are
+   * hibernated: not CDP-attached, no network emulation, nothing in flight.
+   */
+  private canHibernate(sessionId: string): boolean {
+    const s = this.registry.get(sessionId)
+    return !!s && s.state === 'live' && s.headless && s.launchMode !== 'attach'
+      && !this.sessionCdpBrowsers.has(sessionId)
+      && !this.sessionNetworkPages.has(sessionId)
+      && !this.sessionBusy.has(sessionId)
+      && !this.sessionTransitions.has(sessionId)
+  }
+
+  private transition(sessionId: string, fn: () => Promise<void>): Promise<void> {
+    const p = fn().finally(() => this.sessionTransitions.delete(sessionId))
+    this.sessionTransitions.set(sessionId, p)
+    return p
+  }
+
+  /** Save what the session needs to come back, then close its browser. */
+  async hibernate(sessionId: string): Promise<void> {
+    const entry = this.contexts.get(sessionId)
+    const pageState = this.sessionPages.get(sessionId)
+    if (!entry || !pageState) return
+    await this.transition(sessionId, async () => {
+      const t0 = Date.now()
+      const rssBefore = await childRssBytes()
+      const saved: HibernatedState = {
+        pages: Array.from(pageState.pages, ([page_id, page]) => ({ page_id, url: page.url() })),
+        activePageId: pageState.activePageId,
+        pageRev: this.getPageRev(sessionId),
+        routes: this.listRoutes(sessionId),
+        viewport: entry.page.viewportSize(),
+        storageState: await entry.context.storageState(),
+      }
+
+      await this.cleanupRoutes(sessionId)
+      this.sessionRoutes.delete(sessionId)
+      this.sessionSnapshots.delete(sessionId)
+      this.contexts.delete(sessionId)
+      this.sessionPages.delete(sessionId)
+      this.sessionHibernated.set(sessionId, saved)
+      this.registry.hibernate(sessionId)
+      this.bumpStateRev(sessionId)
+      await entry.context.close().catch(() => {})
+
+      const rssAfter = await childRssBytes()
+      const reclaimed = rssBefore !== null && rssAfter !== null ? Math.max(0, rssBefore - rssAfter) : 0
+      this.hibernation.hibernated++
+      this.hibernation.reclaimedBytes += reclaimed
+      this.hibernation.lastReclaimedBytes = reclaimed
+      pushSample(this.hibernation.hibernateMs, Date.now() - t0)
+    })
+  }
+
+  /** Resume the session if it is hibernated (or waits for a hibernate in progress, then resumes). */
+  async ensureAwake(sessionId: string): Promise<void> {
+    const pending = this.sessionTransitions.get(sessionId)
+    if (pending) await pending.catch(() => {})
+    if (!this.sessionHibernated.has(sessionId)) return
+    const again = this.sessionTransitions.get(sessionId)
+    if (again) return again
+    return this.transition(sessionId, () => this.resume(sessionId))
+  }
+
+  /** Relaunch a hibernated session: same page ids, URLs, routes, init scripts and viewport. */
+  private async resume(sessionId: string): Promise<void> {
+    const saved = this.sessionHibernated.get(sessionId)
+    const s = this.registry.get(sessionId)
+    if (!saved || !s) return
+    const t0 = Date.now()
+    try {
+      await this.launchSession(sessionId, {
+        profile: s.profile,
+        headless: s.headless,
+        acceptDownloads: this.sessionAcceptDownloads.get(sessionId) ?? false,
+        channel: s.browserChannel,
+        executablePath: s.executablePath,
+        ephemeral: s.ephemeral,
+      }, { pageId: saved.pages[0].page_id, storageState: saved.storageState })
+      if (!this.sessionShared.has(sessionId)) {
+        await this.contexts.get(sessionId)!.context.addCookies(saved.storageState.cookies).catch(() => {})
+      }
+    } catch (err) {
+      this.hibernation.failed++
+      throw err
+    }
+    this.sessionHibernated.delete(sessionId)
+    const entry = this.contexts.get(sessionId)!
+    for (const script of this.sessionInitScripts.get(sessionId) ?? []) {
+      await entry.context.addInitScript(script).catch(() => {})
+    }
+    for (const r of saved.routes) await this.addRoute(sessionId, r.pattern, r.mock).catch(() => {})
+    for (const p of saved.pages.slice(1)) await this.createPage(sessionId, p.page_id)
+    const pages = this.sessionPages.get(sessionId)!.pages
+    await Promise.all(saved.pages.map(async ({ page_id, url }) => {
+      if (!url || url === 'about:blank') return
+      try { await pages.get(page_id)!.goto(url, { waitUntil: 'domcontentloaded' }) } catch { /* page gone — leave blank */ }
+    }))
+    if (saved.activePageId !== saved.pages[0].page_id) this.switchPage(sessionId, saved.activePageId)
+    if (saved.viewport) await this.contexts.get(sessionId)!.page.setViewportSize(saved.viewport).catch(() => {})
+    // Snapshots taken before hibernation are stale: page_rev moves past the old value
+    this.sessionPageRevs.set(sessionId, saved.pageRev + 1)
+    this.events.publish(sessionId, 'page_rev', { page_rev: saved.pageRev + 1, reason: 'resumed' })
+    this.hibernation.resumed++
+    pushSample(this.hibernation.resumeMs, Date.now() - t0)
+  }
+
+  hibernationStats(): Record<string, unknown> {
+    const h = this.hibernation
+    return {
+      idle_ms: this.hibernateIdleMs || null,
+      hibernated_now: this.sessionHibernated.size,
+      hibernations: h.hibernated,
+      resumes: h.resumed,
+      failures: h.failed,
+      hibernate_ms: summarize(h.hibernateMs),
+      resume_ms: summarize(h.resumeMs),
+      reclaimed_mb_total: Math.round(h.reclaimedBytes / 2 ** 20),
+      reclaimed_mb_last: Math.round(h.lastReclaimedBytes / 2 ** 20),
+    }
+  }
+
+  /** --user-data-dir of each live session's own browser process (for per-session RSS). */
+  browserDataDirs(): Map<string, string> {
+    return new Map([...this.sessionDataDirs].filter(([id]) => this.contexts.has(id)))
+  }
+
   getAcceptDownloads(sessionId: string): boolean {
     return this.sessionAcceptDownloads.get(sessionId) ?? false
   }
@@ -596,6 +910,7 @@ export class BrowserManager {
       this.sessionRoutes.delete(sessionId)
       this.sessionAcceptDownloads.delete(sessionId)
       this.sessionPageRevs.delete(sessionId)
+      this.sessionStateRevs.delete(sessionId)
       this.sessionSnapshots.delete(sessionId)
       this.sessionConsoleLog.delete(sessionId)
       this.sessionPageErrors.delete(sessionId)
@@ -615,16 +930,58 @@ export class BrowserManager {
       this.sessionPages.delete(sessionId)
     }
 
+    // Hibernated sessions have no context but still hold saved state and buffers
+    if (this.sessionHibernated.delete(sessionId)) {
+      this.sessionAcceptDownloads.delete(sessionId)
+      this.sessionPageRevs.delete(sessionId)
+      this.sessionStateRevs.delete(sessionId)
+      this.sessionConsoleLog.delete(sessionId)
+      this.sessionPageErrors.delete(sessionId)
+      this.sessionDialogs.delete(sessionId)
+    }
+    this.sessionShared.delete(sessionId)
+    this.sessionDataDirs.delete(sessionId)
+    this.sessionInitScripts.delete(sessionId)
+    this.sessionLastActive.delete(sessionId)
+    this.sessionBusy.delete(sessionId)
+    this.events.close(sessionId)
+
     // Clean up ephemeral temp dir (regardless of whether context was live)
     const ephDir = this.sessionEphemeralDirs.get(sessionId)
     if (ephDir) {
       try { fs.rmSync(ephDir, { recursive: true, force: true }) } catch { /* ignore */ }
       this.sessionEphemeralDirs.delete(sessionId)
     }
+    this.removeUploadDir(sessionId)
+  }
+
+  /**
+   * Temp dir for streamed uploads of this session. Files must outlive the
+   * setInputFiles call (Chromium reads them when the form is submitted), so
+   * they are only removed when the session closes.
+   */
+  uploadDir(sessionId: string): string {
+    let dir = this.sessionUploadDirs.get(sessionId)
+    if (!dir) {
+      dir = fs.mkdtempSync(path.join(os.tmpdir(), 'agentmb-up-'))
+      this.sessionUploadDirs.set(sessionId, dir)
+    }
+    return dir
+  }
+
+  private removeUploadDir(sessionId: string): void {
+    const dir = this.sessionUploadDirs.get(sessionId)
+    if (!dir) return
+    try { fs.rmSync(dir, { recursive: true, force: true }) } catch { /* ignore */ }
+    this.sessionUploadDirs.delete(sessionId)
   }
 
-  /** Called on daemon shutdown: disconnect CDP sessions, clean ephemeral dirs, then close all managed contexts. */
+  /** Called on daemon shutdown: close the warm pool, disconnect CDP sessions, clean ephemeral dirs, close all managed contexts, then the shared browsers. */
   async shutdownAll(): Promise<void> {
+    if (this.hibernateTimer) clearInterval(this.hibernateTimer)
+    this.hibernateTimer = null
+    this.events.endAll()
+    await this.warmPool.close()
     // First close CDP-attached browser handles (disconnects without killing remote processes)
     for (const [id, browser] of this.sessionCdpBrowsers) {
       await browser.close().catch(() => {})
@@ -635,8 +992,10 @@ export class BrowserManager {
       try { fs.rmSync(dir, { recursive: true, force: true }) } catch { /* ignore */ }
       this.sessionEphemeralDirs.delete(id)
     }
+    for (const id of [...this.sessionUploadDirs.keys()]) this.removeUploadDir(id)
     // Let registry handle persisting zombie state + closing remaining managed contexts
     await this.registry.shutdownAll()
+    await this.sharedBrowsers.close()
   }
 
   // ---------------------------------------------------------------------------
@@ -672,5 +1031,9 @@ export class BrowserManager {
     const entry = this.contexts.get(sessionId)
     if (!entry) throw new Error(`Session ${sessionId} not found`)
     await entry.context.addInitScript(script)
+    // Re-applied when a hibernated session is resumed
+    const scripts = this.sessionInitScripts.get(sessionId) ?? []
+    scripts.push(script)
+    this.sessionInitScripts.set(sessionId, scripts)
   }
 }
@@ -0,0 +1,168 @@
+import fs from 'fs'
+import os from 'os'
+import path from 'path'
+import { chromium, BrowserContext } from 'playwright-core'
+
+// ---------------------------------------------------------------------------
+// Launch options shared by fresh launches and the warm pool
+// ---------------------------------------------------------------------------
+
+export const LAUNCH_ARGS = [
+  '--no-sandbox',
+  '--disable-setuid-sandbox',
+  '--disable-dev-shm-usage',
+  '--disable-accelerated-2d-canvas',
+  '--no-first-run',
+  '--no-zygote',
+]
+
+/** Viewport of every new context */
+export const DEFAULT_VIEWPORT = { width: 1280, height: 720 }
+
+export function launchOptions(opts: {
+  headless: boolean
+  acceptDownloads?: boolean
+  channel?: string
+  executablePath?: string
+}): Parameters<typeof chromium.launchPersistentContext>[1] {
+  const launchOpts: Parameters<typeof chromium.launchPersistentContext>[1] = {
+    headless: opts.headless,
+    acceptDownloads: opts.acceptDownloads ?? false,
+    args: LAUNCH_ARGS,
+    viewport: DEFAULT_VIEWPORT,
+  }
+  // Multi-channel: system Chrome / Edge (mutually exclusive with executablePath)
+  if (opts.channel) (launchOpts as any).channel = opts.channel
+  if (opts.executablePath) (launchOpts as any).executablePath = opts.executablePath
+  return launchOpts
+}
+
+// ---------------------------------------------------------------------------
+// Warm pool: pre-launched ephemeral contexts, claimed by session create
+// ---------------------------------------------------------------------------
+
+export interface WarmContext {
+  context: BrowserContext
+  userDataDir: string
+}
+
+export interface WarmPoolStats {
+  sizes: Record<string, number>
+  idle: Record<string, number>
+  launching: Record<string, number>
+  hits: number
+  misses: number
+  launched: number
+  failed: number
+}
+
+/** Pool key for a launch: `<channel>:headless` or `<channel>:headed` (channel defaults to chromium). */
+export function warmPoolKey(channel: string | undefined, headless: boolean): string {
+  return `${channel ?? 'chromium'}:${headless ? 'headless' : 'headed'}`
+}
+
+/**
+ * Keeps `sizes[key]` ephemeral persistent contexts launched per channel /
+ * headless combination. A claim hands one over and starts a background
+ * launch to replace it; a miss (pool empty) leaves the caller to launch
+ * cold. Failed launches are not retried until the next claim.
+ */
+export class WarmPool {
+  private idle = new Map<string, WarmContext[]>()
+  private launching = new Map<string, number>()
+  private hits = 0
+  private misses = 0
+  private launched = 0
+  private failed = 0
+  private closed = false
+
+  constructor(private sizes: Record<string, number>) {}
+
+  get enabled(): boolean {
+    return Object.values(this.sizes).some((n) => n > 0)
+  }
+
+  /** Start filling every configured key. */
+  start(): void {
+    for (const key of Object.keys(this.sizes)) this.refill(key)
+  }
+
+  /** Take a warm context for `key`, or null on a miss. Keys without a pool are not counted. */
+  claim(key: string): WarmContext | null {
+    if (!this.sizes[key]) return null
+    const warm = this.idle.get(key)?.shift() ?? null
+    if (warm) this.hits++
+    else this.misses++
+    this.refill(key)
+    return warm
+  }
+
+  stats(): WarmPoolStats {
+    const count = (m: Map<string, unknown[] | number>) =>
+      Object.fromEntries([...m].map(([k, v]) => [k, typeof v === 'number' ? v : v.length]))
+    return {
+      sizes: { ...this.sizes },
+      idle: count(this.idle),
+      launching: count(this.launching),
+      hits: this.hits,
+      misses: this.misses,
+      launched: this.launched,
+      failed: this.failed,
+    }
+  }
+
+  /** Close idle contexts and remove their temp dirs; in-flight launches are closed as they land. */
+  async close(): Promise<void> {
+    this.closed = true
+    const all = [...this.idle.values()].flat()
+    this.idle.clear()
+    await Promise.all(all.map((w) => this.dispose(w)))
+  }
+
+  private refill(key: string): void {
+    const want = this.sizes[key] ?? 0
+    const have = (this.idle.get(key)?.length ?? 0) + (this.launching.get(key) ?? 0)
+    for (let i = have; i < want && !this.closed; i++) void this.launchOne(key)
+  }
+
+  private async launchOne(key: string): Promise<void> {
+    const [channel, mode] = key.split(':')
+    this.launching.set(key, (this.launching.get(key) ?? 0) + 1)
+    const userDataDir = fs.mkdtempSync(path.join(os.tmpdir(), 'agentmb-eph-warm-'))
+    let warm: WarmContext | null = null
+    try {
+      const context = await chromium.launchPersistentContext(userDataDir, launchOptions({
+        headless: mode !== 'headed',
+        channel: channel === 'chromium' ? undefined : channel,
+      }))
+      warm = { context, userDataDir }
+      this.launched++
+    } catch {
+      this.failed++
+      try { fs.rmSync(userDataDir, { recursive: true, force: true }) } catch { /* ignore */ }
+    } finally {
+      this.launching.set(key, (this.launching.get(key) ?? 1) - 1)
+    }
+    if (!warm) return
+    if (this.closed) {
+      await this.dispose(warm)
+      return
+    }
+    const queue = this.idle.get(key) ?? []
+    this.idle.set(key, queue)
+    queue.push(warm)
+    // A browser that dies while idle is dropped (and replaced)
+    warm.context.on('close', () => {
+      const i = queue.indexOf(warm!)
+      if (i < 0) return
+      queue.splice(i, 1)
+      try { fs.rmSync(warm!.userDataDir, { recursive: true, force: true }) } catch { /* ignore */ }
+      this.refill(key)
+    })
+  }
+
+  private async dispose(warm: WarmContext): Promise<void> {
+    await warm.context.close().catch(() => {})
+    try { fs.rmSync(warm.userDataDir, { recursive: true, force: true }) } catch { /* ignore */ }
+  }
+}
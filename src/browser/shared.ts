@@ -0,0 +1,111 @@
+import { chromium, Browser, BrowserContext } from 'playwright-core'
+import { DEFAULT_VIEWPORT, LAUNCH_ARGS } from './pool'
+
+// ---------------------------------------------------------------------------
+// Shared-browser mode: ephemeral sessions as contexts in shared processes
+// ---------------------------------------------------------------------------
+
+interface SharedBrowser {
+  key: string
+  ready: Promise<Browser>
+  /** Contexts open or being opened in this browser */
+  contexts: number
+}
+
+export interface SharedBrowsersStats {
+  contexts_per_browser: number
+  browsers: number
+  contexts: number
+}
+
+/**
+ * Hosts ephemeral sessions as `browser.newContext()` contexts, packing up to
+ * `contextsPerBrowser` of them into each browser process (one set of
+ * browsers per channel / executable / headless combination). A browser is
+ * launched when every existing one is full; an emptied browser is closed
+ * unless it is the last one for its combination, which stays up so the
+ * next session does not pay for a launch.
+ */
+export class SharedBrowsers {
+  private browsers: SharedBrowser[] = []
+
+  constructor(private contextsPerBrowser: number) {}
+
+  get enabled(): boolean {
+    return this.contextsPerBrowser > 0
+  }
+
+  async newContext(opts: {
+    headless: boolean
+    acceptDownloads?: boolean
+    channel?: string
+    executablePath?: string
+    /** Cookies + localStorage to start from (resuming a hibernated session) */
+    storageState?: object
+  }): Promise<BrowserContext> {
+    const slot = this.acquire(opts)
+    let context: BrowserContext
+    try {
+      const browser = await slot.ready
+      context = await browser.newContext({
+        acceptDownloads: opts.acceptDownloads ?? false,
+        viewport: DEFAULT_VIEWPORT,
+        // eslint-disable-next-line @typescript-eslint/no-explicit-any
+        storageState: opts.storageState as any,
+      })
+    } catch (err) {
+      this.release(slot)
+      throw err
+    }
+    context.on('close', () => this.release(slot))
+    return context
+  }
+
+  stats(): SharedBrowsersStats {
+    return {
+      contexts_per_browser: this.contextsPerBrowser,
+      browsers: this.browsers.length,
+      contexts: this.browsers.reduce((n, b) => n + b.contexts, 0),
+    }
+  }
+
+  /** Close every shared browser (their contexts go with them). */
+  async close(): Promise<void> {
+    const all = this.browsers
+    this.browsers = []
+    await Promise.all(all.map((b) => b.ready.then((br) => br.close()).catch(() => {})))
+  }
+
+  /** Reserve a context slot synchronously, so concurrent creates never overfill a browser. */
+  private acquire(opts: { headless: boolean; channel?: string; executablePath?: string }): SharedBrowser {
+    const key = `${opts.channel ?? ''}|${opts.executablePath ?? ''}|${opts.headless ? 'headless' : 'headed'}`
+    let slot = this.browsers.find((b) => b.key === key && b.contexts < this.contextsPerBrowser)
+    if (!slot) {
+      const launchOpts: Parameters<typeof chromium.launch>[0] = { headless: opts.headless, args: LAUNCH_ARGS }
+      if (opts.channel) launchOpts.channel = opts.channel
+      if (opts.executablePath) launchOpts.executablePath = opts.executablePath
+      const created: SharedBrowser = { key, ready: chromium.launch(launchOpts), contexts: 0 }
+      created.ready.then(
+        (browser) => browser.on('disconnected', () => this.drop(created)),
+        () => this.drop(created),
+      )
+      this.browsers.push(created)
+      slot = created
+    }
+    slot.contexts++
+    return slot
+  }
+
+  private release(slot: SharedBrowser): void {
+    slot.contexts--
+    if (slot.contexts > 0 || !this.browsers.includes(slot)) return
+    const others = this.browsers.filter((b) => b !== slot && b.key === slot.key)
+    if (others.length === 0) return
+    this.drop(slot)
+    slot.ready.then((browser) => browser.close()).catch(() => {})
+  }
+
+  private drop(slot: SharedBrowser): void {
+    this.browsers = this.browsers.filter((b) => b !== slot)
+  }
+}
@@ -0,0 +1,167 @@
+import { childRssBytes, procAvailable } from './procmem'
+
+// ---------------------------------------------------------------------------
+// Admission control for session creation
+// ---------------------------------------------------------------------------
+
+export interface AdmissionLimits {
+  /** Live managed sessions (plus creates in flight); 0 = unlimited */
+  maxSessions: number
+  /** Total RSS of the daemon's child processes (browsers); 0 = unlimited */
+  maxBrowserRssBytes: number
+  /** Default time a create may wait in the queue */
+  timeoutMs: number
+}
+
+export class AdmissionTimeoutError extends Error {
+  constructor(readonly waitedMs: number, readonly reason: 'sessions' | 'rss') {
+    super(`admission_timeout: no capacity after ${waitedMs} ms (${reason} limit)`)
+  }
+}
+
+interface Waiter {
+  enqueuedAt: number
+  resolve: () => void
+  reject: (err: Error) => void
+  timer: NodeJS.Timeout
+}
+
+const WAIT_SAMPLES = 1024
+const RSS_SAMPLE_MS = 1000
+const PUMP_MS = 250
+
+/**
+ * FIFO queue in front of session creation. A create is admitted when the
+ * live + in-flight session count is under maxSessions and the last sampled
+ * browser RSS is under maxBrowserRssBytes; otherwise it waits until
+ * capacity frees up or its deadline passes (AdmissionTimeoutError).
+ * Callers must release() once the create has finished, whether it
+ * succeeded or not.
+ */
+export class AdmissionController {
+  private queue: Waiter[] = []
+  private inFlight = 0
+  private admitted = 0
+  private timedOut = 0
+  /** Recent queue waits in ms (ring buffer), including zero waits */
+  private waits: number[] = []
+  private waitsNext = 0
+  private rssBytes: number | null = null
+  private rssTimer: NodeJS.Timeout | null = null
+  private pumpTimer: NodeJS.Timeout | null = null
+
+  constructor(
+    private limits: AdmissionLimits,
+    private liveCount: () => number,
+  ) {
+    if (limits.maxBrowserRssBytes > 0) {
+      if (procAvailable()) {
+        void this.sampleRss()
+        this.rssTimer = setInterval(() => void this.sampleRss(), RSS_SAMPLE_MS)
+        this.rssTimer.unref()
+      } else {
+        process.stderr.write('[agentmb] AGENTMB_MAX_BROWSER_RSS_MB needs /proc (Linux) — RSS limit disabled\n')
+      }
+    }
+  }
+
+  /** Resolve once the create may proceed; reject with AdmissionTimeoutError after `timeoutMs`. */
+  admit(timeoutMs = this.limits.timeoutMs): Promise<void> {
+    if (this.queue.length === 0 && this.blockedBy() === null) {
+      this.take(0)
+      return Promise.resolve()
+    }
+    return new Promise<void>((resolve, reject) => {
+      const waiter: Waiter = {
+        enqueuedAt: Date.now(),
+        resolve,
+        reject,
+        timer: setTimeout(() => {
+          this.queue = this.queue.filter((w) => w !== waiter)
+          this.timedOut++
+          reject(new AdmissionTimeoutError(Date.now() - waiter.enqueuedAt, this.blockedBy() ?? 'sessions'))
+        }, Math.max(0, timeoutMs)),
+      }
+      this.queue.push(waiter)
+      this.schedulePump()
+    })
+  }
+
+  /** A create admitted by admit() has finished (the session is live, or failed). */
+  release(): void {
+    this.inFlight = Math.max(0, this.inFlight - 1)
+    this.pump()
+  }
+
+  /** Capacity may have changed (a session closed). */
+  notify(): void {
+    this.pump()
+  }
+
+  stats(): Record<string, unknown> {
+    const sorted = [...this.waits].sort((a, b) => a - b)
+    const pct = (p: number) => (sorted.length ? sorted[Math.min(sorted.length - 1, Math.floor((sorted.length * p) / 100))] : 0)
+    return {
+      queue_depth: this.queue.length,
+      in_flight: this.inFlight,
+      live_sessions: this.liveCount(),
+      max_sessions: this.limits.maxSessions || null,
+      browser_rss_mb: this.rssBytes === null ? null : Math.round(this.rssBytes / 2 ** 20),
+      max_browser_rss_mb: this.limits.maxBrowserRssBytes ? Math.round(this.limits.maxBrowserRssBytes / 2 ** 20) : null,
+      admitted: this.admitted,
+      timed_out: this.timedOut,
+      oldest_wait_ms: this.queue.length ? Date.now() - this.queue[0].enqueuedAt : 0,
+      wait_p50_ms: pct(50),
+      wait_p99_ms: pct(99),
+    }
+  }
+
+  close(): void {
+    if (this.rssTimer) clearInterval(this.rssTimer)
+    if (this.pumpTimer) clearInterval(this.pumpTimer)
+    this.rssTimer = this.pumpTimer = null
+  }
+
+  private blockedBy(): 'sessions' | 'rss' | null {
+    if (this.limits.maxSessions > 0 && this.liveCount() + this.inFlight >= this.limits.maxSessions) return 'sessions'
+    if (this.limits.maxBrowserRssBytes > 0 && this.rssBytes !== null && this.rssBytes >= this.limits.maxBrowserRssBytes) {
+      // Let at least one create through when nothing is running, or the queue could never drain
+      if (this.inFlight > 0 || this.liveCount() > 0) return 'rss'
+    }
+    return null
+  }
+
+  private take(waitedMs: number): void {
+    this.inFlight++
+    this.admitted++
+    this.waits[this.waitsNext] = waitedMs
+    this.waitsNext = (this.waitsNext + 1) % WAIT_SAMPLES
+  }
+
+  private pump(): void {
+    while (this.queue.length > 0 && this.blockedBy() === null) {
+      const waiter = this.queue.shift()!
+      clearTimeout(waiter.timer)
+      this.take(Date.now() - waiter.enqueuedAt)
+      waiter.resolve()
+    }
+    if (this.queue.length === 0 && this.pumpTimer) {
+      clearInterval(this.pumpTimer)
+      this.pumpTimer = null
+    }
+  }
+
+  /** Poll while creates are queued: capacity also frees up when sessions close or browsers shrink. */
+  private schedulePump(): void {
+    if (this.pumpTimer) return
+    this.pumpTimer = setInterval(() => this.pump(), PUMP_MS)
+    this.pumpTimer.unref()
+  }
+
+  private async sampleRss(): Promise<void> {
+    const bytes = await childRssBytes()
+    if (bytes === null) return // keep the last sample
+    this.rssBytes = bytes
+    this.pump()
+  }
+}
@@ -20,6 +20,104 @@ export interface DaemonConfig {
    * Values: 'safe' (default) | 'permissive' | 'disabled'
    */
   policyProfile?: string
+  /**
+   * Optional Unix domain socket path, served in addition to TCP host:port.
+   * Set via AGENTMB_SOCKET env var: '1' / 'true' → <dataDir>/agentmb.sock,
+   * any other non-empty value is used as the socket path. Unset = TCP only.
+   */
+  socketPath?: string
+  /**
+   * Size cap for POST /sessions/:id/download, which buffers the file and
+   * returns it base64-encoded in JSON. Default 50 MB.
+   * Set via AGENTMB_MAX_DOWNLOAD_BYTES env var.
+   */
+  maxDownloadBytes: number
+  /**
+   * Size cap for POST /sessions/:id/upload (base64 content in JSON). Default 50 MB.
+   * Set via AGENTMB_MAX_UPLOAD_BYTES env var.
+   */
+  maxUploadBytes: number
+  /**
+   * Size cap for streamed transfers (POST /sessions/:id/download/stream and
+   * POST /sessions/:id/upload/stream).
+   * Memory use is bounded regardless of size, so the default is 0 (no cap).
+   * Set via AGENTMB_MAX_STREAM_BYTES env var.
+   */
+  maxStreamBytes: number
+  /**
+   * Coalescing window for sessions.json writes: registry changes within it
+   * are written once, asynchronously. Pending changes are flushed on shutdown.
+   * Default 50 ms. Set via AGENTMB_PERSIST_DEBOUNCE_MS env var.
+   */
+  persistDebounceMs: number
+  /**
+   * Zombie sessions (metadata only, browser not running) whose profile dir has
+   * not been touched for this many hours are dropped from the registry at
+   * startup and by periodic GC. Profiles on disk are kept. Sealed sessions
+   * are never dropped. Default 168 (7 days); 0 keeps zombies forever.
+   * Set via AGENTMB_ZOMBIE_TTL_HOURS env var.
+   */
+  zombieTtlHours: number
+  /**
+   * Warm pool of pre-launched ephemeral browser contexts, keyed by
+   * `<channel>:<headless|headed>` → pool size. Ephemeral session creates
+   * with a matching channel/headless (and no executable_path or
+   * accept_downloads) claim one instead of launching Chromium cold.
+   * Set via AGENTMB_WARM_POOL: a bare number sizes `chromium:headless`,
+   * or a comma list such as `chromium:headless=4,chrome:headed=1`.
+   * Default: no pool.
+   */
+  warmPool: Record<string, number>
+  /**
+   * Shared-browser mode for ephemeral sessions: when > 0, each ephemeral
+   * session is a browser.newContext() inside a shared Chromium process
+   * holding up to this many sessions, instead of a browser of its own
+   * (the warm pool is then not used). Default 0 (off).
+   * Set via AGENTMB_SHARED_CONTEXTS env var.
+   */
+  sharedContextsPerBrowser: number
+  /**
+   * Admission control: at most this many live managed sessions (CDP-attach
+   * sessions excluded). Creates beyond it wait in a FIFO queue.
+   * Default 0 (unlimited). Set via AGENTMB_MAX_SESSIONS env var.
+   */
+  maxSessions: number
+  /**
+   * Admission control: creates wait while the browsers' total RSS (all child
+   * processes of the daemon, sampled every second; Linux only) is at or above
+   * this many MB. Default 0 (unlimited). Set via AGENTMB_MAX_BROWSER_RSS_MB env var.
+   */
+  maxBrowserRssMb: number
+  /**
+   * How long a queued create waits for capacity before failing with
+   * 503 admission_timeout (overridable per request with queue_timeout_ms).
+   * Default 20000, so the answer arrives within the SDK's 30 s request timeout.
+   * Set via AGENTMB_ADMISSION_TIMEOUT_MS env var.
+   */
+  admissionTimeoutMs: number
+  /**
+   * Idle hibernation: a live headless managed session with no request for
+   * this long has its page URLs, routes and viewport saved and its browser
+   * closed; the next request on it relaunches and restores it. Profile and
+   * ephemeral temp dirs are kept, so cookies and storage survive.
+   * Default 0 (off). Set via AGENTMB_HIBERNATE_IDLE_MS env var.
+   */
+  hibernateIdleMs: number
+  /**
+   * Add a per-phase `timings` breakdown (policy, resolve_target, stability,
+   * execute, audit) to every response and action audit entry, not only to
+   * requests sending X-Agentmb-Timings: 1. Default false.
+   * Set via AGENTMB_TIMINGS=1.
+   */
+  timings: boolean
+  /**
+   * Origins allowed to open the WebSocket command channel (GET /api/v1/ws).
+   * Upgrades carrying any other Origin header are refused with 403, so web
+   * pages — including ones the managed browser opens — cannot drive the API.
+   * Non-browser clients (the SDK) send no Origin and are unaffected.
+   * Default: none. Set via AGENTMB_WS_ALLOWED_ORIGINS (comma list).
+   */
+  wsAllowedOrigins: string[]
 }
 
 export function resolveConfig(overrides: Partial<DaemonConfig> = {}): DaemonConfig {
@@ -36,9 +134,52 @@ export function resolveConfig(overrides: Partial<DaemonConfig> = {}): DaemonConf
     apiToken: overrides.apiToken ?? process.env.AGENTMB_API_TOKEN,
     encryptionKey: overrides.encryptionKey ?? process.env.AGENTMB_ENCRYPTION_KEY,
     policyProfile: overrides.policyProfile ?? process.env.AGENTMB_POLICY_PROFILE ?? 'safe',
+    socketPath: overrides.socketPath ?? resolveSocketPath(process.env.AGENTMB_SOCKET, dataDir),
+    maxDownloadBytes: overrides.maxDownloadBytes ?? Number(process.env.AGENTMB_MAX_DOWNLOAD_BYTES ?? 50 * 1024 * 1024),
+    maxUploadBytes: overrides.maxUploadBytes ?? Number(process.env.AGENTMB_MAX_UPLOAD_BYTES ?? 50 * 1024 * 1024),
+    maxStreamBytes: overrides.maxStreamBytes ?? Number(process.env.AGENTMB_MAX_STREAM_BYTES ?? 0),
+    persistDebounceMs: overrides.persistDebounceMs ?? Number(process.env.AGENTMB_PERSIST_DEBOUNCE_MS ?? 50),
+    zombieTtlHours: overrides.zombieTtlHours ?? Number(process.env.AGENTMB_ZOMBIE_TTL_HOURS ?? 168),
+    warmPool: overrides.warmPool ?? parseWarmPool(process.env.AGENTMB_WARM_POOL),
+    sharedContextsPerBrowser: overrides.sharedContextsPerBrowser ?? Number(process.env.AGENTMB_SHARED_CONTEXTS ?? 0),
+    maxSessions: overrides.maxSessions ?? Number(process.env.AGENTMB_MAX_SESSIONS ?? 0),
+    maxBrowserRssMb: overrides.maxBrowserRssMb ?? Number(process.env.AGENTMB_MAX_BROWSER_RSS_MB ?? 0),
+    admissionTimeoutMs: overrides.admissionTimeoutMs ?? Number(process.env.AGENTMB_ADMISSION_TIMEOUT_MS ?? 20000),
+    hibernateIdleMs: overrides.hibernateIdleMs ?? Number(process.env.AGENTMB_HIBERNATE_IDLE_MS ?? 0),
+    timings: overrides.timings ?? process.env.AGENTMB_TIMINGS === '1',
+    wsAllowedOrigins: overrides.wsAllowedOrigins ?? parseList(process.env.AGENTMB_WS_ALLOWED_ORIGINS),
   }
 }
 
+/** Parse AGENTMB_WARM_POOL (see DaemonConfig.warmPool); malformed entries are ignored. */
+function parseWarmPool(value: string | undefined): Record<string, number> {
+  const sizes: Record<string, number> = {}
+  if (!value) return sizes
+  if (/^\d+$/.test(value.trim())) {
+    sizes['chromium:headless'] = Number(value)
+    return sizes
+  }
+  for (const part of value.split(',')) {
+    const m = part.trim().match(/^([\w-]+):(headless|headed)=(\d+)$/)
+    if (m) sizes[`${m[1]}:${m[2]}`] = Number(m[3])
+  }
+  return sizes
+}
+
+function parseList(value: string | undefined): string[] {
+  return (value ?? '').split(',').map((v) => v.trim()).filter(Boolean)
+}
+
+function resolveSocketPath(value: string | undefined, dataDir: string): string | undefined {
+  if (!value || value === '0' || value === 'false') return undefined
+  if (value === '1' || value === 'true') return defaultSocketPath(dataDir)
+  return value
+}
+
+export function defaultSocketPath(dataDir: string): string {
+  return path.join(dataDir, 'agentmb.sock')
+}
+
 export function profilesDir(config: DaemonConfig): string {
   return path.join(config.dataDir, 'profiles')
 }
@@ -0,0 +1,47 @@
+import crypto from 'crypto'
+import type { FastifyReply, FastifyRequest } from 'fastify'
+
+/**
+ * Conditional GET helpers for cheap read-only endpoints.
+ *
+ * Validators are weak ETags built from revision counters the daemon already
+ * keeps (page_rev, per-session state rev, policy rev), so a matching
+ * `If-None-Match` is answered with 304 before the body is collected or
+ * serialized. A per-process boot id is mixed in because counters restart at
+ * zero when the daemon does.
+ */
+
+const BOOT_ID = crypto.randomBytes(4).toString('hex')
+
+/** Weak ETag from revision parts, e.g. etag('pages', pageRev, stateRev). */
+export function etag(kind: string, ...parts: Array<string | number>): string {
+  return `W/"${BOOT_ID}-${kind}-${parts.join('.')}"`
+}
+
+/** Weak ETag from a response body, for state the daemon cannot version (cookies). */
+export function contentEtag(kind: string, body: unknown): string {
+  const digest = crypto.createHash('sha1').update(JSON.stringify(body)).digest('base64url').slice(0, 16)
+  return `W/"${BOOT_ID}-${kind}-${digest}"`
+}
+
+function matches(header: string, tag: string): boolean {
+  if (header.trim() === '*') return true
+  // Weak comparison (RFC 9110 §8.8.3.2): ignore the W/ prefix on both sides.
+  const opaque = tag.replace(/^W\//, '')
+  return header.split(',').some((t) => t.trim().replace(/^W\//, '') === opaque)
+}
+
+/**
+ * Set the ETag on *reply*; when the request's If-None-Match matches, send an
+ * empty 304 and return true (the handler must then return without a body).
+ */
+export function notModified(req: FastifyRequest, reply: FastifyReply, tag: string): boolean {
+  reply.header('etag', tag)
+  reply.header('cache-control', 'no-cache')
+  const inm = req.headers['if-none-match']
+  if (typeof inm === 'string' && matches(inm, tag)) {
+    reply.code(304).send()
+    return true
+  }
+  return false
+}
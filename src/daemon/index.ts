@@ -15,6 +15,7 @@ if (nodeMajor < 20) {
 }
 
 import fs from 'fs'
+import http from 'http'
 import path from 'path'
 import { buildServer } from './server'
 import { SessionRegistry } from './session'
@@ -22,6 +23,8 @@ import { BrowserManager } from '../browser/manager'
 import { AuditLogger } from '../audit/logger'
 import { resolveConfig, pidFile, profilesDir, logsDir } from './config'
 import { PolicyEngine } from '../policy/engine'
+import { listenUnixSocket, closeUnixSocket } from './uds'
+import { closeCommandChannels } from './ws'
 import type { PolicyProfileName } from '../policy/types'
 
 async function main() {
@@ -46,12 +49,19 @@ async function main() {
   }
   fs.writeFileSync(pid, String(process.pid))
 
-  const registry = new SessionRegistry(config.dataDir, config.encryptionKey)
+  const registry = new SessionRegistry(
+    config.dataDir, config.encryptionKey, config.persistDebounceMs, config.zombieTtlHours * 3_600_000,
+  )
+  // Debounced registry writes may still be pending if the process exits without shutdown()
+  process.on('exit', () => registry.flushSync())
   const manager = new BrowserManager(registry, config)
+  manager.startHibernation(config.hibernateIdleMs)
   const auditLogger = new AuditLogger(logsDir(config))
 
   // Restore persisted session metadata (zombie state — profiles on disk, browsers not auto-relaunched)
   registry.loadPersistedSessions()
+  // Periodic zombie GC + journal compaction
+  registry.startMaintenance()
   const zombieCount = registry.list().length
   if (zombieCount > 0) {
     console.log(`[agentmb] Loaded ${zombieCount} session(s) from state file (zombie state — run 'agentmb session new' to relaunch browser)`)
@@ -67,11 +77,15 @@ async function main() {
   server.policyEngine = policyEngine
   console.log(`[agentmb] Policy profile: ${policyProfile}`)
 
+  let udsServer: http.Server | undefined
+
   // Graceful shutdown
   const shutdown = async (signal: string) => {
     server.log.info(`Received ${signal}, shutting down…`)
     // Disconnect CDP sessions + clean ephemeral dirs, then persist zombie state + close managed browsers
     await manager.shutdownAll()
+    closeCommandChannels()
+    if (udsServer && config.socketPath) await closeUnixSocket(udsServer, config.socketPath)
     await server.close()
     fs.unlinkSync(pid)
     process.exit(0)
@@ -84,6 +98,18 @@ async function main() {
     server.log.info(
       `agentmb daemon listening on http://${config.host}:${config.port}`
     )
+    if (config.socketPath) {
+      udsServer = await listenUnixSocket(server, config.socketPath)
+      server.log.info(`agentmb daemon listening on unix:${config.socketPath}`)
+    }
+    // Pre-launch warm contexts in the background once the API is up
+    // (shared-browser mode serves ephemeral sessions itself, so the pool would sit unused)
+    if (manager.warmPool.enabled && manager.sharedBrowsers.enabled) {
+      server.log.warn('AGENTMB_WARM_POOL is ignored while AGENTMB_SHARED_CONTEXTS is set')
+    } else if (manager.warmPool.enabled) {
+      manager.warmPool.start()
+      server.log.info(`Warm pool: ${JSON.stringify(config.warmPool)}`)
+    }
   } catch (err) {
     server.log.error(err)
     fs.unlinkSync(pid)
@@ -0,0 +1,170 @@
+import { monitorEventLoopDelay } from 'perf_hooks'
+import type { AuditLogger } from '../audit/logger'
+import type { BrowserManager } from '../browser/manager'
+import type { SessionRegistry } from './session'
+import { browserRssByDataDir, childRssBytes } from './procmem'
+
+// ---------------------------------------------------------------------------
+// Prometheus text exposition (format 0.0.4) for GET /metrics
+// ---------------------------------------------------------------------------
+
+export const METRICS_CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+
+type Labels = Record<string, string>
+
+const HTTP_BUCKETS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30]
+const POLICY_BUCKETS = [0, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60]
+
+function escapeLabel(value: string): string {
+  return value.replace(/\\/g, '\\\\').replace(/"/g, '\\"').replace(/\n/g, '\\n')
+}
+
+function formatLabels(labels: Labels): string {
+  const parts = Object.entries(labels).map(([k, v]) => `${k}="${escapeLabel(v)}"`)
+  return parts.length ? `{${parts.join(',')}}` : ''
+}
+
+function formatValue(value: number): string {
+  if (value === Infinity) return '+Inf'
+  if (value === -Infinity) return '-Inf'
+  return Number.isNaN(value) ? 'NaN' : String(value)
+}
+
+function header(lines: string[], name: string, type: string, help: string): void {
+  lines.push(`# HELP ${name} ${help}`, `# TYPE ${name} ${type}`)
+}
+
+function sample(lines: string[], name: string, labels: Labels, value: number): void {
+  lines.push(`${name}${formatLabels(labels)} ${formatValue(value)}`)
+}
+
+/** Cumulative histogram, one series per distinct label set. */
+class Histogram {
+  private series = new Map<string, { labels: Labels; counts: number[]; sum: number; count: number }>()
+
+  constructor(readonly name: string, readonly help: string, private buckets: number[]) {}
+
+  observe(labels: Labels, value: number): void {
+    const key = formatLabels(labels)
+    let s = this.series.get(key)
+    if (!s) {
+      s = { labels, counts: this.buckets.map(() => 0), sum: 0, count: 0 }
+      this.series.set(key, s)
+    }
+    for (let i = 0; i < this.buckets.length; i++) {
+      if (value <= this.buckets[i]) s.counts[i]++
+    }
+    s.sum += value
+    s.count++
+  }
+
+  render(lines: string[]): void {
+    header(lines, this.name, 'histogram', this.help)
+    for (const s of this.series.values()) {
+      this.buckets.forEach((le, i) => sample(lines, `${this.name}_bucket`, { ...s.labels, le: String(le) }, s.counts[i]))
+      sample(lines, `${this.name}_bucket`, { ...s.labels, le: '+Inf' }, s.count)
+      sample(lines, `${this.name}_sum`, s.labels, s.sum)
+      sample(lines, `${this.name}_count`, s.labels, s.count)
+    }
+  }
+}
+
+/** Sources read at scrape time (the manager and audit logger are attached after the server is built). */
+export interface MetricsSources {
+  registry: SessionRegistry
+  manager?: BrowserManager
+  auditLogger?: AuditLogger
+}
+
+/**
+ * Daemon metrics: request latency and in-flight counts are recorded by
+ * server hooks, policy waits by the action routes; session counts, browser
+ * memory, audit backlog and event-loop lag are sampled when /metrics is
+ * scraped. Route labels are the route pattern (`/api/v1/sessions/:id/click`),
+ * never the raw URL, so cardinality stays bounded.
+ */
+export class DaemonMetrics {
+  private httpDuration = new Histogram(
+    'agentmb_http_request_duration_seconds',
+    'HTTP request latency by route pattern, method and status code.',
+    HTTP_BUCKETS,
+  )
+  private policyWait = new Histogram(
+    'agentmb_policy_wait_seconds',
+    'Time actions spent waiting in PolicyEngine.checkAndWait (throttle, cooldown, jitter).',
+    POLICY_BUCKETS,
+  )
+  private inFlight = new Map<string, number>()
+  /** Event-loop delay since the previous scrape */
+  private loopDelay = monitorEventLoopDelay({ resolution: 10 })
+
+  constructor() {
+    this.loopDelay.enable()
+  }
+
+  requestStarted(route: string): void {
+    this.inFlight.set(route, (this.inFlight.get(route) ?? 0) + 1)
+  }
+
+  requestFinished(route: string, method: string, statusCode: number, seconds: number): void {
+    this.inFlight.set(route, Math.max(0, (this.inFlight.get(route) ?? 1) - 1))
+    this.httpDuration.observe({ route, method, status_code: String(statusCode) }, seconds)
+  }
+
+  observePolicyWait(waitedMs: number, outcome: 'allowed' | 'denied'): void {
+    this.policyWait.observe({ outcome }, waitedMs / 1000)
+  }
+
+  async render(src: MetricsSources): Promise<string> {
+    const lines: string[] = []
+
+    this.httpDuration.render(lines)
+    header(lines, 'agentmb_http_requests_in_flight', 'gauge', 'Requests currently being handled, by route pattern.')
+    for (const [route, n] of this.inFlight) sample(lines, 'agentmb_http_requests_in_flight', { route }, n)
+
+    const states: Record<string, number> = { live: 0, zombie: 0, hibernated: 0 }
+    for (const s of src.registry.list()) states[s.state] = (states[s.state] ?? 0) + 1
+    header(lines, 'agentmb_sessions', 'gauge', 'Sessions in the registry, by state.')
+    for (const [state, n] of Object.entries(states)) sample(lines, 'agentmb_sessions', { state }, n)
+
+    const [total, byDir] = await Promise.all([childRssBytes(), browserRssByDataDir()])
+    if (total !== null) {
+      header(lines, 'agentmb_browser_rss_bytes', 'gauge', 'Summed RSS of every browser process tree launched by the daemon.')
+      sample(lines, 'agentmb_browser_rss_bytes', {}, total)
+    }
+    if (byDir && src.manager) {
+      header(lines, 'agentmb_session_browser_rss_bytes', 'gauge',
+        'RSS of the browser process tree owned by a session (sessions in shared browsers are not listed).')
+      for (const [id, dir] of src.manager.browserDataDirs()) {
+        const bytes = byDir.get(dir)
+        if (bytes !== undefined) sample(lines, 'agentmb_session_browser_rss_bytes', { session_id: id }, bytes)
+      }
+    }
+
+    this.policyWait.render(lines)
+
+    if (src.auditLogger) {
+      header(lines, 'agentmb_audit_backlog_bytes', 'gauge', 'Audit log bytes buffered but not yet flushed to disk.')
+      sample(lines, 'agentmb_audit_backlog_bytes', {}, src.auditLogger.backlogBytes())
+    }
+
+    header(lines, 'agentmb_event_loop_lag_seconds', 'gauge', 'Event-loop delay since the previous scrape.')
+    for (const q of [50, 90, 99]) {
+      sample(lines, 'agentmb_event_loop_lag_seconds', { quantile: String(q / 100) }, this.loopDelay.percentile(q) / 1e9)
+    }
+    sample(lines, 'agentmb_event_loop_lag_seconds', { quantile: '1' }, this.loopDelay.max / 1e9)
+    this.loopDelay.reset()
+
+    const mem = process.memoryUsage()
+    header(lines, 'agentmb_process_resident_memory_bytes', 'gauge', 'RSS of the daemon process itself.')
+    sample(lines, 'agentmb_process_resident_memory_bytes', {}, mem.rss)
+    header(lines, 'agentmb_process_uptime_seconds', 'gauge', 'Seconds since the daemon started.')
+    sample(lines, 'agentmb_process_uptime_seconds', {}, Math.floor(process.uptime()))
+
+    return lines.join('\n') + '\n'
+  }
+
+  close(): void {
+    this.loopDelay.disable()
+  }
+}
@@ -0,0 +1,74 @@
+import fs from 'fs'
+
+/** ppid → child pids for every process in /proc; null where /proc is not available. */
+async function processTree(): Promise<Map<number, number[]> | null> {
+  let names: string[]
+  try {
+    names = await fs.promises.readdir('/proc')
+  } catch {
+    return null
+  }
+  const children = new Map<number, number[]>()
+  for (const name of names) {
+    if (!/^\d+$/.test(name)) continue
+    let stat: string
+    try { stat = await fs.promises.readFile(`/proc/${name}/stat`, 'utf8') } catch { continue }
+    // "<pid> (<comm>) <state> <ppid> ..." — comm may contain spaces or parens
+    const ppid = Number(stat.slice(stat.lastIndexOf(')') + 2).split(' ')[1])
+    const list = children.get(ppid) ?? []
+    list.push(Number(name))
+    children.set(ppid, list)
+  }
+  return children
+}
+
+/** Summed VmRSS of `pids` and all their descendants. */
+async function subtreeRss(children: Map<number, number[]>, pids: number[]): Promise<number> {
+  let total = 0
+  const stack = [...pids]
+  while (stack.length > 0) {
+    const pid = stack.pop()!
+    stack.push(...(children.get(pid) ?? []))
+    try {
+      const status = await fs.promises.readFile(`/proc/${pid}/status`, 'utf8')
+      const m = status.match(/^VmRSS:\s+(\d+) kB/m)
+      if (m) total += Number(m[1]) * 1024
+    } catch { /* exited */ }
+  }
+  return total
+}
+
+/**
+ * Summed VmRSS of every descendant of `rootPid` (the browsers and their
+ * helper processes), read from /proc. Null where /proc is not available.
+ * Async and allocation-light enough to call about once a second.
+ */
+export async function childRssBytes(rootPid = process.pid): Promise<number | null> {
+  const children = await processTree()
+  if (!children) return null
+  return subtreeRss(children, children.get(rootPid) ?? [])
+}
+
+/**
+ * RSS of each browser launched by `rootPid` (the browser process plus its
+ * renderers and helpers), keyed by the browser's `--user-data-dir`. Null
+ * where /proc is not available.
+ */
+export async function browserRssByDataDir(rootPid = process.pid): Promise<Map<string, number> | null> {
+  const children = await processTree()
+  if (!children) return null
+  const byDir = new Map<string, number>()
+  for (const pid of children.get(rootPid) ?? []) {
+    let cmdline: string
+    try { cmdline = await fs.promises.readFile(`/proc/${pid}/cmdline`, 'utf8') } catch { continue }
+    const arg = cmdline.split('\0').find((a) => a.startsWith('--user-data-dir='))
+    if (!arg) continue
+    const dir = arg.slice('--user-data-dir='.length)
+    byDir.set(dir, (byDir.get(dir) ?? 0) + await subtreeRss(children, [pid]))
+  }
+  return byDir
+}
+
+export function procAvailable(): boolean {
+  return fs.existsSync('/proc/self/status')
+}
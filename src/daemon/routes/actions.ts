@@ -2,6 +2,8 @@ import crypto from 'crypto'
 import fs from 'fs'
 import os from 'os'
 import path from 'path'
+import { Readable, Transform } from 'stream'
+import { pipeline } from 'stream/promises'
 import { FastifyInstance, FastifyReply, FastifyRequest } from 'fastify'
 import { SessionRegistry, LiveSession, SessionInfo } from '../session'
 import { BrowserContext, Page, Frame } from 'playwright-core'
@@ -13,6 +15,8 @@ import * as Actions from '../../browser/actions'
 import { ActionDiagnosticsError, Actionable, ActionDiagnostics } from '../../browser/actions'
 import { extractDomain } from '../../policy/engine'
 import { BrowserManager } from '../../browser/manager'
+import { etag, notModified } from '../etag'
+import { timed, timedSync } from '../timings'
 
 // ---------------------------------------------------------------------------
 // Frame resolution (T04 / r05-c05 P1: no silent fallback on missing frame)
@@ -122,14 +126,15 @@ async function applyPolicy(
   const engine = server.policyEngine
   if (!engine) return true
 
-  const result = await engine.checkAndWait({
+  const result = await timed('policy', () => engine.checkAndWait({
     sessionId,
     domain,
     action,
     sensitive: opts.sensitive,
     retry: opts.retry,
     auditLogger: server.auditLogger,
-  })
+  }))
+  server.metrics?.observePolicyWait(result.waitedMs, result.allowed ? 'allowed' : 'denied')
 
   if (!result.allowed) {
     reply.code(403).send({
@@ -175,15 +180,19 @@ interface StabilityOpts { wait_before_ms?: number; wait_after_ms?: number; wait_
 
 async function applyStabilityPre(page: Page, opts?: StabilityOpts): Promise<void> {
   if (!opts) return
-  if (opts.wait_before_ms) await new Promise<void>(r => setTimeout(r, opts.wait_before_ms!))
-  if (opts.wait_dom_stable_ms) {
-    try { await page.waitForFunction('document.readyState === "complete"', undefined, { timeout: opts.wait_dom_stable_ms }) } catch { /* timeout is acceptable */ }
-  }
+  await timed('stability_pre', async () => {
+    if (opts.wait_before_ms) await new Promise<void>(r => setTimeout(r, opts.wait_before_ms!))
+    if (opts.wait_dom_stable_ms) {
+      try { await page.waitForFunction('document.readyState === "complete"', undefined, { timeout: opts.wait_dom_stable_ms }) } catch { /* timeout is acceptable */ }
+    }
+  })
 }
 
 async function applyStabilityPost(page: Page, opts?: StabilityOpts): Promise<void> {
   if (!opts) return
-  if (opts.wait_after_ms) await new Promise<void>(r => setTimeout(r, opts.wait_after_ms!))
+  await timed('stability_post', async () => {
+    if (opts.wait_after_ms) await new Promise<void>(r => setTimeout(r, opts.wait_after_ms!))
+  })
 }
 
 // ---------------------------------------------------------------------------
@@ -204,11 +213,17 @@ function enrichDiag(diag: ActionDiagnostics): ActionDiagnostics & { recovery_hin
   return recovery_hint ? { ...diag, recovery_hint } : diag
 }
 
+class UploadTooLargeError extends Error {}
+
 export function registerActionRoutes(server: FastifyInstance, registry: SessionRegistry): void {
   function getLogger(): AuditLogger | undefined {
     return server.auditLogger
   }
 
+  // Streamed uploads (POST /upload/stream): hand the raw request stream to the
+  // route instead of buffering it under Fastify's bodyLimit.
+  server.addContentTypeParser('application/octet-stream', (_req, payload, done) => done(null, payload))
+
   /**
    * R07-T14: Resolve an action target (selector | element_id | ref_id) to CSS selector.
    * ref_id: validates snapshot exists + page_rev matches (→ 409 stale_ref on mismatch).
@@ -219,6 +234,14 @@ export function registerActionRoutes(server: FastifyInstance, registry: SessionR
     input: { selector?: string; element_id?: string; ref_id?: string },
     reply: FastifyReply,
     sessionId?: string,
+  ): string | null {
+    return timedSync('resolve_target', () => lookupTarget(input, reply, sessionId))
+  }
+
+  function lookupTarget(
+    input: { selector?: string; element_id?: string; ref_id?: string },
+    reply: FastifyReply,
+    sessionId?: string,
   ): string | null {
     if (input.ref_id) {
       const bm: BrowserManager | undefined = (server as any).browserManager
@@ -449,6 +472,27 @@ export function registerActionRoutes(server: FastifyInstance, registry: SessionR
     }
   })
 
+  // POST /api/v1/sessions/:id/screenshot/raw — same capture, image bytes as the body
+  // (content-type image/png | image/jpeg; server-side duration in x-duration-ms)
+  server.post<{
+    Params: { id: string }
+    Body: { format?: 'png' | 'jpeg'; full_page?: boolean; purpose?: string; operator?: string }
+  }>('/api/v1/sessions/:id/screenshot/raw', async (req, reply) => {
+    const s = resolve(req.params.id, reply)
+    if (!s) return
+    const { format = 'png', full_page = false, purpose, operator } = req.body ?? {}
+    try {
+      const shot = await Actions.screenshotBuffer(s.page, format, full_page, getLogger(), s.id, purpose, inferOperator(req, s, operator))
+      return reply
+        .header('content-type', format === 'jpeg' ? 'image/jpeg' : 'image/png')
+        .header('x-duration-ms', String(shot.duration_ms))
+        .send(shot.buffer)
+    } catch (e) {
+      if (e instanceof ActionDiagnosticsError) return reply.code(422).send(enrichDiag(e.diagnostics))
+      throw e
+    }
+  })
+
   // POST /api/v1/sessions/:id/type
   server.post<{
     Params: { id: string }
@@ -595,10 +639,11 @@ export function registerActionRoutes(server: FastifyInstance, registry: SessionR
     const s = resolve(req.params.id, reply)
     if (!s) return
     const { selector, content, filename, mime_type = 'application/octet-stream', purpose, operator } = req.body
-    // Guard: base64 content must not exceed 50 MB decoded
+    // Guard: base64 content must not exceed the upload cap (default 50 MB) decoded
+    const maxUploadBytes = server.daemonConfig?.maxUploadBytes ?? 50 * 1024 * 1024
     const approxBytes = Math.floor(content.length * 0.75)
-    if (approxBytes > 50 * 1024 * 1024) {
-      return reply.code(413).send({ error: 'File too large: maximum upload size is 50 MB' })
+    if (approxBytes > maxUploadBytes) {
+      return reply.code(413).send({ error: `File too large: maximum upload size is ${Math.floor(maxUploadBytes / (1024 * 1024))} MB (use /upload/stream for large files)` })
     }
     try {
       return await Actions.uploadFile(s.page, selector, content, filename, mime_type, getLogger(), s.id, purpose, inferOperator(req, s, operator))
@@ -608,6 +653,59 @@ export function registerActionRoutes(server: FastifyInstance, registry: SessionR
     }
   })
 
+  // POST /api/v1/sessions/:id/upload/stream
+  // Body: the raw file bytes (content-type: application/octet-stream).
+  // Target + metadata travel in the querystring: selector | element_id | ref_id,
+  // filename, mime_type, purpose, operator. The body is piped to a per-session
+  // temp file and handed to setInputFiles by path — never buffered in memory.
+  // Cap: AGENTMB_MAX_STREAM_BYTES (0 = unlimited) → 413.
+  server.post<{
+    Params: { id: string }
+    Querystring: { selector?: string; element_id?: string; ref_id?: string; filename?: string; mime_type?: string; purpose?: string; operator?: string }
+  }>('/api/v1/sessions/:id/upload/stream', async (req, reply) => {
+    const s = resolve(req.params.id, reply)
+    if (!s) return
+    const { filename = 'upload.bin', mime_type = 'application/octet-stream', purpose, operator } = req.query
+    const selector = resolveTarget(req.query, reply, s.id)
+    if (!selector) return
+    if (!(req.body instanceof Readable)) {
+      return reply.code(415).send({ error: 'upload/stream expects the file as an application/octet-stream body' })
+    }
+    const maxBytes = server.daemonConfig?.maxStreamBytes ?? 0
+    const declared = Number(req.headers['content-length'] ?? 0)
+    if (maxBytes > 0 && declared > maxBytes) {
+      return reply.code(413).send({ error: 'upload_too_large', size_bytes: declared, max_bytes: maxBytes })
+    }
+
+    const baseDir = server.browserManager?.uploadDir(s.id) ?? os.tmpdir()
+    const dir = fs.mkdtempSync(path.join(baseDir, 'f-'))
+    const filePath = path.join(dir, path.basename(filename) || 'upload.bin')
+    let received = 0
+    const limiter = new Transform({
+      transform(chunk: Buffer, _enc, cb) {
+        received += chunk.length
+        if (maxBytes > 0 && received > maxBytes) cb(new UploadTooLargeError())
+        else cb(null, chunk)
+      },
+    })
+    try {
+      await pipeline(req.body, limiter, fs.createWriteStream(filePath))
+    } catch (e) {
+      fs.rmSync(dir, { recursive: true, force: true })
+      if (e instanceof UploadTooLargeError) {
+        return reply.code(413).send({ error: 'upload_too_large', size_bytes: received, max_bytes: maxBytes })
+      }
+      throw e
+    }
+    try {
+      return await Actions.uploadFilePath(s.page, selector, filePath, mime_type, getLogger(), s.id, purpose, inferOperator(req, s, operator))
+    } catch (e) {
+      fs.rmSync(dir, { recursive: true, force: true })
+      if (e instanceof ActionDiagnosticsError) return reply.code(422).send(enrichDiag(e.diagnostics))
+      throw e
+    }
+  })
+
   // POST /api/v1/sessions/:id/download
   // T07: guard on accept_downloads; T08: element_id / ref_id support
   server.post<{
@@ -624,7 +722,7 @@ export function registerActionRoutes(server: FastifyInstance, registry: SessionR
         message: 'Downloads are disabled for this session. Create the session with accept_downloads=true (CLI: agentmb session new --accept-downloads).',
       })
     }
-    const { timeout_ms = 30000, max_bytes = 50 * 1024 * 1024, purpose, operator } = req.body
+    const { timeout_ms = 30000, max_bytes = server.daemonConfig?.maxDownloadBytes ?? 50 * 1024 * 1024, purpose, operator } = req.body
     // T08: resolve selector/element_id/ref_id to CSS selector
     const selector = resolveTarget(req.body, reply, s.id)
     if (!selector) return
@@ -636,6 +734,47 @@ export function registerActionRoutes(server: FastifyInstance, registry: SessionR
     }
   })
 
+  // POST /api/v1/sessions/:id/download/stream
+  // Same trigger as /download, but the file is piped back as the raw response
+  // body (application/octet-stream, chunked from disk) instead of base64 JSON.
+  // Filename → x-filename (URI-encoded) + content-disposition; wait time → x-duration-ms.
+  // Cap: max_bytes, else AGENTMB_MAX_STREAM_BYTES (0 = unlimited) → 413.
+  server.post<{
+    Params: { id: string }
+    Body: { selector?: string; element_id?: string; ref_id?: string; timeout_ms?: number; max_bytes?: number; purpose?: string; operator?: string }
+  }>('/api/v1/sessions/:id/download/stream', async (req, reply) => {
+    const s = resolve(req.params.id, reply)
+    if (!s) return
+    const bm = server.browserManager
+    if (bm && !bm.getAcceptDownloads(s.id)) {
+      return reply.code(422).send({
+        error: 'download_not_enabled',
+        message: 'Downloads are disabled for this session. Create the session with accept_downloads=true (CLI: agentmb session new --accept-downloads).',
+      })
+    }
+    const { timeout_ms = 30000, max_bytes = server.daemonConfig?.maxStreamBytes ?? 0, purpose, operator } = req.body ?? {}
+    const selector = resolveTarget(req.body ?? {}, reply, s.id)
+    if (!selector) return
+    let dl: Awaited<ReturnType<typeof Actions.downloadToPath>>
+    try {
+      dl = await Actions.downloadToPath(s.page, selector, timeout_ms, getLogger(), s.id, purpose, inferOperator(req, s, operator))
+    } catch (e) {
+      if (e instanceof ActionDiagnosticsError) return reply.code(422).send(enrichDiag(e.diagnostics))
+      throw e
+    }
+    if (max_bytes > 0 && dl.size_bytes > max_bytes) {
+      return reply.code(413).send({ error: 'download_too_large', filename: dl.filename, size_bytes: dl.size_bytes, max_bytes })
+    }
+    const encodedName = encodeURIComponent(dl.filename)
+    return reply
+      .header('content-type', 'application/octet-stream')
+      .header('content-length', String(dl.size_bytes))
+      .header('content-disposition', `attachment; filename*=UTF-8''${encodedName}`)
+      .header('x-filename', encodedName)
+      .header('x-duration-ms', String(dl.duration_ms))
+      .send(fs.createReadStream(dl.path, { highWaterMark: 256 * 1024 }))
+  })
+
   // GET /api/v1/sessions/:id/logs
   server.get<{
     Params: { id: string }
@@ -1183,6 +1322,8 @@ export function registerActionRoutes(server: FastifyInstance, registry: SessionR
     const s = resolve(req.params.id, reply); if (!s) return
     const bm: BrowserManager | undefined = (server as any).browserManager
     const page_rev = bm?.getPageRev(s.id) ?? 0
+    // Active-page switches change s.page without a navigation, hence the state rev.
+    if (notModified(req, reply, etag('page_rev', page_rev, bm?.getStateRev(s.id) ?? 0))) return
     return { status: 'ok', session_id: req.params.id, page_rev, url: s.page.url() }
   })
 }
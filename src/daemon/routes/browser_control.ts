@@ -99,7 +99,9 @@ export function registerBrowserControlRoutes(server: FastifyInstance, registry:
     const { width, height, purpose, operator } = req.body
     if (!width || !height) return reply.code(400).send({ error: 'width and height are required' })
     try {
-      return await Actions.setViewport(s.page, width, height, getLogger(), s.id, purpose, inferOp(req, s, operator))
+      const result = await Actions.setViewport(s.page, width, height, getLogger(), s.id, purpose, inferOp(req, s, operator))
+      bm()?.bumpStateRev(s.id)
+      return result
     } catch (e) {
       if (e instanceof ActionDiagnosticsError) return reply.code(422).send(e.diagnostics)
       throw e
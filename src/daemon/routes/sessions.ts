@@ -8,6 +8,8 @@ import { BrowserManager, PageInfo, RouteMockConfig } from '../../browser/manager
 import { AuditLogger } from '../../audit/logger'
 import '../types' // T11: Fastify type augmentation
 import type { PolicyProfileName } from '../../policy/types'
+import { etag, notModified } from '../etag'
+import { AdmissionTimeoutError } from '../admission'
 
 // ---------------------------------------------------------------------------
 // T12: CDP error sanitization
@@ -39,12 +41,13 @@ export function registerSessionRoutes(server: FastifyInstance, registry: Session
       executable_path?: string
       launch_mode?: 'managed' | 'attach'
       cdp_url?: string
+      queue_timeout_ms?: number
     }
   }>('/api/v1/sessions', async (req, reply) => {
     const {
       profile, headless = true, agent_id, accept_downloads = false,
       ephemeral, browser_channel, executable_path,
-      launch_mode, cdp_url,
+      launch_mode, cdp_url, queue_timeout_ms,
     } = req.body ?? {}
 
     const manager = server.browserManager
@@ -72,6 +75,22 @@ export function registerSessionRoutes(server: FastifyInstance, registry: Session
       }
     }
 
+    // Admission control: managed launches wait for capacity (attach starts no local browser)
+    const admission = launch_mode === 'attach' ? undefined : server.admission
+    if (admission) {
+      try {
+        await admission.admit(queue_timeout_ms)
+      } catch (err) {
+        if (!(err instanceof AdmissionTimeoutError)) throw err
+        return reply.code(503).header('retry-after', '1').send({
+          error: 'admission_timeout',
+          reason: err.reason,
+          waited_ms: err.waitedMs,
+          message: err.message,
+        })
+      }
+    }
+
     const id = registry.create({
       profile, headless, agentId: agent_id,
       ephemeral, browserChannel: browser_channel, executablePath: executable_path,
@@ -109,6 +128,9 @@ export function registerSessionRoutes(server: FastifyInstance, registry: Session
       // Use registry.close() so persist() is called and sessions.json stays clean
       await registry.close(id)
       return reply.code(500).send({ error: err.message })
+    } finally {
+      // The session is live (or gone) now, so it no longer counts as in flight
+      admission?.release()
     }
 
     const s = registry.get(id)!
@@ -171,6 +193,7 @@ export function registerSessionRoutes(server: FastifyInstance, registry: Session
     const manager = server.browserManager
     if (manager) await manager.closeSession(req.params.id)
     await registry.close(req.params.id)
+    server.admission?.notify()
     return reply.code(204).send()
   })
 
@@ -282,6 +305,8 @@ export function registerSessionRoutes(server: FastifyInstance, registry: Session
     if (!s) return reply.code(404).send({ error: 'Not found' })
     const manager = server.browserManager
     if (!manager) return reply.code(503).send({ error: 'Browser manager not initialized' })
+    // Page URLs move with page_rev (any page's main frame); open/switch/close with the state rev.
+    if (notModified(req, reply, etag('pages', manager.getPageRev(req.params.id), manager.getStateRev(req.params.id)))) return
     return { session_id: req.params.id, pages: manager.listPages(req.params.id) }
   })
 
@@ -344,26 +369,24 @@ export function registerSessionRoutes(server: FastifyInstance, registry: Session
     if ('notFound' in live) return reply.code(404).send({ error: `Session not found: ${req.params.id}` })
     if ('zombie' in live) return reply.code(410).send({ error: 'Session browser is not running', state: 'zombie' })
 
+    const manager = server.browserManager
+    if (!manager) return reply.code(503).send({ error: 'Browser manager not initialized' })
+
     const { context, page } = live as any
-    const cdpSession = await context.newCDPSession(page)
-    try {
-      const { targetInfos } = await cdpSession.send('Target.getTargets') as any
-      getLogger()?.write({
-        session_id: req.params.id,
-        action_id: 'act_' + crypto.randomBytes(6).toString('hex'),
-        type: 'cdp',
-        action: 'cdp_info',
-        url: page.url(),
-        params: { method: 'Target.getTargets' },
-        result: { target_count: targetInfos.length },
-      })
-      return {
-        session_id: req.params.id,
-        url: page.url(),
-        targets: targetInfos,
-      }
-    } finally {
-      await cdpSession.detach()
+    const { targetInfos } = await manager.sendCdp(context, page, 'Target.getTargets') as any
+    getLogger()?.write({
+      session_id: req.params.id,
+      action_id: 'act_' + crypto.randomBytes(6).toString('hex'),
+      type: 'cdp',
+      action: 'cdp_info',
+      url: page.url(),
+      params: { method: 'Target.getTargets' },
+      result: { target_count: targetInfos.length },
+    })
+    return {
+      session_id: req.params.id,
+      url: page.url(),
+      targets: targetInfos,
     }
   })
 
@@ -407,6 +430,7 @@ export function registerSessionRoutes(server: FastifyInstance, registry: Session
     if (!s) return reply.code(404).send({ error: 'Not found' })
     const manager = server.browserManager
     if (!manager) return reply.code(503).send({ error: 'Browser manager not initialized' })
+    if (notModified(req, reply, etag('routes', manager.getStateRev(req.params.id)))) return
     return { session_id: req.params.id, routes: manager.listRoutes(req.params.id) }
   })
 
@@ -472,10 +496,12 @@ export function registerSessionRoutes(server: FastifyInstance, registry: Session
     const { method, params = {}, purpose, operator } = req.body
     if (!method) return reply.code(400).send({ error: 'method is required' })
 
+    const manager = server.browserManager
+    if (!manager) return reply.code(503).send({ error: 'Browser manager not initialized' })
+
     const { context, page } = live as any
-    const cdpSession = await context.newCDPSession(page)
     try {
-      const result = await cdpSession.send(method, params)
+      const result = await manager.sendCdp(context, page, method, params)
       getLogger()?.write({
         session_id: req.params.id,
         action_id: 'act_' + crypto.randomBytes(6).toString('hex'),
@@ -502,8 +528,82 @@ export function registerSessionRoutes(server: FastifyInstance, registry: Session
         operator,
       })
       return reply.code(400).send({ error: sanitizeCdpError(err.message) })
-    } finally {
-      await cdpSession.detach()
+    }
+  })
+
+  // POST /api/v1/sessions/:id/cdp/batch — run several CDP commands on the page's CDP session
+  // Sequential by default (in order, optionally stopping at the first error); parallel=true
+  // sends them all at once. Per-command failures are reported in results, not as a 400.
+  server.post<{
+    Params: { id: string }
+    Body: {
+      commands: Array<{ method: string; params?: Record<string, unknown> }>
+      parallel?: boolean; stop_on_error?: boolean; purpose?: string; operator?: string
+    }
+  }>('/api/v1/sessions/:id/cdp/batch', async (req, reply) => {
+    const live = registry.getLive(req.params.id)
+    if ('notFound' in live) return reply.code(404).send({ error: `Session not found: ${req.params.id}` })
+    if ('zombie' in live) return reply.code(410).send({ error: 'Session browser is not running', state: 'zombie' })
+
+    const { commands, parallel = false, stop_on_error = false, purpose, operator } = req.body ?? {}
+    if (!Array.isArray(commands) || commands.length === 0) return reply.code(400).send({ error: 'commands must be a non-empty array' })
+    if (commands.length > 100) return reply.code(400).send({ error: 'commands must not exceed 100' })
+    const missing = commands.findIndex((c) => !c || typeof c.method !== 'string' || !c.method)
+    if (missing !== -1) return reply.code(400).send({ error: `commands[${missing}].method is required` })
+
+    const manager = server.browserManager
+    if (!manager) return reply.code(503).send({ error: 'Browser manager not initialized' })
+
+    const { context, page } = live as any
+    const t0 = Date.now()
+    // eslint-disable-next-line @typescript-eslint/no-explicit-any
+    type CommandResult = { index: number; method: string; result?: any; error?: string; duration_ms: number }
+    const errors: string[] = []
+    const run = async (index: number): Promise<CommandResult> => {
+      const { method, params = {} } = commands[index]
+      const started = Date.now()
+      try {
+        const result = await manager.sendCdp(context, page, method, params)
+        return { index, method, result, duration_ms: Date.now() - started }
+      } catch (err: any) {
+        errors.push(`${method}: ${err.message}`)
+        return { index, method, error: sanitizeCdpError(err.message), duration_ms: Date.now() - started }
+      }
+    }
+
+    let results: CommandResult[]
+    if (parallel) {
+      results = await Promise.all(commands.map((_, i) => run(i)))
+    } else {
+      results = []
+      for (let i = 0; i < commands.length; i++) {
+        const r = await run(i)
+        results.push(r)
+        if (r.error !== undefined && stop_on_error) break
+      }
+    }
+
+    const failed = results.filter((r) => r.error !== undefined).length
+    const completed = results.length - failed
+    getLogger()?.write({
+      session_id: req.params.id,
+      action_id: 'act_' + crypto.randomBytes(6).toString('hex'),
+      type: 'cdp',
+      action: 'cdp_batch',
+      url: page.url(),
+      params: { methods: commands.map((c) => c.method), parallel },
+      result: { completed, failed },
+      error: errors.length ? errors.join('; ') : null, // full errors in audit log
+      purpose,
+      operator,
+    })
+    return {
+      status: failed === 0 ? 'ok' : completed > 0 ? 'partial' : 'failed',
+      total_commands: commands.length,
+      completed_commands: completed,
+      failed_commands: failed,
+      duration_ms: Date.now() - t0,
+      results,
     }
   })
 
@@ -524,6 +624,8 @@ export function registerSessionRoutes(server: FastifyInstance, registry: Session
     const { context } = live as any
     try {
       await context.tracing.start({ screenshots, snapshots })
+      // A trace in progress cannot survive hibernation
+      server.browserManager?.markBusy(req.params.id, 1)
       return { session_id: req.params.id, tracing: true, screenshots, snapshots }
     } catch (err: any) {
       return reply.code(400).send({ error: err.message })
@@ -587,6 +689,7 @@ export function registerSessionRoutes(server: FastifyInstance, registry: Session
     const engine = server.policyEngine
     if (!engine) return reply.code(503).send({ error: 'Policy engine not initialized' })
 
+    if (notModified(req, reply, etag('policy', engine.getRevision()))) return
     const effective = engine.getSessionPolicy(req.params.id)
     return {
       session_id: req.params.id,
@@ -610,6 +713,7 @@ export function registerSessionRoutes(server: FastifyInstance, registry: Session
     const tmpPath = `/tmp/agentmb-trace-${req.params.id}.zip`
     try {
       await context.tracing.stop({ path: tmpPath })
+      server.browserManager?.markBusy(req.params.id, -1)
       const { readFileSync, unlinkSync } = await import('fs')
       const buffer = readFileSync(tmpPath)
       unlinkSync(tmpPath)
@@ -643,6 +747,8 @@ export function registerSessionRoutes(server: FastifyInstance, registry: Session
     if (!manager) return reply.code(503).send({ error: 'Browser manager not initialized' })
     const live = registry.getLive(req.params.id)
     if ('notFound' in live || 'zombie' in live) return reply.code(410).send({ error: 'Session browser is not running' })
+    // url follows page_rev; viewport, active page and headless (relaunch) follow the state rev.
+    if (notModified(req, reply, etag('settings', manager.getPageRev(req.params.id), manager.getStateRev(req.params.id)))) return
     const liveSess = live as any
     const viewport = liveSess.page?.viewportSize?.() ?? null
     const userAgent = await liveSess.page?.evaluate(() => navigator.userAgent).catch(() => null)
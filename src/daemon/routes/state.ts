@@ -2,18 +2,27 @@
  * R07-C03 state routes:
  *  T05 — Cookie CRUD + storage_state export/import
  *  T06/T16/T17 — Console log + page error collection
+ *  Event stream — console / page errors / dialogs / navigations pushed as they happen
  *  T15 — Annotated screenshot
  */
 import { FastifyInstance, FastifyReply } from 'fastify'
+import { PassThrough } from 'stream'
 import { SessionRegistry, LiveSession } from '../session'
 import { BrowserContext, Page } from 'playwright-core'
 import { BrowserManager } from '../../browser/manager'
+import { SESSION_EVENT_TYPES, SessionEvent, SessionEventType } from '../../browser/events'
 import * as Actions from '../../browser/actions'
 import { ActionDiagnosticsError } from '../../browser/actions'
 import '../types'
+import { contentEtag, notModified } from '../etag'
 
 type ReadySession = LiveSession & { context: BrowserContext; page: Page }
 
+/** Comment line sent on idle event streams so proxies and clients see the connection alive. */
+const EVENT_HEARTBEAT_MS = 15_000
+/** A subscriber this far behind is disconnected; it can resume with Last-Event-ID. */
+const EVENT_MAX_BUFFERED_BYTES = 8 * 2 ** 20
+
 function resolve(registry: SessionRegistry, id: string, reply: FastifyReply): ReadySession | null {
   const result = registry.getLive(id)
   if ('notFound' in result) { reply.code(404).send({ error: `Session ${id} not found` }); return null }
@@ -37,6 +46,10 @@ export function registerStateRoutes(server: FastifyInstance, registry: SessionRe
       const s = resolve(registry, req.params.id, reply); if (!s) return
       const urls = req.query.urls ? req.query.urls.split(',') : undefined
       const cookies = await bm().getCookies(s.id, urls)
+      // Set-Cookie and document.cookie change the jar without the daemon seeing it, so
+      // the validator is a content hash: the jar is still read, but an unchanged one
+      // costs the client neither the body nor decoding.
+      if (notModified(req, reply, contentEtag('cookies', cookies))) return
       return { session_id: s.id, cookies, count: cookies.length }
     },
   )
@@ -184,6 +197,75 @@ export function registerStateRoutes(server: FastifyInstance, registry: SessionRe
     },
   )
 
+  // ---------------------------------------------------------------------------
+  // Event stream (SSE / NDJSON)
+  // ---------------------------------------------------------------------------
+
+  /**
+   * GET /api/v1/sessions/:id/events — console, page_error, dialog, framenavigated
+   * and page_rev events as server-sent events (NDJSON with ?format=ndjson or
+   * Accept: application/x-ndjson). ?types=console,dialog filters. Last-Event-ID
+   * (or ?since=<seq>) first replays retained events after that seq. The first
+   * message is always `ready`. A hibernated session is not woken up; its events
+   * resume when something else wakes it. Ends after `session_closed`.
+   */
+  server.get<{ Params: { id: string }; Querystring: { types?: string; since?: string; format?: string } }>(
+    '/api/v1/sessions/:id/events',
+    async (req, reply) => {
+      const s = registry.get(req.params.id)
+      if (!s) return reply.code(404).send({ error: `Session ${req.params.id} not found` })
+      if (s.state === 'zombie') return reply.code(410).send({ error: `Session ${s.id} is in zombie state — relaunch first` })
+      const manager = bm()
+      if (!manager) return reply.code(503).send({ error: 'Browser manager not initialized' })
+
+      const types = req.query.types ? req.query.types.split(',').map((t) => t.trim()).filter(Boolean) : null
+      const unknown = (types ?? []).filter((t) => !SESSION_EVENT_TYPES.includes(t as SessionEventType))
+      if (unknown.length) {
+        return reply.code(400).send({ error: `unknown event type(s): ${unknown.join(', ')}`, allowed: SESSION_EVENT_TYPES })
+      }
+      const lastId = (req.headers['last-event-id'] as string | undefined) ?? req.query.since
+      const since = lastId !== undefined ? Number(lastId) : null
+      if (since !== null && !(Number.isInteger(since) && since >= 0)) {
+        return reply.code(400).send({ error: 'since / Last-Event-ID must be a non-negative integer' })
+      }
+      const ndjson = req.query.format === 'ndjson' || (req.headers.accept ?? '').includes('application/x-ndjson')
+
+      const stream = new PassThrough()
+      const frame = (name: string, payload: object, id?: number) =>
+        ndjson
+          ? JSON.stringify(payload) + '\n'
+          : `${id !== undefined ? `id: ${id}\n` : ''}event: ${name}\ndata: ${JSON.stringify(payload)}\n\n`
+      const push = (chunk: string) => {
+        if (stream.writableEnded || stream.destroyed) return
+        if (stream.writableLength > EVENT_MAX_BUFFERED_BYTES) return stream.destroy()
+        stream.write(chunk)
+      }
+      const send = (e: SessionEvent) => {
+        if (types && e.type !== 'session_closed' && !types.includes(e.type)) return
+        push(frame(e.type, e, e.seq))
+      }
+
+      const replay = since !== null ? manager.events.since(s.id, since) : { events: [], missed: false }
+      push(frame('ready', {
+        type: 'ready', session_id: s.id, last_seq: manager.events.lastSeq(s.id),
+        page_rev: manager.getPageRev(s.id), missed: replay.missed,
+      }))
+      for (const e of replay.events) send(e)
+      const unsubscribe = manager.events.subscribe(s.id, send, () => stream.end())
+      const heartbeat = setInterval(() => push(ndjson ? '\n' : ': ping\n\n'), EVENT_HEARTBEAT_MS)
+      stream.once('close', () => {
+        clearInterval(heartbeat)
+        unsubscribe()
+      })
+      reply.raw.once('close', () => stream.destroy())
+      return reply
+        .header('content-type', ndjson ? 'application/x-ndjson' : 'text/event-stream')
+        .header('cache-control', 'no-cache')
+        .header('x-accel-buffering', 'no')
+        .send(stream)
+    },
+  )
+
   // ---------------------------------------------------------------------------
   // R07-T15: Annotated screenshot
   // ---------------------------------------------------------------------------
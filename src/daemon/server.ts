@@ -1,4 +1,5 @@
 import Fastify, { FastifyInstance, FastifyRequest, FastifyReply } from 'fastify'
+import { monitorEventLoopDelay } from 'perf_hooks'
 import { SessionRegistry } from './session'
 import { registerSessionRoutes } from './routes/sessions'
 import { registerActionRoutes } from './routes/actions'
@@ -6,6 +7,10 @@ import { registerStateRoutes } from './routes/state'
 import { registerInteractionRoutes } from './routes/interaction'
 import { registerBrowserControlRoutes } from './routes/browser_control'
 import { DaemonConfig } from './config'
+import { AdmissionController, AdmissionTimeoutError } from './admission'
+import { DaemonMetrics, METRICS_CONTENT_TYPE } from './metrics'
+import { registerTimingHooks } from './timings'
+import { attachCommandChannel, closeCommandChannels, commandChannelStats } from './ws'
 // T11: Fastify instance type augmentation — makes auditLogger/browserManager type-safe
 import './types'
 
@@ -24,6 +29,32 @@ export function buildServer(config: DaemonConfig, registry: SessionRegistry): Fa
     },
   })
 
+  // Route handlers read limits (download/upload caps, …) from here
+  server.daemonConfig = config
+
+  // Session-create admission queue (limits on live sessions / browser RSS)
+  server.admission = new AdmissionController(
+    {
+      maxSessions: config.maxSessions ?? 0,
+      maxBrowserRssBytes: (config.maxBrowserRssMb ?? 0) * 2 ** 20,
+      timeoutMs: config.admissionTimeoutMs ?? 20000,
+    },
+    () => registry.list().filter((s) => s.state === 'live' && s.launchMode !== 'attach').length,
+  )
+  server.addHook('onClose', async () => server.admission?.close())
+
+  // Prometheus metrics: latency / in-flight per route pattern (404s share one label)
+  const metrics = new DaemonMetrics()
+  server.metrics = metrics
+  const routeLabel = (req: FastifyRequest) => req.routeOptions.url ?? '<unmatched>'
+  server.addHook('onRequest', async (req: FastifyRequest) => {
+    metrics.requestStarted(routeLabel(req))
+  })
+  server.addHook('onResponse', async (req: FastifyRequest, reply: FastifyReply) => {
+    metrics.requestFinished(routeLabel(req), req.method, reply.statusCode, reply.elapsedTime / 1000)
+  })
+  server.addHook('onClose', async () => metrics.close())
+
   // API token authentication (optional — only enforced when AGENTMB_API_TOKEN is set)
   if (config.apiToken) {
     server.addHook('preHandler', async (req: FastifyRequest, reply: FastifyReply) => {
@@ -41,6 +72,53 @@ export function buildServer(config: DaemonConfig, registry: SessionRegistry): Fa
     })
   }
 
+  // Idle hibernation: requests on a session keep it awake and resume it when hibernated.
+  // Metadata-only routes do not relaunch the browser. Requests that never finish
+  // (CDP WebSocket passthrough) keep their session awake for good — except event
+  // streams, which only watch and must not pin the browser.
+  const NO_RESUME = new Set(['/api/v1/sessions/:id/attach', '/api/v1/sessions/:id/seal', '/api/v1/sessions/:id/policy'])
+  const NOT_BUSY = '/api/v1/sessions/:id/events'
+  const busySessions = new WeakMap<FastifyRequest, string>()
+  server.addHook('preHandler', async (req: FastifyRequest, reply: FastifyReply) => {
+    if (reply.sent) return
+    const manager = server.browserManager
+    const id = (req.params as { id?: string } | undefined)?.id
+    if (!manager || !id || !req.routeOptions.url?.startsWith('/api/v1/sessions/:id/')) return
+    if (req.routeOptions.url === NOT_BUSY) return
+    manager.markBusy(id, 1)
+    busySessions.set(req, id)
+    if (NO_RESUME.has(req.routeOptions.url) || !manager.needsResume(id)) return
+    const admission = server.admission
+    try {
+      await admission?.admit()
+    } catch (err) {
+      if (!(err instanceof AdmissionTimeoutError)) throw err
+      return reply.code(503).header('retry-after', '1').send({
+        error: 'admission_timeout', reason: err.reason, waited_ms: err.waitedMs, message: err.message,
+      })
+    }
+    try {
+      await manager.ensureAwake(id)
+    } catch (err: any) {
+      return reply.code(503).send({ error: 'resume_failed', message: err.message })
+    } finally {
+      admission?.release()
+    }
+  })
+  server.addHook('onResponse', async (req: FastifyRequest) => {
+    const id = busySessions.get(req)
+    if (id === undefined) return
+    busySessions.delete(req)
+    server.browserManager?.markBusy(id, -1)
+  })
+
+  // Opt-in phase timings; registered after the auth / hibernation preHandlers on purpose
+  registerTimingHooks(server, config.timings ?? false)
+
+  // WebSocket command channel (GET /api/v1/ws): many API requests over one connection
+  attachCommandChannel(server, server.server)
+  server.addHook('preClose', async () => closeCommandChannels())
+
   // Health check — always accessible (auth-exempt)
   server.get('/health', async () => {
     return {
@@ -48,13 +126,31 @@ export function buildServer(config: DaemonConfig, registry: SessionRegistry): Fa
       version: '0.3.1',
       uptime_s: Math.floor(process.uptime()),
       sessions_active: registry.count(),
+      admission: server.admission?.stats() ?? null,
     }
   })
 
-  server.get('/api/v1/status', async () => {
+  // Event-loop delay since start (or since the last ?reset_event_loop=1), in ms
+  const loopDelay = monitorEventLoopDelay({ resolution: 10 })
+  loopDelay.enable()
+
+  server.get<{ Querystring: { reset_event_loop?: string } }>('/api/v1/status', async (req) => {
+    const event_loop = {
+      p50_ms: loopDelay.percentile(50) / 1e6,
+      p99_ms: loopDelay.percentile(99) / 1e6,
+      max_ms: loopDelay.max / 1e6,
+    }
+    if (req.query.reset_event_loop === '1') loopDelay.reset()
     return {
       pid: process.pid,
       uptime_s: Math.floor(process.uptime()),
+      event_loop,
+      warm_pool: server.browserManager?.warmPool.stats() ?? null,
+      shared_browsers: server.browserManager?.sharedBrowsers.stats() ?? null,
+      hibernation: server.browserManager?.hibernationStats() ?? null,
+      cdp_sessions: server.browserManager?.cdpCacheStats() ?? null,
+      command_channel: commandChannelStats(),
+      event_streams: server.browserManager?.events.stats() ?? null,
       sessions: registry.list().map((s) => ({
         id: s.id,
         profile: s.profile,
@@ -64,6 +160,16 @@ export function buildServer(config: DaemonConfig, registry: SessionRegistry): Fa
     }
   })
 
+  // Prometheus scrape endpoint (token-protected like the rest of the API)
+  server.get('/metrics', async (_req, reply) => {
+    const body = await metrics.render({
+      registry,
+      manager: server.browserManager,
+      auditLogger: server.auditLogger,
+    })
+    return reply.type(METRICS_CONTENT_TYPE).send(body)
+  })
+
   registerSessionRoutes(server, registry)
   registerActionRoutes(server, registry)
   registerStateRoutes(server, registry)
@@ -27,10 +27,9 @@ export function resolveEncryptionKey(raw: string): Buffer {
   )
 }
 
-function encryptSessions(data: SessionInfo[], key: Buffer): string {
+function encryptText(plaintext: string, key: Buffer): string {
   const iv = crypto.randomBytes(12)
   const cipher = crypto.createCipheriv('aes-256-gcm', key, iv)
-  const plaintext = JSON.stringify(data)
   const ct = Buffer.concat([cipher.update(plaintext, 'utf8'), cipher.final()])
   const envelope: EncryptedEnvelope = {
     v: 1,
@@ -42,7 +41,7 @@ function encryptSessions(data: SessionInfo[], key: Buffer): string {
   return JSON.stringify(envelope)
 }
 
-function decryptSessions(raw: string, key: Buffer): SessionInfo[] {
+function decryptText(raw: string, key: Buffer): string {
   const env = JSON.parse(raw) as EncryptedEnvelope
   const decipher = crypto.createDecipheriv(
     'aes-256-gcm',
@@ -50,21 +49,39 @@ function decryptSessions(raw: string, key: Buffer): SessionInfo[] {
     Buffer.from(env.iv, 'hex'),
   )
   decipher.setAuthTag(Buffer.from(env.tag, 'hex'))
-  const pt = Buffer.concat([
+  return Buffer.concat([
     decipher.update(Buffer.from(env.ct, 'hex')),
     decipher.final(),
   ]).toString('utf8')
-  return JSON.parse(pt) as SessionInfo[]
 }
 
+// ---------------------------------------------------------------------------
+// Session journal: sessions.json is a compacted snapshot, sessions.journal an
+// append-only log of changes since (one JSON record per line, each line an
+// encrypted envelope when a key is set). Records are idempotent, so replaying
+// a journal that a crash left behind after compaction is harmless.
+// ---------------------------------------------------------------------------
+
+type JournalRecord =
+  | { op: 'put'; info: SessionInfo }
+  | { op: 'del'; id: string }
+
+/** Compact once the journal holds this many records (or 2× the registry, if larger) */
+const COMPACT_MIN_RECORDS = 256
+/** Delay before retrying after a failed journal / snapshot write (ENOSPC, EACCES, …) */
+const WRITE_RETRY_MS = 1000
+
 export interface SessionInfo {
   id: string
   profile: string
   headless: boolean
   createdAt: string
   agentId?: string
-  /** 'live' = browser running; 'zombie' = metadata only (browser not started) */
-  state: 'live' | 'zombie'
+  /**
+   * 'live' = browser running; 'zombie' = metadata only (browser not started);
+   * 'hibernated' = browser closed while idle, relaunched on the next request
+   */
+  state: 'live' | 'zombie' | 'hibernated'
   /** Pure Sandbox: ephemeral temp dir, cleaned up on close */
   ephemeral?: boolean
   /** Multi-channel: 'chrome' | 'msedge' | 'chromium' */
@@ -87,19 +104,54 @@ export interface LiveSession extends SessionInfo {
 export class SessionRegistry {
   private sessions = new Map<string, LiveSession>()
   private stateFile: string
+  private journalFile: string
+  private profilesDir: string
   private encryptionKey?: Buffer
+  /** Coalesced persistence: records queue up, one journal append per debounce window */
+  private persistDebounceMs: number
+  private persistTimer: NodeJS.Timeout | null = null
+  /** Pending journal records, last one per session id (insertion order = write order) */
+  private pending = new Map<string, JournalRecord>()
+  private writing: Promise<void> | null = null
+  private journalRecords = 0
+  /**
+   * Set when a journal append or snapshot write failed: the changes it dropped
+   * are only in memory, and a partial append may have left a torn line, so the
+   * next flush (or maintenance pass) rewrites the snapshot instead of appending.
+   */
+  private needsCompaction = false
+  /** Zombies whose profile is untouched for this long are dropped (0 = keep forever) */
+  private zombieTtlMs: number
+  private maintenanceTimer: NodeJS.Timeout | null = null
 
-  constructor(dataDir: string, encryptionKeyStr?: string) {
+  constructor(dataDir: string, encryptionKeyStr?: string, persistDebounceMs = 50, zombieTtlMs = 0) {
     this.stateFile = path.join(dataDir, 'sessions.json')
+    this.journalFile = path.join(dataDir, 'sessions.journal')
+    this.profilesDir = path.join(dataDir, 'profiles')
+    this.persistDebounceMs = persistDebounceMs
+    this.zombieTtlMs = zombieTtlMs
     fs.mkdirSync(dataDir, { recursive: true })
     if (encryptionKeyStr) {
       this.encryptionKey = resolveEncryptionKey(encryptionKeyStr)
     }
   }
 
-  /** Load persisted session metadata from previous daemon run. */
+  /**
+   * Load persisted session metadata from previous daemon run: the snapshot,
+   * then the journal on top. Expired zombies are dropped and, if anything
+   * was replayed or dropped, the result is compacted so the next start
+   * reads only the surviving sessions.
+   */
   loadPersistedSessions(): void {
-    if (!fs.existsSync(this.stateFile)) return
+    if (!this.loadSnapshot()) return
+    const replayed = this.replayJournal()
+    const dropped = this.gcZombies()
+    if (replayed > 0 || dropped.length > 0) void this.compact()
+  }
+
+  /** Returns false when the state cannot be read with the configured key (nothing is loaded or written). */
+  private loadSnapshot(): boolean {
+    if (!fs.existsSync(this.stateFile)) return true
     try {
       const raw = fs.readFileSync(this.stateFile, 'utf8')
       let data: SessionInfo[]
@@ -114,11 +166,11 @@ export class SessionRegistry {
           process.stderr.write(
             '[agentmb] sessions.json is encrypted but AGENTMB_ENCRYPTION_KEY is not set — skipping session load\n',
           )
-          return
+          return false
         }
-        data = decryptSessions(raw, this.encryptionKey)
+        data = JSON.parse(decryptText(raw, this.encryptionKey)) as SessionInfo[]
       } else {
-        return // unknown format, start fresh
+        return true // unknown format, start fresh
       }
 
       for (const info of data) {
@@ -128,22 +180,213 @@ export class SessionRegistry {
     } catch {
       // Corrupt or tampered state file — ignore, start fresh
     }
+    return true
   }
 
-  private persist(): void {
-    const infos: SessionInfo[] = Array.from(this.sessions.values()).map(
-      ({ context: _c, page: _p, ...info }) => info,
-    )
+  /** Apply journal records on top of the snapshot; returns how many were applied. */
+  private replayJournal(): number {
+    let raw: string
     try {
-      const content = this.encryptionKey
-        ? encryptSessions(infos, this.encryptionKey)
-        : JSON.stringify(infos, null, 2)
-      fs.writeFileSync(this.stateFile, content)
+      raw = fs.readFileSync(this.journalFile, 'utf8')
+    } catch {
+      return 0
+    }
+    let applied = 0
+    let warned = false
+    for (const line of raw.split('\n')) {
+      if (!line) continue
+      let rec: JournalRecord
+      try {
+        const parsed = JSON.parse(line)
+        if (parsed.v === 1 && parsed.ct) {
+          if (!this.encryptionKey) {
+            if (!warned) {
+              process.stderr.write(
+                '[agentmb] sessions.journal has encrypted records but AGENTMB_ENCRYPTION_KEY is not set — skipping them\n',
+              )
+              warned = true
+            }
+            continue
+          }
+          rec = JSON.parse(decryptText(line, this.encryptionKey)) as JournalRecord
+        } else {
+          rec = parsed as JournalRecord
+        }
+      } catch {
+        continue // torn last line after a crash, or a record we cannot decrypt
+      }
+      if (rec.op === 'put') {
+        this.sessions.set(rec.info.id, { ...rec.info, state: 'zombie', context: null, page: null })
+      } else if (rec.op === 'del') {
+        this.sessions.delete(rec.id)
+      }
+      applied++
+    }
+    this.journalRecords = applied
+    return applied
+  }
+
+  /**
+   * Queue a journal record. Records within the debounce window coalesce
+   * (last record per session wins) into one append, done off the event loop.
+   * Durability is up to persistDebounceMs behind memory; flush()/flushSync()
+   * close that gap.
+   */
+  private persist(rec: JournalRecord): void {
+    const id = rec.op === 'put' ? rec.info.id : rec.id
+    this.pending.delete(id)
+    this.pending.set(id, rec)
+    this.scheduleFlush(this.persistDebounceMs)
+  }
+
+  private scheduleFlush(delayMs: number): void {
+    if (this.persistTimer) return
+    this.persistTimer = setTimeout(() => {
+      this.persistTimer = null
+      void this.flush()
+    }, delayMs)
+    this.persistTimer.unref()
+  }
+
+  private put(s: LiveSession): void {
+    const { context: _c, page: _p, ...info } = s
+    this.persist({ op: 'put', info })
+  }
+
+  private encode(text: string): string {
+    return this.encryptionKey ? encryptText(text, this.encryptionKey) : text
+  }
+
+  /** Serialize disk writes: a later write must not be overtaken by an earlier one. */
+  private async exclusive(fn: () => Promise<void>): Promise<void> {
+    while (this.writing) await this.writing
+    this.writing = fn().finally(() => { this.writing = null })
+    await this.writing
+  }
+
+  /** Append pending records now; resolves once they are on disk. */
+  async flush(): Promise<void> {
+    if (this.persistTimer) {
+      clearTimeout(this.persistTimer)
+      this.persistTimer = null
+    }
+    await this.exclusive(async () => {
+      if (this.needsCompaction) return this.writeSnapshot()
+      if (this.pending.size === 0) return
+      const records = [...this.pending.values()]
+      this.pending.clear()
+      const lines = records.map((r) => this.encode(JSON.stringify(r)) + '\n').join('')
+      try {
+        await fs.promises.appendFile(this.journalFile, lines)
+        this.journalRecords += records.length
+      } catch {
+        // Not on disk, and possibly a torn line: rewrite the snapshot next time
+        this.needsCompaction = true
+        this.scheduleFlush(WRITE_RETRY_MS)
+        return
+      }
+      if (this.journalRecords >= Math.max(COMPACT_MIN_RECORDS, 2 * this.sessions.size)) {
+        await this.writeSnapshot()
+      }
+    })
+  }
+
+  /** Rewrite the snapshot from memory and empty the journal. */
+  async compact(): Promise<void> {
+    if (this.persistTimer) {
+      clearTimeout(this.persistTimer)
+      this.persistTimer = null
+    }
+    await this.exclusive(() => this.writeSnapshot())
+  }
+
+  private snapshotContent(): string {
+    const infos: SessionInfo[] = this.list()
+    return this.encryptionKey ? this.encode(JSON.stringify(infos)) : JSON.stringify(infos, null, 2)
+  }
+
+  private async writeSnapshot(): Promise<void> {
+    // Memory already holds every pending change, so the snapshot supersedes them
+    this.pending.clear()
+    const tmp = `${this.stateFile}.${process.pid}.tmp`
+    try {
+      await fs.promises.writeFile(tmp, this.snapshotContent())
+      await fs.promises.rename(tmp, this.stateFile)
+      await fs.promises.writeFile(this.journalFile, '')
+      this.journalRecords = 0
+      this.needsCompaction = false
+    } catch {
+      this.needsCompaction = true
+      this.scheduleFlush(WRITE_RETRY_MS)
+    }
+  }
+
+  /**
+   * Synchronous last-chance compaction for process 'exit' handlers, where no
+   * async work can complete (an in-flight async write is abandoned).
+   */
+  flushSync(): void {
+    if (this.persistTimer) {
+      clearTimeout(this.persistTimer)
+      this.persistTimer = null
+    }
+    if (this.pending.size === 0 && !this.writing && !this.needsCompaction) return
+    this.pending.clear()
+    const tmp = `${this.stateFile}.${process.pid}.sync.tmp`
+    try {
+      fs.writeFileSync(tmp, this.snapshotContent())
+      fs.renameSync(tmp, this.stateFile)
+      fs.writeFileSync(this.journalFile, '')
+      this.journalRecords = 0
+      this.needsCompaction = false
     } catch {
       // non-critical
     }
   }
 
+  // ---------------------------------------------------------------------------
+  // Zombie GC
+  // ---------------------------------------------------------------------------
+
+  /** Last time a zombie's profile was used: profile dir mtime, or creation for ephemeral/attach sessions. */
+  private lastTouched(s: SessionInfo): number {
+    let t = Date.parse(s.createdAt) || 0
+    if (!s.ephemeral && s.launchMode !== 'attach') {
+      try {
+        t = Math.max(t, fs.statSync(path.join(this.profilesDir, s.profile)).mtimeMs)
+      } catch { /* profile dir gone — creation time only */ }
+    }
+    return t
+  }
+
+  /** Drop zombies whose profile has been untouched for longer than the TTL; returns their ids. */
+  gcZombies(now = Date.now()): string[] {
+    if (this.zombieTtlMs <= 0) return []
+    const dropped: string[] = []
+    for (const [id, s] of this.sessions) {
+      if (s.state !== 'zombie' || s.sealed) continue
+      if (now - this.lastTouched(s) > this.zombieTtlMs) {
+        this.sessions.delete(id)
+        this.persist({ op: 'del', id })
+        dropped.push(id)
+      }
+    }
+    return dropped
+  }
+
+  /** Periodic zombie GC + compaction (timer does not keep the process alive). */
+  startMaintenance(intervalMs = 10 * 60_000): void {
+    if (this.maintenanceTimer) return
+    this.maintenanceTimer = setInterval(() => {
+      const dropped = this.gcZombies()
+      if (dropped.length > 0) {
+        process.stderr.write(`[agentmb] GC removed ${dropped.length} zombie session(s) with untouched profiles\n`)
+      }
+      if (this.journalRecords > 0 || this.pending.size > 0 || this.needsCompaction) void this.compact()
+    }, intervalMs)
+    this.maintenanceTimer.unref()
+  }
+
   create(opts: {
     profile?: string
     headless?: boolean
@@ -169,7 +412,7 @@ export class SessionRegistry {
       cdpUrl: opts.cdpUrl,
     }
     this.sessions.set(id, { ...info, context: null, page: null })
-    this.persist()
+    this.persist({ op: 'put', info })
     return id
   }
 
@@ -178,14 +421,26 @@ export class SessionRegistry {
     const s = this.sessions.get(id)
     if (!s) throw new Error(`Session not found: ${id}`)
     s.sealed = true
-    this.persist()
+    this.put(s)
   }
 
   attach(id: string, context: BrowserContext, page: Page): void {
     const existing = this.sessions.get(id)
     if (!existing) throw new Error(`Session ${id} not found`)
-    this.sessions.set(id, { ...existing, state: 'live', context, page })
-    this.persist()
+    const next: LiveSession = { ...existing, state: 'live', context, page }
+    this.sessions.set(id, next)
+    // Tab switches re-attach a live session: nothing persisted changes
+    if (existing.state !== 'live') this.put(next)
+  }
+
+  /** Browser closed by idle hibernation; BrowserManager restores it on the next request. */
+  hibernate(id: string): void {
+    const s = this.sessions.get(id)
+    if (!s) return
+    s.state = 'hibernated'
+    s.context = null
+    s.page = null
+    this.put(s)
   }
 
   get(id: string): LiveSession | undefined {
@@ -222,7 +477,7 @@ export class SessionRegistry {
     const s = this.sessions.get(id)
     if (!s) return
     s.headless = headless
-    this.persist()
+    this.put(s)
   }
 
   async close(id: string): Promise<void> {
@@ -232,16 +487,21 @@ export class SessionRegistry {
       try { await s.context.close() } catch { /* ignore */ }
     }
     this.sessions.delete(id)
-    this.persist()
+    this.persist({ op: 'del', id })
   }
 
   /** On daemon shutdown: persist zombie metadata to disk, then close all contexts. */
   async shutdownAll(): Promise<void> {
-    // 1. Mark all live sessions as zombie and persist to disk (so they survive restart)
+    if (this.maintenanceTimer) {
+      clearInterval(this.maintenanceTimer)
+      this.maintenanceTimer = null
+    }
+    // 1. Mark all live sessions as zombie and compact to disk (so they survive restart
+    //    and the next start reads one snapshot, no journal)
     for (const [, s] of this.sessions) {
-      if (s.state === 'live') s.state = 'zombie'
+      if (s.state !== 'zombie') s.state = 'zombie'
     }
-    this.persist()
+    await this.compact()
     // 2. Close all browser contexts
     await Promise.all(
       Array.from(this.sessions.values()).map(async (s) => {
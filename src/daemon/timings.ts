@@ -0,0 +1,118 @@
+import { AsyncLocalStorage } from 'async_hooks'
+import { performance } from 'perf_hooks'
+import type { FastifyInstance, FastifyReply, FastifyRequest } from 'fastify'
+
+// ---------------------------------------------------------------------------
+// Opt-in per-request phase timings (X-Agentmb-Timings: 1, ?timings=1 or AGENTMB_TIMINGS=1)
+// ---------------------------------------------------------------------------
+
+export type Phase = 'policy' | 'resolve_target' | 'stability_pre' | 'stability_post' | 'audit'
+
+const PHASES: Phase[] = ['policy', 'resolve_target', 'stability_pre', 'stability_post', 'audit']
+
+const round = (ms: number) => Math.round(ms * 100) / 100
+
+/**
+ * Where one request's time went. Named phases are measured where they
+ * happen; `execute` is the rest of the route handler (Playwright work and
+ * bookkeeping), and `overhead` is everything before the handler ran (auth,
+ * body parsing, resuming a hibernated session).
+ */
+export class PhaseTimings {
+  private readonly startedAt = performance.now()
+  private handlerStartedAt: number | null = null
+  private phases: Record<Phase, number> = { policy: 0, resolve_target: 0, stability_pre: 0, stability_post: 0, audit: 0 }
+
+  handlerStarted(): void {
+    this.handlerStartedAt = performance.now()
+  }
+
+  add(phase: Phase, ms: number): void {
+    this.phases[phase] += ms
+  }
+
+  /** Phase breakdown in ms as of `now` (audit entries get the phases finished before they were written). */
+  snapshot(now = performance.now()): Record<string, number> {
+    const handlerStart = this.handlerStartedAt ?? now
+    const measured = PHASES.reduce((sum, p) => sum + this.phases[p], 0)
+    const out: Record<string, number> = {}
+    for (const p of PHASES) out[`${p}_ms`] = round(this.phases[p])
+    out.execute_ms = round(Math.max(0, now - handlerStart - measured))
+    out.overhead_ms = round(handlerStart - this.startedAt)
+    out.total_ms = round(now - this.startedAt)
+    return out
+  }
+
+  /** `Server-Timing` header value (shows up in browser devtools and curl -v). */
+  serverTiming(now = performance.now()): string {
+    return Object.entries(this.snapshot(now))
+      .map(([k, v]) => `${k.slice(0, -3)};dur=${v}`)
+      .join(', ')
+  }
+}
+
+const store = new AsyncLocalStorage<PhaseTimings>()
+
+/** Timings of the request being handled, when it asked for them. */
+export function currentTimings(): PhaseTimings | undefined {
+  return store.getStore()
+}
+
+export async function timed<T>(phase: Phase, fn: () => Promise<T>): Promise<T> {
+  const timings = store.getStore()
+  if (!timings) return fn()
+  const t0 = performance.now()
+  try {
+    return await fn()
+  } finally {
+    timings.add(phase, performance.now() - t0)
+  }
+}
+
+export function timedSync<T>(phase: Phase, fn: () => T): T {
+  const timings = store.getStore()
+  if (!timings) return fn()
+  const t0 = performance.now()
+  try {
+    return fn()
+  } finally {
+    timings.add(phase, performance.now() - t0)
+  }
+}
+
+function wantsTimings(req: FastifyRequest): boolean {
+  const header = req.headers['x-agentmb-timings']
+  if (header === '1' || header === 'true') return true
+  const query = (req.query as { timings?: string } | undefined)?.timings
+  return query === '1' || query === 'true'
+}
+
+/**
+ * Start a PhaseTimings for requests that opt in (or all of them, with
+ * `always`), run the route handler inside it, and report the result as a
+ * `timings` field on JSON object responses plus a `Server-Timing` header.
+ * Must be registered after every other preHandler hook, so that the handler
+ * is what runs inside the timing context.
+ */
+export function registerTimingHooks(server: FastifyInstance, always: boolean): void {
+  const requests = new WeakMap<FastifyRequest, PhaseTimings>()
+
+  server.addHook('onRequest', async (req: FastifyRequest) => {
+    if (always || wantsTimings(req)) requests.set(req, new PhaseTimings())
+  })
+  server.addHook('preHandler', (req: FastifyRequest, _reply: FastifyReply, done: () => void) => {
+    const timings = requests.get(req)
+    if (!timings) return done()
+    timings.handlerStarted()
+    store.run(timings, done)
+  })
+  server.addHook('preSerialization', async (req: FastifyRequest, _reply: FastifyReply, payload: unknown) => {
+    const timings = requests.get(req)
+    if (!timings || !payload || typeof payload !== 'object' || Array.isArray(payload)) return payload
+    return { ...(payload as Record<string, unknown>), timings: timings.snapshot() }
+  })
+  server.addHook('onSend', async (req: FastifyRequest, reply: FastifyReply) => {
+    const timings = requests.get(req)
+    if (timings) reply.header('server-timing', timings.serverTiming())
+  })
+}
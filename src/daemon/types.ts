@@ -1,17 +1,24 @@
 /**
  * Fastify instance type augmentation (T11: auditLogger type safety)
  *
- * Adds typed `auditLogger` and `browserManager` properties to FastifyInstance
- * so route handlers can access them without `(server as any)` casts.
+ * Adds typed `auditLogger`, `browserManager`, `policyEngine`, `daemonConfig`
+ * `admission` and `metrics` properties to FastifyInstance so route handlers can access them without
+ * `(server as any)` casts.
  */
 import type { AuditLogger } from '../audit/logger'
 import type { BrowserManager } from '../browser/manager'
 import type { PolicyEngine } from '../policy/engine'
+import type { DaemonConfig } from './config'
+import type { AdmissionController } from './admission'
+import type { DaemonMetrics } from './metrics'
 
 declare module 'fastify' {
   interface FastifyInstance {
     auditLogger: AuditLogger | undefined
     browserManager: BrowserManager | undefined
     policyEngine: PolicyEngine | undefined
+    daemonConfig: DaemonConfig | undefined
+    admission: AdmissionController | undefined
+    metrics: DaemonMetrics | undefined
   }
 }
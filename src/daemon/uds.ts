@@ -0,0 +1,53 @@
+import fs from 'fs'
+import http from 'http'
+import type { FastifyInstance } from 'fastify'
+import { attachCommandChannel } from './ws'
+
+/**
+ * Serve the Fastify app on a Unix domain socket in addition to TCP.
+ *
+ * Requests arriving on the socket are handed to `server.routing`, so they go
+ * through the same hooks (auth, logging) and route handlers as TCP requests.
+ * The socket file is created mode 0600 (owner only); a stale file left by a
+ * crashed daemon is removed first (the PID file already guards double-start).
+ * The WebSocket command channel is served on the socket too.
+ */
+export async function listenUnixSocket(server: FastifyInstance, socketPath: string): Promise<http.Server> {
+  if (process.platform === 'win32') {
+    throw new Error('AGENTMB_SOCKET is not supported on Windows')
+  }
+  await server.ready()
+  try {
+    fs.unlinkSync(socketPath)
+  } catch (e: any) {
+    if (e?.code !== 'ENOENT') throw e
+  }
+
+  const uds = http.createServer((req, res) => server.routing(req, res))
+  uds.keepAliveTimeout = 60_000
+  attachCommandChannel(server, uds)
+  const prevUmask = process.umask(0o177)
+  try {
+    await new Promise<void>((resolve, reject) => {
+      uds.once('error', reject)
+      uds.listen(socketPath, () => {
+        uds.off('error', reject)
+        resolve()
+      })
+    })
+  } finally {
+    process.umask(prevUmask)
+  }
+  fs.chmodSync(socketPath, 0o600)
+  return uds
+}
+
+export async function closeUnixSocket(uds: http.Server, socketPath: string): Promise<void> {
+  uds.closeAllConnections()
+  await new Promise<void>((resolve) => uds.close(() => resolve()))
+  try {
+    fs.unlinkSync(socketPath)
+  } catch {
+    // already gone
+  }
+}
@@ -0,0 +1,304 @@
+import crypto from 'crypto'
+import type http from 'http'
+import type { Socket } from 'net'
+import type { Duplex } from 'stream'
+import type { FastifyInstance } from 'fastify'
+
+// ---------------------------------------------------------------------------
+// WebSocket command channel (GET /api/v1/ws)
+//
+// One connection carries many API requests. Each binary message is a JSON
+// header line followed by the raw body bytes:
+//
+//   client → daemon   {"id":7,"method":"POST","path":"/api/v1/sessions/s1/click","headers":{…}}\n{"selector":"#go"}
+//   daemon → client   {"id":7,"status":200,"headers":{…}}\n{"status":"ok",…}
+//
+// Requests are dispatched with `server.inject`, so every route, hook (auth,
+// hibernation, metrics, timings) and audit entry behaves as over plain HTTP;
+// what the channel saves is the per-request connection, header and routing
+// work on both ends. Responses are sent as soon as they are ready, so they
+// may arrive out of order — match them by `id`.
+// ---------------------------------------------------------------------------
+
+export const COMMAND_CHANNEL_PATH = '/api/v1/ws'
+
+const WS_GUID = '258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+const MAX_MESSAGE_BYTES = 64 * 2 ** 20
+/** Upgrade-request headers applied to every command on the connection. */
+const CONNECTION_HEADERS = ['x-api-token', 'authorization', 'x-operator', 'x-agentmb-timings']
+/** Response headers that describe the HTTP connection, not the response. */
+const HOP_HEADERS = new Set(['content-length', 'connection', 'keep-alive', 'transfer-encoding', 'date'])
+/** Streaming routes stay on plain HTTP (their bodies are not buffered in one message; event streams never end). */
+const NOT_MULTIPLEXED = [/\/upload\/stream(\?|$)/, /\/download\/stream(\?|$)/, /^\/api\/v1\/sessions\/[^/]+\/events(\?|$)/]
+
+const OP_CONT = 0x0
+const OP_TEXT = 0x1
+const OP_BINARY = 0x2
+const OP_CLOSE = 0x8
+const OP_PING = 0x9
+const OP_PONG = 0xa
+
+const open = new Set<WsConnection>()
+
+export interface CommandChannelStats {
+  connections_total: number
+  connections_open: number
+  commands_total: number
+  commands_in_flight: number
+}
+
+/** Minimal RFC 6455 server side: unfragmented sends, masked client frames, ping/pong/close. */
+class WsConnection {
+  private buf: Buffer = Buffer.alloc(0)
+  private fragments: Buffer[] = []
+  private fragmentBytes = 0
+  private closed = false
+
+  constructor(
+    private readonly socket: Duplex,
+    private readonly onMessage: (data: Buffer) => void,
+    onClose: () => void,
+  ) {
+    socket.on('data', (chunk: Buffer) => this.receive(chunk))
+    socket.on('error', () => socket.destroy())
+    socket.once('close', () => {
+      this.closed = true
+      onClose()
+    })
+  }
+
+  send(data: Buffer, opcode = OP_BINARY): void {
+    if (this.closed) return
+    const len = data.length
+    let header: Buffer
+    if (len < 126) {
+      header = Buffer.from([0x80 | opcode, len])
+    } else if (len < 65536) {
+      header = Buffer.alloc(4)
+      header[0] = 0x80 | opcode
+      header[1] = 126
+      header.writeUInt16BE(len, 2)
+    } else {
+      header = Buffer.alloc(10)
+      header[0] = 0x80 | opcode
+      header[1] = 127
+      header.writeBigUInt64BE(BigInt(len), 2)
+    }
+    this.socket.write(Buffer.concat([header, data]))
+  }
+
+  /** Send a close frame and end the socket (`force`: destroy it once flushed instead of waiting for the peer). */
+  close(code = 1000, force = false): void {
+    if (this.closed) return
+    const payload = Buffer.alloc(2)
+    payload.writeUInt16BE(code, 0)
+    this.send(payload, OP_CLOSE)
+    this.closed = true
+    this.socket.end(force ? () => this.socket.destroy() : undefined)
+  }
+
+  receive(chunk: Buffer): void {
+    this.buf = this.buf.length ? Buffer.concat([this.buf, chunk]) : chunk
+    while (!this.closed && this.buf.length >= 2) {
+      const b0 = this.buf[0]
+      const b1 = this.buf[1]
+      let len = b1 & 0x7f
+      let offset = 2
+      if (len === 126) {
+        if (this.buf.length < 4) return
+        len = this.buf.readUInt16BE(2)
+        offset = 4
+      } else if (len === 127) {
+        if (this.buf.length < 10) return
+        const big = this.buf.readBigUInt64BE(2)
+        if (big > BigInt(MAX_MESSAGE_BYTES)) return this.close(1009)
+        len = Number(big)
+        offset = 10
+      }
+      if (!(b1 & 0x80)) return this.close(1002) // client frames must be masked
+      if (len > MAX_MESSAGE_BYTES) return this.close(1009)
+      if (this.buf.length < offset + 4 + len) return
+
+      const mask = this.buf.subarray(offset, offset + 4)
+      const payload = Buffer.from(this.buf.subarray(offset + 4, offset + 4 + len))
+      for (let i = 0; i < len; i++) payload[i] ^= mask[i & 3]
+      this.buf = this.buf.subarray(offset + 4 + len)
+      this.frame((b0 & 0x80) !== 0, b0 & 0x0f, payload)
+    }
+  }
+
+  private frame(fin: boolean, opcode: number, payload: Buffer): void {
+    switch (opcode) {
+      case OP_TEXT:
+      case OP_BINARY:
+      case OP_CONT:
+        if (opcode !== OP_CONT && this.fragments.length) return this.close(1002)
+        if (opcode === OP_CONT && !this.fragments.length) return this.close(1002)
+        if (fin && !this.fragments.length) return this.onMessage(payload)
+        this.fragmentBytes += payload.length
+        if (this.fragmentBytes > MAX_MESSAGE_BYTES) return this.close(1009)
+        this.fragments.push(payload)
+        if (fin) {
+          const message = Buffer.concat(this.fragments)
+          this.fragments = []
+          this.fragmentBytes = 0
+          this.onMessage(message)
+        }
+        return
+      case OP_PING:
+        return this.send(payload, OP_PONG)
+      case OP_PONG:
+        return
+      case OP_CLOSE:
+        return this.close(payload.length >= 2 ? payload.readUInt16BE(0) : 1000)
+      default:
+        return this.close(1002)
+    }
+  }
+}
+
+const stats: CommandChannelStats = { connections_total: 0, connections_open: 0, commands_total: 0, commands_in_flight: 0 }
+
+function rejectUpgrade(socket: Duplex, status: number, reason: string, message: string): void {
+  const body = JSON.stringify({ error: message })
+  socket.end(
+    `HTTP/1.1 ${status} ${reason}\r\nConnection: close\r\nContent-Type: application/json\r\n` +
+      `Content-Length: ${Buffer.byteLength(body)}\r\n\r\n${body}`,
+  )
+}
+
+/**
+ * `?token=` is accepted because browsers cannot set headers on a WebSocket
+ * upgrade; it ends up in proxy and access logs, so header auth is preferred.
+ */
+function tokenFrom(req: http.IncomingMessage, url: URL): string | undefined {
+  const xToken = req.headers['x-api-token'] as string | undefined
+  const auth = req.headers['authorization']
+  const bearer = auth?.startsWith('Bearer ') ? auth.slice(7) : undefined
+  return xToken ?? bearer ?? url.searchParams.get('token') ?? undefined
+}
+
+function replyFrame(id: unknown, status: number, headers: Record<string, unknown>, body: Buffer | string): Buffer {
+  const head = JSON.stringify({ id, status, headers })
+  return Buffer.concat([Buffer.from(head + '\n'), typeof body === 'string' ? Buffer.from(body) : body])
+}
+
+function errorFrame(id: unknown, status: number, message: string): Buffer {
+  return replyFrame(id, status, { 'content-type': 'application/json; charset=utf-8' }, JSON.stringify({ error: message }))
+}
+
+/**
+ * Accept command-channel upgrades on `httpServer` (the TCP listener, and the
+ * Unix socket listener when one is configured). The API token is checked on
+ * the upgrade request — and again per command by the normal auth hook, which
+ * sees the connection's token header.
+ *
+ * CORS does not apply to WebSockets, so a page in any browser (the managed
+ * one included) could otherwise open the channel and read every reply. Upgrades
+ * with an Origin header are refused unless it is in `wsAllowedOrigins`.
+ */
+export function attachCommandChannel(server: FastifyInstance, httpServer: http.Server): void {
+  httpServer.on('upgrade', (req: http.IncomingMessage, socket: Duplex, head: Buffer) => {
+    const url = new URL(req.url ?? '/', 'http://localhost')
+    if (url.pathname !== COMMAND_CHANNEL_PATH) {
+      return rejectUpgrade(socket, 404, 'Not Found', `No WebSocket endpoint at ${url.pathname}`)
+    }
+    const origin = req.headers.origin
+    if (origin !== undefined && !(server.daemonConfig?.wsAllowedOrigins ?? []).includes(origin)) {
+      return rejectUpgrade(socket, 403, 'Forbidden', `Origin ${origin} may not open the command channel (AGENTMB_WS_ALLOWED_ORIGINS)`)
+    }
+    const apiToken = server.daemonConfig?.apiToken
+    const token = tokenFrom(req, url)
+    if (apiToken && token !== apiToken) {
+      return rejectUpgrade(socket, 401, 'Unauthorized', 'Unauthorized — provide X-API-Token or Authorization: Bearer <token>')
+    }
+    const key = req.headers['sec-websocket-key']
+    if (req.headers.upgrade?.toLowerCase() !== 'websocket' || !key || req.headers['sec-websocket-version'] !== '13') {
+      return rejectUpgrade(socket, 400, 'Bad Request', 'Expected a WebSocket (version 13) upgrade')
+    }
+
+    const accept = crypto.createHash('sha1').update(key + WS_GUID).digest('base64')
+    socket.write(
+      'HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n' +
+        `Sec-WebSocket-Accept: ${accept}\r\n\r\n`,
+    )
+    ;(socket as Socket).setNoDelay?.(true)
+
+    const baseHeaders: Record<string, string> = {}
+    for (const name of CONNECTION_HEADERS) {
+      const value = req.headers[name]
+      if (typeof value === 'string') baseHeaders[name] = value
+    }
+    if (token && !baseHeaders['x-api-token'] && !baseHeaders.authorization) baseHeaders['x-api-token'] = token
+
+    stats.connections_total++
+    stats.connections_open++
+    const conn: WsConnection = new WsConnection(
+      socket,
+      (data) => void dispatch(server, conn, baseHeaders, data),
+      () => {
+        stats.connections_open--
+        open.delete(conn)
+      },
+    )
+    open.add(conn)
+    if (head.length) conn.receive(head)
+  })
+}
+
+export function commandChannelStats(): CommandChannelStats {
+  return { ...stats }
+}
+
+/**
+ * Close every open channel (1001 going away). Upgraded sockets are not
+ * tracked by the HTTP server, so `server.close()` would otherwise wait on them.
+ */
+export function closeCommandChannels(): void {
+  for (const conn of open) conn.close(1001, true)
+  open.clear()
+}
+
+async function dispatch(
+  server: FastifyInstance,
+  conn: WsConnection,
+  baseHeaders: Record<string, string>,
+  data: Buffer,
+): Promise<void> {
+  const nl = data.indexOf(0x0a)
+  let msg: { id?: unknown; method?: string; path?: string; headers?: Record<string, string> }
+  try {
+    msg = JSON.parse(data.subarray(0, nl === -1 ? data.length : nl).toString('utf8'))
+  } catch {
+    return conn.send(errorFrame(null, 400, 'Malformed command header (expected one JSON line)'))
+  }
+  const id = msg.id ?? null
+  const path = msg.path
+  if (typeof path !== 'string' || !path.startsWith('/api/v1/') || path.startsWith(COMMAND_CHANNEL_PATH)) {
+    return conn.send(errorFrame(id, 400, 'path must be an /api/v1/ route'))
+  }
+  if (NOT_MULTIPLEXED.some((re) => re.test(path))) {
+    return conn.send(errorFrame(id, 400, `${path} streams its body; call it over plain HTTP`))
+  }
+  const body = nl === -1 ? undefined : data.subarray(nl + 1)
+
+  stats.commands_total++
+  stats.commands_in_flight++
+  try {
+    const res = await server.inject({
+      method: (msg.method ?? 'GET').toUpperCase() as any,
+      url: path,
+      headers: { ...baseHeaders, ...(msg.headers ?? {}) },
+      payload: body && body.length ? body : undefined,
+    })
+    const headers: Record<string, unknown> = {}
+    for (const [k, v] of Object.entries(res.headers)) {
+      if (!HOP_HEADERS.has(k)) headers[k] = v
+    }
+    conn.send(replyFrame(id, res.statusCode, headers, res.rawPayload))
+  } catch (err: any) {
+    conn.send(errorFrame(id, 500, err?.message ?? String(err)))
+  } finally {
+    stats.commands_in_flight--
+  }
+}
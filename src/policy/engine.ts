@@ -35,6 +35,9 @@ export class PolicyEngine {
   /** Per-session policy overrides (set by POST /sessions/:id/policy) */
   private sessionOverrides = new Map<string, PolicyConfig>()
 
+  /** Bumped on every override change; used as the GET policy ETag */
+  private revision = 0
+
   // -- Per-domain, per-session tracking --
 
   /** Timestamp of last completed action per domain-session */
@@ -88,14 +91,19 @@ export class PolicyEngine {
   setSessionPolicy(sessionId: string, profileName: PolicyProfileName, overrides?: Partial<PolicyConfig>): void {
     const base = POLICY_PROFILES[profileName] ?? POLICY_PROFILES.safe
     this.sessionOverrides.set(sessionId, { ...base, ...overrides })
+    this.revision++
   }
 
   getSessionPolicy(sessionId: string): PolicyConfig {
     return this.sessionOverrides.get(sessionId) ?? this.baseConfig
   }
 
+  getRevision(): number {
+    return this.revision
+  }
+
   clearSession(sessionId: string): void {
-    this.sessionOverrides.delete(sessionId)
+    if (this.sessionOverrides.delete(sessionId)) this.revision++
     for (const key of [...this.lastActionTs.keys()]) {
       if (key.startsWith(`${sessionId}|`)) {
         this.lastActionTs.delete(key)
@@ -0,0 +1,118 @@
+"""
+E2E tests — admission control for session creation
+  - creates beyond AGENTMB_MAX_SESSIONS queue instead of launching
+  - a queued create proceeds as soon as a session closes
+  - past its deadline a queued create fails with 503 admission_timeout
+  - /health reports queue depth and wait times
+Starts its own daemon on port 19320 with AGENTMB_MAX_SESSIONS=2.
+Run: pytest tests/e2e/test_admission.py -v
+"""
+
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+
+import httpx
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../sdk/python"))
+
+from agentmb import BrowserClient
+
+ADMISSION_PORT = 19320
+ADMISSION_DATA_DIR = "/tmp/agentmb-admission-test"
+ADMISSION_BASE = f"http://127.0.0.1:{ADMISSION_PORT}"
+DAEMON_BIN = os.path.join(os.path.dirname(__file__), "../../dist/daemon/index.js")
+
+
+def _admission():
+    return httpx.get(f"{ADMISSION_BASE}/health").json()["admission"]
+
+
+@pytest.fixture(scope="module")
+def client():
+    env = {
+        **os.environ,
+        "AGENTMB_PORT": str(ADMISSION_PORT),
+        "AGENTMB_DATA_DIR": ADMISSION_DATA_DIR,
+        "AGENTMB_MAX_SESSIONS": "2",
+        "AGENTMB_ADMISSION_TIMEOUT_MS": "15000",
+    }
+    env.pop("AGENTMB_API_TOKEN", None)
+    proc = subprocess.Popen(["node", DAEMON_BIN], env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.time() + 8
+    while time.time() < deadline:
+        try:
+            if httpx.get(f"{ADMISSION_BASE}/health", timeout=1).status_code == 200:
+                break
+        except Exception:
+            pass
+        time.sleep(0.2)
+    else:
+        proc.terminate()
+        proc.wait()
+        pytest.skip("Admission daemon failed to start — skipping admission tests")
+    with BrowserClient(base_url=ADMISSION_BASE) as c:
+        yield c
+    proc.send_signal(signal.SIGTERM)
+    proc.wait(timeout=30)
+
+
+@pytest.fixture
+def full(client):
+    """Two live sessions: the daemon is at its limit."""
+    sessions = [client.sessions.create(profile=f"e2e-admission-{i}", ephemeral=True) for i in range(2)]
+    yield sessions
+    for s in sessions:
+        try:
+            s.close()
+        except httpx.HTTPStatusError:
+            pass
+
+
+def test_health_reports_limits(client):
+    adm = client.health().admission
+    assert adm["max_sessions"] == 2 and adm["queue_depth"] == 0
+    assert adm["max_browser_rss_mb"] is None
+
+
+def test_create_times_out_when_full(client, full):
+    before = _admission()["timed_out"]
+    t0 = time.time()
+    with pytest.raises(httpx.HTTPStatusError) as exc:
+        client.sessions.create(profile="e2e-admission-late", ephemeral=True, queue_timeout_ms=500)
+    resp = exc.value.response
+    assert resp.status_code == 503
+    assert resp.json()["error"] == "admission_timeout" and resp.json()["reason"] == "sessions"
+    assert resp.headers["retry-after"] == "1"
+    assert 0.5 <= time.time() - t0 < 5
+    adm = _admission()
+    assert adm["timed_out"] == before + 1 and adm["live_sessions"] == 2
+
+
+def test_queued_create_proceeds_when_a_session_closes(client, full):
+    result = {}
+
+    def create():
+        result["session"] = client.sessions.create(profile="e2e-admission-queued", ephemeral=True)
+
+    t = threading.Thread(target=create)
+    t.start()
+    deadline = time.time() + 5
+    while _admission()["queue_depth"] == 0 and time.time() < deadline:
+        time.sleep(0.05)
+    assert _admission()["queue_depth"] == 1
+    time.sleep(0.3)
+    full[0].close()
+    t.join(timeout=30)
+    try:
+        assert "session" in result
+        adm = _admission()
+        assert adm["queue_depth"] == 0 and adm["live_sessions"] == 2
+        assert adm["wait_p99_ms"] >= 300
+    finally:
+        if "session" in result:
+            result["session"].close()
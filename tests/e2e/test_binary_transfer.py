@@ -0,0 +1,219 @@
+"""
+E2E tests — binary transfer paths that bypass base64-in-JSON
+  - POST /sessions/:id/screenshot/raw + Session.screenshot(raw=True / path=...)
+  - POST /sessions/:id/download/stream + Session.download_to(path)
+  - POST /sessions/:id/upload/stream + streamed Session.upload (path or file object)
+Requires: daemon running on localhost:19315
+Run: pytest tests/e2e/test_binary_transfer.py -v
+"""
+
+import base64
+import os
+import sys
+
+import httpx
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../sdk/python"))
+
+from agentmb import AsyncBrowserClient, BrowserClient, DownloadToResult, ScreenshotFileResult, UploadResult
+from agentmb.client import AsyncSession
+
+BASE_URL = f"http://127.0.0.1:{os.environ.get('AGENTMB_PORT', '19315')}"
+TEST_PROFILE = "e2e-binary-test"
+
+
+def _inline(html: str) -> str:
+    """Encode HTML as a data: URL."""
+    encoded = base64.b64encode(html.encode()).decode()
+    return f"data:text/html;base64,{encoded}"
+
+
+PAGE = _inline("<h1 style='height:2000px'>binary transfer</h1>")
+
+PNG_MAGIC = b"\x89PNG\r\n\x1a\n"
+JPEG_MAGIC = b"\xff\xd8\xff"
+
+
+@pytest.fixture(scope="module")
+def client():
+    with BrowserClient(base_url=BASE_URL) as c:
+        yield c
+
+
+@pytest.fixture(scope="module")
+def session(client):
+    sess = client.sessions.create(profile=TEST_PROFILE, headless=True)
+    sess.navigate(PAGE)
+    yield sess
+    sess.close()
+
+
+# ---------------------------------------------------------------------------
+# Raw screenshots
+# ---------------------------------------------------------------------------
+
+def test_screenshot_raw_png(session):
+    data = session.screenshot(raw=True)
+    assert isinstance(data, bytes)
+    assert data.startswith(PNG_MAGIC)
+
+
+def test_screenshot_raw_jpeg(session):
+    data = session.screenshot(format="jpeg", raw=True)
+    assert data.startswith(JPEG_MAGIC)
+
+
+def test_screenshot_raw_headers(session):
+    resp = httpx.post(
+        f"{BASE_URL}/api/v1/sessions/{session.id}/screenshot/raw",
+        json={"format": "png"},
+        headers={"X-API-Token": os.environ.get("AGENTMB_API_TOKEN", "")},
+    )
+    assert resp.status_code == 200
+    assert resp.headers["content-type"] == "image/png"
+    assert int(resp.headers["x-duration-ms"]) >= 0
+
+
+def test_screenshot_raw_matches_base64(session):
+    """raw and JSON paths capture the same image (same dimensions → same PNG header chunk)."""
+    raw = session.screenshot(raw=True)
+    b64 = base64.b64decode(session.screenshot().data)
+    assert raw[:24] == b64[:24]  # signature + IHDR width/height
+
+
+def test_screenshot_to_path(session, tmp_path):
+    dest = tmp_path / "full.png"
+    res = session.screenshot(full_page=True, path=str(dest))
+    assert isinstance(res, ScreenshotFileResult)
+    assert res.path == str(dest)
+    assert res.size_bytes == dest.stat().st_size > 0
+    assert dest.read_bytes().startswith(PNG_MAGIC)
+    assert not (tmp_path / "full.png.part").exists()
+
+
+def test_screenshot_raw_unknown_session(client):
+    with pytest.raises(httpx.HTTPStatusError) as exc:
+        client.sessions.get_handle("sess_doesnotexist").screenshot(raw=True)
+    assert exc.value.response.status_code == 404
+
+
+async def test_async_screenshot_raw_and_path(session, tmp_path):
+    async with AsyncBrowserClient(base_url=BASE_URL) as ac:
+        handle = AsyncSession(session.id, ac)
+        data = await handle.screenshot(raw=True)
+        assert data.startswith(PNG_MAGIC)
+        dest = tmp_path / "async.png"
+        res = await handle.screenshot(path=str(dest))
+        assert res.size_bytes == dest.stat().st_size
+
+
+# ---------------------------------------------------------------------------
+# Streaming download
+# ---------------------------------------------------------------------------
+
+DOWNLOAD_BYTES = 3 * 1024 * 1024 + 17  # > one stream chunk, not chunk-aligned
+
+
+def _download_page(n: int) -> str:
+    js = (
+        f"const b=new Uint8Array({n});for(let i=0;i<b.length;i++)b[i]=i&255;"
+        "const a=document.getElementById('dl');a.href=URL.createObjectURL(new Blob([b]));"
+    )
+    return _inline(f"<a id='dl' download='export data.bin'>dl</a><script>{js}</script>")
+
+
+@pytest.fixture(scope="module")
+def dl_session(client):
+    sess = client.sessions.create(profile="e2e-binary-dl", headless=True, accept_downloads=True, ephemeral=True)
+    sess.navigate(_download_page(DOWNLOAD_BYTES))
+    yield sess
+    sess.close()
+
+
+def test_download_to_streams_file(dl_session, tmp_path):
+    dest = tmp_path / "out.bin"
+    res = dl_session.download_to(str(dest), selector="#dl")
+    assert isinstance(res, DownloadToResult)
+    assert res.filename == "export data.bin"
+    assert res.size_bytes == DOWNLOAD_BYTES == dest.stat().st_size
+    data = dest.read_bytes()
+    assert data[:5] == bytes([0, 1, 2, 3, 4]) and data[256] == 0
+    assert res.bytes_per_sec > 0
+
+
+def test_download_to_respects_max_bytes(dl_session, tmp_path):
+    dest = tmp_path / "capped.bin"
+    with pytest.raises(httpx.HTTPStatusError) as exc:
+        dl_session.download_to(str(dest), selector="#dl", max_bytes=1024)
+    assert exc.value.response.status_code == 413
+    assert exc.value.response.json()["error"] == "download_too_large"
+    assert not dest.exists()
+    assert not (tmp_path / "capped.bin.part").exists()
+
+
+def test_download_stream_requires_accept_downloads(session, tmp_path):
+    with pytest.raises(httpx.HTTPStatusError) as exc:
+        session.download_to(str(tmp_path / "x.bin"), selector="a")
+    assert exc.value.response.status_code == 422
+    assert exc.value.response.json()["error"] == "download_not_enabled"
+
+
+async def test_async_download_to(dl_session, tmp_path):
+    async with AsyncBrowserClient(base_url=BASE_URL) as ac:
+        res = await AsyncSession(dl_session.id, ac).download_to(str(tmp_path / "a.bin"), selector="#dl")
+    assert res.size_bytes == DOWNLOAD_BYTES
+
+
+# ---------------------------------------------------------------------------
+# Streaming upload
+# ---------------------------------------------------------------------------
+
+UPLOAD_PAGE = _inline("<input id='f' type='file'/>")
+UPLOAD_BYTES = 5 * 1024 * 1024 + 3
+
+
+def _page_file(sess):
+    return sess.eval("(() => { const f = document.getElementById('f').files[0]; return f ? [f.name, f.size] : null })()").result
+
+
+def test_upload_streams_from_path(session, tmp_path):
+    src = tmp_path / "big upload.bin"
+    src.write_bytes(os.urandom(UPLOAD_BYTES))
+    session.navigate(UPLOAD_PAGE)
+    res = session.upload("#f", str(src))
+    assert isinstance(res, UploadResult)
+    assert res.filename == "big upload.bin"
+    assert res.size_bytes == UPLOAD_BYTES
+    assert _page_file(session) == ["big upload.bin", UPLOAD_BYTES]
+
+
+def test_upload_streams_from_file_object(session, tmp_path):
+    src = tmp_path / "report.csv"
+    src.write_text("a,b\n1,2\n")
+    session.navigate(UPLOAD_PAGE)
+    with open(src, "rb") as fh:
+        res = session.upload("#f", fh)
+    assert res.filename == "report.csv"
+    assert res.mime_type == "text/csv"
+    assert _page_file(session) == ["report.csv", 8]
+
+
+def test_upload_stream_rejects_json_body(session):
+    resp = httpx.post(
+        f"{BASE_URL}/api/v1/sessions/{session.id}/upload/stream",
+        params={"selector": "#f"},
+        json={"content": "aGk="},
+        headers={"X-API-Token": os.environ.get("AGENTMB_API_TOKEN", "")},
+    )
+    assert resp.status_code == 415
+
+
+async def test_async_upload_streams(session, tmp_path):
+    src = tmp_path / "async.bin"
+    src.write_bytes(b"x" * 300_000)
+    session.navigate(UPLOAD_PAGE)
+    async with AsyncBrowserClient(base_url=BASE_URL) as ac:
+        res = await AsyncSession(session.id, ac).upload("#f", str(src))
+    assert res.size_bytes == 300_000
+    assert _page_file(session) == ["async.bin", 300_000]
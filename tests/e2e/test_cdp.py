@@ -1,5 +1,7 @@
 """
 E2E tests — CDP passthrough endpoint + audit purpose/operator fields
+  - one cached CDP session per page, reused across calls, dropped on page close
+  - /cdp/batch: ordered and parallel batches, per-command errors, limits
 Requires: daemon running on localhost:19315
 Run: pytest tests/e2e/test_cdp.py -v
 """
@@ -76,6 +78,89 @@ def test_cdp_404_unknown_session(client):
     assert exc_info.value.response.status_code == 404
 
 
+# ---------------------------------------------------------------------------
+# CDP session cache
+# ---------------------------------------------------------------------------
+
+def _cdp_cache(client):
+    return client._get("/api/v1/status")["cdp_sessions"]
+
+
+def test_cdp_session_is_reused(client, session):
+    """Repeated commands on one page share a CDP session, so enabled domains stay enabled."""
+    session.cdp_send("Runtime.evaluate", {"expression": "0"})
+    before = _cdp_cache(client)
+    session.cdp_send("Performance.enable", {})
+    for _ in range(5):
+        metrics = session.cdp_send("Performance.getMetrics", {})["result"]["metrics"]
+        assert any(m["name"] == "JSHeapUsedSize" for m in metrics)
+    session.cdp_info()
+    after = _cdp_cache(client)
+    assert after["opened"] == before["opened"]
+    assert after["reused"] >= before["reused"] + 7
+
+
+def test_cdp_session_per_page_dropped_on_close(client, session):
+    """A new page gets its own CDP session; closing the page drops it."""
+    page = session.new_page()
+    session.switch_page(page.page_id)
+    try:
+        before = _cdp_cache(client)
+        session.cdp_send("Runtime.evaluate", {"expression": "1"})
+        assert _cdp_cache(client)["opened"] == before["opened"] + 1
+    finally:
+        pages = session.pages().pages
+        session.switch_page(pages[0].page_id)
+        session.close_page(page.page_id)
+    assert _cdp_cache(client)["dropped"] >= before["dropped"] + 1
+
+
+# ---------------------------------------------------------------------------
+# CDP batch
+# ---------------------------------------------------------------------------
+
+def test_cdp_batch_in_order(session):
+    batch = session.cdp_send_many([
+        {"method": "Runtime.evaluate", "params": {"expression": "window.__n = 41", "returnByValue": True}},
+        {"method": "Runtime.evaluate", "params": {"expression": "++window.__n", "returnByValue": True}},
+        ("DOM.getDocument", {"depth": 1}),
+    ])
+    assert batch.status == "ok" and batch.total_commands == 3 and batch.completed_commands == 3
+    assert [r.index for r in batch.results] == [0, 1, 2]
+    assert batch.results[1].result["result"]["value"] == 42
+    assert batch.results[2].result["root"]["nodeName"] == "#document"
+
+
+def test_cdp_batch_per_command_errors(session):
+    batch = session.cdp_send_many([
+        ("Runtime.evaluate", {"expression": "1", "returnByValue": True}),
+        ("InvalidMethod.doesNotExist", {}),
+        ("Runtime.evaluate", {"expression": "2", "returnByValue": True}),
+    ])
+    assert batch.status == "partial" and batch.failed_commands == 1
+    assert batch.results[1].error and batch.results[1].result is None
+    assert batch.results[2].result["result"]["value"] == 2
+
+    stopped = session.cdp_send_many([("InvalidMethod.doesNotExist", {}), ("Runtime.evaluate", {"expression": "1"})],
+                                    stop_on_error=True)
+    assert stopped.status == "failed" and len(stopped.results) == 1 and stopped.total_commands == 2
+
+
+def test_cdp_batch_parallel(session):
+    cmds = [("Runtime.evaluate", {"expression": f"{i} * 2", "returnByValue": True}) for i in range(20)]
+    batch = session.cdp_send_many(cmds, parallel=True)
+    assert batch.status == "ok"
+    assert [r.result["result"]["value"] for r in batch.results] == [i * 2 for i in range(20)]
+
+
+def test_cdp_batch_validation(session):
+    import httpx
+    for commands in ([], [{"params": {}}], [("Runtime.evaluate", {})] * 101):
+        with pytest.raises(httpx.HTTPStatusError) as exc_info:
+            session.cdp_send_many(commands)
+        assert exc_info.value.response.status_code == 400
+
+
 # ---------------------------------------------------------------------------
 # T10: audit purpose/operator fields
 # ---------------------------------------------------------------------------
@@ -0,0 +1,202 @@
+"""
+E2E tests — conditional GETs (ETag / If-None-Match → 304)
+  - daemon: page_rev, pages, settings, policy, routes, cookies validators
+  - SDK: per-client response cache revalidates and serves 304s
+Requires: daemon running on localhost:19315 (cache tests use a local
+          ETag server and need no daemon)
+Run: pytest tests/e2e/test_conditional_get.py -v
+"""
+
+import base64
+import json
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../sdk/python"))
+
+from agentmb import AsyncBrowserClient, BrowserClient
+from agentmb.cache import ResponseCache
+from agentmb.client import AsyncSession, Session
+
+BASE_URL = f"http://127.0.0.1:{os.environ.get('AGENTMB_PORT', '19315')}"
+
+
+def _inline(html: str) -> str:
+    """Encode HTML as a data: URL."""
+    encoded = base64.b64encode(html.encode()).decode()
+    return f"data:text/html;base64,{encoded}"
+
+
+def _headers() -> dict:
+    token = os.environ.get("AGENTMB_API_TOKEN")
+    return {"x-api-token": token} if token else {}
+
+
+# ---------------------------------------------------------------------------
+# SDK cache against a local ETag server
+# ---------------------------------------------------------------------------
+
+class _EtagServer:
+    """Serves {"session_id", "page_rev"} with ETag "rev-<n>"; 304 when it matches."""
+
+    def __init__(self):
+        self.rev = 1
+        self.seen = []
+        owner = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                inm = self.headers.get("if-none-match")
+                owner.seen.append(inm)
+                tag = f'W/"rev-{owner.rev}"'
+                if inm == tag:
+                    self.send_response(304)
+                    self.send_header("etag", tag)
+                    self.end_headers()
+                    return
+                data = json.dumps({"status": "ok", "session_id": "s1", "page_rev": owner.rev, "url": "about:blank"}).encode()
+                self.send_response(200)
+                self.send_header("content-type", "application/json")
+                self.send_header("content-length", str(len(data)))
+                self.send_header("etag", tag)
+                self.end_headers()
+                self.wfile.write(data)
+
+            do_DELETE = do_GET
+
+            def log_message(self, *_):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def etag_server():
+    srv = _EtagServer()
+    yield srv
+    srv.close()
+
+
+def test_cache_revalidates_and_serves_304(etag_server):
+    with BrowserClient(base_url=etag_server.url) as c:
+        sess = Session("s1", c)
+        a = sess.page_rev()
+        b = sess.page_rev()
+        assert a.page_rev == b.page_rev == 1
+        assert a is not b
+        assert etag_server.seen == [None, 'W/"rev-1"']
+        assert c.metrics.not_modified == 1
+
+        etag_server.rev = 2
+        assert sess.page_rev().page_rev == 2
+        assert c.metrics.not_modified == 1
+
+
+def test_cache_disabled_sends_no_validator(etag_server):
+    with BrowserClient(base_url=etag_server.url, cache=False) as c:
+        Session("s1", c).page_rev()
+        Session("s1", c).page_rev()
+    assert etag_server.seen == [None, None]
+
+
+def test_close_drops_session_entries(etag_server):
+    with BrowserClient(base_url=etag_server.url) as c:
+        sess = Session("s1", c)
+        sess.page_rev()
+        assert len(c._cache) == 1
+        sess.close()
+        assert len(c._cache) == 0
+
+
+async def test_async_cache(etag_server):
+    async with AsyncBrowserClient(base_url=etag_server.url) as c:
+        sess = AsyncSession("s1", c)
+        await sess.page_rev()
+        assert (await sess.page_rev()).page_rev == 1
+        assert c.metrics.not_modified == 1
+
+
+def test_response_cache_lru():
+    cache = ResponseCache(max_entries=2)
+    cache.store("/a", 'W/"1"', b"a")
+    cache.store("/b", 'W/"1"', b"b")
+    cache.body("/a")
+    cache.store("/c", 'W/"1"', b"c")
+    assert cache.etag("/b") is None and cache.etag("/a") == 'W/"1"'
+    cache.store("/a", None, b"a2")          # response without validator
+    assert cache.etag("/a") is None
+
+
+# ---------------------------------------------------------------------------
+# Against the daemon
+# ---------------------------------------------------------------------------
+
+@pytest.fixture(scope="module")
+def client():
+    with BrowserClient(base_url=BASE_URL) as c:
+        yield c
+
+
+@pytest.fixture(scope="module")
+def session(client):
+    sess = client.sessions.create(profile="e2e-conditional-get", headless=True)
+    yield sess
+    sess.close()
+
+
+def _revalidate(sess, suffix):
+    """(status of a conditional re-GET, etag) for a session endpoint."""
+    url = f"{BASE_URL}/api/v1/sessions/{sess.id}/{suffix}"
+    first = httpx.get(url, headers=_headers())
+    first.raise_for_status()
+    tag = first.headers["etag"]
+    again = httpx.get(url, headers={**_headers(), "if-none-match": tag})
+    return again.status_code, tag
+
+
+@pytest.mark.parametrize("suffix", ["page_rev", "pages", "settings", "policy", "routes", "cookies"])
+def test_unchanged_resource_returns_304(session, suffix):
+    status, tag = _revalidate(session, suffix)
+    assert tag.startswith('W/"')
+    assert status == 304
+
+
+def test_validators_change_with_state(session):
+    _, rev_tag = _revalidate(session, "page_rev")
+    _, pages_tag = _revalidate(session, "pages")
+    session.navigate(_inline("<p>changed</p>"))
+    assert _revalidate(session, "page_rev")[1] != rev_tag
+    assert _revalidate(session, "pages")[1] != pages_tag
+
+    _, routes_tag = _revalidate(session, "routes")
+    session.route("**/etag-test", {"status": 204})
+    assert _revalidate(session, "routes")[1] != routes_tag
+
+    _, policy_tag = _revalidate(session, "policy")
+    session.set_policy("permissive")
+    assert _revalidate(session, "policy")[1] != policy_tag
+
+    _, cookie_tag = _revalidate(session, "cookies")
+    session.add_cookies([{"name": "etag", "value": "1", "domain": "example.com", "path": "/"}])
+    assert _revalidate(session, "cookies")[1] != cookie_tag
+
+
+def test_sdk_polling_uses_304(client, session):
+    before = client.metrics.not_modified
+    first = session.page_rev()
+    second = session.page_rev()
+    assert first.page_rev == second.page_rev
+    session.pages()
+    session.pages()
+    assert client.metrics.not_modified - before >= 2
@@ -0,0 +1,187 @@
+"""
+E2E tests — session event stream (GET /api/v1/sessions/:id/events, Session.events())
+  - SSE framing: `ready` first, then id/event/data messages; NDJSON on request
+  - console, page_error, dialog and framenavigated (with page_rev) events are pushed
+  - ?types= filters (unknown types → 400); since / Last-Event-ID replays retained events
+  - the stream ends with session_closed; unknown / closed sessions → 404
+  - AsyncSession.events() async iterator; SSE decoder (no daemon needed)
+  - SDK iterator: `gap` event when ready.missed, clean end when the daemon
+    ends the stream (stand-in transport, no daemon needed)
+Requires: daemon running on localhost:19315 (decoder / iterator tests need no daemon)
+Run: pytest tests/e2e/test_events.py -v
+"""
+
+import asyncio
+import base64
+import json
+import os
+import sys
+
+import httpx
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../sdk/python"))
+
+from agentmb import AsyncBrowserClient, BrowserClient
+from agentmb.client import AsyncSession
+from agentmb.events import SseDecoder
+
+BASE_URL = f"http://127.0.0.1:{os.environ.get('AGENTMB_PORT', '19315')}"
+
+
+def _inline(html: str) -> str:
+    """Encode HTML as a data: URL."""
+    encoded = base64.b64encode(html.encode()).decode()
+    return f"data:text/html;base64,{encoded}"
+
+
+def _headers() -> dict:
+    token = os.environ.get("AGENTMB_API_TOKEN")
+    return {"x-api-token": token} if token else {}
+
+
+@pytest.fixture(scope="module")
+def client():
+    with BrowserClient(base_url=BASE_URL) as c:
+        yield c
+
+
+@pytest.fixture
+def session(client):
+    sess = client.sessions.create(profile="e2e-events", headless=True)
+    sess.set_policy("disabled")
+    yield sess
+    try:
+        sess.close()
+    except httpx.HTTPStatusError:
+        pass  # closed by the test
+
+
+def _read_sse(resp, count):
+    """First *count* ``(event, data, id)`` messages of an open SSE response."""
+    decoder, out = SseDecoder(), []
+    for line in resp.iter_lines():
+        message = decoder.feed(line)
+        if message:
+            out.append((message[0], json.loads(message[1]), message[2]))
+            if len(out) == count:
+                break
+    return out
+
+
+def test_sse_decoder():
+    d = SseDecoder()
+    lines = [": ping", "", "id: 3", "event: console", "data: {\"a\":", "data: 1}", "", "data: x", ""]
+    messages = [m for m in (d.feed(line) for line in lines) if m]
+    assert messages == [("console", "{\"a\":\n1}", "3"), ("message", "x", None)]
+
+
+def test_iterator_reports_gap_and_ends_on_shutdown():
+    opened = []
+
+    def handler(request):
+        opened.append(dict(request.url.params))
+        body = (
+            'event: ready\ndata: {"type":"ready","session_id":"s1","last_seq":300,"page_rev":1,"missed":true}\n\n'
+            'id: 299\nevent: console\ndata: {"seq":299,"type":"console","ts":"t","data":{"text":"x"}}\n\n'
+        )
+        return httpx.Response(200, headers={"content-type": "text/event-stream"}, content=body.encode())
+
+    with BrowserClient(base_url="http://agentmb.test") as c:
+        c._http = httpx.Client(base_url="http://agentmb.test", transport=httpx.MockTransport(handler))
+        events = list(c._stream_events("/api/v1/sessions/s1/events", None, 5, reconnect=True))
+    assert [e.type for e in events] == ["gap", "console"]
+    assert events[0].seq == 5 and events[0].data == {"since": 5, "last_seq": 300}
+    assert opened == [{"since": "5"}]  # ended without session_closed: no reconnect
+
+
+def test_unknown_session_and_type(session):
+    assert httpx.get(f"{BASE_URL}/api/v1/sessions/nope/events", headers=_headers()).status_code == 404
+    resp = httpx.get(f"{BASE_URL}/api/v1/sessions/{session.id}/events?types=console,bogus", headers=_headers())
+    assert resp.status_code == 400 and "bogus" in resp.json()["error"]
+
+
+def test_page_events_are_pushed(session):
+    async def _run():
+        async with AsyncBrowserClient(base_url=BASE_URL) as ac:
+            sess = AsyncSession(session.id, ac)
+            seen = []
+
+            async def collect():
+                async for event in sess.events():
+                    seen.append(event)
+                    if event.type == "dialog":
+                        return
+
+            task = asyncio.create_task(collect())
+            await asyncio.sleep(0.3)  # stream open before the page does anything
+            await sess.navigate(_inline("<h1>events</h1>"))
+            await sess.eval("console.log('hello events')")
+            await sess.eval("setTimeout(() => { throw new Error('boom') }, 0)")
+            await asyncio.sleep(0.2)
+            await sess.eval("setTimeout(() => alert('hi there'), 0)")
+            await asyncio.wait_for(task, 10)
+            return seen
+
+    seen = asyncio.run(_run())
+    by_type = {e.type: e for e in seen}
+    assert by_type["framenavigated"].data["url"].startswith("data:text/html")
+    assert by_type["framenavigated"].data["page_rev"] == session.page_rev().page_rev
+    assert by_type["console"].data["text"] == "hello events" and by_type["console"].data["type"] == "log"
+    assert "boom" in by_type["page_error"].data["message"]
+    assert by_type["dialog"].data["message"] == "hi there"
+    assert all(e.page_id for e in seen)
+    seqs = [e.seq for e in seen]
+    assert seqs == sorted(seqs) and len(set(seqs)) == len(seqs)
+
+
+def test_sse_framing_filter_and_replay(session):
+    session.navigate(_inline("<p>a</p>"))
+    session.eval("console.log('one'); console.warn('two')")
+    url = f"{BASE_URL}/api/v1/sessions/{session.id}/events"
+    with httpx.stream("GET", url, params={"since": 0, "types": "console"}, headers=_headers(), timeout=10) as resp:
+        assert resp.headers["content-type"].startswith("text/event-stream")
+        assert resp.headers["cache-control"] == "no-cache"
+        messages = _read_sse(resp, 3)
+    ready, first, second = messages
+    assert ready[0] == "ready" and ready[1]["session_id"] == session.id and ready[2] is None
+    assert ready[1]["last_seq"] >= second[1]["seq"] and ready[1]["missed"] is False
+    assert [m[0] for m in (first, second)] == ["console", "console"]
+    assert [m[1]["data"]["text"] for m in (first, second)] == ["one", "two"]
+    assert second[2] == str(second[1]["seq"])
+
+    # Last-Event-ID resumes after the given event
+    with httpx.stream("GET", url, params={"types": "console"},
+                      headers={**_headers(), "last-event-id": first[2]}, timeout=10) as resp:
+        _, resumed = _read_sse(resp, 2)
+    assert resumed[1]["seq"] == second[1]["seq"]
+
+
+def test_ndjson_and_session_closed(client):
+    sess = client.sessions.create(profile="e2e-events-close", headless=True)
+    url = f"{BASE_URL}/api/v1/sessions/{sess.id}/events"
+
+    async def _run():
+        async with httpx.AsyncClient(headers=_headers(), timeout=10) as hc:
+            async with hc.stream("GET", url, params={"format": "ndjson", "types": "console"}) as resp:
+                assert resp.headers["content-type"].startswith("application/x-ndjson")
+                lines = []
+                async for line in resp.aiter_lines():
+                    if not line:
+                        continue
+                    lines.append(json.loads(line))
+                    if len(lines) == 1:
+                        await asyncio.to_thread(sess.close)
+                return lines  # stream ended by the daemon
+
+    lines = asyncio.run(_run())
+    assert lines[0]["type"] == "ready"
+    assert lines[-1]["type"] == "session_closed"  # delivered despite the types filter
+
+
+def test_closed_session_stream_is_404(client):
+    sess = client.sessions.create(profile="e2e-events-gone", headless=True)
+    sess.close()
+    with pytest.raises(httpx.HTTPStatusError) as exc_info:
+        next(iter(sess.events()))
+    assert exc_info.value.response.status_code == 404
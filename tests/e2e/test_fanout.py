@@ -0,0 +1,156 @@
+"""
+E2E tests — bounded-concurrency fan-out across sessions
+  - BrowserClient.fan_out (thread pool) / AsyncBrowserClient.fan_out (semaphore)
+  - completion order, per-item timing, error and timeout capture
+Requires: daemon running on localhost:19315 (scheduling tests need no daemon)
+Run: pytest tests/e2e/test_fanout.py -v
+"""
+
+import asyncio
+import base64
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../sdk/python"))
+
+from agentmb import AsyncBrowserClient, BrowserClient, FanOutResult
+
+BASE_URL = f"http://127.0.0.1:{os.environ.get('AGENTMB_PORT', '19315')}"
+
+
+def _inline(html: str) -> str:
+    """Encode HTML as a data: URL."""
+    encoded = base64.b64encode(html.encode()).decode()
+    return f"data:text/html;base64,{encoded}"
+
+
+# ---------------------------------------------------------------------------
+# Scheduling (no daemon needed — fn does not touch the session)
+# ---------------------------------------------------------------------------
+
+def test_sync_fan_out_bounds_concurrency_and_captures_errors():
+    active, peak, lock = [0], [0], threading.Lock()
+
+    def work(n):
+        with lock:
+            active[0] += 1
+            peak[0] = max(peak[0], active[0])
+        time.sleep(0.02)
+        with lock:
+            active[0] -= 1
+        if n == 3:
+            raise RuntimeError("boom")
+        return n * 10
+
+    with BrowserClient(base_url=BASE_URL) as client:
+        results = list(client.fan_out(range(10), work, concurrency=3))
+
+    assert peak[0] <= 3
+    assert sorted(r.index for r in results) == list(range(10))
+    failed = [r for r in results if not r.ok]
+    assert len(failed) == 1 and failed[0].session == 3
+    assert "RuntimeError: boom" in failed[0].error
+    with pytest.raises(RuntimeError):
+        failed[0].unwrap()
+    assert all(r.result == r.session * 10 for r in results if r.ok)
+    assert all(r.duration_ms >= 15 for r in results)
+
+
+def test_sync_fan_out_yields_fast_items_first():
+    def work(delay):
+        time.sleep(delay)
+        return delay
+
+    with BrowserClient(base_url=BASE_URL) as client:
+        order = [r.result for r in client.fan_out([0.3, 0.01, 0.01], work, concurrency=3)]
+    assert order[-1] == 0.3
+
+
+def test_sync_fan_out_timeout():
+    with BrowserClient(base_url=BASE_URL) as client:
+        t0 = time.monotonic()
+        results = {r.index: r for r in client.fan_out([0.01, 1.0], time.sleep, concurrency=2, timeout=0.2)}
+        elapsed = time.monotonic() - t0
+    assert results[0].ok
+    assert isinstance(results[1].exception, TimeoutError)
+    assert elapsed < 0.9
+
+
+def test_sync_fan_out_rejects_coroutine_function():
+    async def work(s):
+        return s
+
+    with BrowserClient(base_url=BASE_URL) as client:
+        with pytest.raises(TypeError):
+            list(client.fan_out([1], work))
+
+
+async def test_async_fan_out_bounds_concurrency_and_timeout():
+    active, peak = [0], [0]
+
+    async def work(delay):
+        active[0] += 1
+        peak[0] = max(peak[0], active[0])
+        try:
+            await asyncio.sleep(delay)
+        finally:
+            active[0] -= 1
+        return delay
+
+    async with AsyncBrowserClient(base_url=BASE_URL) as client:
+        results = [r async for r in client.fan_out([0.01] * 8 + [5.0], work, concurrency=4, timeout=0.3)]
+
+    assert peak[0] <= 4
+    assert len(results) == 9
+    assert isinstance(results[-1], FanOutResult)
+    assert results[-1].index == 8 and isinstance(results[-1].exception, TimeoutError)
+    assert all(r.ok for r in results[:-1])
+
+
+def test_concurrency_must_be_positive():
+    with BrowserClient(base_url=BASE_URL) as client:
+        with pytest.raises(ValueError):
+            list(client.fan_out([1], lambda s: s, concurrency=0))
+
+
+# ---------------------------------------------------------------------------
+# Against the daemon
+# ---------------------------------------------------------------------------
+
+N_SESSIONS = 3
+
+
+def test_sync_fan_out_sessions():
+    with BrowserClient(base_url=BASE_URL) as client:
+        sessions = [client.sessions.create(profile=f"e2e-fanout-{i}", headless=True) for i in range(N_SESSIONS)]
+        try:
+            def title(s):
+                s.navigate(_inline(f"<title>{s.id}</title>"))
+                return s.eval("document.title").result
+
+            results = list(client.fan_out(sessions, title, concurrency=N_SESSIONS))
+            assert all(r.ok for r in results), [r.error for r in results]
+            assert {r.result for r in results} == {s.id for s in sessions}
+        finally:
+            for s in sessions:
+                s.close()
+
+
+async def test_async_fan_out_sessions():
+    async with AsyncBrowserClient(base_url=BASE_URL) as client:
+        sessions = [await client.sessions.create(profile=f"e2e-fanout-a{i}", headless=True) for i in range(N_SESSIONS)]
+        try:
+            async def title(s):
+                await s.navigate(_inline(f"<title>{s.id}</title>"))
+                return (await s.eval("document.title")).result
+
+            results = [r async for r in client.fan_out(sessions, title, concurrency=2)]
+            assert all(r.ok for r in results), [r.error for r in results]
+            assert {r.result for r in results} == {s.id for s in sessions}
+        finally:
+            for s in sessions:
+                await s.close()
@@ -0,0 +1,122 @@
+"""
+E2E tests — idle session hibernation (AGENTMB_HIBERNATE_IDLE_MS)
+  - an idle session's browser is closed and the session marked hibernated
+  - the next request resumes it: same page ids, URLs, active page, routes,
+    cookies and viewport
+  - a session with a trace in progress is never hibernated
+  - /api/v1/status reports hibernate / resume latency and memory reclaimed
+Starts its own daemon on port 19321 with AGENTMB_HIBERNATE_IDLE_MS=1500.
+Run: pytest tests/e2e/test_hibernation.py -v
+"""
+
+import base64
+import os
+import signal
+import subprocess
+import sys
+import time
+
+import httpx
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../sdk/python"))
+
+from agentmb import BrowserClient
+
+HIBERNATE_PORT = 19321
+HIBERNATE_DATA_DIR = "/tmp/agentmb-hibernate-test"
+HIBERNATE_BASE = f"http://127.0.0.1:{HIBERNATE_PORT}"
+DAEMON_BIN = os.path.join(os.path.dirname(__file__), "../../dist/daemon/index.js")
+
+
+def _inline(html: str) -> str:
+    """Encode HTML as a data: URL."""
+    encoded = base64.b64encode(html.encode()).decode()
+    return f"data:text/html;base64,{encoded}"
+
+
+def _stats():
+    return httpx.get(f"{HIBERNATE_BASE}/api/v1/status").json()["hibernation"]
+
+
+def _wait_state(client, session_id, state, timeout=15):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        # GET /sessions/:id is metadata only and does not wake the session
+        if client.sessions.get(session_id).state == state:
+            return
+        time.sleep(0.25)
+    pytest.fail(f"session {session_id} did not become {state}")
+
+
+@pytest.fixture(scope="module")
+def client():
+    env = {
+        **os.environ,
+        "AGENTMB_PORT": str(HIBERNATE_PORT),
+        "AGENTMB_DATA_DIR": HIBERNATE_DATA_DIR,
+        "AGENTMB_HIBERNATE_IDLE_MS": "1500",
+    }
+    env.pop("AGENTMB_API_TOKEN", None)
+    proc = subprocess.Popen(["node", DAEMON_BIN], env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.time() + 8
+    while time.time() < deadline:
+        try:
+            if httpx.get(f"{HIBERNATE_BASE}/health", timeout=1).status_code == 200:
+                break
+        except Exception:
+            pass
+        time.sleep(0.2)
+    else:
+        proc.terminate()
+        proc.wait()
+        pytest.skip("Hibernation daemon failed to start — skipping hibernation tests")
+    with BrowserClient(base_url=HIBERNATE_BASE) as c:
+        yield c
+    proc.send_signal(signal.SIGTERM)
+    proc.wait(timeout=30)
+
+
+def test_idle_session_hibernates_and_resumes(client):
+    sess = client.sessions.create(profile="e2e-hibernate", ephemeral=True)
+    try:
+        sess.navigate(_inline("<title>first</title>"))
+        second = sess.new_page()
+        sess.switch_page(second.page_id)
+        sess.navigate(_inline("<title>second</title>"))
+        sess.route("**/mocked", {"status": 200, "body": "hi"})
+        sess.add_cookies([{"name": "keep", "value": "1", "url": "https://example.com"}])
+        sess.set_viewport(800, 600)
+        before = {p.page_id: p for p in sess.pages().pages}
+
+        _wait_state(client, sess.id, "hibernated")
+        stats = _stats()
+        assert stats["hibernated_now"] == 1 and stats["hibernations"] >= 1
+
+        # Any request on the session resumes it transparently
+        after = {p.page_id: p for p in sess.pages().pages}
+        assert client.sessions.get(sess.id).state == "live"
+        assert after.keys() == before.keys()
+        assert [(p.url, p.active) for p in after.values()] == [(p.url, p.active) for p in before.values()]
+        assert sess.eval("document.title").result == "second"
+        assert sess.eval("[innerWidth, innerHeight]").result == [800, 600]
+        assert [r.pattern for r in sess.routes().routes] == ["**/mocked"]
+        assert [c["name"] for c in sess.cookies().cookies] == ["keep"]
+
+        stats = _stats()
+        assert stats["hibernated_now"] == 0 and stats["resumes"] >= 1
+        assert stats["resume_ms"]["p50"] > 0 and stats["hibernate_ms"]["p50"] > 0
+    finally:
+        sess.close()
+
+
+def test_tracing_keeps_session_awake(client):
+    sess = client.sessions.create(profile="e2e-hibernate-trace", ephemeral=True)
+    try:
+        sess.trace_start(screenshots=False, snapshots=False)
+        time.sleep(3.5)
+        assert client.sessions.get(sess.id).state == "live"
+        sess.trace_stop()
+        _wait_state(client, sess.id, "hibernated")
+    finally:
+        sess.close()
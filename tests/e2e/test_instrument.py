@@ -0,0 +1,163 @@
+"""
+E2E tests — client-side instrumentation hooks + LatencyHistogram
+  - RequestEvent: wall vs server duration_ms, decode time, bytes, errors
+  - per-endpoint p50/p95/p99 with ids templated out of the path
+Requires: daemon running on localhost:19315 (hook tests use a local HTTP
+          server and need no daemon)
+Run: pytest tests/e2e/test_instrument.py -v
+"""
+
+import base64
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../sdk/python"))
+
+from agentmb import AsyncBrowserClient, BrowserClient, ClientHook, LatencyHistogram
+from agentmb.client import Session
+from agentmb.instrument import Histogram, endpoint_of
+
+BASE_URL = f"http://127.0.0.1:{os.environ.get('AGENTMB_PORT', '19315')}"
+
+
+def _inline(html: str) -> str:
+    """Encode HTML as a data: URL."""
+    encoded = base64.b64encode(html.encode()).decode()
+    return f"data:text/html;base64,{encoded}"
+
+
+class _Server:
+    """Answers every request after a 20 ms sleep; /fail returns 500."""
+
+    def __init__(self):
+        class Handler(BaseHTTPRequestHandler):
+            def _reply(self):
+                length = int(self.headers.get("content-length") or 0)
+                self.rfile.read(length)
+                time.sleep(0.02)
+                status = 500 if self.path.endswith("/fail") else 200
+                data = json.dumps({"status": "ok", "url": "about:blank", "title": "", "duration_ms": 5}).encode()
+                self.send_response(status)
+                self.send_header("content-type", "application/json")
+                self.send_header("content-length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            do_GET = do_POST = _reply
+
+            def log_message(self, *_):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def server():
+    srv = _Server()
+    yield srv
+    srv.close()
+
+
+class _Recorder(ClientHook):
+    def __init__(self):
+        self.started, self.ended = [], []
+
+    def on_request_start(self, event):
+        self.started.append(event.endpoint)
+
+    def on_request_end(self, event):
+        self.ended.append(event)
+
+
+def test_event_fields(server):
+    rec = _Recorder()
+    with BrowserClient(base_url=server.url, hooks=[rec]) as c:
+        Session("sess_1", c).navigate("https://example.com")
+    assert rec.started == ["POST /api/v1/sessions/{id}/navigate"]
+    ev = rec.ended[0]
+    assert ev.status == 200 and ev.error is None
+    assert ev.server_ms == 5
+    assert ev.wall_ms >= 20 > ev.server_ms
+    assert ev.overhead_ms == pytest.approx(ev.wall_ms - 5)
+    assert ev.decode_ms > 0
+    assert ev.bytes_out > len("https://example.com") and ev.bytes_in > 0
+
+
+def test_errors_are_reported(server):
+    rec = _Recorder()
+    with BrowserClient(base_url=server.url, hooks=[rec]) as c:
+        with pytest.raises(httpx.HTTPStatusError):
+            c._get("/api/v1/fail")
+    assert isinstance(rec.ended[0].error, httpx.HTTPStatusError)
+
+
+def test_histogram_groups_by_endpoint(server):
+    hist = LatencyHistogram()
+    with BrowserClient(base_url=server.url) as c:
+        c.add_hook(hist)
+        for i in range(5):
+            Session(f"sess_{i}", c).navigate("https://example.com")
+        c._get("/health")
+        c.remove_hook(hist)
+        c._get("/health")
+    summary = hist.summary()
+    nav = summary["POST /api/v1/sessions/{id}/navigate"]
+    assert nav["count"] == 5
+    assert nav["wall"]["p50"] >= 20
+    assert nav["server"]["p50"] == pytest.approx(5, rel=0.05)
+    assert summary["GET /health"]["count"] == 1
+    table = hist.dump()
+    assert "navigate" in table and "p99" in table
+
+
+async def test_async_hooks(server):
+    rec = _Recorder()
+    async with AsyncBrowserClient(base_url=server.url, hooks=[rec]) as c:
+        await c._get("/health")
+    assert rec.ended[0].endpoint == "GET /health" and rec.ended[0].wall_ms >= 20
+
+
+def test_histogram_percentiles_within_bucket_error():
+    h = Histogram()
+    for v in range(1, 1001):
+        h.record(float(v))
+    assert h.percentile(50) == pytest.approx(500, rel=0.03)
+    assert h.percentile(99) == pytest.approx(990, rel=0.03)
+    assert h.max == 1000 and h.mean == pytest.approx(500.5)
+
+
+def test_endpoint_templating():
+    assert endpoint_of("delete", "/api/v1/sessions/s1/pages/p2") == "DELETE /api/v1/sessions/{id}/pages/{page_id}"
+    assert endpoint_of("post", "/api/v1/sessions/s1/pages/switch") == "POST /api/v1/sessions/{id}/pages/switch"
+    assert endpoint_of("get", "/api/v1/sessions/s1/cookies?urls=a") == "GET /api/v1/sessions/{id}/cookies"
+
+
+# ---------------------------------------------------------------------------
+# Against the daemon
+# ---------------------------------------------------------------------------
+
+def test_daemon_calls_split_wall_and_server_time():
+    hist = LatencyHistogram()
+    with BrowserClient(base_url=BASE_URL, hooks=[hist]) as c:
+        sess = c.sessions.create(profile="e2e-instrument", headless=True)
+        try:
+            for i in range(3):
+                sess.navigate(_inline(f"<p>{i}</p>"))
+        finally:
+            sess.close()
+    nav = hist.summary()["POST /api/v1/sessions/{id}/navigate"]
+    assert nav["count"] == 3
+    assert nav["wall"]["p50"] >= nav["server"]["p50"] > 0
@@ -0,0 +1,117 @@
+"""
+E2E tests — Prometheus /metrics endpoint
+  - text exposition format with HELP/TYPE lines
+  - per-route latency histograms keyed by route pattern, in-flight gauge
+  - live/zombie/hibernated session counts, per-session browser RSS
+  - policy wait histogram, audit backlog and event-loop lag
+Requires: daemon running on localhost:19315
+Run: pytest tests/e2e/test_metrics.py -v
+"""
+
+import base64
+import os
+import re
+import sys
+
+import httpx
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../sdk/python"))
+
+from agentmb import BrowserClient
+
+BASE_URL = f"http://127.0.0.1:{os.environ.get('AGENTMB_PORT', '19315')}"
+
+_SAMPLE = re.compile(r'^([a-zA-Z_:][a-zA-Z0-9_:]*)(?:\{(.*)\})? (\S+)$')
+_LABEL = re.compile(r'(\w+)="((?:[^"\\]|\\.)*)"')
+
+
+def _inline(html: str) -> str:
+    """Encode HTML as a data: URL."""
+    encoded = base64.b64encode(html.encode()).decode()
+    return f"data:text/html;base64,{encoded}"
+
+
+def _headers() -> dict:
+    token = os.environ.get("AGENTMB_API_TOKEN")
+    return {"x-api-token": token} if token else {}
+
+
+def _scrape():
+    """``(raw text, [(name, labels, value)])`` from GET /metrics."""
+    resp = httpx.get(f"{BASE_URL}/metrics", headers=_headers())
+    assert resp.status_code == 200
+    samples = []
+    for line in resp.text.splitlines():
+        if not line or line.startswith("#"):
+            continue
+        m = _SAMPLE.match(line)
+        assert m, f"malformed sample line: {line!r}"
+        samples.append((m.group(1), dict(_LABEL.findall(m.group(2) or "")), float(m.group(3))))
+    return resp, samples
+
+
+def _value(samples, name, **labels):
+    for n, lbl, v in samples:
+        if n == name and all(lbl.get(k) == val for k, val in labels.items()):
+            return v
+    return None
+
+
+@pytest.fixture(scope="module")
+def client():
+    with BrowserClient(base_url=BASE_URL) as c:
+        yield c
+
+
+@pytest.fixture(scope="module")
+def session(client):
+    sess = client.sessions.create(profile="e2e-metrics", headless=True)
+    yield sess
+    sess.close()
+
+
+def test_exposition_format():
+    resp, samples = _scrape()
+    assert resp.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "# TYPE agentmb_http_request_duration_seconds histogram" in resp.text
+    assert "# TYPE agentmb_sessions gauge" in resp.text
+    assert _value(samples, "agentmb_process_uptime_seconds") >= 0
+
+
+def test_route_latency_uses_route_pattern(session):
+    route = "/api/v1/sessions/:id/navigate"
+    _, before = _scrape()
+    start = _value(before, "agentmb_http_request_duration_seconds_count", route=route, method="POST", status_code="200") or 0
+    session.navigate(_inline("<h1>metrics</h1>"))
+    session.navigate(_inline("<h1>again</h1>"))
+    _, after = _scrape()
+    assert _value(after, "agentmb_http_request_duration_seconds_count", route=route, method="POST", status_code="200") == start + 2
+    inf = _value(after, "agentmb_http_request_duration_seconds_bucket", route=route, method="POST", status_code="200", le="+Inf")
+    assert inf == start + 2
+    # Session ids never leak into route labels
+    assert not any(session.id in lbl.get("route", "") for _, lbl, _ in after)
+    # The scrape itself is in flight while the body is rendered
+    assert _value(after, "agentmb_http_requests_in_flight", route="/metrics") == 1
+
+
+def test_session_counts_and_browser_rss(session):
+    _, samples = _scrape()
+    assert _value(samples, "agentmb_sessions", state="live") >= 1
+    assert _value(samples, "agentmb_sessions", state="zombie") is not None
+    if not os.path.isdir("/proc"):
+        pytest.skip("per-session RSS needs /proc")
+    rss = _value(samples, "agentmb_session_browser_rss_bytes", session_id=session.id)
+    assert rss is not None and rss > 10 * 2**20
+    assert _value(samples, "agentmb_browser_rss_bytes") >= rss
+
+
+def test_policy_wait_and_runtime_gauges(session):
+    _, before = _scrape()
+    start = _value(before, "agentmb_policy_wait_seconds_count", outcome="allowed") or 0
+    session.eval("1 + 1")
+    _, after = _scrape()
+    assert _value(after, "agentmb_policy_wait_seconds_count", outcome="allowed") == start + 1
+    assert _value(after, "agentmb_audit_backlog_bytes") >= 0
+    for q in ("0.5", "0.9", "0.99", "1"):
+        assert _value(after, "agentmb_event_loop_lag_seconds", quantile=q) >= 0
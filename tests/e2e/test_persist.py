@@ -0,0 +1,172 @@
+"""
+E2E tests — session registry persistence
+  - changes are appended to sessions.journal (debounced, async)
+  - a failed append is not lost: the snapshot is rewritten once writes work again
+  - snapshot compaction on shutdown; restart replays snapshot + journal
+  - zombies with untouched profiles past AGENTMB_ZOMBIE_TTL_HOURS are GC'd
+  - /api/v1/status reports event-loop delay
+Starts its own daemon on port 19317 (data dir /tmp/agentmb-persist-test)
+with AGENTMB_PERSIST_DEBOUNCE_MS=200 and AGENTMB_ZOMBIE_TTL_HOURS=24.
+Run: pytest tests/e2e/test_persist.py -v
+"""
+
+import json
+import os
+import shutil
+import signal
+import subprocess
+import sys
+import time
+
+import httpx
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../sdk/python"))
+
+from agentmb import BrowserClient
+from agentmb._bench.persist import seed
+
+PERSIST_PORT = 19317
+PERSIST_DATA_DIR = "/tmp/agentmb-persist-test"
+PERSIST_BASE = f"http://127.0.0.1:{PERSIST_PORT}"
+STATE_FILE = os.path.join(PERSIST_DATA_DIR, "sessions.json")
+JOURNAL_FILE = os.path.join(PERSIST_DATA_DIR, "sessions.journal")
+DAEMON_BIN = os.path.join(os.path.dirname(__file__), "../../dist/daemon/index.js")
+SEEDED = 500
+STALE = 300
+
+
+def _start():
+    env = {
+        **os.environ,
+        "AGENTMB_PORT": str(PERSIST_PORT),
+        "AGENTMB_DATA_DIR": PERSIST_DATA_DIR,
+        "AGENTMB_PERSIST_DEBOUNCE_MS": "200",
+        "AGENTMB_ZOMBIE_TTL_HOURS": "24",
+    }
+    env.pop("AGENTMB_API_TOKEN", None)
+    env.pop("AGENTMB_ENCRYPTION_KEY", None)
+    proc = subprocess.Popen(["node", DAEMON_BIN], env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.time() + 8
+    while time.time() < deadline:
+        try:
+            if httpx.get(f"{PERSIST_BASE}/health", timeout=1).status_code == 200:
+                return proc
+        except Exception:
+            pass
+        time.sleep(0.2)
+    proc.terminate()
+    proc.wait()
+    pytest.skip("Persist daemon failed to start — skipping persistence tests")
+
+
+def _stop(proc):
+    proc.send_signal(signal.SIGTERM)
+    proc.wait(timeout=30)
+
+
+def _journal():
+    if not os.path.exists(JOURNAL_FILE):
+        return []
+    with open(JOURNAL_FILE) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def _state():
+    """Snapshot with the journal replayed on top, as the daemon loads it."""
+    with open(STATE_FILE) as f:
+        state = {s["id"]: s for s in json.load(f)}
+    for rec in _journal():
+        if rec["op"] == "put":
+            state[rec["info"]["id"]] = rec["info"]
+        else:
+            state.pop(rec["id"], None)
+    return state
+
+
+@pytest.fixture(scope="module")
+def daemon():
+    shutil.rmtree(PERSIST_DATA_DIR, ignore_errors=True)
+    seed(PERSIST_DATA_DIR, SEEDED)
+    seed(PERSIST_DATA_DIR, STALE, age_days=30, prefix="stale")
+    proc = _start()
+    yield proc
+    if proc.poll() is None:
+        _stop(proc)
+
+
+def test_stale_zombies_collected_at_startup(daemon):
+    status = httpx.get(f"{PERSIST_BASE}/api/v1/status").json()
+    ids = {s["id"] for s in status["sessions"]}
+    assert len(ids) == SEEDED
+    assert not any(i.startswith("sess_stale") for i in ids)
+    assert set(status["event_loop"]) == {"p50_ms", "p99_ms", "max_ms"}
+    time.sleep(0.5)                                  # startup compaction
+    assert len(_state()) == SEEDED and _journal() == []
+
+
+def test_changes_are_journaled_not_rewritten(daemon):
+    snapshot_mtime = os.stat(STATE_FILE).st_mtime_ns
+    with BrowserClient(base_url=PERSIST_BASE) as client:
+        sess = client.sessions.create(profile="e2e-persist", ephemeral=True, headless=True)
+        try:
+            time.sleep(0.6)                          # > debounce window
+            assert _state()[sess.id]["state"] == "live"
+            journaled = len(_journal())
+
+            # Tab switches re-attach a live session: nothing new is journaled
+            for _ in range(10):
+                page = sess.new_page()
+                sess.switch_page(page.page_id)
+                sess.close_page(page.page_id)
+            time.sleep(0.6)
+            assert len(_journal()) == journaled
+        finally:
+            sess.close()
+        time.sleep(0.6)
+        assert sess.id not in _state()
+        assert _journal()[-1] == {"op": "del", "id": sess.id}
+    assert os.stat(STATE_FILE).st_mtime_ns == snapshot_mtime
+    assert [n for n in os.listdir(PERSIST_DATA_DIR) if n.endswith(".tmp")] == []
+
+
+def test_failed_append_is_compacted_later(daemon):
+    os.replace(JOURNAL_FILE, JOURNAL_FILE + ".saved")
+    os.mkdir(JOURNAL_FILE)                           # appends now fail (EISDIR)
+    with BrowserClient(base_url=PERSIST_BASE) as client:
+        sess = client.sessions.create(profile="e2e-persist-fail", ephemeral=True, headless=True)
+        try:
+            time.sleep(0.6)                          # > debounce window: the append failed
+            with open(STATE_FILE) as f:
+                assert sess.id not in {s["id"] for s in json.load(f)}
+            os.rmdir(JOURNAL_FILE)
+            os.remove(JOURNAL_FILE + ".saved")       # superseded by the coming snapshot
+            time.sleep(2.0)                          # > retry delay
+            with open(STATE_FILE) as f:
+                assert {s["id"]: s for s in json.load(f)}[sess.id]["state"] == "live"
+            assert _journal() == []
+        finally:
+            sess.close()
+
+
+def test_shutdown_compacts_and_restart_replays(daemon):
+    with BrowserClient(base_url=PERSIST_BASE) as client:
+        sess = client.sessions.create(profile="e2e-persist-shutdown", headless=True)
+    _stop(daemon)
+    assert _journal() == []
+    with open(STATE_FILE) as f:
+        state = {s["id"]: s for s in json.load(f)}
+    assert state[sess.id]["state"] == "zombie"
+    assert len(state) == SEEDED + 1
+
+    # A journal left by a crash is replayed over the snapshot
+    with open(JOURNAL_FILE, "w") as f:
+        f.write(json.dumps({"op": "del", "id": sess.id}) + "\n")
+        f.write('{"op": "put", "info": {"id": "sess_torn"')   # torn last line
+    proc = _start()
+    try:
+        ids = {s["id"] for s in httpx.get(f"{PERSIST_BASE}/api/v1/status").json()["sessions"]}
+        assert sess.id not in ids and "sess_torn" not in ids
+        assert len(ids) == SEEDED
+    finally:
+        _stop(proc)
@@ -0,0 +1,218 @@
+"""
+E2E tests — SDK retry/backoff layer (RetryPolicy)
+  - per-status rules, Retry-After, deadline, connect errors, client.metrics
+  - 409 stale_ref: re-run snapshot_map and remap ref_id by fingerprint
+Requires: daemon running on localhost:19315 (rule tests use a scripted
+          local HTTP server and need no daemon)
+Run: pytest tests/e2e/test_retry.py -v
+"""
+
+import base64
+import json
+import os
+import socket
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../sdk/python"))
+
+from agentmb import AsyncBrowserClient, BrowserClient, RetryPolicy, RetryRule
+from agentmb.retry import RefIndex
+
+BASE_URL = f"http://127.0.0.1:{os.environ.get('AGENTMB_PORT', '19315')}"
+
+FAST = dict(backoff=0.01, max_backoff=0.05)
+
+
+def _inline(html: str) -> str:
+    """Encode HTML as a data: URL."""
+    encoded = base64.b64encode(html.encode()).decode()
+    return f"data:text/html;base64,{encoded}"
+
+
+# ---------------------------------------------------------------------------
+# Scripted server: each request pops the next (status, body, headers)
+# ---------------------------------------------------------------------------
+
+class _Scripted:
+    def __init__(self):
+        self.script = []
+        self.requests = []
+        owner = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def _reply(self):
+                length = int(self.headers.get("content-length") or 0)
+                body = json.loads(self.rfile.read(length)) if length else None
+                owner.requests.append((self.command, self.path, body))
+                status, payload, headers = owner.script.pop(0) if owner.script else (200, {"status": "ok"}, {})
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("content-type", "application/json")
+                self.send_header("content-length", str(len(data)))
+                for k, v in headers.items():
+                    self.send_header(k, v)
+                self.end_headers()
+                self.wfile.write(data)
+
+            do_GET = do_POST = do_DELETE = do_PUT = _reply
+
+            def log_message(self, *_):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+@pytest.fixture
+def scripted():
+    srv = _Scripted()
+    yield srv
+    srv.close()
+
+
+def test_retry_off_by_default(scripted):
+    scripted.script = [(503, {"error": "busy"}, {})]
+    with BrowserClient(base_url=scripted.url) as c:
+        with pytest.raises(httpx.HTTPStatusError):
+            c._get("/x")
+    assert len(scripted.requests) == 1
+
+
+def test_503_retried_then_succeeds(scripted):
+    scripted.script = [(503, {"error": "busy"}, {}), (503, {"error": "busy"}, {})]
+    with BrowserClient(base_url=scripted.url, retry=RetryPolicy(**FAST)) as c:
+        assert c._post("/x", {"a": 1}) == {"status": "ok"}
+        assert c.metrics.retries == 2
+        assert c.metrics.retries_by_status == {503: 2}
+    assert [r[2] for r in scripted.requests] == [{"a": 1}] * 3
+
+
+def test_gives_up_with_original_error(scripted):
+    scripted.script = [(429, {"error": "slow down"}, {})] * 10
+    with BrowserClient(base_url=scripted.url, retry=RetryPolicy(rules={429: RetryRule(max_attempts=2)}, **FAST)) as c:
+        with pytest.raises(httpx.HTTPStatusError) as ei:
+            c._get("/x")
+        assert ei.value.response.status_code == 429
+        assert c.metrics.gave_up == 1
+    assert len(scripted.requests) == 2
+
+
+def test_gateway_errors_only_retried_for_idempotent_methods(scripted):
+    scripted.script = [(502, {}, {}), (502, {}, {})]
+    with BrowserClient(base_url=scripted.url, retry=RetryPolicy(**FAST)) as c:
+        with pytest.raises(httpx.HTTPStatusError):
+            c._post("/click", {})
+        assert c._get("/pages") == {"status": "ok"}
+    assert [r[0] for r in scripted.requests] == ["POST", "GET", "GET"]
+
+
+def test_retry_after_and_deadline(scripted):
+    scripted.script = [(429, {}, {"retry-after": "5"})]
+    with BrowserClient(base_url=scripted.url, retry=RetryPolicy(deadline=1.0, **FAST)) as c:
+        t0 = time.monotonic()
+        with pytest.raises(httpx.HTTPStatusError):
+            c._get("/x")
+        assert time.monotonic() - t0 < 1.0     # a 5 s wait would overrun the deadline
+    scripted.script = [(429, {}, {"retry-after": "0.05"})]
+    with BrowserClient(base_url=scripted.url, retry=RetryPolicy(**FAST)) as c:
+        assert c._get("/x") == {"status": "ok"}
+
+
+def test_policy_403_and_404_not_retried(scripted):
+    scripted.script = [(403, {"error": "Sensitive action blocked"}, {}), (404, {"error": "nope"}, {})]
+    with BrowserClient(base_url=scripted.url, retry=True) as c:
+        for _ in range(2):
+            with pytest.raises(httpx.HTTPStatusError):
+                c._post("/x", {})
+        assert c.metrics.retries == 0
+
+
+def test_connect_error_retried():
+    s = socket.socket()
+    s.bind(("127.0.0.1", 0))
+    port = s.getsockname()[1]
+    s.close()
+    with BrowserClient(base_url=f"http://127.0.0.1:{port}", retry=RetryPolicy(connect_attempts=3, **FAST)) as c:
+        with pytest.raises(httpx.ConnectError):
+            c.health()
+        assert c.metrics.retries_by_status == {0: 2}
+
+
+def test_stale_ref_remapped_from_new_snapshot(scripted):
+    old_el = {"ref_id": "snap_000001:e3", "tag": "button", "role": "button", "name": "", "text": "Buy",
+              "label": "Buy", "href": "", "placeholder": "", "type": "", "rect": {"x": 10, "y": 10, "width": 40, "height": 20}}
+    new_els = [
+        {**old_el, "ref_id": "snap_000002:e1", "text": "Sell", "label": "Sell"},
+        {**old_el, "ref_id": "snap_000002:e7", "rect": {"x": 300, "y": 300, "width": 40, "height": 20}},
+        {**old_el, "ref_id": "snap_000002:e8", "rect": {"x": 12, "y": 14, "width": 40, "height": 20}},
+    ]
+    scripted.script = [
+        (409, {"error": "stale_ref", "ref_id": "snap_000001:e3"}, {}),
+        (200, {"snapshot_id": "snap_000002", "elements": new_els}, {}),
+        (200, {"status": "ok"}, {}),
+    ]
+    with BrowserClient(base_url=scripted.url, retry=True) as c:
+        c._refs.remember("s1", {"limit": 500}, "snap_000001", [old_el])
+        assert c._post("/api/v1/sessions/s1/click", {"ref_id": "snap_000001:e3"}) == {"status": "ok"}
+        assert c.metrics.stale_ref_remaps == 1
+    assert scripted.requests[1][:3] == ("POST", "/api/v1/sessions/s1/snapshot_map", {"limit": 500})
+    assert scripted.requests[2][2] == {"ref_id": "snap_000002:e8"}
+
+
+def test_stale_ref_without_known_snapshot_raises(scripted):
+    scripted.script = [(409, {"error": "stale_ref"}, {})]
+    with BrowserClient(base_url=scripted.url, retry=True) as c:
+        with pytest.raises(httpx.HTTPStatusError):
+            c._post("/api/v1/sessions/s1/click", {"ref_id": "snap_999999:e1"})
+    assert len(scripted.requests) == 1
+
+
+async def test_async_retry(scripted):
+    scripted.script = [(503, {}, {})]
+    async with AsyncBrowserClient(base_url=scripted.url, retry=RetryPolicy(**FAST)) as c:
+        assert await c._get("/x") == {"status": "ok"}
+        assert c.metrics.retries == 1
+
+
+def test_ref_index_eviction():
+    idx = RefIndex(max_snapshots=2)
+    for i in range(3):
+        idx.remember("s", {}, f"snap_{i}", [{"ref_id": f"snap_{i}:e1"}])
+    assert idx.lookup("snap_0:e1") is None
+    assert idx.lookup("snap_2:e1") is not None
+
+
+# ---------------------------------------------------------------------------
+# Against the daemon
+# ---------------------------------------------------------------------------
+
+PAGE = _inline(
+    "<button id='go' onclick=\"document.title='clicked'\">Go</button>"
+    "<button>Other</button>"
+)
+
+
+def test_click_stale_ref_after_reload_is_remapped():
+    with BrowserClient(base_url=BASE_URL, retry=True) as c:
+        sess = c.sessions.create(profile="e2e-retry-test", headless=True)
+        try:
+            sess.navigate(PAGE)
+            snap = sess.snapshot_map()
+            ref = next(e.ref_id for e in snap.elements if e.text == "Go")
+            sess.navigate(PAGE)                    # bumps page_rev → ref is stale
+            sess.click(ref_id=ref)
+            assert sess.eval("document.title").result == "clicked"
+            assert c.metrics.stale_ref_remaps == 1
+        finally:
+            sess.close()
@@ -0,0 +1,204 @@
+"""
+E2E tests — SDK response decoding (decoder="auto"/"json"/"orjson", trusted=True, lazy=True)
+  - validated path decodes straight from bytes (model_validate_json)
+  - trusted path builds nested models without validation
+  - lazy path leaves large list fields as LazyModelList
+Requires: daemon running on localhost:19315 (decode-only tests need no daemon)
+Run: pytest tests/e2e/test_sdk_decode.py -v
+"""
+
+import base64
+import json
+import os
+import sys
+
+import pytest
+from pydantic import ValidationError
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../sdk/python"))
+
+from agentmb import BrowserClient, ElementMapResult, LazyModelList, SnapshotMapResult
+from agentmb._decode import construct, decode, get_loads
+from agentmb.models import ActionResult, AuditEntry, ElementInfo, PageInfo
+
+BASE_URL = f"http://127.0.0.1:{os.environ.get('AGENTMB_PORT', '19315')}"
+TEST_PROFILE = "e2e-decode-test"
+
+
+def _inline(html: str) -> str:
+    """Encode HTML as a data: URL."""
+    encoded = base64.b64encode(html.encode()).decode()
+    return f"data:text/html;base64,{encoded}"
+
+
+PAGE = _inline(
+    "<button id='b'>Go</button><a href='#x'>Link</a>"
+    "<input id='q' placeholder='Search'><select><option>one</option></select>"
+)
+
+ELEMENT_MAP_BODY = json.dumps({
+    "status": "ok",
+    "url": "https://example.com/",
+    "elements": [
+        {"element_id": "e1", "tag": "button", "role": "button", "text": "Go", "name": "",
+         "placeholder": "", "href": "", "type": "submit", "overlay_blocked": False,
+         "rect": {"x": 1, "y": 2, "width": 30, "height": 10}, "label": "Go", "label_source": "text"},
+        {"element_id": "e2", "tag": "a", "role": "link", "text": "Link", "name": "",
+         "placeholder": "", "href": "#x", "type": "", "overlay_blocked": False,
+         "rect": {"x": 1, "y": 20, "width": 30, "height": 10}},
+    ],
+    "count": 2,
+    "duration_ms": 5,
+}).encode()
+
+
+# ---------------------------------------------------------------------------
+# Decode helpers (no daemon needed)
+# ---------------------------------------------------------------------------
+
+def test_get_loads_modes():
+    assert get_loads("json") is json.loads
+    assert get_loads("auto")(b'{"a": 1}') == {"a": 1}
+    with pytest.raises(ValueError):
+        get_loads("yaml")
+
+
+def test_orjson_decoder_requires_orjson():
+    try:
+        import orjson  # noqa: F401
+        assert get_loads("orjson") is orjson.loads
+    except ImportError:
+        with pytest.raises(ImportError, match="agentmb\\[fast\\]"):
+            get_loads("orjson")
+
+
+def test_trusted_matches_validated():
+    validated = decode(ElementMapResult, ELEMENT_MAP_BODY, json.loads, False)
+    trusted = decode(ElementMapResult, ELEMENT_MAP_BODY, json.loads, True)
+    assert trusted == validated
+    assert trusted.model_dump() == validated.model_dump()
+    assert isinstance(trusted.elements[0], ElementInfo)
+    assert trusted.elements[1].rect.y == 20
+
+
+def test_trusted_fills_defaults_and_fields_set():
+    trusted = decode(ElementMapResult, ELEMENT_MAP_BODY, json.loads, True)
+    el = trusted.elements[1]
+    assert el.label == ""
+    assert el.label_source == "none"
+    assert "label" not in el.model_fields_set
+    assert "label" in trusted.elements[0].model_fields_set
+
+
+def test_trusted_drops_unknown_keys():
+    r = construct(ActionResult, {"status": "ok", "duration_ms": 3, "from_newer_daemon": True})
+    assert r == ActionResult(status="ok", duration_ms=3)
+    assert not hasattr(r, "from_newer_daemon")
+
+
+def test_trusted_optional_nested_none():
+    entry = construct(AuditEntry, {"v": 1, "ts": "t", "id": "a", "type": "action", "session_id": "s",
+                                   "action": "click", "params": None})
+    assert entry.params is None
+
+
+def test_dict_model_passes_through():
+    assert decode(dict, b'{"x": [1, 2]}', json.loads, False) == {"x": [1, 2]}
+
+
+@pytest.mark.parametrize("trusted", [False, True])
+def test_lazy_list_builds_on_access(trusted):
+    result = decode(ElementMapResult, ELEMENT_MAP_BODY, json.loads, trusted, lazy=True)
+    elements = result.elements
+    assert isinstance(elements, LazyModelList)
+    assert len(elements) == 2 and elements.built_count == 0
+    assert elements[-1].rect.y == 20
+    assert elements.built_count == 1
+    assert elements[1] is elements[-1]
+    assert isinstance(elements[0], ElementInfo)
+    assert elements.raw[0]["element_id"] == "e1"
+
+
+def test_lazy_list_slicing_and_iteration():
+    elements = decode(ElementMapResult, ELEMENT_MAP_BODY, json.loads, False, lazy=True).elements
+    head = elements[:1]
+    assert isinstance(head, LazyModelList) and len(head) == 1
+    assert [e.element_id for e in elements] == ["e1", "e2"]
+    assert [e.element_id for e in elements[::-1]] == ["e2", "e1"]
+    assert elements[0] in elements
+    with pytest.raises(IndexError):
+        elements[5]
+
+
+def test_lazy_result_equals_and_dumps_like_eager():
+    eager = decode(ElementMapResult, ELEMENT_MAP_BODY, json.loads, False)
+    lazy = decode(ElementMapResult, ELEMENT_MAP_BODY, json.loads, False, lazy=True)
+    assert lazy == eager
+    assert lazy.model_dump_json() == eager.model_dump_json()
+    assert lazy.model_dump() == eager.model_dump()
+
+
+def test_lazy_validation_error_on_access():
+    body = json.dumps({"status": "ok", "url": "u", "count": 1, "duration_ms": 1,
+                       "elements": [{"element_id": "e1"}]}).encode()
+    result = decode(ElementMapResult, body, json.loads, False, lazy=True)
+    with pytest.raises(ValidationError):
+        result.elements[0]
+
+
+def test_lazy_ignores_models_without_lists():
+    body = b'{"page_id": "p1", "url": "about:blank", "active": true}'
+    assert isinstance(decode(PageInfo, body, json.loads, False, lazy=True), PageInfo)
+
+
+# ---------------------------------------------------------------------------
+# Against the daemon
+# ---------------------------------------------------------------------------
+
+@pytest.fixture(scope="module")
+def clients():
+    with BrowserClient(base_url=BASE_URL) as validated, \
+         BrowserClient(base_url=BASE_URL, trusted=True) as trusted:
+        yield validated, trusted
+
+
+@pytest.fixture(scope="module")
+def session_id(clients):
+    validated, _ = clients
+    sess = validated.sessions.create(profile=TEST_PROFILE, headless=True)
+    sess.navigate(PAGE)
+    yield sess.id
+    sess.close()
+
+
+def test_element_map_trusted_equals_validated(clients, session_id):
+    validated, trusted = clients
+    a = validated.sessions.get_handle(session_id).element_map()
+    b = trusted.sessions.get_handle(session_id).element_map()
+    assert isinstance(b, ElementMapResult)
+    assert [e.tag for e in a.elements] == [e.tag for e in b.elements]
+    assert [e.rect.width for e in a.elements] == [e.rect.width for e in b.elements]
+
+
+def test_snapshot_map_trusted(clients, session_id):
+    _, trusted = clients
+    snap = trusted.sessions.get_handle(session_id).snapshot_map()
+    assert isinstance(snap, SnapshotMapResult)
+    assert snap.elements and snap.elements[0].ref_id.startswith(snap.snapshot_id)
+
+
+def test_json_decoder_client(session_id):
+    with BrowserClient(base_url=BASE_URL, decoder="json", trusted=True) as c:
+        assert c.health().status == "ok"
+        assert c.sessions.get_handle(session_id).element_map().count >= 1
+
+
+def test_lazy_client_results(session_id):
+    with BrowserClient(base_url=BASE_URL, lazy=True) as c:
+        sess = c.sessions.get_handle(session_id)
+        em = sess.element_map()
+        assert isinstance(em.elements, LazyModelList)
+        assert em.elements[0].element_id
+        logs = sess.logs(tail=5)
+        assert isinstance(logs, LazyModelList)
+        assert all(isinstance(e, AuditEntry) for e in logs)
@@ -0,0 +1,71 @@
+"""
+E2E tests — lazy public names in the agentmb package (PEP 562) and the
+import-time budget check (agentmb._bench.import_time)
+Requires: nothing (no daemon)
+Run: pytest tests/e2e/test_sdk_import.py -v
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+SDK_DIR = os.path.join(os.path.dirname(__file__), "../../sdk/python")
+sys.path.insert(0, SDK_DIR)
+
+import agentmb
+
+
+def _fresh(code: str) -> str:
+    env = dict(os.environ, PYTHONPATH=os.path.abspath(SDK_DIR))
+    return subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, env=env, check=True).stdout
+
+
+def test_bare_import_loads_no_dependencies():
+    out = _fresh(
+        "import sys, agentmb\n"
+        "print(sorted(m for m in ('httpx', 'pydantic', 'agentmb.client', 'agentmb.models') if m in sys.modules))"
+    )
+    assert out.strip() == "[]"
+
+
+def test_model_access_does_not_load_client():
+    out = _fresh(
+        "import sys\n"
+        "from agentmb import ElementInfo\n"
+        "print(ElementInfo.__name__, 'httpx' in sys.modules, 'agentmb.client' in sys.modules)"
+    )
+    assert out.split() == ["ElementInfo", "False", "False"]
+
+
+def test_version_is_a_plain_constant():
+    out = _fresh("import sys, agentmb; print(agentmb.__version__, 'httpx' in sys.modules)")
+    assert out.split() == ["0.3.1", "False"]
+    assert "__version__" in vars(agentmb)
+
+
+def test_every_public_name_resolves():
+    for name in agentmb.__all__:
+        assert getattr(agentmb, name) is not None, name
+    assert set(agentmb.__all__) <= set(dir(agentmb))
+
+
+def test_lazy_name_is_cached_and_identical():
+    from agentmb.client import AsyncBrowserClient
+
+    assert agentmb.AsyncBrowserClient is AsyncBrowserClient
+    assert "AsyncBrowserClient" in vars(agentmb)
+
+
+def test_unknown_name_raises_attribute_error():
+    with pytest.raises(AttributeError):
+        agentmb.NoSuchThing
+    with pytest.raises(ImportError):
+        exec("from agentmb import NoSuchThing", {})
+
+
+def test_import_time_budget():
+    from agentmb._bench import import_time
+
+    assert import_time.main(["--runs", "1", "--budget-ms", "200"]) == 0
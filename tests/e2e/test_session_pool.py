@@ -0,0 +1,291 @@
+"""
+E2E tests — warm session pools (SessionPool / AsyncSessionPool)
+  - checkout/checkin reuse, reset between uses, max size + waiting,
+    idle eviction, health checks, discard on error
+Requires: daemon running on localhost:19315 (bookkeeping tests use an
+          in-process stand-in client and need no daemon)
+Run: pytest tests/e2e/test_session_pool.py -v
+"""
+
+import asyncio
+import base64
+import itertools
+import os
+import sys
+import threading
+import time
+
+import httpx
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../sdk/python"))
+
+from agentmb import AsyncBrowserClient, AsyncSessionPool, BrowserClient, SessionPool
+
+BASE_URL = f"http://127.0.0.1:{os.environ.get('AGENTMB_PORT', '19315')}"
+
+
+def _inline(html: str) -> str:
+    """Encode HTML as a data: URL."""
+    encoded = base64.b64encode(html.encode()).decode()
+    return f"data:text/html;base64,{encoded}"
+
+
+# ---------------------------------------------------------------------------
+# Stand-in client (pool bookkeeping only)
+# ---------------------------------------------------------------------------
+
+class _Info:
+    def __init__(self, state):
+        self.state = state
+
+
+class _StubSession:
+    def __init__(self, sid, registry):
+        self.id = sid
+        self._registry = registry
+        self.resets = 0
+
+    def close(self):
+        self._registry.pop(self.id, None)
+
+
+class _StubSessions:
+    def __init__(self):
+        self.live = {}
+        self.states = {}          # per-session state override (default "live")
+        self.get_error = None     # raised by get() when set
+        self.create_delay = 0.0
+        self.peak = 0
+        self.created_with = []
+        self._ids = itertools.count(1)
+
+    def create(self, **kwargs):
+        self.created_with.append(kwargs)
+        time.sleep(self.create_delay)
+        s = _StubSession(f"s{next(self._ids)}", self.live)
+        self.live[s.id] = s
+        self.peak = max(self.peak, len(self.live))
+        return s
+
+    def get(self, sid):
+        if self.get_error is not None:
+            raise self.get_error
+        return _Info(self.states.get(sid, "live") if sid in self.live else "zombie")
+
+
+class _StubClient:
+    def __init__(self):
+        self.sessions = _StubSessions()
+
+
+def _count_reset(sess):
+    sess.resets += 1
+
+
+def test_pool_reuses_and_resets():
+    client = _StubClient()
+    with SessionPool(client, size=2, reset=_count_reset) as pool:
+        assert pool.stats()["idle"] == 2
+        with pool.checkout() as a:
+            pass
+        with pool.checkout() as b:
+            pass
+        assert a is b and a.resets == 2
+        assert pool.stats()["created"] == 2
+        assert pool.stats()["reused"] == 2
+    assert client.sessions.live == {}
+    assert all(kw["ephemeral"] for kw in client.sessions.created_with)
+    assert len({kw["profile"] for kw in client.sessions.created_with}) == 2
+
+
+def _fake_daemon(calls):
+    """MockTransport handler answering the routes the default async reset uses."""
+    ids = itertools.count(1)
+
+    def handler(request):
+        path = request.url.path
+        calls.append((request.method, path))
+        if request.method == "POST" and path == "/api/v1/sessions":
+            return httpx.Response(201, json={"session_id": f"s{next(ids)}", "profile": "p", "headless": True,
+                                             "created_at": "t"})
+        sid = path.split("/")[4]
+        if path.endswith("/pages"):
+            return httpx.Response(200, json={"session_id": sid,
+                                             "pages": [{"page_id": "p1", "url": "about:blank", "active": True}]})
+        if path.endswith("/navigate"):
+            return httpx.Response(200, json={"status": "ok", "url": "about:blank", "title": "", "duration_ms": 1})
+        if request.method == "DELETE":
+            return httpx.Response(200, json={"status": "ok"})
+        return httpx.Response(200, json={"session_id": sid, "profile": "p", "headless": True,
+                                         "created_at": "t", "state": "live"})
+
+    return handler
+
+
+def test_async_pool_reuses_with_default_reset():
+    calls = []
+
+    async def _run():
+        client = AsyncBrowserClient(base_url="http://agentmb.test")
+        client._http = httpx.AsyncClient(base_url="http://agentmb.test",
+                                         transport=httpx.MockTransport(_fake_daemon(calls)))
+        async with client:
+            async with AsyncSessionPool(client, size=1) as pool:
+                async with pool.checkout() as a:
+                    pass
+                async with pool.checkout() as b:
+                    pass
+                return a is b, pool.stats()
+
+    same, stats = asyncio.run(_run())
+    assert same and stats["created"] == 1 and stats["reused"] == 2
+    assert stats["discarded"] == 0 and stats["reset_failed"] == 0
+    cleared = {p.rsplit("/", 1)[1] for m, p in calls if m == "DELETE" and p.count("/") == 5}
+    assert cleared == {"cookies", "console", "page_errors", "dialogs"}
+
+
+def test_pool_grows_to_max_size_then_waits():
+    client = _StubClient()
+    pool = SessionPool(client, size=0, max_size=2, reset=_count_reset, acquire_timeout=0.2)
+    a, b = pool.acquire(), pool.acquire()
+    assert pool.stats()["in_use"] == 2
+    with pytest.raises(TimeoutError):
+        pool.acquire()
+
+    threading.Timer(0.05, pool.release, args=(a,)).start()
+    pool.acquire_timeout = 2
+    t0 = time.monotonic()
+    c = pool.acquire()
+    assert c is a and time.monotonic() - t0 < 1.5
+    pool.release(b)
+    pool.release(c)
+    pool.close()
+
+
+def test_pool_discards_on_error_and_failed_reset():
+    client = _StubClient()
+
+    def bad_reset(sess):
+        raise RuntimeError("reset failed")
+
+    with SessionPool(client, size=1, reset=_count_reset) as pool:
+        with pytest.raises(ValueError):
+            with pool.checkout() as sess:
+                raise ValueError("task failed")
+        assert sess.id not in client.sessions.live
+        assert pool.stats()["discarded"] == 1
+
+    with SessionPool(client, size=1, reset=bad_reset) as pool:
+        with pytest.warns(RuntimeWarning, match="reset failed"):
+            with pool.checkout() as sess:
+                pass
+        assert sess.id not in client.sessions.live
+        assert pool.stats()["reset_failed"] == 1
+
+
+def test_pool_health_check_replaces_dead_session():
+    client = _StubClient()
+    with SessionPool(client, size=1, reset=_count_reset) as pool:
+        dead = pool._state.idle[0].session
+        client.sessions.live.pop(dead.id)         # daemon lost it
+        with pool.checkout() as sess:
+            assert sess is not dead
+        assert pool.stats()["unhealthy"] == 1
+
+
+def test_pool_health_check_error_keeps_slot():
+    client = _StubClient()
+    with SessionPool(client, size=1, max_size=1, reset=_count_reset, acquire_timeout=0.2) as pool:
+        idle = pool._state.idle[0].session
+        client.sessions.get_error = RuntimeError("daemon busy")
+        with pytest.raises(RuntimeError):
+            pool.acquire()
+        assert pool.stats()["in_use"] == 0 and pool.stats()["idle"] == 1
+        client.sessions.get_error = None
+        with pool.checkout() as sess:
+            assert sess is idle
+
+
+def test_pool_concurrent_acquire_respects_max_size():
+    client = _StubClient()
+    client.sessions.create_delay = 0.02
+    pool = SessionPool(client, size=0, max_size=2, reset=_count_reset, acquire_timeout=5)
+
+    def task():
+        for _ in range(5):
+            with pool.checkout():
+                time.sleep(0.002)
+
+    threads = [threading.Thread(target=task) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    pool.close()
+    assert client.sessions.peak <= 2 and pool.stats()["created"] == 2
+
+
+def test_pool_reuses_hibernated_session():
+    client = _StubClient()
+    with SessionPool(client, size=1, reset=_count_reset) as pool:
+        idle = pool._state.idle[0].session
+        client.sessions.states[idle.id] = "hibernated"   # daemon hibernated it while idle
+        with pool.checkout() as sess:
+            assert sess is idle
+        assert pool.stats()["unhealthy"] == 0 and pool.stats()["created"] == 1
+
+
+def test_pool_idle_eviction_keeps_size():
+    client = _StubClient()
+    with SessionPool(client, size=1, max_size=3, idle_timeout=0.05, reset=_count_reset) as pool:
+        held = [pool.acquire() for _ in range(3)]
+        for s in held:
+            pool.release(s)
+        assert pool.stats()["idle"] == 3
+        time.sleep(0.1)
+        assert pool.evict_idle() == 2
+        assert pool.stats()["idle"] == 1
+        assert len(client.sessions.live) == 1
+
+
+def test_closed_pool_rejects_acquire_and_closes_returns():
+    client = _StubClient()
+    pool = SessionPool(client, size=1, reset=_count_reset).warm()
+    sess = pool.acquire()
+    pool.close()
+    with pytest.raises(RuntimeError):
+        pool.acquire()
+    pool.release(sess)
+    assert client.sessions.live == {}
+
+
+# ---------------------------------------------------------------------------
+# Against the daemon
+# ---------------------------------------------------------------------------
+
+def test_sync_pool_resets_between_uses():
+    with BrowserClient(base_url=BASE_URL) as client, SessionPool(client, size=1, headless=True) as pool:
+        with pool.checkout() as sess:
+            first_id = sess.id
+            sess.navigate(_inline("<script>console.log('from task 1')</script>"))
+            sess.eval("document.cookie = 'k=v'")
+            sess.new_page()
+        with pool.checkout() as sess:
+            assert sess.id == first_id
+            assert sess.eval("location.href").result == "about:blank"
+            assert sess.console_log().count == 0
+            assert len(sess.pages().pages) == 1
+
+
+async def test_async_pool_checkout_concurrently():
+    async with AsyncBrowserClient(base_url=BASE_URL) as client:
+        async with AsyncSessionPool(client, size=2, max_size=2, headless=True) as pool:
+            async def task(i):
+                async with pool.checkout() as sess:
+                    await sess.navigate(_inline(f"<title>t{i}</title>"))
+                    return sess.id
+
+            ids = await asyncio.gather(*(task(i) for i in range(4)))
+            assert len(set(ids)) <= 2
+            assert pool.stats()["created"] == 2
@@ -0,0 +1,97 @@
+"""
+E2E tests — shared-browser mode for ephemeral sessions (AGENTMB_SHARED_CONTEXTS)
+  - ephemeral sessions are packed N per browser process
+  - contexts in one browser stay isolated (cookies, storage)
+  - emptied browsers are closed, the last one per combination is kept
+  - profile sessions still get a browser of their own
+Starts its own daemon on port 19319 with AGENTMB_SHARED_CONTEXTS=2.
+Run: pytest tests/e2e/test_shared_contexts.py -v
+"""
+
+import os
+import signal
+import subprocess
+import sys
+import time
+
+import httpx
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../sdk/python"))
+
+from agentmb import BrowserClient
+from agentmb._bench.density import tree_memory
+
+SHARED_PORT = 19319
+SHARED_DATA_DIR = "/tmp/agentmb-shared-test"
+SHARED_BASE = f"http://127.0.0.1:{SHARED_PORT}"
+DAEMON_BIN = os.path.join(os.path.dirname(__file__), "../../dist/daemon/index.js")
+
+
+def _shared():
+    return httpx.get(f"{SHARED_BASE}/api/v1/status").json()["shared_browsers"]
+
+
+@pytest.fixture(scope="module")
+def client():
+    env = {
+        **os.environ,
+        "AGENTMB_PORT": str(SHARED_PORT),
+        "AGENTMB_DATA_DIR": SHARED_DATA_DIR,
+        "AGENTMB_SHARED_CONTEXTS": "2",
+    }
+    env.pop("AGENTMB_API_TOKEN", None)
+    proc = subprocess.Popen(["node", DAEMON_BIN], env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.time() + 8
+    while time.time() < deadline:
+        try:
+            if httpx.get(f"{SHARED_BASE}/health", timeout=1).status_code == 200:
+                break
+        except Exception:
+            pass
+        time.sleep(0.2)
+    else:
+        proc.terminate()
+        proc.wait()
+        pytest.skip("Shared-mode daemon failed to start — skipping shared context tests")
+    with BrowserClient(base_url=SHARED_BASE) as c:
+        yield c
+    proc.send_signal(signal.SIGTERM)
+    proc.wait(timeout=30)
+
+
+def test_ephemeral_sessions_share_browsers(client):
+    sessions = [client.sessions.create(profile=f"e2e-shared-{i}", ephemeral=True) for i in range(3)]
+    try:
+        assert _shared() == {"contexts_per_browser": 2, "browsers": 2, "contexts": 3}
+
+        a, b = sessions[0], sessions[1]               # same browser process
+        for s in (a, b):
+            s.navigate("https://example.com")
+        a.add_cookies([{"name": "who", "value": "a", "url": "https://example.com"}])
+        assert [c["name"] for c in a.cookies().cookies] == ["who"]
+        assert b.cookies().count == 0
+        a.eval("localStorage.setItem('k', 'a')")
+        assert b.eval("localStorage.getItem('k')").result is None
+    finally:
+        for s in sessions:
+            s.close()
+    time.sleep(0.5)
+    assert _shared() == {"contexts_per_browser": 2, "browsers": 1, "contexts": 0}
+
+
+def test_profile_sessions_are_not_shared(client):
+    sess = client.sessions.create(profile="e2e-shared-profile")
+    try:
+        assert _shared()["contexts"] == 0
+        sess.navigate("data:text/html,<title>own</title>")
+        assert sess.eval("document.title").result == "own"
+    finally:
+        sess.close()
+
+
+def test_tree_memory_counts_this_process():
+    if not os.path.isdir("/proc"):
+        pytest.skip("needs /proc")
+    used, procs, kind = tree_memory(os.getpid())
+    assert used > 0 and procs >= 1 and kind in ("pss", "rss")
@@ -0,0 +1,124 @@
+"""
+E2E tests — opt-in per-phase timings (X-Agentmb-Timings / timings=True)
+  - no timings unless the request asks for them
+  - stability, policy and execute phases land in the right buckets
+  - Server-Timing header mirrors the body; SDK hooks see it as event.timings
+  - action audit entries of timed requests carry the phase breakdown
+Requires: daemon running on localhost:19315 (Server-Timing parsing needs no daemon)
+Run: pytest tests/e2e/test_timings.py -v
+"""
+
+import base64
+import os
+import sys
+
+import httpx
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../sdk/python"))
+
+from agentmb import BrowserClient, ClientHook
+from agentmb.client import Session
+from agentmb.instrument import parse_server_timing
+
+BASE_URL = f"http://127.0.0.1:{os.environ.get('AGENTMB_PORT', '19315')}"
+
+PHASES = {"policy_ms", "resolve_target_ms", "stability_pre_ms", "stability_post_ms",
+          "audit_ms", "execute_ms", "overhead_ms", "total_ms"}
+
+
+def _inline(html: str) -> str:
+    """Encode HTML as a data: URL."""
+    encoded = base64.b64encode(html.encode()).decode()
+    return f"data:text/html;base64,{encoded}"
+
+
+def _headers(timings: bool = True) -> dict:
+    token = os.environ.get("AGENTMB_API_TOKEN")
+    h = {"x-api-token": token} if token else {}
+    if timings:
+        h["x-agentmb-timings"] = "1"
+    return h
+
+
+@pytest.fixture(scope="module")
+def client():
+    with BrowserClient(base_url=BASE_URL) as c:
+        yield c
+
+
+@pytest.fixture(scope="module")
+def session(client):
+    sess = client.sessions.create(profile="e2e-timings", headless=True)
+    sess.set_policy("disabled")
+    sess.navigate(_inline("<button id='go' onclick='this.textContent=\"done\"'>go</button>"))
+    yield sess
+    sess.close()
+
+
+def _click(session, timings=True, **body):
+    return httpx.post(
+        f"{BASE_URL}/api/v1/sessions/{session.id}/click",
+        json={"selector": "#go", **body},
+        headers=_headers(timings),
+    )
+
+
+def test_parse_server_timing():
+    assert parse_server_timing("policy;dur=0, execute;dur=41.5,total;desc=x;dur=50") == {
+        "policy": 0.0, "execute": 41.5, "total": 50.0,
+    }
+    assert parse_server_timing(None) is None
+    assert parse_server_timing("cache;desc=hit") is None
+
+
+def test_timings_are_opt_in(session):
+    resp = _click(session, timings=False)
+    assert resp.status_code == 200
+    assert "timings" not in resp.json() and "server-timing" not in resp.headers
+
+
+def test_stability_waits_are_separated(session):
+    resp = _click(session, stability={"wait_before_ms": 200, "wait_after_ms": 100})
+    assert resp.status_code == 200
+    t = resp.json()["timings"]
+    assert set(t) == PHASES
+    assert t["stability_pre_ms"] >= 190 and t["stability_post_ms"] >= 90
+    assert t["execute_ms"] < t["stability_pre_ms"] + 1000
+    inner = sum(t[k] for k in PHASES - {"total_ms"})
+    assert abs(t["total_ms"] - inner) < 2
+    header = parse_server_timing(resp.headers["server-timing"])
+    assert header["stability_pre"] >= 190 and header["total"] >= t["total_ms"]
+
+
+def test_policy_sleep_is_attributed(session):
+    session.set_policy("safe", allow_sensitive_actions=True)
+    try:
+        resp = _click(session)
+        t = resp.json()["timings"]
+        assert t["policy_ms"] >= 100                   # safe profile jitter is 100-300 ms
+        assert t["execute_ms"] < t["total_ms"] - t["policy_ms"] + 1
+    finally:
+        session.set_policy("disabled")
+
+
+def test_error_responses_carry_timings(session):
+    resp = _click(session, selector="#missing", timeout_ms=300)
+    assert resp.status_code == 422
+    assert resp.json()["timings"]["execute_ms"] >= 250
+
+
+def test_sdk_hook_and_audit_entry(session):
+    seen = []
+
+    class Hook(ClientHook):
+        def on_request_end(self, event):
+            seen.append(event)
+
+    with BrowserClient(base_url=BASE_URL, timings=True, hooks=[Hook()]) as c:
+        Session(session.id, c).click("#go")
+    assert seen[-1].timings is not None and seen[-1].timings["execute"] > 0
+
+    entry = [e for e in session.logs(tail=10) if e.type == "action" and e.action == "click"][-1]
+    assert entry.timings is not None
+    assert {"policy_ms", "resolve_target_ms", "execute_ms"} <= set(entry.timings)
@@ -0,0 +1,143 @@
+"""
+E2E tests — pooled / shared SDK transport (TransportConfig, SharedTransport)
+           and the Unix domain socket transport (AGENTMB_SOCKET / transport="uds")
+Requires: daemon running on localhost:19315 (UDS tests: started with AGENTMB_SOCKET=1)
+Run: pytest tests/e2e/test_transport.py -v
+"""
+
+import asyncio
+import base64
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../sdk/python"))
+
+from agentmb import AsyncBrowserClient, BrowserClient, SharedTransport, TransportConfig
+from agentmb.transport import default_socket_path
+
+BASE_URL = f"http://127.0.0.1:{os.environ.get('AGENTMB_PORT', '19315')}"
+SOCKET_PATH = default_socket_path()
+
+needs_socket = pytest.mark.skipif(
+    not os.path.exists(SOCKET_PATH), reason=f"daemon socket not found at {SOCKET_PATH} (start with AGENTMB_SOCKET=1)"
+)
+
+
+# ---------------------------------------------------------------------------
+# Config (no daemon needed)
+# ---------------------------------------------------------------------------
+
+def test_transport_config_limits():
+    cfg = TransportConfig(max_connections=64, max_keepalive_connections=32, keepalive_expiry=10.0)
+    limits = cfg.limits()
+    assert limits.max_connections == 64
+    assert limits.max_keepalive_connections == 32
+    assert limits.keepalive_expiry == 10.0
+
+
+def test_transport_rejects_unknown_type():
+    with pytest.raises(TypeError):
+        BrowserClient(base_url=BASE_URL, transport=object())
+
+
+def test_http2_without_h2_raises_helpful_error():
+    try:
+        import h2  # noqa: F401
+        pytest.skip("h2 installed")
+    except ImportError:
+        pass
+    with pytest.raises(ImportError, match="agentmb\\[http2\\]"):
+        BrowserClient(base_url=BASE_URL, transport=TransportConfig(http2=True))
+
+
+def test_unknown_transport_name_rejected():
+    with pytest.raises(ValueError):
+        BrowserClient(base_url=BASE_URL, transport="carrier-pigeon")
+
+
+def test_default_socket_path_follows_env(monkeypatch, tmp_path):
+    monkeypatch.delenv("AGENTMB_SOCKET", raising=False)
+    monkeypatch.setenv("AGENTMB_DATA_DIR", str(tmp_path))
+    assert default_socket_path() == str(tmp_path / "agentmb.sock")
+    monkeypatch.setenv("AGENTMB_SOCKET", "/tmp/custom.sock")
+    assert default_socket_path() == "/tmp/custom.sock"
+    monkeypatch.setenv("AGENTMB_SOCKET", "1")
+    assert default_socket_path() == str(tmp_path / "agentmb.sock")
+
+
+# ---------------------------------------------------------------------------
+# Against the daemon
+# ---------------------------------------------------------------------------
+
+def test_sync_client_with_transport_config():
+    with BrowserClient(base_url=BASE_URL, transport=TransportConfig(max_keepalive_connections=4)) as c:
+        assert c.health().status == "ok"
+
+
+def test_shared_transport_survives_client_close():
+    """Closing one client must not close the pool the other client uses."""
+    with SharedTransport(TransportConfig()) as shared:
+        a = BrowserClient(base_url=BASE_URL, transport=shared)
+        b = BrowserClient(base_url=BASE_URL, transport=shared)
+        assert a.health().status == "ok"
+        a.close()
+        assert b.health().status == "ok"
+        b.close()
+
+
+async def test_async_concurrent_requests_with_per_host_limit():
+    cfg = TransportConfig(max_connections=8, max_keepalive_connections=8, max_connections_per_host=2)
+    async with AsyncBrowserClient(base_url=BASE_URL, transport=cfg) as c:
+        results = await asyncio.gather(*(c.health() for _ in range(20)))
+    assert all(r.status == "ok" for r in results)
+
+
+async def test_async_shared_transport():
+    shared = SharedTransport(TransportConfig(max_keepalive_connections=16))
+    try:
+        clients = [AsyncBrowserClient(base_url=BASE_URL, transport=shared) for _ in range(3)]
+        results = await asyncio.gather(*(c.health() for c in clients for _ in range(5)))
+        assert len(results) == 15
+        for c in clients:
+            await c.close()
+    finally:
+        await shared.aclose()
+
+
+# ---------------------------------------------------------------------------
+# Unix domain socket
+# ---------------------------------------------------------------------------
+
+@needs_socket
+def test_uds_socket_is_owner_only():
+    assert os.stat(SOCKET_PATH).st_mode & 0o077 == 0
+
+
+@needs_socket
+def test_uds_health():
+    with BrowserClient(base_url=BASE_URL, transport="uds", socket_path=SOCKET_PATH) as c:
+        assert c.health().status == "ok"
+
+
+@needs_socket
+def test_uds_session_shared_with_tcp():
+    """A session created over TCP is drivable over the socket (same daemon state)."""
+    with BrowserClient(base_url=BASE_URL) as tcp, \
+            BrowserClient(base_url=BASE_URL, transport="uds", socket_path=SOCKET_PATH) as uds:
+        sess = tcp.sessions.create(profile="e2e-uds-test", ephemeral=True)
+        try:
+            sess.navigate("data:text/html;base64," + base64.b64encode(b"<button id=b>go</button>").decode())
+            handle = uds.sessions.get_handle(sess.id)
+            assert handle.page_rev().page_rev == sess.page_rev().page_rev
+            assert handle.click("#b").status == "ok"
+        finally:
+            sess.close()
+
+
+@needs_socket
+async def test_uds_async_client():
+    async with AsyncBrowserClient(base_url=BASE_URL, transport="uds", socket_path=SOCKET_PATH) as c:
+        results = await asyncio.gather(*(c.health() for _ in range(10)))
+    assert all(r.status == "ok" for r in results)
@@ -0,0 +1,119 @@
+"""
+E2E tests — warm browser pool (AGENTMB_WARM_POOL)
+  - pool fills in the background after startup
+  - ephemeral creates claim a warm context (hit) and the pool refills
+  - creates the pool cannot serve are not counted
+  - shutdown closes idle warm browsers and removes their temp dirs
+Starts its own daemon on port 19318 with AGENTMB_WARM_POOL=chromium:headless=2.
+Run: pytest tests/e2e/test_warm_pool.py -v
+"""
+
+import glob
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+
+import httpx
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../sdk/python"))
+
+from agentmb import BrowserClient
+
+POOL_PORT = 19318
+POOL_DATA_DIR = "/tmp/agentmb-warm-pool-test"
+POOL_BASE = f"http://127.0.0.1:{POOL_PORT}"
+POOL_KEY = "chromium:headless"
+DAEMON_BIN = os.path.join(os.path.dirname(__file__), "../../dist/daemon/index.js")
+WARM_GLOB = os.path.join(tempfile.gettempdir(), "agentmb-eph-warm-*")
+
+
+def _pool():
+    return httpx.get(f"{POOL_BASE}/api/v1/status").json()["warm_pool"]
+
+
+def _wait_idle(n, timeout=30):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        pool = _pool()
+        if pool["idle"].get(POOL_KEY, 0) >= n:
+            return pool
+        time.sleep(0.2)
+    pytest.fail(f"warm pool did not reach {n} idle contexts: {_pool()}")
+
+
+@pytest.fixture(scope="module")
+def daemon():
+    env = {
+        **os.environ,
+        "AGENTMB_PORT": str(POOL_PORT),
+        "AGENTMB_DATA_DIR": POOL_DATA_DIR,
+        "AGENTMB_WARM_POOL": f"{POOL_KEY}=2",
+    }
+    env.pop("AGENTMB_API_TOKEN", None)
+    proc = subprocess.Popen(["node", DAEMON_BIN], env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    deadline = time.time() + 8
+    while time.time() < deadline:
+        try:
+            if httpx.get(f"{POOL_BASE}/health", timeout=1).status_code == 200:
+                break
+        except Exception:
+            pass
+        time.sleep(0.2)
+    else:
+        proc.terminate()
+        proc.wait()
+        pytest.skip("Warm pool daemon failed to start — skipping warm pool tests")
+    yield proc
+    if proc.poll() is None:
+        proc.send_signal(signal.SIGTERM)
+        proc.wait(timeout=30)
+
+
+@pytest.fixture(scope="module")
+def client(daemon):
+    with BrowserClient(base_url=POOL_BASE) as c:
+        yield c
+
+
+def test_pool_fills_after_startup(client):
+    pool = _wait_idle(2)
+    assert pool["sizes"] == {POOL_KEY: 2}
+    assert pool["launched"] >= 2 and pool["hits"] == 0
+
+
+def test_ephemeral_create_claims_warm_context(client):
+    _wait_idle(2)
+    before = _pool()
+    sess = client.sessions.create(profile="e2e-warm", ephemeral=True, headless=True)
+    try:
+        assert _pool()["hits"] == before["hits"] + 1
+        sess.navigate("data:text/html,<title>warm</title>")
+        assert sess.eval("document.title").result == "warm"
+    finally:
+        sess.close()
+    pool = _wait_idle(2)                              # refilled in the background
+    assert pool["launched"] == before["launched"] + 1
+
+
+def test_unpoolable_creates_are_not_counted(client):
+    _wait_idle(2)
+    before = _pool()
+    sess = client.sessions.create(profile="e2e-warm-dl", ephemeral=True, headless=True, accept_downloads=True)
+    sess.close()
+    sess = client.sessions.create(profile="e2e-warm-profile", headless=True)
+    sess.close()
+    after = _pool()
+    assert (after["hits"], after["misses"]) == (before["hits"], before["misses"])
+    assert after["idle"][POOL_KEY] == 2
+
+
+def test_shutdown_closes_idle_contexts(daemon, client):
+    _wait_idle(2)
+    assert len(glob.glob(WARM_GLOB)) >= 2
+    daemon.send_signal(signal.SIGTERM)
+    daemon.wait(timeout=30)
+    assert glob.glob(WARM_GLOB) == []
@@ -0,0 +1,210 @@
+"""
+E2E tests — WebSocket command channel (GET /api/v1/ws, AsyncBrowserClient(websocket=True))
+  - masked framing round-trips; unknown WebSocket paths are refused
+  - upgrades from a web page (Origin header not allowed) are refused with 403
+  - concurrent commands share one connection and are matched by id (out of order)
+  - streaming routes are refused over the channel; the SDK sends them over HTTP
+  - AsyncSession actions, errors and audit entries behave as over HTTP
+  - a dropped channel fails in-flight requests and reconnects on the next one
+  - daemons without the channel (404 on upgrade) are served over plain HTTP
+Requires: daemon running on localhost:19315 (framing / fallback tests need no daemon)
+Run: pytest tests/e2e/test_ws_channel.py -v
+"""
+
+import asyncio
+import base64
+import json
+import os
+import sys
+
+import httpx
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "../../sdk/python"))
+
+from agentmb import AsyncBrowserClient
+from agentmb.channel import CommandChannel, CommandChannelTransport, _OP_BINARY, _frame, _mask
+
+BASE_URL = f"http://127.0.0.1:{os.environ.get('AGENTMB_PORT', '19315')}"
+
+
+def _inline(html: str) -> str:
+    """Encode HTML as a data: URL."""
+    encoded = base64.b64encode(html.encode()).decode()
+    return f"data:text/html;base64,{encoded}"
+
+
+def _headers() -> dict:
+    token = os.environ.get("AGENTMB_API_TOKEN")
+    return {"x-api-token": token} if token else {}
+
+
+def _channel_stats() -> dict:
+    return httpx.get(f"{BASE_URL}/api/v1/status", headers=_headers()).json()["command_channel"]
+
+
+async def _open_channel() -> CommandChannel:
+    return await CommandChannel.connect(httpx.URL(BASE_URL), _headers())
+
+
+# ---------------------------------------------------------------------------
+# Framing / fallback (no daemon needed)
+# ---------------------------------------------------------------------------
+
+def test_frame_is_masked_and_sized():
+    for size in (0, 125, 126, 70000):
+        payload = bytes(range(256)) * (size // 256) + bytes(size % 256)
+        frame = _frame(_OP_BINARY, payload)
+        assert frame[0] == 0x82 and frame[1] & 0x80
+        head = {0: 2, 125: 2, 126: 4, 70000: 10}[size]
+        key = frame[head:head + 4]
+        assert _mask(frame[head + 4:], key) == payload
+
+
+def test_refused_upgrade_falls_back_to_http():
+    async def old_daemon(reader, writer):
+        await reader.readuntil(b"\r\n\r\n")
+        writer.write(b"HTTP/1.1 404 Not Found\r\nContent-Length: 0\r\nConnection: close\r\n\r\n")
+        writer.close()
+
+    async def _run():
+        server = await asyncio.start_server(old_daemon, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        inner = httpx.MockTransport(lambda req: httpx.Response(200, json={"via": "http", "path": req.url.path}))
+        transport = CommandChannelTransport(inner)
+        async with httpx.AsyncClient(base_url=f"http://127.0.0.1:{port}", transport=transport) as c:
+            first = await c.get("/api/v1/sessions")
+            second = await c.post("/api/v1/sessions", json={})
+        server.close()
+        return first.json(), second.json(), transport.active
+
+    first, second, active = asyncio.run(_run())
+    assert first == {"via": "http", "path": "/api/v1/sessions"}
+    assert second["via"] == "http" and active is False
+
+
+# ---------------------------------------------------------------------------
+# Daemon protocol
+# ---------------------------------------------------------------------------
+
+def _upgrade_status(path: bytes, extra: bytes = b"") -> bytes:
+    async def _run():
+        reader, writer = await asyncio.open_connection("127.0.0.1", httpx.URL(BASE_URL).port)
+        writer.write(
+            b"GET " + path + b" HTTP/1.1\r\nHost: x\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+            b"Sec-WebSocket-Key: dGhlIHNhbXBsZSBub25jZQ==\r\nSec-WebSocket-Version: 13\r\n" + extra + b"\r\n"
+        )
+        head = await reader.readuntil(b"\r\n\r\n")
+        writer.close()
+        return head.split(b"\r\n")[0]
+
+    return asyncio.run(_run())
+
+
+def test_unknown_websocket_path_refused():
+    assert b" 404 " in _upgrade_status(b"/api/v1/nope")
+
+
+def test_cross_origin_upgrade_refused():
+    token = os.environ.get("AGENTMB_API_TOKEN", "").encode()
+    auth = b"X-API-Token: " + token + b"\r\n" if token else b""
+    assert b" 403 " in _upgrade_status(b"/api/v1/ws", b"Origin: https://evil.example\r\n" + auth)
+
+
+def test_commands_are_matched_by_id():
+    async def _run():
+        channel = await _open_channel()
+        try:
+            sess_status, _, body = await channel.request(
+                "POST", "/api/v1/sessions", {"content-type": "application/json"},
+                json.dumps({"profile": "e2e-ws-raw", "headless": True}).encode(),
+            )
+            assert sess_status == 201, body
+            sid = json.loads(body)["session_id"]
+            try:
+                slow = channel.request(
+                    "POST", f"/api/v1/sessions/{sid}/eval", {"content-type": "application/json"},
+                    json.dumps({"expression": "new Promise(r => setTimeout(() => r('slow'), 500))"}).encode(),
+                )
+                fast = channel.request("GET", f"/api/v1/sessions/{sid}", {}, b"")
+                done = []
+
+                async def track(name, coro):
+                    result = await coro
+                    done.append(name)
+                    return result
+
+                slow_res, fast_res = await asyncio.gather(track("slow", slow), track("fast", fast))
+                return slow_res, fast_res, done
+            finally:
+                await channel.request("DELETE", f"/api/v1/sessions/{sid}", {}, b"")
+        finally:
+            await channel.aclose()
+
+    slow, fast, done = asyncio.run(_run())
+    assert json.loads(slow[2])["result"] == "slow"
+    assert fast[0] == 200 and done == ["fast", "slow"]
+
+
+def test_streaming_and_non_api_routes_refused():
+    async def _run():
+        channel = await _open_channel()
+        try:
+            return await asyncio.gather(
+                channel.request("POST", "/api/v1/sessions/x/upload/stream", {}, b"data"),
+                channel.request("GET", "/health", {}, b""),
+            )
+        finally:
+            await channel.aclose()
+
+    (status, headers, body), (health_status, _, _) = asyncio.run(_run())
+    assert status == 400 and "plain HTTP" in json.loads(body)["error"]
+    assert headers["content-type"].startswith("application/json")
+    assert health_status == 400
+
+
+# ---------------------------------------------------------------------------
+# SDK
+# ---------------------------------------------------------------------------
+
+def test_async_session_over_channel():
+    before = _channel_stats()
+
+    async def _run():
+        async with AsyncBrowserClient(base_url=BASE_URL, websocket=True) as client:
+            sess = await client.sessions.create(profile="e2e-ws-sdk", headless=True)
+            try:
+                await sess.set_policy("disabled")
+                await sess.navigate(_inline("<button id='b' onclick='this.textContent=\"ok\"'>b</button>"))
+                await sess.click("#b")
+                texts = await asyncio.gather(*(sess.eval("document.querySelector('#b').textContent") for _ in range(8)))
+                with pytest.raises(httpx.HTTPStatusError) as exc_info:
+                    await sess.click("#missing", timeout_ms=200)
+                assert exc_info.value.response.status_code == 422
+                logs = await sess.logs(tail=20)
+                return texts, logs, client._http._transport.active
+            finally:
+                await sess.close()
+
+    texts, logs, active = asyncio.run(_run())
+    assert [t.result for t in texts] == ["ok"] * 8
+    assert any(e.type == "action" and e.action == "click" for e in logs)
+    assert active is True
+    after = _channel_stats()
+    assert after["connections_total"] == before["connections_total"] + 1
+    assert after["commands_total"] >= before["commands_total"] + 14
+
+
+def test_dropped_channel_reconnects():
+    async def _run():
+        transport = CommandChannelTransport(httpx.AsyncHTTPTransport())
+        async with httpx.AsyncClient(base_url=BASE_URL, transport=transport, headers=_headers()) as c:
+            assert (await c.get("/api/v1/status")).status_code == 200
+            first = transport._channel
+            first._writer.transport.abort()
+            await asyncio.sleep(0.1)
+            assert first.closed
+            resp = await c.get("/api/v1/status")
+            return resp.status_code, transport._channel is not first, transport.active
+
+    assert asyncio.run(_run()) == (200, True, True)